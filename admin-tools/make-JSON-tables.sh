@@ -1,7 +1,11 @@
 #!/bin/bash
+# Regenerate mathics_pygments/tables.py from data/mma-tables.json and
+# generate/symbol_tables.py, as "make tables" does.
 bs=${BASH_SOURCE[0]}
 json_tables_owd=$(pwd)
 mydir=$(dirname $bs)
-cd $mydir
-python ../mathics_pygments/generate/build_pygments_tables.py -o $mydir/../mathics_pygments/data/mma-tables-new.json
+cd $mydir/..
+python -m mathics_pygments.generate.build_tables "$@"
+rc=$?
 cd $json_tables_owd
+exit $rc
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Performance benchmarks for mathics_pygments.
+
+These are not run as part of the test suite. Run an individual
+benchmark from the top-level directory, e.g.::
+
+    python -m benchmarks.bench_unicode
+
+benchmarks.suite runs the lexer on all the corpora, stage by stage, and
+writes the results as JSON, so that runs at two commits can be compared::
+
+    python -m benchmarks.suite -o before.json
+    python -m benchmarks.suite --compare before.json
+"""
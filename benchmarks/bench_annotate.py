@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Benchmark for the annotation pass of MathematicaLexer.
+
+Compares the annotation pipeline the lexer used to run every token
+through, builtins(), unicode() and lexical_scope() in turn (frozen in
+tests/annotation_pipeline.py), with MathematicaAnnotations.annotate(),
+on the raw tokens of a large generated package, and gives the share of
+annotate() in the time of the whole of lexing.
+"""
+
+from pygments.lexer import RegexLexer
+
+from benchmarks.common import best_of
+from benchmarks.corpus import package
+from mathics_pygments.lexer import MathematicaAnnotations, MathematicaLexer
+from tests.annotation_pipeline import AnnotationPipeline
+
+
+def pipeline(raw):
+    pipeline = AnnotationPipeline()
+    return [pipeline(item) for item in raw]
+
+
+def annotate(raw):
+    annotate = MathematicaAnnotations().annotate
+    return [annotate(item) for item in raw]
+
+
+def main(size: int = 2_000_000, repeat: int = 5):
+    text = package(size)
+    lexer = MathematicaLexer()
+    raw = list(RegexLexer.get_tokens_unprocessed(lexer, text))
+    assert pipeline(raw) == annotate(raw)
+    print(f"{len(raw):,} tokens in {len(text):,} characters of input")
+
+    before = best_of(lambda: pipeline(raw), repeat).seconds
+    after = best_of(lambda: annotate(raw), repeat).seconds
+    print(f"annotation pipeline: {len(raw) / before:12,.0f} tokens/sec")
+    print(
+        f"annotate():          {len(raw) / after:12,.0f} tokens/sec"
+        f"  ({before / after:.1f}x faster)"
+    )
+
+    lex = best_of(lambda: list(lexer.get_tokens_unprocessed(text)), repeat).seconds
+    print(
+        f"full lexing:         {len(raw) / lex:12,.0f} tokens/sec"
+        f"  ({after / lex:.0%} of it annotating)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Scaling of highlight_many() with the number of worker processes, against
+highlighting the same files one at a time with pygments.highlight().
+
+    python -m benchmarks.bench_batch [number of files] [maximum workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+
+from benchmarks.corpus import package
+from mathics_pygments.batch import highlight_many
+from mathics_pygments.lexer import MathematicaLexer
+
+
+def main(count: int = 200, max_workers: int = 0):
+    max_workers = max_workers or os.cpu_count() or 1
+    formatter = HtmlFormatter()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        size = 0
+        for i in range(count):
+            text = package(20_000, seed=i)
+            size += len(text)
+            path = os.path.join(directory, f"file{i}.m")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            paths.append(path)
+        print(f"{count} files, {size:,} characters")
+
+        start = time.perf_counter()
+        lexer = MathematicaLexer()
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                highlight(f.read(), lexer, formatter)
+        serial = time.perf_counter() - start
+        print(f"{'workers':<10} {'seconds':>8} {'MB/sec':>8} {'speedup':>8}")
+        print(f"{'serial':<10} {serial:>8.2f} {size / serial / 1e6:>8.2f} {1:>8.2f}")
+
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            for _ in highlight_many(paths, formatter, workers=workers):
+                pass
+            elapsed = time.perf_counter() - start
+            print(
+                f"{workers:<10} {elapsed:>8.2f} {size / elapsed / 1e6:>8.2f}"
+                f" {serial / elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
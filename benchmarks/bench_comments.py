@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Lexing of comment-dominated code: a package with large documentation
+headers, and one made mostly of comments.
+
+Compares the previous rules of the "comments" state, which gave a token
+for every pair of characters starting with "*" and for every stray
+parenthesis, with the current ones, which give one token for the text
+between two comment delimiters.
+
+    python -m benchmarks.bench_comments [size]
+"""
+
+import sys
+
+from benchmarks.common import best_of
+from benchmarks.corpus import comments, documented_package
+from mathics_pygments.lexer import MathematicaLexer, MToken
+
+
+class PreviousLexer(MathematicaLexer):
+    tokens = {
+        "comments": [
+            (r"[^\*\(\)]+", MToken.COMMENT),
+            (r"\*[^\)]", MToken.COMMENT),
+            (r"\(\*", MToken.COMMENT, "#push"),
+            (r"\*\)", MToken.COMMENT, "#pop"),
+            (r"\([^\*]?|[^\*]?\)", MToken.COMMENT),
+        ],
+    }
+
+
+def main(size: int = 1_000_000):
+    corpora = {
+        "documented": documented_package(size),
+        "comments": comments(size),
+    }
+    print(f"{'corpus':<12} {'engine':<17} {'tokens':>9} {'MB/sec':>8}")
+    for name, text in corpora.items():
+        comment_chars = 0
+        lexers = (
+            ("regex, previous", PreviousLexer()),
+            ("regex", MathematicaLexer()),
+            ("master, previous", PreviousLexer(engine="master")),
+            ("master", MathematicaLexer(engine="master")),
+            ("scanner", MathematicaLexer(engine="scanner")),
+        )
+        for label, lexer in lexers:
+            elapsed, _, tokens = best_of(lambda: list(lexer.get_raw_tokens(text)))
+            comment_chars = sum(
+                len(value) for _, token, value in tokens if token is MToken.COMMENT
+            )
+            print(
+                f"{name:<12} {label:<17} {len(tokens):>9,}"
+                f" {len(text) / elapsed / 1e6:>8.2f}"
+            )
+        print(f"{name:<12} {comment_chars / len(text):.0%} of it in comments\n")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
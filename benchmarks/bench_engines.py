@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Throughput of the MathematicaLexer engines on the benchmark corpora.
+"""
+
+from benchmarks.common import best_of
+from benchmarks.corpus import package, unicode_dense
+from mathics_pygments.lexer import MathematicaLexer
+
+
+def main(size: int = 1_000_000, repeat: int = 3):
+    corpora = {"package": package(size), "unicode": unicode_dense(size // 4)}
+    print(f"{'corpus':<10} {'engine':<10} {'tokens/sec':>12} {'MB/sec':>8}")
+    for name, text in corpora.items():
+        for engine in MathematicaLexer.engines:
+            lexer = MathematicaLexer(engine=engine)
+            tokens = sum(1 for _ in lexer.get_tokens_unprocessed(text))
+            elapsed = best_of(
+                lambda: list(lexer.get_tokens_unprocessed(text)), repeat
+            ).seconds
+            print(
+                f"{name:<10} {engine:<10} {tokens / elapsed:>12,.0f}"
+                f" {len(text) / elapsed / 1e6:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Formatter time with and without the mergetokens option of
+MathematicaLexer, which merges adjacent tokens of the same type.
+
+For each corpus, the tokens are lexed once with each setting, and the
+HTML, Terminal256 and LaTeX formatters are timed on them alone, so the
+time of lexing is left out.
+
+    python -m benchmarks.bench_formatters [size]
+"""
+
+import io
+import sys
+
+from pygments.formatters import HtmlFormatter, LatexFormatter, Terminal256Formatter
+
+from benchmarks import corpus
+from benchmarks.common import best_of
+from mathics_pygments.lexer import MathematicaLexer
+from mathics_pygments.style import MathematicaStyle
+
+CORPORA = {
+    "package": corpus.package,
+    "comments": corpus.comments,
+    "strings": corpus.strings,
+    "unicode": corpus.unicode_dense,
+    "notebook": corpus.notebook,
+}
+
+FORMATTERS = {
+    "html": HtmlFormatter,
+    "terminal256": Terminal256Formatter,
+    "latex": LatexFormatter,
+}
+
+
+def main(size: int = 500_000):
+    print(
+        f"{'corpus':<10} {'formatter':<12} {'tokens':>9} {'merged':>9}"
+        f" {'seconds':>8} {'merged':>8} {'speedup':>8}"
+    )
+    for name, make in CORPORA.items():
+        text = make(size)
+        tokens = list(MathematicaLexer().get_tokens(text))
+        merged = list(MathematicaLexer(mergetokens=True).get_tokens(text))
+        for label, formatter_class in FORMATTERS.items():
+            formatter = formatter_class(style=MathematicaStyle)
+
+            def run(tokens):
+                return lambda: formatter.format(iter(tokens), io.StringIO())
+
+            before = best_of(run(tokens)).seconds
+            after = best_of(run(merged)).seconds
+            print(
+                f"{name:<10} {label:<12} {len(tokens):>9,} {len(merged):>9,}"
+                f" {before:>8.3f} {after:>8.3f} {before / after:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Import time of mathics_pygments, from python -X importtime, and the time
+of creating the first lexer and lexing a first snippet, which is where
+the symbol tables are loaded and the token table compiled.
+
+Each measurement runs in a fresh interpreter; the median of the runs is
+reported.
+
+    python -m benchmarks.bench_import [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+MODULES = ("pygments.lexer", "mathics_pygments.builtins", "mathics_pygments")
+
+FIRST_LEX = """
+import time
+start = time.perf_counter()
+from mathics_pygments.lexer import MathematicaLexer
+imported = time.perf_counter()
+list(MathematicaLexer().get_tokens("Module[{x}, Sin[x] + 1]"))
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def import_times() -> dict:
+    """
+    Return the cumulative import times in microseconds of MODULES, when
+    they are imported by "import mathics_pygments".
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mathics_pygments"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() in MODULES:
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(runs: int = 9):
+    times = {name: [] for name in MODULES}
+    for _ in range(runs):
+        for name, value in import_times().items():
+            times[name].append(value)
+    print(f"{'import mathics_pygments':<28} {'ms (median)':>12}")
+    for name in MODULES:
+        value = statistics.median(times[name]) / 1e3 if times[name] else None
+        shown = "not imported" if value is None else f"{value:.1f}"
+        print(f"{name:<28} {shown:>12}")
+
+    first = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", FIRST_LEX],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        first.append([float(value) for value in output.split()])
+    imported, lexed = (statistics.median(values) * 1e3 for values in zip(*first))
+    print(f"{'import lexer':<28} {imported:>12.1f}")
+    print(f"{'first lexer and lex':<28} {lexed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Wall time and peak resident memory of lexing a large generated notebook
+from a memory map, against get_tokens() on the text read from the file.
+
+Each measurement runs in a process of its own, so that its peak RSS is
+not that of an earlier one:
+
+    python -m benchmarks.bench_mapped [size in MB] [engine]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import notebook
+from mathics_pygments.lexer import MathematicaLexer
+
+MODES = ("read", "mapped")
+
+
+def peak_rss() -> int:
+    """
+    Peak resident memory of this process in kilobytes. ru_maxrss is kept
+    across exec() on Linux, so that it would include the memory of the
+    parent process that generated the notebook; VmHWM is not.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run(mode: str, path: str, engine: str):
+    """Lex the file at path in the given mode and print time and peak RSS."""
+    lexer = MathematicaLexer(engine=engine)
+    start = time.perf_counter()
+    if mode == "read":
+        with open(path, encoding="utf-8") as f:
+            tokens = lexer.get_tokens(f.read())
+    else:
+        tokens = lexer.get_tokens_mapped(path)
+    count = sum(1 for _ in tokens)
+    elapsed = time.perf_counter() - start
+    print(count, elapsed, peak_rss())
+
+
+def main(size: int = 100, engine: str = "scanner"):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.nb")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(notebook(size * 1_000_000))
+        print(f"{size} MB notebook, {engine} engine")
+        print(
+            f"{'mode':<8} {'tokens':>12} {'seconds':>8} {'MB/sec':>8} {'peak RSS':>10}"
+        )
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_mapped", "--run"]
+                + [mode, path, engine],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            count, elapsed, rss = output.split()
+            elapsed = float(elapsed)
+            print(
+                f"{mode:<8} {int(count):>12,} {elapsed:>8.2f}"
+                f" {size / elapsed:>8.2f} {int(rss) / 1024:>7.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run(*sys.argv[2:])
+    else:
+        main(*(int(arg) if arg.isdigit() else arg for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Scaling of MathematicaLexer.get_tokens_parallel() with the number of
+worker processes, against lexing the same text in this process with
+get_tokens_unprocessed().
+
+The workers lex and annotate the segments of the text; this process
+unpickles their tokens and puts them together. The "here" column is
+the CPU time of this process alone, which bounds the speedup with as
+many CPUs as workers. The last line of each engine is what
+get_tokens_parallel() does without the workers argument (see
+mathics_pygments.batch).
+
+    python -m benchmarks.bench_parallel [size] [maximum workers]
+"""
+
+import sys
+
+from benchmarks.common import best_of
+from benchmarks.corpus import package
+from mathics_pygments import batch
+from mathics_pygments.lexer import MathematicaLexer
+
+
+def main(size: int = 5_000_000, max_workers: int = 0):
+    cpus = batch.cpu_count()
+    max_workers = max_workers or cpus
+    text = package(size)
+    print(f"{len(text):,} characters, {cpus} CPUs")
+    print(
+        f"{'engine':<8} {'workers':<8} {'seconds':>8} {'here':>8}"
+        f" {'MB/sec':>8} {'speedup':>8}"
+    )
+    for engine in ("regex", "scanner"):
+        lexer = MathematicaLexer(engine=engine)
+        serial = best_of(lambda: list(lexer.get_tokens_unprocessed(text))).seconds
+        runs = [("serial", lambda: list(lexer.get_tokens_unprocessed(text)))]
+        for workers in range(1, max_workers + 1):
+            runs.append(
+                (
+                    workers,
+                    lambda n=workers: list(lexer.get_tokens_parallel(text, workers=n)),
+                )
+            )
+        runs.append(("default", lambda: list(lexer.get_tokens_parallel(text))))
+        for label, run in runs:
+            elapsed, here, _ = best_of(run)
+            print(
+                f"{engine:<8} {label:<8} {elapsed:>8.2f} {here:>8.2f}"
+                f" {len(text) / elapsed / 1e6:>8.2f} {serial / elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+How the time and memory of MathematicaLexer scale with each parameter of
+the synthetic code of benchmarks.synthetic: its size, nesting depth,
+Unicode density, comment nesting and density of scope constructs.
+
+Each parameter is varied in turn, the others keeping their defaults.
+Time is reported per character and should stay flat as a parameter
+grows, so a rule or annotator that is not linear shows up as a rising
+column. For the size, the slope of log time against log size is given
+too, which is 1 for linear lexing. Tokens are not kept, so the peak
+traced memory is that of the state of the lexer, which should not grow
+with the size either.
+
+With matplotlib installed, --plot DIR draws time and memory against each
+parameter into DIR; -o writes the results as JSON.
+
+    python -m benchmarks.bench_scaling [--engine ENGINE] [--plot DIR] [-o FILE]
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+import tracemalloc
+
+from benchmarks.synthetic import generate
+from mathics_pygments.lexer import MathematicaLexer
+
+SIZE = 100_000
+
+# The values each parameter takes.
+SWEEPS = {
+    "size": (25_000, 50_000, 100_000, 200_000, 400_000),
+    "depth": (1, 4, 16, 64, 256),
+    "unicode": (0.0, 0.1, 0.25, 0.5, 0.9),
+    "comments": (0, 1, 4, 16, 64),
+    "scopes": (0.0, 0.25, 0.5, 0.75, 1.0),
+}
+
+
+def measure(lexer, text: str, repeat: int) -> tuple:
+    """The best time of lexing text, and the peak memory traced doing it."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in lexer.get_tokens_unprocessed(text):
+            pass
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    for _ in lexer.get_tokens_unprocessed(text):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def slope(xs, ys) -> float:
+    """The least-squares slope of log ys against log xs."""
+    xs = [math.log(x) for x in xs]
+    ys = [math.log(y) for y in ys]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum(
+        (x - mx) ** 2 for x in xs
+    )
+
+
+def plot(results: dict, directory: str):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed; not plotting")
+        return
+    os.makedirs(directory, exist_ok=True)
+    for parameter, rows in results.items():
+        figure, (left, right) = plt.subplots(1, 2, figsize=(10, 4))
+        values = [row["value"] for row in rows]
+        left.plot(values, [row["ns_per_char"] for row in rows], marker="o")
+        left.set_xlabel(parameter)
+        left.set_ylabel("ns per character")
+        right.plot(values, [row["peak_bytes"] / 1024 for row in rows], marker="o")
+        right.set_xlabel(parameter)
+        right.set_ylabel("peak kB")
+        figure.tight_layout()
+        figure.savefig(os.path.join(directory, f"scaling-{parameter}.png"))
+        plt.close(figure)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--engine", choices=MathematicaLexer.engines, default="regex")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--plot", metavar="DIR", help="draw the results into DIR")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    lexer = MathematicaLexer(engine=args.engine)
+    results = {}
+    for parameter, values in SWEEPS.items():
+        print(f"{parameter:<10} {'ns/char':>9} {'peak kB':>9} {'tokens':>9}")
+        rows = []
+        for value in values:
+            shape = {"size": SIZE, parameter: value}
+            text = generate(**shape)
+            seconds, peak = measure(lexer, text, args.repeat)
+            tokens = sum(1 for _ in lexer.get_tokens_unprocessed(text))
+            rows.append(
+                {
+                    "value": value,
+                    "characters": len(text),
+                    "tokens": tokens,
+                    "seconds": seconds,
+                    "ns_per_char": seconds / len(text) * 1e9,
+                    "peak_bytes": peak,
+                }
+            )
+            print(
+                f"{value:<10} {rows[-1]['ns_per_char']:>9.0f}"
+                f" {peak / 1024:>9.1f} {tokens:>9,}"
+            )
+        if parameter == "size":
+            exponent = slope(
+                [row["characters"] for row in rows], [row["seconds"] for row in rows]
+            )
+            print(f"time ~ size^{exponent:.2f}")
+        print()
+        results[parameter] = rows
+
+    if args.plot:
+        plot(results, args.plot)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
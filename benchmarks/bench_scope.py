@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Benchmark for the lexical scope tracking of MathematicaAnnotations.
+
+Lexes roughly the same amount of code made of Module/Block/With nests of
+increasing depth. Time per token should stay flat as the depth grows.
+"""
+
+import time
+
+from pygments.lexer import RegexLexer
+
+from benchmarks.corpus import nested_modules
+from mathics_pygments.lexer import MathematicaAnnotations, MathematicaLexer
+
+
+def main(size: int = 1_000_000, depths=(1, 10, 100, 1_000), repeat: int = 3):
+    lexer = MathematicaLexer()
+    print(f"{'depth':>6} {'tokens':>10} {'annotate ns/token':>18} {'lex ns/token':>13}")
+    for depth in depths:
+        text = nested_modules(depth, size)
+        raw = list(RegexLexer.get_tokens_unprocessed(lexer, text))
+
+        annotate_time = lex_time = float("inf")
+        for _ in range(repeat):
+            annotate = MathematicaAnnotations().annotate
+            start = time.perf_counter()
+            for item in raw:
+                annotate(item)
+            annotate_time = min(annotate_time, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in lexer.get_tokens_unprocessed(text):
+                pass
+            lex_time = min(lex_time, time.perf_counter() - start)
+
+        print(
+            f"{depth:>6} {len(raw):>10,} {annotate_time / len(raw) * 1e9:>18.0f}"
+            f" {lex_time / len(raw) * 1e9:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
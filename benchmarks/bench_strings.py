@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Lexing of large string literals: a generated file embedding a
+CompressedData payload, a base64 image and an escaped JSON document, and
+a data file of many short strings with escapes.
+
+Compares the previous rules of the "strings" state, which gave a token
+for every escape and matched a quote or backslash at the start of a line
+with a rule of its own, with the current ones, which give one token for
+the text between the quotes. The options mergestrings and elidedata are
+timed on the annotated tokens, with the number of characters left of the
+embedded data.
+
+    python -m benchmarks.bench_strings [size]
+"""
+
+import sys
+
+from benchmarks.common import best_of
+from benchmarks.corpus import embedded_data, strings
+from mathics_pygments.lexer import MathematicaLexer, MToken
+
+
+class PreviousLexer(MathematicaLexer):
+    tokens = {
+        "strings": [
+            (r'[^"\\]+', MToken.STRING),
+            (r'^[\\"]', MToken.STRING),
+            (r"(\\n|\\r)", MToken.STRING),
+            (r'\\"', MToken.STRING),
+            (r"\\", MToken.STRING),
+            (r'"', MToken.STRING, "#pop"),
+        ],
+    }
+
+
+def main(size: int = 1_000_000):
+    corpora = {
+        "embedded": embedded_data(size),
+        "strings": strings(size),
+    }
+    print(f"{'corpus':<10} {'engine':<17} {'tokens':>9} {'MB/sec':>8}")
+    for name, text in corpora.items():
+        lexers = (
+            ("regex, previous", PreviousLexer()),
+            ("regex", MathematicaLexer()),
+            ("master, previous", PreviousLexer(engine="master")),
+            ("master", MathematicaLexer(engine="master")),
+            ("scanner", MathematicaLexer(engine="scanner")),
+        )
+        for label, lexer in lexers:
+            elapsed, _, tokens = best_of(lambda: list(lexer.get_raw_tokens(text)))
+            print(
+                f"{name:<10} {label:<17} {len(tokens):>9,}"
+                f" {len(text) / elapsed / 1e6:>8.2f}"
+            )
+        print()
+
+    text = corpora["embedded"]
+    print(f"{'options':<27} {'tokens':>9} {'MB/sec':>8} {'characters':>11}")
+    for label, options in (
+        ("none", {}),
+        ("mergestrings", {"mergestrings": True}),
+        ("elidedata", {"elidedata": True}),
+        ("mergestrings, elidedata", {"mergestrings": True, "elidedata": True}),
+    ):
+        lexer = MathematicaLexer(engine="scanner", **options)
+        elapsed, _, tokens = best_of(lambda: list(lexer.get_tokens_unprocessed(text)))
+        characters = sum(len(value) for _, _, value in tokens)
+        print(
+            f"{label:<27} {len(tokens):>9,} {len(text) / elapsed / 1e6:>8.2f}"
+            f" {characters:>11,}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Load time and memory of the symbol tables: importing
+mathics_pygments.builtins, and the first MathematicaLexer, which
+builds UNICODE_TOKENS and the operator regexes from them.
+
+Each measurement runs in a fresh interpreter, after a first run that
+leaves the compiled modules in __pycache__, as an installed package has
+them; the median of the runs is reported.
+
+    python -m benchmarks.bench_tables [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+MEASURE = """
+import resource, time, tracemalloc
+
+def rss():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+import pygments.lexer
+before = rss()
+tracemalloc.start()
+start = time.perf_counter()
+import mathics_pygments.builtins
+loaded = time.perf_counter()
+allocated = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+after = rss()
+from mathics_pygments.lexer import MathematicaLexer
+start_lexer = time.perf_counter()
+MathematicaLexer()
+lexer = time.perf_counter()
+print(loaded - start, allocated, after - before, lexer - start_lexer)
+"""
+
+
+def main(runs: int = 9):
+    command = [sys.executable, "-c", MEASURE]
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run(command, check=True, capture_output=True, env=env)
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            command, check=True, capture_output=True, text=True, env=env
+        ).stdout
+        results.append([float(value) for value in output.split()])
+    load, allocated, rss, lexer = (
+        statistics.median(values) for values in zip(*results)
+    )
+    print(f"import builtins     {load * 1e3:8.1f} ms")
+    print(f"  allocated         {allocated / 1024:8.0f} kB")
+    print(f"  resident          {rss:8.0f} kB")
+    print(f"first lexer         {lexer * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Throughput and accuracy of the "mathics-scanner" engine against the
+default "regex" engine.
+
+Accuracy is measured against the Mathics3 tokeniser, since that is how
+Mathics3 itself reads the code: the share of the tokeniser's tokens that
+the regex engine also finds as a single token with the same span, and
+with the same token type. The most frequent disagreements are listed.
+
+Pass Wolfram Language files (real packages) on the command line, e.g.
+
+    python -m benchmarks.bench_tokeniser path/to/*.m
+
+Without arguments, the generated benchmark package is used.
+"""
+
+import sys
+import time
+from collections import Counter
+
+from benchmarks.common import best_of
+from benchmarks.corpus import package
+from mathics_pygments.lexer import MathematicaLexer, MToken
+
+BLANK_TOKENS = (MToken.WHITESPACE, MToken.COMMENT)
+
+
+def spans(tokens) -> dict:
+    return {
+        (index, index + len(value)): (token, value)
+        for index, token, value in tokens
+        if token not in BLANK_TOKENS
+    }
+
+
+def compare(reference, tokens, disagreements: Counter) -> tuple:
+    """
+    Return how many of the reference tokens have a token with the same
+    span in tokens, and how many of those have the same token type too.
+    """
+    found = spans(tokens)
+    same_span = same_token = 0
+    for span, (token, value) in spans(reference).items():
+        other = found.get(span)
+        if other is None:
+            disagreements[value] += 1
+            continue
+        same_span += 1
+        if other[0] is token:
+            same_token += 1
+        else:
+            disagreements[f"{value} ({other[0]} vs {token})"] += 1
+    return same_span, same_token
+
+
+def main(paths=(), repeat: int = 3):
+    if paths:
+        sources = {}
+        for path in paths:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                sources[path] = f.read()
+    else:
+        sources = {"package": package(300_000)}
+
+    regex = MathematicaLexer()
+    tokeniser = MathematicaLexer(engine="mathics-scanner")
+    total = same_span = same_token = 0
+    times = {"regex": 0.0, "mathics-scanner": 0.0}
+    size = 0
+    disagreements = Counter()
+    for text in sources.values():
+        size += len(text)
+        for name, lexer in (("regex", regex), ("mathics-scanner", tokeniser)):
+            times[name] += best_of(
+                lambda: list(lexer.get_tokens_unprocessed(text)), repeat
+            ).seconds
+        reference = list(tokeniser.get_tokens_unprocessed(text))
+        spans_found, tokens_found = compare(
+            reference, list(regex.get_tokens_unprocessed(text)), disagreements
+        )
+        total += len(spans(reference))
+        same_span += spans_found
+        same_token += tokens_found
+
+    print(f"{len(sources)} file(s), {size:,} characters")
+    print(f"{'engine':<16} {'MB/sec':>8}")
+    for name, elapsed in times.items():
+        print(f"{name:<16} {size / elapsed / 1e6:>8.2f}")
+    print(
+        f"regex engine agrees with the Mathics3 tokeniser on "
+        f"{same_span / total:.1%} of token spans and "
+        f"{same_token / total:.1%} of tokens"
+    )
+    print("most frequent disagreements:")
+    for value, count in disagreements.most_common(15):
+        print(f"{count:>8}  {value!r}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Microbenchmark for the classification of Unicode characters.
+
+Compares the previous chain of membership tests, where
+builtins.UNICODE_OPERATORS was a sorted list, with the single
+lexer.UNICODE_TOKENS lookup, and reports lexing throughput on
+Unicode-dense input.
+"""
+
+import timeit
+
+import mathics_pygments.builtins as mma
+from benchmarks.corpus import unicode_dense
+from mathics_pygments.lexer import UNICODE_TOKENS, MathematicaLexer, MToken, load_tables
+
+SYSTEM_SYMBOLS = mma.UNICODE_SYSTEM_SYMBOLS
+GROUPINGS = mma.UNICODE_GROUPINGS
+OPERATORS_LIST = mma.UNICODE_OPERATORS_SORTED
+UNDEFINED_SYMBOLS = mma.UNICODE_SYSTEM_UNDEFINED_SYMBOLS
+
+
+def classify_chain(chars):
+    """The classification used before UNICODE_TOKENS existed."""
+    for char in chars:
+        if char in SYSTEM_SYMBOLS:
+            MToken.BUILTIN
+        elif char in GROUPINGS:
+            MToken.GROUP
+        elif char in OPERATORS_LIST:
+            MToken.OPERATOR
+        elif char in UNDEFINED_SYMBOLS:
+            MToken.SYMBOL
+        else:
+            MToken.UNKNOWN
+
+
+def classify_table(chars):
+    get_token = UNICODE_TOKENS.get
+    unknown = MToken.UNKNOWN
+    for char in chars:
+        get_token(char, unknown)
+
+
+def main(size: int = 200_000, repeat: int = 5):
+    load_tables()
+    text = unicode_dense(size)
+    chars = [char for char in text if ord(char) > 0x7F]
+    print(f"{len(chars)} non-ASCII characters in {len(text)} characters of input")
+
+    chain = min(timeit.repeat(lambda: classify_chain(chars), number=1, repeat=repeat))
+    table = min(timeit.repeat(lambda: classify_table(chars), number=1, repeat=repeat))
+    print(f"membership chain:  {chain * 1e3:8.2f} ms")
+    print(f"UNICODE_TOKENS:    {table * 1e3:8.2f} ms  ({chain / table:.1f}x faster)")
+
+    lexer = MathematicaLexer()
+    tokens = sum(1 for _ in lexer.get_tokens_unprocessed(text))
+    lex = min(
+        timeit.repeat(
+            lambda: list(lexer.get_tokens_unprocessed(text)), number=1, repeat=repeat
+        )
+    )
+    print(f"lexing:            {lex * 1e3:8.2f} ms  ({tokens / lex:,.0f} tokens/sec)")
+
+
+if __name__ == "__main__":
+    main()
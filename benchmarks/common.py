@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Timing shared by the benchmarks.
+"""
+
+import time
+from typing import Any, NamedTuple
+
+
+class Timing(NamedTuple):
+    seconds: float
+    cpu: float
+    result: Any
+
+
+def best_of(func, repeat: int = 3) -> Timing:
+    """
+    Call func repeat times, and return the shortest wall-clock time of
+    the calls, in seconds, with the CPU time of this process in that call
+    and what func returned.
+    """
+    best = None
+    for _ in range(repeat):
+        start, cpu = time.perf_counter(), time.process_time()
+        result = func()
+        timing = Timing(time.perf_counter() - start, time.process_time() - cpu, result)
+        if best is None or timing.seconds < best.seconds:
+            best = timing
+    return best
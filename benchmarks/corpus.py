@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Deterministic Mathematica inputs for the benchmarks.
+
+Every function takes a target size in characters and a seed, so that
+results are comparable between runs and between commits.
+"""
+
+import random
+
+import mathics_pygments.builtins as mma
+
+
+def unicode_dense(size: int = 200_000, seed: int = 0) -> str:
+    """
+    Code made mostly of the Unicode operators, groupings and letter-like
+    symbols in the builtins tables, separated by short ASCII symbols.
+    """
+    rng = random.Random(seed)
+    chars = sorted(
+        set(mma.UNICODE_OPERATORS_SORTED)
+        | mma.UNICODE_GROUPINGS
+        | mma.UNICODE_SYSTEM_SYMBOLS
+        | mma.UNICODE_SYSTEM_UNDEFINED_SYMBOLS
+    )
+    chars = [char for char in chars if ord(char) > 0x7F]
+    parts = []
+    length = 0
+    while length < size:
+        run = "".join(rng.choice(chars) for _ in range(rng.randint(1, 6)))
+        part = run + rng.choice(("x", "y1", " ", "\n", "f[", "]"))
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+_DEFINITIONS = (
+    '{f}::usage = "{f}[x, y] computes something from x and y.\\nSee also {g}.";\n',
+    "(* ::Subsection:: *)\n(* {f} handles the {n}-th case (see {g}) *)\n",
+    "{f}[x_Integer, y_:{n}] := Module[{{a = x^2, b = {{1, 2, {n}}}, c}},\n"
+    "    c = a + b[[1]];\n"
+    "    If[c > {n}, Sin[c] + y, #1 & /@ Range[c]]\n"
+    "]\n",
+    "{g}[data_List, opts___?OptionQ] := Block[{{$RecursionLimit = {n}, t}},\n"
+    "    t = Map[#^2 &, data];\n"
+    "    Total[t] /. x_Real :> Round[x]\n"
+    "]\n",
+    "{f}Cached = With[{{k = {n}.5`10, m = 2^^101}}, Function[{{u}}, u*k + m*1.2*^3]];\n",
+    '{g}Options = <|"Name" -> "{f} \\"quoted\\"", "Size" -> {n}, "Scale" -> .{n}|>;\n',
+    "{g}[Foo`Bar`{f}[z__], w_.] := {f}[z] // N /; w >= {n} && {f}Cached[w] != 0\n",
+)
+
+
+def package(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    A Wolfram Language package made of typical definitions: usage
+    messages, comments, patterns, scoping constructs, numbers in the
+    various notations, strings and associations.
+    """
+    rng = random.Random(seed)
+    parts = ['BeginPackage["Benchmark`"]\n\nBegin["`Private`"]\n\n']
+    length = len(parts[0])
+    i = 0
+    while length < size:
+        i += 1
+        template = rng.choice(_DEFINITIONS)
+        part = template.format(
+            f="func%d" % i, g="helper%d" % rng.randint(1, i), n=rng.randint(0, 999)
+        )
+        parts.append(part)
+        length += len(part)
+    parts.append("\nEnd[]\n\nEndPackage[]\n")
+    return "".join(parts)
+
+
+def nested_modules(depth: int, size: int = 1_000_000) -> str:
+    """
+    Repeated nests of ``depth`` Module, Block and With constructs, each
+    defining local variables used in its body, up to about ``size``
+    characters.
+    """
+    keywords = ("Module", "Block", "With")
+    opening = []
+    closing = []
+    for i in range(1, depth + 1):
+        keyword = keywords[i % len(keywords)]
+        opening.append(f"{keyword}[{{x{i} = {i}, y{i}}}, y{i} = x{i}^2;\n")
+        closing.append(f" + y{i}]")
+    nest = "".join(opening) + f"f[x{depth}]" + "".join(reversed(closing)) + ";\n"
+    return nest * max(1, size // len(nest))
+
+
+_NOTEBOOK_CELLS = (
+    'Cell["Definition of func{i}", "Text",\n'
+    " CellChangeTimes->{{{{3.{n}*^9, {n}}}}}],\n\n"
+    "Cell[CellGroupData[{{\n"
+    "Cell[BoxData[\n"
+    ' RowBox[{{RowBox[{{"func{i}", "[", RowBox[{{"x_", ",", "y_"}}], "]"}}],\n'
+    '  ":=", RowBox[{{"Module", "[", RowBox[{{RowBox[{{"{{", "a", "}}"}}], ",",\n'
+    '  RowBox[{{"x", "^", "{n}"}}]}}], "]"}}]}}]], "Input",\n'
+    ' CellLabel->"In[{i}]:="],\n\n'
+    'Cell[BoxData["{n}"], "Output", CellLabel->"Out[{i}]="]\n'
+    "}}, Open  ]],\n\n"
+)
+
+
+def notebook(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    A notebook as Mathematica saves it, in ASCII: text cells, and input
+    cells holding the box form of definitions, grouped with their output
+    cells.
+    """
+    rng = random.Random(seed)
+    parts = ["(* Content-type: application/vnd.wolfram.mathematica *)\n\nNotebook[{\n"]
+    length = len(parts[0])
+    i = 0
+    while length < size:
+        i += 1
+        part = _NOTEBOOK_CELLS.format(i=i, n=rng.randint(0, 999))
+        parts.append(part)
+        length += len(part)
+    parts.append('Cell["End", "Text"]\n},\nWindowSize->{808, 911}\n]\n')
+    return "".join(parts)
+
+
+_COMMENTS = (
+    "(* ::Section:: *)\n(*{w}*)\n\n",
+    "(* {w}\n   {w}\n   (* {w} *)\n   {w} *)\n",
+    "(* TODO: {w} *)\nf{n}[x_] := x + {n} (* {w} *)\n",
+    "(*\n * {w}\n * {w}\n *)\n",
+)
+
+_WORDS = (
+    "the result is computed from each element of list and then normalized to"
+    " unit length see also options below for details x y returns a value"
+).split()
+
+
+def _words(rng, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(count))
+
+
+def comments(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    Code that is mostly comments: section markers, nested comments,
+    commented-out definitions and long prose.
+    """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        part = rng.choice(_COMMENTS).format(
+            w=_words(rng, rng.randint(3, 30)), n=rng.randint(0, 999)
+        )
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+_BANNER = "(" + "*" * 78 + ")\n"
+
+_HEADER = (
+    _BANNER
+    + "(* {name}\n"
+    + " *\n"
+    + " * {text}\n"
+    + " * {text}\n"
+    + " *\n"
+    + " * Example: {name}[{{1, 2, 3}}] (* gives {{1, 4, 9}} *)\n"
+    + " *)\n"
+    + _BANNER
+    + "(*\n{code}*)\n"
+)
+
+
+def documented_package(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    A package whose definitions each come with a large documentation
+    header: asterisk banners, prose, a nested example comment and a
+    commented-out older version of the definition.
+    """
+    rng = random.Random(seed)
+    parts = ["(* ::Package:: *)\n\n" + _BANNER * 3]
+    length = len(parts[0])
+    i = 0
+    while length < size:
+        i += 1
+        code = package(400, seed=seed + i)
+        part = _HEADER.format(
+            name="func%d" % i,
+            text=_words(rng, rng.randint(8, 16)),
+            code=code,
+        ) + package(400, seed=seed + i + 1)
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def strings(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    A data file of records of strings, with escaped quotes, backslashes
+    and newlines, as exported from a spreadsheet or a database.
+    """
+    rng = random.Random(seed)
+    parts = ["data = {\n"]
+    length = len(parts[0])
+    i = 0
+    while length < size:
+        i += 1
+        fields = [
+            f'"record {i}"',
+            '"' + _words(rng, rng.randint(1, 12)).capitalize() + '."',
+            '"She said \\"' + _words(rng, 3) + '\\""',
+            '"C:\\\\data\\\\file' + str(rng.randint(0, 99)) + '.csv"',
+            '"line one\\nline two\\t' + _words(rng, 2) + '"',
+        ]
+        part = "  {" + ", ".join(rng.sample(fields, 4)) + "},\n"
+        parts.append(part)
+        length += len(part)
+    parts.append('  {"end"}\n};\n')
+    return "".join(parts)
+
+
+def embedded_data(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    A generated package made mostly of a few large strings: a
+    CompressedData payload, a base64 image and a serialized JSON
+    document, with its quotes and backslashes escaped, each a third of
+    the size.
+    """
+    rng = random.Random(seed)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    length = size // 3
+
+    def base64(count):
+        return "".join(rng.choice(alphabet) for _ in range(count))
+
+    records = []
+    total = 0
+    while total < length:
+        record = (
+            '{\\"id\\": %d, \\"name\\": \\"%s\\", \\"path\\": '
+            '\\"C:\\\\\\\\data\\\\\\\\%d.csv\\"}'
+            % (len(records), _words(rng, 3), rng.randint(0, 999))
+        )
+        records.append(record)
+        total += len(record) + 2
+    return (
+        "(* Generated file. *)\n\n"
+        + package(2000, seed=seed)
+        + 'table = CompressedData["\n1:eJx'
+        + base64(length)
+        + '\n"];\n\nimage = ImportString["'
+        + base64(length)
+        + '", "Base64"];\n\nrecords = ImportString["['
+        + ", ".join(records)
+        + ']", "RawJSON"];\n'
+    )
+
+
+def numbers(size: int = 1_000_000, seed: int = 0) -> str:
+    """
+    A numeric data dump: a matrix of integers, reals, reals with
+    precision and exponents, rationals and numbers in other bases.
+    """
+    rng = random.Random(seed)
+    forms = (
+        lambda: str(rng.randint(-(10**6), 10**6)),
+        lambda: f"{rng.uniform(-1e3, 1e3):.6f}",
+        lambda: f"{rng.random():.15f}`15.",
+        lambda: f"{rng.uniform(1, 10):.4f}*^{rng.randint(-30, 30)}",
+        lambda: f"{rng.randint(1, 99)}/{rng.randint(1, 99)}",
+        lambda: f"16^^{rng.randint(0, 0xFFFFFF):X}",
+    )
+    parts = ["matrix = {\n"]
+    length = len(parts[0])
+    while length < size:
+        row = ", ".join(rng.choice(forms)() for _ in range(8))
+        part = "  {" + row + "},\n"
+        parts.append(part)
+        length += len(part)
+    parts.append("  {0}\n};\n")
+    return "".join(parts)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Throughput of MathematicaLexer on the benchmark corpora, stage by stage,
+with the results written as JSON to compare them between commits.
+
+For each corpus the stages are timed separately:
+
+    lex            the raw tokens of the engine, get_raw_tokens()
+    annotate       MathematicaAnnotations.annotate() over the raw tokens,
+                   which marks local variables; the engines tell builtins
+                   from other symbols themselves
+    total          get_tokens_unprocessed()
+
+The corpora are generated with fixed seeds, so a run is comparable with
+runs at other commits of the same size. Each stage is timed repeat
+times and the best time is kept.
+
+    python -m benchmarks.suite [-o results.json] [--compare old.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+
+import pygments
+
+from benchmarks import corpus
+from benchmarks.common import best_of
+from mathics_pygments.lexer import MathematicaAnnotations, MathematicaLexer
+from mathics_pygments.version import __version__
+
+# The corpora, by name, as functions of the size in characters.
+CORPORA = {
+    "package": lambda size: corpus.package(size, seed=0),
+    "comments": lambda size: corpus.comments(size, seed=0),
+    "strings": lambda size: corpus.strings(size, seed=0),
+    "unicode": lambda size: corpus.unicode_dense(size, seed=0),
+    "nested": lambda size: corpus.nested_modules(12, size),
+    "numbers": lambda size: corpus.numbers(size, seed=0),
+    "notebook": lambda size: corpus.notebook(size, seed=0),
+}
+
+
+def stages(lexer, text: str) -> dict:
+    """The functions that time each stage on text, by name."""
+    raw = list(lexer.get_raw_tokens(text))
+
+    def annotate():
+        annotate = MathematicaAnnotations().annotate
+        for item in raw:
+            annotate(item)
+
+    return {
+        "lex": lambda: list(lexer.get_raw_tokens(text)),
+        "annotate": annotate,
+        "total": lambda: list(lexer.get_tokens_unprocessed(text)),
+    }
+
+
+def run(size: int, repeat: int, engine: str, names) -> dict:
+    lexer = MathematicaLexer(engine=engine)
+    results = {}
+    for name in names:
+        text = CORPORA[name](size)
+        tokens = sum(1 for _ in lexer.get_tokens_unprocessed(text))
+        timings = {}
+        for stage, func in stages(lexer, text).items():
+            seconds = best_of(func, repeat).seconds
+            timings[stage] = {
+                "seconds": seconds,
+                "tokens_per_sec": tokens / seconds,
+                "mb_per_sec": len(text) / seconds / 1e6,
+            }
+        results[name] = {"characters": len(text), "tokens": tokens, "stages": timings}
+    return results
+
+
+def commit() -> str:
+    """The git commit of the working tree, if there is one."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def report(results: dict, baseline=None):
+    header = f"{'corpus':<10} {'stage':<14} {'tokens/sec':>12} {'MB/sec':>8}"
+    print(header + ("  vs baseline" if baseline else ""))
+    for name, result in results["corpora"].items():
+        for stage, timing in result["stages"].items():
+            line = (
+                f"{name:<10} {stage:<14} {timing['tokens_per_sec']:>12,.0f}"
+                f" {timing['mb_per_sec']:>8.2f}"
+            )
+            try:
+                old = baseline["corpora"][name]["stages"][stage]["seconds"]
+            except (KeyError, TypeError):
+                pass
+            else:
+                line += f"  {old / timing['seconds']:>10.2f}x"
+            print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--compare", help="show the speedup over the results in this JSON file"
+    )
+    parser.add_argument("--size", type=int, default=500_000, help="characters")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engine", choices=MathematicaLexer.engines, default="regex")
+    parser.add_argument(
+        "corpora", nargs="*", help=f"corpora to run, of {', '.join(CORPORA)}"
+    )
+    args = parser.parse_args(argv)
+    for name in args.corpora:
+        if name not in CORPORA:
+            parser.error(f"unknown corpus {name!r}")
+
+    results = {
+        "commit": commit(),
+        "version": __version__,
+        "python": platform.python_version(),
+        "pygments": pygments.__version__,
+        "platform": platform.platform(),
+        "engine": args.engine,
+        "size": args.size,
+        "repeat": args.repeat,
+        "corpora": run(args.size, args.repeat, args.engine, args.corpora or CORPORA),
+    }
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    report(results, baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
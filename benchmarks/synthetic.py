@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+"""
+Synthetic Wolfram Language code of a controllable shape, for measuring
+how the lexer scales.
+
+The code is a sequence of definitions f[x_, y_] := expression, each
+preceded by a comment. Its shape is set by:
+
+    size      the size of the code in characters
+    depth     how many levels of brackets, braces and parentheses each
+              expression nests
+    unicode   the share of operators and symbols that are Unicode
+              characters rather than ASCII ones
+    comments  how deeply each comment nests comments
+    scopes    the share of nesting levels that are Module, Block or With
+              constructs, whose local variables are used in their bodies
+
+Symbols, operators and Unicode characters are taken from the tables of
+mathics_pygments.builtins. The same arguments always give the same code.
+
+    python -m benchmarks.synthetic [--size N] [--depth N] [--unicode P]
+        [--comments N] [--scopes P] [--seed N] [-o output]
+"""
+
+import argparse
+import random
+import sys
+
+import mathics_pygments.builtins as mma
+
+# The operators that cannot stand between two operands.
+NON_BINARY = frozenset(
+    ("!", "!!", "'", "++", "--", "&", ";", "=.", "..", "...", "?", "??")
+    + ("<<", ">>", ">>>", "::", "\\!", "_", "__", "___")
+)
+BINARY_OPERATORS = [op for op in mma.OPERATORS if op not in NON_BINARY]
+UNICODE_OPERATORS = [char for char in mma.UNICODE_OPERATORS_SORTED if ord(char) > 0x7F]
+SYSTEM_SYMBOLS = sorted(mma.SYSTEM_SYMBOLS)
+UNICODE_SYMBOLS = sorted(
+    mma.UNICODE_SYSTEM_SYMBOLS | mma.UNICODE_SYSTEM_UNDEFINED_SYMBOLS
+)
+SCOPE_KEYWORDS = ("Module", "Block", "With")
+
+_WORDS = "the value of each element is computed from its neighbours".split()
+
+
+class _Generator:
+    def __init__(self, depth, unicode, comments, scopes, seed):
+        self.rng = random.Random(seed)
+        self.depth = depth
+        self.unicode = unicode
+        self.comments = comments
+        self.scopes = scopes
+        # The local variables of the enclosing scope constructs.
+        self.variables = []
+
+    def operator(self) -> str:
+        if self.rng.random() < self.unicode:
+            return self.rng.choice(UNICODE_OPERATORS)
+        return self.rng.choice(BINARY_OPERATORS)
+
+    def symbol(self) -> str:
+        rng = self.rng
+        if rng.random() < self.unicode:
+            return rng.choice(UNICODE_SYMBOLS)
+        if self.variables and rng.random() < 0.5:
+            return rng.choice(self.variables)
+        return rng.choice(SYSTEM_SYMBOLS) if rng.random() < 0.5 else "x"
+
+    def leaf(self) -> str:
+        rng = self.rng
+        kind = rng.randrange(6)
+        if kind == 0:
+            return str(rng.randint(0, 10**6))
+        if kind == 1:
+            return f"{rng.uniform(0, 100):.{rng.randint(1, 8)}f}"
+        if kind == 2:
+            return '"' + " ".join(rng.sample(_WORDS, 3)) + '"'
+        if kind == 3:
+            return rng.choice(("y", "#", "#2", "x_", "z_Integer"))
+        return self.symbol()
+
+    def expression(self) -> str:
+        # Built level by level rather than recursively, so that any depth
+        # can be generated.
+        rng = self.rng
+        opening = []
+        closing = []
+        for level in range(self.depth):
+            if rng.random() < self.scopes:
+                variable = f"v{level}"
+                opening.append(
+                    f"{rng.choice(SCOPE_KEYWORDS)}[{{{variable} = {self.leaf()}}},"
+                    f" {variable} {self.operator()} "
+                )
+                closing.append("]")
+                self.variables.append(variable)
+                continue
+            kind = rng.randrange(3)
+            if kind == 0:
+                opening.append(f"{rng.choice(SYSTEM_SYMBOLS)}[{self.leaf()}, ")
+                closing.append("]")
+            elif kind == 1:
+                opening.append(f"{{{self.leaf()}, ")
+                closing.append("}")
+            else:
+                opening.append(f"( {self.leaf()} {self.operator()} ")
+                closing.append(" )")
+        inner = f"{self.leaf()} {self.operator()} {self.leaf()}"
+        self.variables.clear()
+        return "".join(opening) + inner + "".join(reversed(closing))
+
+    def comment(self) -> str:
+        if not self.comments:
+            return ""
+        words = " ".join(self.rng.sample(_WORDS, 4))
+        return f"(* {words} " * self.comments + "*) " * self.comments + "\n"
+
+    def definition(self, number: int) -> str:
+        return f"{self.comment()}f{number}[x_, y_] := {self.expression()};\n\n"
+
+
+def generate(
+    size: int = 100_000,
+    depth: int = 3,
+    unicode: float = 0.0,
+    comments: int = 1,
+    scopes: float = 0.1,
+    seed: int = 0,
+) -> str:
+    """
+    Return about size characters of synthetic code of the given shape,
+    as described in the documentation of this module.
+    """
+    generator = _Generator(depth, unicode, comments, scopes, seed)
+    parts = []
+    length = 0
+    number = 0
+    while length < size:
+        number += 1
+        part = generator.definition(number)
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--unicode", type=float, default=0.0)
+    parser.add_argument("--comments", type=int, default=1)
+    parser.add_argument("--scopes", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="file to write instead of stdout")
+    args = parser.parse_args(argv)
+    text = generate(
+        args.size, args.depth, args.unicode, args.comments, args.scopes, args.seed
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
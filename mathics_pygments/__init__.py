@@ -3,13 +3,16 @@
 # Copyright (c) 2021, 2024 Rocky Bernstein
 # Licensed under the MIT License (https://opensource.org/licenses/MIT)
 
-from mathics_pygments.lexer import MathematicaLexer
+from mathics_pygments.lexer import FastMathematicaLexer, MathematicaLexer
+from mathics_pygments.startup import warmup
 from mathics_pygments.style import MathematicaNotebookStyle, MathematicaStyle
 from mathics_pygments.version import __version__
 
 __all__ = [
+    "FastMathematicaLexer",
     "MathematicaLexer",
     "MathematicaNotebookStyle",
     "MathematicaStyle",
     "__version__",
+    "warmup",
 ]
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Lexing and highlighting in a pool of processes: of many files, or of one
+large text split into segments.
+
+Each worker process creates one MathematicaLexer when it starts, which
+imports the symbol tables and compiles the token table, and then uses it
+for all the files it is given. Files are read in the workers, and only
+the results are sent back: the highlighted text, or the tokens with
+their token types given by name, since token types are singletons that
+do not survive pickling.
+
+A single text is split at newlines outside of comments and strings,
+preferably outside of any brackets too, found by a quick scan of the
+text. Each worker lexes one segment and goes on into the next one up to
+its first restart point (see mathics_pygments.streaming). Where that
+point is also a restart point of the next worker, both lex the same
+text from the top level, so the next worker's tokens are right from
+there on. Where it is not, because the scan was wrong about a comment
+or string, the text is lexed here until the two agree again. So the
+result does not depend on the scan. Each worker also annotates its
+tokens, as if its segment started at the top level; where a segment
+starts inside a Module, Block or With, its tokens are annotated here
+until a restart point where both this process and the worker are at
+the top level again. Without the workers argument, shorter texts, and any text when
+fewer than two CPUs are available, are lexed here instead (see
+benchmarks/bench_parallel.py).
+"""
+
+import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pygments import format as format_tokens
+
+from mathics_pygments.cache import token_type
+from mathics_pygments.lexer import MathematicaAnnotations, MathematicaLexer, MToken
+from mathics_pygments.streaming import restart_point
+
+# What the scan for split points looks at.
+SCAN = re.compile(r'\(\*|\*\)|\\.|"|[][{}()\n]', re.DOTALL)
+
+# lex_parallel() lexes shorter texts here: starting the workers and
+# sending the tokens back takes longer than lexing them.
+PARALLEL_MIN_SIZE = 1 << 20
+
+# The lexer and formatter of a worker process, set by _start_worker().
+_lexer = None
+_formatter = None
+
+
+def cpu_count() -> int:
+    """The number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _start_worker(options: dict, formatter):
+    global _lexer, _formatter
+    _lexer = MathematicaLexer(**options)
+    _formatter = formatter
+    # Lexing something once does the remaining setup, such as compiling
+    # the combined expressions of the "master" engine.
+    for _ in _lexer.get_tokens("f[x_] := x\n"):
+        pass
+
+
+def _read(path) -> bytes:
+    # Bytes are decoded by the lexer, as its "encoding" option says.
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _lex(path) -> list:
+    return [(str(token), value) for token, value in _lexer.get_tokens(_read(path))]
+
+
+def _highlight(path):
+    return format_tokens(_lexer.get_tokens(_read(path)), _formatter)
+
+
+def _run(function, paths, formatter, workers, ordered, options):
+    """
+    Generate (path, result) pairs of function(path) run for paths
+    in a pool of workers, in the order of paths or, if not ordered, as
+    they complete.
+    """
+    paths = list(paths)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_start_worker, initargs=(options, formatter)
+    ) as executor:
+        futures = [executor.submit(function, path) for path in paths]
+        try:
+            if ordered:
+                for path, future in zip(paths, futures):
+                    yield path, future.result()
+            else:
+                where = {future: path for path, future in zip(paths, futures)}
+                for future in as_completed(futures):
+                    yield where[future], future.result()
+        finally:
+            # Do not wait for files nobody asks for any more.
+            for future in futures:
+                future.cancel()
+
+
+def lex_many(paths, workers=None, ordered=True, **options):
+    """
+    Generate (path, tokens) pairs for the files at paths, where tokens is
+    the list of (token type, value) pairs that MathematicaLexer.get_tokens()
+    gives for the file. The files are lexed in a pool of worker processes,
+    by default one per CPU. Results come in the order of paths, or as they
+    are ready if ordered is false. Other keyword arguments are options of
+    MathematicaLexer.
+    """
+    for path, tokens in _run(_lex, paths, None, workers, ordered, options):
+        yield path, [(token_type(name), value) for name, value in tokens]
+
+
+def highlight_many(paths, formatter, workers=None, ordered=True, **options):
+    """
+    Generate (path, output) pairs for the files at paths, where output is
+    what pygments.highlight() gives for the file with MathematicaLexer and
+    formatter. Arguments are as for lex_many(); formatter must be picklable,
+    as the Pygments formatters are.
+    """
+    yield from _run(_highlight, paths, formatter, workers, ordered, options)
+
+
+def split_points(text: str, count: int) -> list:
+    """
+    Return up to count - 1 positions that split text into segments of
+    about the same size, each after a newline outside of comments and
+    strings, and outside of brackets where there is one nearby.
+    """
+    top_level = []
+    anywhere = []
+    comments = depth = 0
+    string = False
+    for match in SCAN.finditer(text):
+        value = match.group()
+        if comments:
+            if value == "(*":
+                comments += 1
+            elif value == "*)":
+                comments -= 1
+        elif string:
+            string = value != '"'
+        elif value == "\n":
+            (anywhere if depth else top_level).append(match.end())
+        elif value == '"':
+            string = True
+        elif value == "(*":
+            comments = 1
+        elif value in "[{(":
+            depth += 1
+        elif value in "]})" and depth:
+            depth -= 1
+
+    points = []
+    size = len(text) // max(count, 1)
+    for number in range(1, count):
+        target = number * size
+        point = None
+        for candidates in (top_level, anywhere):
+            found = bisect_left(candidates, target)
+            if found < len(candidates) and candidates[found] < target + size:
+                point = candidates[found]
+                break
+        if (
+            point is not None
+            and point < len(text)
+            and (not points or point > points[-1])
+        ):
+            points.append(point)
+    return points
+
+
+class _Segment:
+    """
+    The tokens of a segment of text, lexed and annotated by a worker as
+    if the segment started at the top level.
+
+    The tokens are given by three lists: their positions in the whole
+    text, the numbers of their token types in names, and their values.
+    local gives the raw token types of the tokens annotated as local
+    variables, by token number. The restart points are given by three
+    lists too: their positions, the number of tokens before each, and
+    whether the worker was inside a scope there. So few of these are
+    objects the garbage collector has to go through, which would
+    otherwise take most of the time of unpickling them. state is the
+    scope state at the last restart point, where the tokens of the
+    worker end, unless complete, which tells whether they run to the
+    end of the whole text.
+    """
+
+    def __init__(self):
+        self.indices, self.types, self.values = [], [], []
+        self.names = []
+        self.local = {}
+        self.points, self.counts, self.scoped = [], [], bytearray()
+        self.state = None
+        self.complete = False
+
+    def restart(self, point: int):
+        """The number of the restart point at point, or None."""
+        number = bisect_left(self.points, point)
+        if number < len(self.points) and self.points[number] == point:
+            return number
+        return None
+
+    def tokens(self, start: int, end: int):
+        """The annotated tokens from number start to end."""
+        names = [token_type(name) for name in self.names]
+        return zip(
+            self.indices[start:end],
+            map(names.__getitem__, self.types[start:end]),
+            self.values[start:end],
+        )
+
+    def raw_tokens(self, start: int, end: int):
+        """The raw tokens from number start to end."""
+        names = [token_type(name) for name in self.names]
+        local = self.local
+        for number in range(start, end):
+            token = names[local.get(number, self.types[number])]
+            yield self.indices[number], token, self.values[number]
+
+
+def _lex_segment(text: str, start: int, end: int, last: bool) -> _Segment:
+    """
+    Lex and annotate text, the text from position start on, up to its
+    first restart point at or after end. last tells whether text runs to
+    the end of the whole text.
+    """
+    segment = _Segment()
+    add_index = segment.indices.append
+    add_type = segment.types.append
+    add_value = segment.values.append
+    names = segment.names
+    # The numbers of the token types in names.
+    numbers = {}
+    annotations = MathematicaAnnotations()
+    annotate = annotations.annotate
+    limit = len(text) if last else len(text) - 2
+    count = 0
+    for item in _lexer.get_raw_tokens(text):
+        index, token, value = item
+        if index >= limit:
+            return segment
+        annotated = annotate(item)[1]
+        if annotated is not token:
+            if token not in numbers:
+                numbers[token] = len(names)
+                names.append(str(token))
+            segment.local[count] = numbers[token]
+        number = numbers.get(annotated)
+        if number is None:
+            number = numbers[annotated] = len(names)
+            names.append(str(annotated))
+        add_index(start + index)
+        add_type(number)
+        add_value(value)
+        count += 1
+        if token is MToken.GROUP or token is MToken.WHITESPACE:
+            point = restart_point(text, index, token, value)
+            if point and point <= limit:
+                segment.points.append(start + point)
+                segment.counts.append(count)
+                segment.scoped.append(bool(annotations.keyword or annotations.frames))
+                if start + point >= end:
+                    segment.state = annotations.get_state()
+                    return segment
+    segment.complete = last
+    return segment
+
+
+def _tokens_parallel(lexer, text: str, workers, segments):
+    """
+    Generate the annotated tokens of text, lexed and annotated in
+    segments by a pool of workers, and put together here as the module
+    docstring says.
+    """
+    points = [0] + split_points(text, segments) + [len(text)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_start_worker, initargs=(lexer.options, None)
+    ) as executor:
+        futures = []
+        for number in range(len(points) - 1):
+            start, end = points[number], points[number + 1]
+            stop = points[min(number + 2, len(points) - 1)]
+            futures.append(
+                executor.submit(
+                    _lex_segment, text[start:stop], start, end, stop == len(text)
+                )
+            )
+        try:
+            results = [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    annotations = MathematicaAnnotations()
+    annotate = annotations.annotate
+    top_level = annotations.get_state()
+
+    def takeover(point, number):
+        """
+        The first worker after worker number with a restart point at
+        point, the number of its tokens before it and whether it was at
+        the top level there, or None.
+        """
+        for number in range(number + 1, len(results)):
+            segment = results[number]
+            restart = segment.restart(point)
+            if restart is not None:
+                return number, segment.counts[restart], not segment.scoped[restart]
+        return None
+
+    # The scope state here, and whether the worker whose tokens are next
+    # was at the top level where they start.
+    state, top = top_level, True
+    number, count = 0, 0
+    while True:
+        segment = results[number]
+        if segment.complete:
+            pos, end = len(text), len(segment.values)
+        elif segment.points:
+            pos, end = segment.points[-1], segment.counts[-1]
+        else:
+            pos, end = 0, 0
+
+        # The tokens of the worker are right once both are at the top
+        # level, provided its scope state at the end of them is known.
+        known = segment.complete or segment.state is not None
+        if state != top_level or not top or not known:
+            annotations.set_state(state)
+            for restart, restart_count in enumerate(segment.counts):
+                if count < restart_count <= end:
+                    for item in segment.raw_tokens(count, restart_count):
+                        yield annotate(item)
+                    count = restart_count
+                    if known and not (
+                        segment.scoped[restart]
+                        or annotations.keyword
+                        or annotations.frames
+                    ):
+                        break
+            else:
+                for item in segment.raw_tokens(count, end):
+                    yield annotate(item)
+                count = end
+            state = annotations.get_state()
+        if count < end:
+            yield from segment.tokens(count, end)
+            state = segment.state
+        if segment.complete:
+            return
+
+        # Go on with the next worker whose tokens are right from pos, or
+        # lex and annotate here until there is one.
+        found = takeover(pos, number)
+        if found is None:
+            annotations.set_state(state)
+            for index, token, value in lexer.get_raw_tokens(text[pos:]):
+                yield annotate((pos + index, token, value))
+                if token is MToken.GROUP or token is MToken.WHITESPACE:
+                    point = restart_point(text, pos + index, token, value)
+                    found = takeover(point, number)
+                    if found is not None:
+                        break
+            else:
+                return
+            state = annotations.get_state()
+        number, count, top = found
+
+
+def lex_parallel(lexer, text: str, workers=None, segments=None):
+    """
+    Generate the (index, token, value) triples that
+    lexer.get_uncached_tokens() gives for text, lexing and annotating
+    segments of it in a pool of workers, by default one per CPU, using
+    four segments per worker by default.
+
+    Unless workers is given, text is lexed here when there are fewer than
+    two CPUs or it is shorter than PARALLEL_MIN_SIZE characters, as
+    starting the pool then takes longer than it saves. So is text for the
+    "mathics-scanner" engine, as the Mathics3 tokeniser cannot start in
+    the middle of a text.
+    """
+    if lexer.engine == "mathics-scanner" or (
+        workers is None and (cpu_count() < 2 or len(text) < PARALLEL_MIN_SIZE)
+    ):
+        yield from lexer.get_uncached_tokens(text)
+        return
+    if workers is None:
+        workers = cpu_count()
+    if segments is None:
+        segments = 4 * workers
+    yield from _tokens_parallel(lexer, text, workers, segments)
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Caches of the tokens of texts lexed before.
+
+Texts are looked up by a hash of their contents together with the class
+and options of the lexer, so the texts themselves are not kept.
+TokenCache keeps the tokens of a text in memory as a tuple, which every
+hit shares. DiskCache keeps them, and optionally the formatted output,
+in an SQLite database, so that they last from one build to the next.
+"""
+
+import marshal
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import NamedTuple
+
+from pygments import format as format_tokens
+from pygments.token import string_to_tokentype
+
+from mathics_pygments.version import __version__
+
+# How precisely DiskCache records when entries were last used, in seconds.
+USE_RESOLUTION = 60
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+def lexer_key(lexer) -> tuple:
+    """The class and options of lexer, as far as they affect its tokens."""
+    options = sorted(
+        (name, repr(value)) for name, value in lexer.options.items() if name != "cache"
+    )
+    return type(lexer).__module__, type(lexer).__qualname__, tuple(options)
+
+
+def text_digest(text: str) -> bytes:
+    return blake2b(text.encode("utf-8", "surrogatepass")).digest()
+
+
+class TokenCache:
+    """
+    A thread-safe cache of the tokens of MathematicaLexer, which evicts the
+    least recently used texts when it holds more than max_entries texts or,
+    if max_size is given, more than max_size characters of text.
+
+    Pass it to a lexer in its "cache" option; lexers may share a cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_size=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._size = 0
+
+    def get_tokens(self, lexer, text: str) -> tuple:
+        """
+        Return the (index, token, value) triples of
+        lexer.get_tokens_unprocessed(text) as a tuple, from the cache if
+        they are in it.
+        """
+        key = (lexer_key(lexer), text_digest(text))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Lexing is done outside of the lock, so that other threads are not
+        # held up by it. Two threads may lex the same text at the same time;
+        # the tokens are the same.
+        tokens = tuple(lexer.get_uncached_tokens(text))
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (tokens, len(text))
+                self._size += len(text)
+                self._evict()
+        return tokens
+
+    def _evict(self):
+        entries = self._entries
+        while entries and (
+            len(entries) > self.max_entries
+            or (self.max_size is not None and self._size > self.max_size)
+        ):
+            _, (_, size) = entries.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+            )
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._size = 0
+
+
+@lru_cache(maxsize=None)
+def symbol_table_hash() -> str:
+    """A hash of the symbol tables of mathics_pygments.builtins."""
+    import mathics_pygments.tables as tables
+
+    with open(tables.__file__, "rb") as f:
+        return blake2b(f.read()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def token_type(name: str):
+    """The token type named name, such as "Token.Name.Variable"."""
+    return string_to_tokentype(name)
+
+
+class DiskCache:
+    """
+    A cache of the tokens of MathematicaLexer, and optionally of formatted
+    output, in the SQLite database at path, for use from one run to the
+    next.
+
+    Entries are keyed by the hash of the text, the versions of
+    mathics_pygments, Python and its marshal format, which the entries
+    are stored in, the hash of the symbol tables, the lexer class and
+    options and, for output, the formatter class, options and style. An
+    entry that cannot be read all the same is taken as missing. When
+    the entries take more than max_size bytes, the least recently used
+    ones are removed until they take at most three quarters of that.
+
+    Any number of processes can use the same database: every write is a
+    transaction of its own, and SQLite serializes them. The total size
+    of the entries is kept in a row of its own, updated by each write, so
+    that a write does not have to add up the sizes of all the entries.
+    """
+
+    def __init__(self, path, max_size: int = 256 << 20):
+        self.path = path
+        self.max_size = max_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " key BLOB PRIMARY KEY, value BLOB NOT NULL,"
+                    " size INTEGER NOT NULL, used REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_used ON entries(used)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS totals ("
+                    " name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+                )
+                total = connection.execute(
+                    "SELECT value FROM totals WHERE name = 'size'"
+                ).fetchone()
+                if total is None:
+                    connection.execute(
+                        "INSERT OR IGNORE INTO totals"
+                        " SELECT 'size', TOTAL(size) FROM entries"
+                    )
+        finally:
+            # Not kept open, so that processes forked before the cache is
+            # used do not inherit a connection, which SQLite does not allow.
+            connection.close()
+            del self._local.connection
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections cannot be shared between threads.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def _key(self, *parts) -> bytes:
+        digest = blake2b()
+        versions = (__version__, sys.version_info[:2], marshal.version)
+        for part in versions + (symbol_table_hash(),) + parts:
+            digest.update(repr(part).encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def _get(self, key: bytes):
+        connection = self._connect()
+        with connection:
+            row = connection.execute(
+                "SELECT value, used FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            value = None
+            if row is not None:
+                try:
+                    value = marshal.loads(row[0])
+                except (EOFError, ValueError, TypeError):
+                    # Written by something else, or cut short; the entry
+                    # is replaced when it is stored again.
+                    pass
+            if value is None:
+                with self._lock:
+                    self._misses += 1
+                return None
+            # Recording every use would make every hit a write.
+            now = time.time()
+            if now - row[1] > USE_RESOLUTION:
+                connection.execute(
+                    "UPDATE entries SET used = ? WHERE key = ?", (now, key)
+                )
+        with self._lock:
+            self._hits += 1
+        return value
+
+    def _put(self, key: bytes, value):
+        value = marshal.dumps(value)
+        connection = self._connect()
+        with connection:
+            # Take the write lock before reading the size of the entry
+            # replaced, so that no other process changes it in between.
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            connection.execute(
+                "UPDATE totals SET value = value + ? WHERE name = 'size'",
+                (len(value) - (row[0] if row else 0),),
+            )
+            (size,) = connection.execute(
+                "SELECT value FROM totals WHERE name = 'size'"
+            ).fetchone()
+            if size > self.max_size:
+                self._evict(connection)
+
+    def _evict(self, connection):
+        # The sizes are added up again here, which is rare, in case a
+        # version of this class that did not keep the total wrote entries.
+        (size,) = connection.execute("SELECT TOTAL(size) FROM entries").fetchone()
+        target = self.max_size * 3 // 4
+        removed = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM entries ORDER BY used"
+        ):
+            if size <= target:
+                break
+            removed.append((key,))
+            size -= entry_size
+        connection.executemany("DELETE FROM entries WHERE key = ?", removed)
+        connection.execute(
+            "UPDATE totals SET value = ? WHERE name = 'size'", (int(size),)
+        )
+
+    def get_tokens(self, lexer, text: str) -> tuple:
+        """
+        Return the (index, token, value) triples of
+        lexer.get_tokens_unprocessed(text) as a tuple, from the cache if
+        they are in it.
+        """
+        key = self._key("tokens", lexer_key(lexer), text_digest(text))
+        value = self._get(key)
+        if value is not None:
+            return tuple(
+                (index, token_type(token), value) for index, token, value in value
+            )
+        tokens = tuple(lexer.get_uncached_tokens(text))
+        stored = [(index, str(token), value) for index, token, value in tokens]
+        self._put(key, stored)
+        return tokens
+
+    def highlight(self, text: str, lexer, formatter):
+        """
+        Return what pygments.highlight(text, lexer, formatter) returns, from
+        the cache if it is in it. Output must be text, not bytes as with
+        the "encoding" option of formatters.
+        """
+        style = getattr(formatter, "style", None)
+        key = self._key(
+            "output",
+            lexer_key(lexer),
+            type(formatter).__module__,
+            type(formatter).__qualname__,
+            sorted((name, repr(value)) for name, value in formatter.options.items()),
+            style and f"{style.__module__}.{style.__qualname__}",
+            text_digest(text),
+        )
+        output = self._get(key)
+        if output is None:
+            output = format_tokens(lexer.get_tokens(text), formatter)
+            self._put(key, output)
+        return output
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of the cache. Hits and misses are those of
+        this DiskCache object; evictions are not counted.
+        """
+        (entries, size) = (
+            self._connect()
+            .execute("SELECT COUNT(*), TOTAL(size) FROM entries")
+            .fetchone()
+        )
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, 0, entries, int(size))
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM entries")
+            connection.execute("UPDATE totals SET value = 0 WHERE name = 'size'")
+        with self._lock:
+            self._hits = self._misses = 0
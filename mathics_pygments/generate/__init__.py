@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""Build-time generators of the data files of mathics_pygments."""
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Build mathics_pygments/tables.py, the symbol tables that
+mathics_pygments.builtins loads, from data/mma-tables.json and
+generate/symbol_tables.py.
+
+Every table is deduplicated and sorted, so that the output depends only
+on the contents of the sources. The tables are written in the form that
+mathics_pygments.builtins exports them, built from tuples of string
+constants, which the compiled module keeps and loads in one piece.
+
+    python -m mathics_pygments.generate.build_tables [-o output] [--check]
+"""
+
+import argparse
+import json
+import os.path as osp
+import sys
+
+from mathics_pygments.generate import symbol_tables
+
+PACKAGE_DIR = osp.dirname(osp.dirname(osp.abspath(__file__)))
+JSON_TABLES = osp.join(PACKAGE_DIR, "data", "mma-tables.json")
+OUTPUT = osp.join(PACKAGE_DIR, "tables.py")
+
+HEADER = """\
+# -*- coding: utf-8 -*-
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+# Generated by mathics_pygments/generate/build_tables.py from
+# data/mma-tables.json and generate/symbol_tables.py. Do not edit.
+# fmt: off
+"""
+
+
+def tables() -> dict:
+    """Return the tables to write, by name."""
+    with open(JSON_TABLES, encoding="utf-8") as f:
+        data = json.load(f)
+    unicode_operators = set(data["unicode-operators"])
+    unicode_operators |= symbol_tables.UNICODE_OPERATORS_EXTRA
+    # Each table is written as kind(values).
+    return {
+        "OPERATORS": ("", sorted(set(data["ascii-operators"]))),
+        "GROUPINGS": ("", sorted(set(symbol_tables.GROUPINGS))),
+        "SYSTEM_SYMBOLS": ("frozenset", sorted(symbol_tables.SYSTEM_SYMBOLS)),
+        "UNICODE_OPERATORS": ("", sorted(unicode_operators)),
+        "UNICODE_OPERATOR_NAMES": (
+            "dict",
+            sorted(data["unicode-operators"].items()),
+        ),
+        "UNICODE_GROUPINGS": ("frozenset", sorted(symbol_tables.UNICODE_GROUPINGS)),
+        "UNICODE_SYSTEM_SYMBOLS": (
+            "frozenset",
+            sorted(symbol_tables.UNICODE_SYSTEM_SYMBOLS),
+        ),
+        "UNICODE_SYSTEM_UNDEFINED_SYMBOLS": (
+            "frozenset",
+            sorted(symbol_tables.UNICODE_SYSTEM_UNDEFINED_SYMBOLS),
+        ),
+    }
+
+
+def literal(value) -> str:
+    """A Python literal for value, a string or a tuple of strings."""
+    if isinstance(value, tuple):
+        return "(" + ", ".join(map(literal, value)) + ")"
+    # JSON strings are Python strings, and json quotes them the way black
+    # does.
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render() -> str:
+    """Return the text of tables.py."""
+    parts = [HEADER]
+    for name, (kind, values) in tables().items():
+        # Tuples are constants of the compiled module; a frozenset or dict
+        # made from one at import takes it over, and the tuple is freed
+        # with the code of the module.
+        parts.append(f"\n{name} = {kind}{'(' if kind else ''}(\n")
+        parts.extend(f"    {literal(value)},\n" for value in values)
+        parts.append(f"){')' if kind else ''}\n")
+    return "".join(parts)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", default=OUTPUT, help="file to write")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check that the output file is up to date",
+    )
+    args = parser.parse_args(argv)
+    text = render()
+    if args.check:
+        try:
+            with open(args.output, encoding="utf-8") as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current != text:
+            print(f"{args.output} is out of date", file=sys.stderr)
+            return 1
+        return 0
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Incremental re-lexing for editors.
+
+A TokenStream keeps the tokens of a text together with checkpoints:
+token boundaries at which lexing can restart, each with the
+MathematicaAnnotations scope state at that point. After an edit, lexing
+restarts at the last checkpoint before the edit. It stops at the first
+old checkpoint after the edit where the scope state is the same again,
+and the old tokens from there on are reused.
+
+Checkpoints are placed right after the grouping tokens ")", "[", "]",
+"{", "}" and ",". Such a token is only produced in the "root" state. No
+rule of MathematicaLexer, successful or not, reads past one of these
+characters without including it in its match. The one exception is a
+"[" preceded by a backslash, as in an incomplete \\[Name]; no checkpoint
+is placed there. So the tokens before a checkpoint depend only on the
+text before it, and the tokens after it only on the scope state and the
+text after it.
+
+Lexing from a checkpoint is correct for the "regex", "master" and
+"scanner" engines. The "mathics-scanner" engine carries state of its own
+between tokens, so for it every edit re-lexes the whole text.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from mathics_pygments.lexer import MathematicaAnnotations, MToken
+
+# Grouping tokens after which lexing can restart.
+BARRIERS = frozenset(")[]{},")
+
+# Minimum distance, in characters, between checkpoints.
+CHECKPOINT_INTERVAL = 256
+
+
+class TokenStream:
+    """
+    The annotated tokens of a text, as produced by
+    MathematicaLexer.get_tokens_unprocessed(), kept up to date through
+    edits of the text with edit().
+
+    Tokens are kept as (gap, token, value) triples, where gap is the
+    distance from the end of the previous token, so that they need not be
+    moved after an edit. The gap is 0 except after the parts of a match
+    that bygroups() leaves out. Iterating over a TokenStream gives
+    (index, token, value) triples.
+    """
+
+    def __init__(self, lexer, text: str):
+        self.lexer = lexer
+        self.text = ""
+        self.items = []
+        # The checkpoints, by position: their positions, the number of tokens
+        # before them and the scope states there. The first one is the start
+        # of the text.
+        self.positions = [0]
+        self.numbers = [0]
+        self.states = [MathematicaAnnotations().get_state()]
+        self.edit(0, 0, text)
+
+    def __iter__(self):
+        index = 0
+        for gap, token, value in self.items:
+            index += gap
+            yield index, token, value
+            index += len(value)
+
+    def __len__(self):
+        return len(self.items)
+
+    def edit(self, offset: int, deleted: int, inserted: str):
+        """
+        Replace the deleted characters of the text at offset with inserted,
+        and re-lex what this changes.
+
+        The stream is updated in place. It is returned together with the
+        range (start, end) of the new text covered by the tokens that differ
+        from the old ones.
+        """
+        if offset < 0 or deleted < 0 or offset + deleted > len(self.text):
+            raise ValueError(
+                f"edit at {offset} of {deleted} characters is outside the text"
+            )
+        text = self.text[:offset] + inserted + self.text[offset + deleted :]
+        delta = len(inserted) - deleted
+        positions = self.positions
+        first = bisect_right(positions, offset) - 1
+        start = positions[first]
+        number = self.numbers[first]
+        # Old tokens can be reused from the checkpoints after the edit.
+        reusable = bisect_left(positions, offset + deleted, first + 1)
+
+        items, checkpoints, stop = self._lex(
+            text, first, reusable, offset + len(inserted), delta
+        )
+        if stop is None:
+            stop = len(positions)
+            old_stop = len(self.items)
+        else:
+            old_stop = self.numbers[stop]
+        changed = self._changed_range(start, items, self.items[number:old_stop])
+
+        shift = number + len(items) - old_stop
+        self.text = text
+        self.items[number:old_stop] = items
+        new_positions, new_numbers, new_states = (
+            zip(*checkpoints) if checkpoints else ((), (), ())
+        )
+        self.positions[first + 1 :] = new_positions + tuple(
+            pos + delta for pos in positions[stop:]
+        )
+        self.numbers[first + 1 :] = new_numbers + tuple(
+            token_number + shift for token_number in self.numbers[stop:]
+        )
+        self.states[first + 1 : stop] = new_states
+        return self, changed
+
+    def _lex(self, text: str, first: int, reusable: int, edit_end: int, delta: int):
+        """
+        Lex text from checkpoint number first. Stop at the first of the old
+        checkpoints from number reusable on that lexing reaches, shifted by
+        delta and past edit_end, in the same scope state.
+
+        Return the tokens, the new checkpoints as (position, token number,
+        scope state) triples, and the number of the old checkpoint where
+        lexing stopped, or None.
+        """
+        positions = self.positions
+        start = positions[first]
+        number = self.numbers[first]
+        annotations = MathematicaAnnotations()
+        annotations.set_state(self.states[first])
+        annotate = annotations.annotate
+        restartable = self.lexer.engine != "mathics-scanner"
+
+        items = []
+        checkpoints = []
+        last = start
+        end = 0
+        raw_tokens = self.lexer.get_raw_tokens(text[start:] if start else text)
+        for index, token, value in raw_tokens:
+            item = annotate((index, token, value))
+            items.append((index - end, item[1], value))
+            end = index + len(value)
+            if not (restartable and token is MToken.GROUP and value in BARRIERS):
+                continue
+            pos = start + end
+            if value == "[" and text[pos - 2 : pos - 1] == "\\":
+                continue
+            if pos >= edit_end:
+                old = bisect_left(positions, pos - delta, reusable)
+                if (
+                    old < len(positions)
+                    and positions[old] == pos - delta
+                    and annotations.get_state() == self.states[old]
+                ):
+                    return items, checkpoints, old
+            if pos - last >= CHECKPOINT_INTERVAL:
+                last = pos
+                checkpoints.append((pos, number + len(items), annotations.get_state()))
+        return items, checkpoints, None
+
+    @staticmethod
+    def _changed_range(start: int, items: list, old_items: list) -> tuple:
+        """
+        Return the range of text covered by the re-lexed tokens items,
+        starting at start, that differ from the old_items they replace.
+        """
+        head = 0
+        limit = min(len(items), len(old_items))
+        while head < limit and items[head] == old_items[head]:
+            head += 1
+        tail = 0
+        limit -= head
+        while tail < limit and items[-1 - tail] == old_items[-1 - tail]:
+            tail += 1
+        changed_start = start + sum(gap + len(value) for gap, _, value in items[:head])
+        changed_end = changed_start + sum(
+            gap + len(value) for gap, _, value in items[head : len(items) - tail]
+        )
+        return changed_start, changed_end
@@ -3,12 +3,82 @@
 # Copyright (c) 2016 rsmenon
 # Licensed under the MIT License (https://opensource.org/licenses/MIT)
 
-from collections import defaultdict
+from collections import namedtuple
+from threading import Lock, RLock
 
-from pygments.lexer import RegexLexer, bygroups, include, words
+from pygments.lexer import RegexLexer, RegexLexerMeta, bygroups, include, words
 from pygments.token import Token as PToken
+from pygments.util import Future, OptionError, get_bool_opt, get_choice_opt
 
-import mathics_pygments.builtins as mma
+from mathics_pygments.master import MasterRegex
+
+# mathics_pygments.builtins, once load_tables() has imported it. Loading
+# the symbol tables takes a good part of the time it takes to import this
+# module, and listing the Pygments lexers imports it.
+mma = None
+_load_lock = Lock()
+# Held while Pygments processes the token table of a lexer class.
+_process_lock = RLock()
+
+
+def load_tables():
+    """
+    Import the symbol tables of mathics_pygments.builtins, and fill
+    UNICODE_TOKENS from them. This is done when the first MathematicaLexer
+    or MathematicaAnnotations is created.
+    """
+    global mma
+    if mma is not None:
+        return
+    with _load_lock:
+        if mma is not None:
+            return
+        import mathics_pygments.builtins as builtins
+
+        # Tables are applied from lowest to highest precedence, so that a
+        # character listed in more than one table gets the token of the
+        # highest one: system symbols, then groupings, then operators, then
+        # undefined symbols.
+        for table, token in (
+            (builtins.UNICODE_SYSTEM_UNDEFINED_SYMBOLS, MToken.SYMBOL),
+            (builtins.UNICODE_OPERATORS, MToken.OPERATOR),
+            (builtins.UNICODE_GROUPINGS, MToken.GROUP),
+            (builtins.UNICODE_SYSTEM_SYMBOLS, MToken.BUILTIN),
+        ):
+            UNICODE_TOKENS.update(dict.fromkeys(table, token))
+        mma = builtins
+
+
+class _OptimizedWords:
+    """
+    A Regex attribute holding the regex_opt() pattern of a table of
+    mathics_pygments.builtins, computed when it is first read.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        load_tables()
+        pattern = words(getattr(mma, self.table)).get()
+        setattr(owner, self.name, pattern)
+        return pattern
+
+
+class _RegexAttribute(Future):
+    """
+    An attribute of Regex in a token table, read when RegexLexer processes
+    the table on the first instantiation of the lexer.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def get(self):
+        return getattr(Regex, self.name)
 
 
 class Regex:
@@ -23,11 +93,25 @@ class Regex:
     BASE_NUMBER = rf"{INTEGER}\s*\^\^\s*({REAL}|{INTEGER})"
     SCIENTIFIC_NUMBER = rf"({REAL}|{INTEGER})\s*\*\^\s*{INTEGER}"
     PATTERNS = rf"{SYMBOLS}\_{{1,3}}({SYMBOLS})?|({SYMBOLS})?\_{{1,3}}{SYMBOLS}"
+    # PATTERNS|SYMBOLS in one pass. A shorter match of SYMBOLS is never
+    # followed by "_", so PATTERNS matches where SYMBOLS followed by "_"
+    # does, and its second alternative only where there is no symbol
+    # before the blanks.
+    NAMES = rf"{SYMBOLS}(\_{{1,3}}({SYMBOLS})?)?|\_{{1,3}}{SYMBOLS}"
     SLOTS = rf"#{SYMBOLS}|#\"{SYMBOLS}\"|#{{1,2}}[0-9]*"
     MESSAGES = rf"(::)(\\s*)({SYMBOLS})"
-    GROUPINGS = words(mma.GROUPINGS).get()
-    OPERATORS = words(mma.OPERATORS).get()
-    MATHICS_MESSAGE = "(\\w+)::(\\w+):( )(.+)"
+    GROUPINGS = _OptimizedWords("GROUPINGS")
+    OPERATORS = _OptimizedWords("OPERATORS")
+    # Only at the start of a word. From inside a word, (\w+) ends where it
+    # does from the start, and retrying it at every position of a long run
+    # such as "____" would take quadratic time. So where an earlier rule
+    # takes the start of a word, as in 1α::tag: text or x_α::tag: text,
+    # the rest of it is not a message but the tokens of the other rules.
+    MATHICS_MESSAGE = "(?<!\\w)(\\w+)::(\\w+):( )(.+)"
+    # Runs of non-ASCII characters. No other root rule starts on these,
+    # except MATHICS_MESSAGE which can start on a (non-ASCII) word
+    # character, so word and non-word runs are kept apart.
+    UNICODE = r"[^\x00-\x7f\w\s]+|[^\W\x00-\x7f]+"
 
 
 class MToken:
@@ -59,7 +143,236 @@ class MToken:
     WHITESPACE = PToken.Text.Whitespace
 
 
-class MathematicaLexer(RegexLexer):
+# Classification of every character in the builtins.UNICODE_* tables,
+# filled by load_tables().
+UNICODE_TOKENS = {}
+
+
+def symbol_token(value):
+    """
+    The token of the symbol value: BUILTIN for a symbol of System`, by
+    name or as System`name, SYMBOL otherwise.
+    """
+    if value in mma.SYSTEM_SYMBOLS or (
+        value.startswith("System`") and value[7:] in mma.SYSTEM_SYMBOLS
+    ):
+        return MToken.BUILTIN
+    return MToken.SYMBOL
+
+
+def symbol_or_pattern(lexer, match):
+    """
+    Callback for Regex.NAMES: a pattern if it has blanks, otherwise a
+    symbol classified by symbol_token().
+    """
+    value = match.group()
+    if "_" in value:
+        yield match.start(), MToken.PATTERN, value
+    else:
+        yield match.start(), symbol_token(value), value
+
+
+def unicode_run(lexer, match):
+    """
+    Callback for Regex.UNICODE: split a run of non-ASCII characters into
+    one token per character, classified by UNICODE_TOKENS, or UNKNOWN if
+    it is in none of the Unicode tables.
+    """
+    index = match.start()
+    get_token = UNICODE_TOKENS.get
+    unknown = MToken.UNKNOWN
+    for char in match.group():
+        yield index, get_token(char, unknown), char
+        index += 1
+
+
+def merge_strings(tokens):
+    """
+    Generate tokens, with the tokens of each string literal, from its
+    opening quote to its closing one, merged into a single token.
+    """
+    string = MToken.STRING
+    start = None
+    parts = []
+    for item in tokens:
+        index, token, value = item
+        if start is not None:
+            if token is string:
+                parts.append(value)
+                # No token in a string is a lone quote but the closing one.
+                if value != '"':
+                    continue
+            yield start, string, "".join(parts)
+            start = None
+            if token is string:
+                continue
+        if token is string and value == '"':
+            start = index
+            parts = [value]
+            continue
+        yield item
+    if start is not None:
+        yield start, string, "".join(parts)
+
+
+def merge_tokens(tokens):
+    """
+    Generate tokens, with each run of adjacent tokens of the same type
+    merged into a single token.
+    """
+    start = None
+    parts = []
+    last = None
+    for index, token, value in tokens:
+        if token is last:
+            parts.append(value)
+            continue
+        if parts:
+            yield start, last, "".join(parts)
+        start = index
+        last = token
+        parts = [value]
+    if parts:
+        yield start, last, "".join(parts)
+
+
+# The length from which elide_data() elides a string, and the number of
+# its characters it keeps.
+ELIDE_LENGTH = 64
+ELIDE_KEEP = 16
+
+COMPRESSED_DATA = ("CompressedData", "System`CompressedData")
+
+
+def elided(text: str) -> str:
+    """The placeholder of elide_data() for the text of a string."""
+    if len(text) < ELIDE_LENGTH:
+        return text
+    return f"{text[:ELIDE_KEEP]}… ({len(text):,} characters)"
+
+
+def elide_data(tokens):
+    """
+    Generate tokens, with the text of each string given to CompressedData
+    replaced by a short placeholder, for display. The tokens of a string
+    may have been merged by merge_strings().
+    """
+    string = MToken.STRING
+    # 0 outside of CompressedData[...], 1 after CompressedData, 2 after
+    # its "[", 3 in its string.
+    state = 0
+    for item in tokens:
+        index, token, value = item
+        if state and token is MToken.WHITESPACE:
+            yield item
+            continue
+        if state == 1 and token is MToken.GROUP and value == "[":
+            state = 2
+        elif state == 2 and token is string and value == '"':
+            state = 3
+        elif state == 2 and token is string:
+            # A merged string.
+            state = 0
+            end = len(value) - 1 if len(value) > 1 and value[-1] == '"' else len(value)
+            item = index, token, '"' + elided(value[1:end]) + value[end:]
+        elif state == 3 and token is string and value != '"':
+            item = index, token, elided(value)
+        else:
+            state = 0
+            if token is MToken.BUILTIN and value in COMPRESSED_DATA:
+                state = 1
+        yield item
+
+
+class LexerState(
+    namedtuple("LexerState", "stack scope", defaults=(("root",), (False, ())))
+):
+    """
+    The state of MathematicaLexer at some point of a text: the RegexLexer
+    state stack and the MathematicaAnnotations scope state. A LexerState
+    is hashable and can be pickled, so that editors can keep one per line.
+    """
+
+    __slots__ = ()
+
+    @property
+    def comment_depth(self) -> int:
+        """The number of comments open."""
+        return self.stack.count("comments")
+
+
+def _collect(items: list, annotate, raw_tokens):
+    """
+    Append the annotated tokens of the raw_tokens generator to items, and
+    return the value that the generator returns.
+    """
+    while True:
+        try:
+            item = next(raw_tokens)
+        except StopIteration as stop:
+            return stop.value
+        items.append(annotate(item))
+
+
+class _LexerMeta(RegexLexerMeta):
+    """
+    RegexLexerMeta, processing the token table of a class in one thread at
+    a time: a lexer created while mathics_pygments.warmup() processes the
+    table on another thread waits for it rather than doing it again.
+    """
+
+    def __call__(cls, *args, **kwds):
+        if "_tokens" in cls.__dict__:
+            return RegexLexerMeta.__call__(cls, *args, **kwds)
+        with _process_lock:
+            return RegexLexerMeta.__call__(cls, *args, **kwds)
+
+
+class MathematicaLexer(RegexLexer, metaclass=_LexerMeta):
+    """
+    Lexer for Mathematica/Wolfram Language source code.
+
+    Additional options accepted:
+
+    `engine`
+        How the token table below is matched. ``"regex"`` (the default)
+        tries the rules of a state one at a time as RegexLexer does;
+        ``"master"`` matches all of them with one combined regular
+        expression per state (see mathics_pygments.master); ``"scanner"``
+        does not use regular expressions at all but a hand-written scanner
+        for this token table (see mathics_pygments.scanner). All of them
+        produce the same tokens.
+
+        ``"mathics-scanner"`` does not use the token table: it takes the
+        tokens of the Mathics3 tokeniser from mathics_scanner, which
+        follows the Wolfram Language more closely but is slower (see
+        mathics_pygments.tokeniser).
+
+    `cache`
+        A TokenCache that keeps the tokens of the texts lexed, so that
+        lexing a text again only looks them up (see
+        mathics_pygments.cache). True uses a TokenCache shared by all
+        lexers. A DiskCache, or the name of its database file, keeps the
+        tokens from one run to the next. The default is not to cache.
+
+    `mergestrings`
+        If true, give each string literal, from its opening quote to its
+        closing one, as a single token rather than as a token for each
+        quote and one for the text between them. Default: False.
+
+    `elidedata`
+        If true, replace the text of the strings given to CompressedData,
+        which can run to megabytes in generated files, with a short
+        placeholder, for display. The tokens then no longer make up the
+        text lexed. Default: False.
+
+    `mergetokens`
+        If true, merge adjacent tokens of the same type, such as the
+        pieces of a comment or a run of operators, into one, so that
+        formatters have fewer tokens to go through. The tokens still make
+        up the text lexed. Default: False.
+    """
+
     name = "Mathematica"
     aliases = [
         "mathematica",
@@ -83,32 +396,28 @@ class MathematicaLexer(RegexLexer):
             (r"\(\*", MToken.COMMENT, "comments"),
             (r'"', MToken.STRING, "strings"),
             include("numbers"),
-            (Regex.PATTERNS, MToken.PATTERN),
-            (Regex.SYMBOLS, MToken.SYMBOL),
+            (Regex.NAMES, symbol_or_pattern),
             (
                 Regex.MATHICS_MESSAGE,
                 bygroups(MToken.OPERATOR, MToken.WHITESPACE, MToken.TEXT, MToken.TEXT),
             ),
             (Regex.SLOTS, MToken.SLOT),
-            (Regex.GROUPINGS, MToken.GROUP),
+            (_RegexAttribute("GROUPINGS"), MToken.GROUP),
             (
                 Regex.MESSAGES,
                 bygroups(MToken.OPERATOR, MToken.WHITESPACE, MToken.MESSAGE),
             ),
-            (Regex.OPERATORS, MToken.OPERATOR),
+            (_RegexAttribute("OPERATORS"), MToken.OPERATOR),
             (r"\s+", MToken.WHITESPACE),
-            # Note IDENTIFIER should come after tokens that have IDENTIFIER parts, like SYMBOLS.
-            # Otherwise, we may have System`foo matching identifier System over Symbol System`foo
-            #
-            # I don't understand why this is not a problem in  pygments-mathematica.
-            (Regex.IDENTIFIER, MToken.SYMBOL),
+            # Non-ASCII characters would otherwise fall through to Pygments'
+            # per-character error recovery.
+            (Regex.UNICODE, unicode_run),
         ],
         "comments": [
-            (r"[^\*\(\)]+", MToken.COMMENT),
-            (r"\*[^\)]", MToken.COMMENT),
             (r"\(\*", MToken.COMMENT, "#push"),
             (r"\*\)", MToken.COMMENT, "#pop"),
-            (r"\([^\*]?|[^\*]?\)", MToken.COMMENT),
+            # Everything up to the next (* or *), as one token.
+            (r"(?:[^*(]+|\*(?!\))|\((?!\*))+", MToken.COMMENT),
         ],
         "numbers": [
             (Regex.BASE_NUMBER, MToken.NUMBER),
@@ -117,215 +426,392 @@ class MathematicaLexer(RegexLexer):
             (Regex.INTEGER, MToken.NUMBER),
         ],
         "strings": [
-            (r'[^"\\]+', MToken.STRING),
-            (r'^[\\"]', MToken.STRING),
-            (r"(\\n|\\r)", MToken.STRING),
-            (r'\\"', MToken.STRING),
-            (r"\\", MToken.STRING),
+            # The text up to the closing quote, as one token. A backslash
+            # escapes the character after it, whatever it is.
+            (r'(?:[^"\\]+|\\[\s\S]?)+', MToken.STRING),
             (r'"', MToken.STRING, "#pop"),
         ],
     }
 
-    def get_tokens_unprocessed(self, text, stack=("root",)):
-        ma = MathematicaAnnotations()
-        annotations = (ma.builtins, ma.unicode, ma.lexical_scope)
-        for index, token, value in RegexLexer.get_tokens_unprocessed(self, text):
-            result = (index, token, value)
-            for func in annotations:
-                result = func(*result)
-
-            yield result
+    engines = ("regex", "master", "scanner", "mathics-scanner")
 
+    # The cache of lexers created with the option cache=True.
+    shared_cache = None
 
-class _State(dict):
-    def __getattr__(self, attr):
-        return self.get(attr)
-
-    __setattr__ = dict.__setitem__
-
-
-class MathematicaAnnotations:
-    def __init__(self):
-        self.scope = _State()
-        self._reset_scope_state()
+    def __init__(self, **options):
+        load_tables()
+        self.engine = get_choice_opt(options, "engine", self.engines, "regex")
+        self.cache = self._get_cache(options)
+        self.mergestrings = get_bool_opt(options, "mergestrings", False)
+        self.elidedata = get_bool_opt(options, "elidedata", False)
+        self.mergetokens = get_bool_opt(options, "mergetokens", False)
+        RegexLexer.__init__(self, **options)
 
     @staticmethod
-    def builtins(index, token, value):
-        if token is MToken.SYMBOL and value in mma.SYSTEM_SYMBOLS:
-            return index, MToken.BUILTIN, value
-        else:
-            return index, token, value
+    def _get_cache(options):
+        cache = options.get("cache")
+        if cache is None:
+            return None
+        from mathics_pygments.cache import DiskCache, TokenCache
+
+        if isinstance(cache, (DiskCache, TokenCache)):
+            return cache
+        try:
+            if not get_bool_opt(options, "cache", False):
+                return None
+        except OptionError:
+            # A file name, as given on the pygmentize command line.
+            return DiskCache(cache)
+        if MathematicaLexer.shared_cache is None:
+            MathematicaLexer.shared_cache = TokenCache()
+        return MathematicaLexer.shared_cache
 
-    @staticmethod
-    def unicode(index, token, value):
-        if token is MToken.UNKNOWN:
-            if value in mma.UNICODE_SYSTEM_SYMBOLS:
-                new_token = MToken.BUILTIN
-            elif value in mma.UNICODE_GROUPINGS:
-                new_token = MToken.GROUP
-            elif value in mma.UNICODE_OPERATORS:
-                new_token = MToken.OPERATOR
-            elif value in mma.UNICODE_SYSTEM_UNDEFINED_SYMBOLS:
-                new_token = MToken.SYMBOL
-            else:
-                new_token = MToken.UNKNOWN
-            return index, new_token, value
+    def get_tokens_unprocessed(self, text, stack=("root",)):
+        if self.cache is not None and tuple(stack) == ("root",):
+            tokens = iter(self.cache.get_tokens(self, text))
         else:
-            return index, token, value
+            tokens = self.get_uncached_tokens(text, stack)
+        return self.filter_tokens(tokens)
+
+    def get_uncached_tokens(self, text, stack=("root",)):
+        """
+        Generate the tokens of text as get_tokens_unprocessed() does, but
+        without looking them up in the cache or applying the mergestrings,
+        elidedata and mergetokens options.
+        """
+        annotate = MathematicaAnnotations().annotate
+        for item in self.get_raw_tokens(text, stack):
+            yield annotate(item)
+
+    def get_line_tokens(self, line, state=LexerState()):
+        """
+        Lex line, starting in state, a LexerState. Return the list of its
+        (index, token, value) triples, with indices counted from the start
+        of line, and the LexerState at its end, from which the next line
+        can be lexed.
+
+        line should include its newline. Tokens then never continue past
+        it, so lexing a text line by line splits tokens at the ends of
+        lines but otherwise gives the tokens of the whole text. The one
+        exception is a number whose parts are on different lines, such as
+        1.5\n*^3.
+
+        Lines are lexed with the "scanner" engine if it is selected, and
+        with the equivalent "master" engine otherwise.
+        """
+        annotations = MathematicaAnnotations()
+        annotations.set_state(state.scope)
+        if self.engine == "scanner":
+            from mathics_pygments.scanner import get_tokens_unprocessed
+
+            raw_tokens = get_tokens_unprocessed(line, state.stack)
+        else:
+            master = MasterRegex.for_lexer(type(self))
+            raw_tokens = master.get_tokens_unprocessed(self, line, state.stack)
+        tokens = []
+        stack = _collect(tokens, annotations.annotate, raw_tokens)
+        return tokens, LexerState(stack, annotations.get_state())
+
+    def get_token_stream(self, text):
+        """
+        Return the tokens of text as a TokenStream, which can re-lex only
+        the part of text that an edit changes (see
+        mathics_pygments.incremental).
+        """
+        from mathics_pygments.incremental import TokenStream
+
+        return TokenStream(self, text)
+
+    def get_tokens_streaming(self, source, chunk_size=1 << 16):
+        """
+        Generate the (index, token, value) triples of the text of source, a
+        file object opened in text mode or an iterable of strings, as
+        get_tokens_unprocessed() does for the whole text, while reading it
+        in chunks (see mathics_pygments.streaming).
+        """
+        from mathics_pygments.streaming import get_tokens_unprocessed
+
+        return self.filter_tokens(get_tokens_unprocessed(self, source, chunk_size))
+
+    def get_tokens_parallel(self, text, workers=None, segments=None):
+        """
+        Generate the (index, token, value) triples of text, as
+        get_tokens_unprocessed() does, lexing segments of text in a pool of
+        worker processes (see mathics_pygments.batch). Without workers, the
+        number of CPUs is used, and text is lexed here where a pool would
+        not be faster.
+        """
+        from mathics_pygments.batch import lex_parallel
+
+        return self.filter_tokens(lex_parallel(self, text, workers, segments))
+
+    def get_tokens_mapped(self, path, block_size=1 << 16):
+        """
+        Generate the (index, token, value) triples of the UTF-8 file at
+        path, with indices in bytes, from a memory map of it rather than
+        its text (see mathics_pygments.mapped).
+        """
+        from mathics_pygments.mapped import get_tokens_unprocessed
+
+        return self.filter_tokens(get_tokens_unprocessed(self, path, block_size))
+
+    def filter_tokens(self, tokens):
+        """
+        Apply the mergestrings, elidedata and mergetokens options to the
+        annotated tokens, an iterator.
+        """
+        if self.mergestrings:
+            tokens = merge_strings(tokens)
+        if self.elidedata:
+            tokens = elide_data(tokens)
+        if self.mergetokens:
+            tokens = merge_tokens(tokens)
+        return tokens
+
+    def get_raw_tokens(self, text, stack=("root",)):
+        """
+        Return the tokens of the selected engine before they are annotated
+        by MathematicaAnnotations.
+        """
+        if self.engine == "mathics-scanner" and tuple(stack) == ("root",):
+            # The Mathics3 tokeniser can only start at the top level; from
+            # inside a comment or string, the regex engine is used.
+            from mathics_pygments.tokeniser import get_tokens_unprocessed
+
+            return get_tokens_unprocessed(text)
+        if self.engine == "scanner":
+            # Imported here, as the scanner uses the token tables of this module.
+            from mathics_pygments.scanner import get_tokens_unprocessed
+
+            return get_tokens_unprocessed(text, stack)
+        if self.engine == "master":
+            master = MasterRegex.for_lexer(type(self))
+            return master.get_tokens_unprocessed(self, text, stack)
+        return RegexLexer.get_tokens_unprocessed(self, text, stack)
+
+
+class FastMathematicaLexer(MathematicaLexer):
+    """
+    MathematicaLexer using the "scanner" engine by default, for batch
+    highlighting. It is registered under its own aliases and claims no
+    file names, so that guess_lexer() and friends keep picking
+    MathematicaLexer.
+    """
 
-    def _reset_scope_state(self):
-        # keyword = True denotes the presence of a trigger symbol such as Block, With, Module
-        # When keyword is True and is followed by a [, then the parser enters an active state
-        self.scope.keyword = False
-        self.scope.active = False
-
-        # level tracks the nestedness of local scopes (e.g., Block[{x = Block[{y = ...}, ...]}, ...])
-        self.scope.level = 0
-
-        # The next three variables are stacks that track opening and closing brackets, braces and
-        # other groupings (associations, angle brackets, etc.) at each level.
-        # Braces are tracked only immediately after entering an active scope, which is where the
-        # local variables are defined.
-        self.scope.brackets = defaultdict(int)
-        self.scope.braces = defaultdict(int)
-        self.scope.other_groups = defaultdict(int)
-
-        # stack_state is a tuple of the above three counters at each level when the parser is inside
-        # a local variable definition region. i.e. when the parser is at { in Block[{x = 1}, x]
-        self.scope.stack_state = defaultdict(int)
-
-        # variables is the set of symbols/builtins that have been identified as being in a local
-        # scope at each level. rhs is True when the parser is in the RHS of an assignment (= or :=)
-        self.scope.variables = defaultdict(set)
-        self.scope.rhs = defaultdict(bool)
-
-    def _reset_scope_level(self, level):
-        scope_vars = (
-            self.scope.brackets,
-            self.scope.braces,
-            self.scope.other_groups,
-            self.scope.stack_state,
-            self.scope.variables,
-            self.scope.rhs,
-        )
-        [var.pop(level) for var in scope_vars if level in var]
+    name = "Mathematica (scanner)"
+    aliases = ["mathematica-fast", "mathics-fast", "wl-fast"]
+    filenames = []
+    mimetypes = []
 
-    def _get_stack_state(self, level):
-        return (
-            self.scope.brackets[level],
-            self.scope.braces[level],
-            self.scope.other_groups[level],
-        )
+    def __init__(self, **options):
+        options.setdefault("engine", "scanner")
+        MathematicaLexer.__init__(self, **options)
 
-    def lexical_scope(self, index, token, value):
-        level = self.scope.level
-        if token is MToken.WHITESPACE:
-            return index, token, value
 
-        if self.scope.active and token is MToken.GROUP and value in ("<|", " ", " "):
-            self.scope.other_groups[level] += 1
-            return index, token, value
-        elif self.scope.active and token is MToken.GROUP and value in ("|>", " ", " "):
-            self.scope.other_groups[level] -= 1
-            return index, token, value
+# Symbols that open a local scope when followed by "[".
+SCOPE_KEYWORDS = ("Block", "With", "Module")
 
-        if self.scope.active and token is MToken.GROUP and value == "}":
-            if self.scope.braces[level]:
-                self.scope.braces[level] -= 1
 
-            if not self.scope.braces[level]:
-                self.scope.rhs[level] = False
+class _ScopeFrame:
+    """
+    Scope state of one Block, With or Module level.
 
-            return index, token, value
+    A frame is pushed on the "[" that follows a scope keyword and popped
+    on its matching "]".
+    """
 
-        if self.scope.active and token is MToken.GROUP and value == "]":
-            if self.scope.brackets[level]:
-                self.scope.brackets[level] -= 1
-                if not self.scope.brackets[level] and level:
-                    self._reset_scope_level(level)
-                    self.scope.level -= 1
+    __slots__ = (
+        "brackets",
+        "braces",
+        "other_groups",
+        "stack_state",
+        "variables",
+        "rhs",
+    )
 
-                if not self.scope.level:
-                    self._reset_scope_state()
+    def __init__(self):
+        # Counters for the opening and closing brackets, braces and other
+        # groupings (associations, angle brackets, etc.) at this level.
+        # Braces are tracked only immediately after entering an active
+        # scope, which is where the local variables are defined.
+        self.brackets = 0
+        self.braces = 0
+        self.other_groups = 0
+
+        # stack_state is a tuple of the above three counters when the parser
+        # enters the local variable definition region. i.e. when the parser
+        # is at { in Block[{x = 1}, x]
+        self.stack_state = None
+
+        # variables is the set of symbols/builtins that have been identified
+        # as being in the local scope, or None before the local variable
+        # definition region has been seen. rhs is True when the parser is in
+        # the RHS of an assignment (= or :=)
+        self.variables = None
+        self.rhs = False
+
+    def get_stack_state(self):
+        return self.brackets, self.braces, self.other_groups
+
+    def get_state(self):
+        variables = self.variables
+        if variables is not None:
+            variables = frozenset(variables)
+        return (
+            self.brackets,
+            self.braces,
+            self.other_groups,
+            self.stack_state,
+            variables,
+            self.rhs,
+        )
 
-            return index, token, value
+    @classmethod
+    def from_state(cls, state):
+        frame = cls()
+        (
+            frame.brackets,
+            frame.braces,
+            frame.other_groups,
+            frame.stack_state,
+            variables,
+            frame.rhs,
+        ) = state
+        if variables is not None:
+            frame.variables = set(variables)
+        return frame
 
-        if token is MToken.BUILTIN and value in ("Block", "With", "Module"):
-            self.scope.keyword = True
-            return index, token, value
 
-        if token is MToken.GROUP and value == "[":
-            # Enter an active state only if the preceding non-whitespace token is one of the scope
-            # keyword symbols. If it is already in an active state, the counter is incremented.
-            if self.scope.keyword:
-                self.scope.active = True
-                self.scope.level += 1
-                self.scope.keyword = False
+class MathematicaAnnotations:
+    def __init__(self):
+        load_tables()
+        self._reset_scope_state()
 
-            if self.scope.active:
-                self.scope.brackets[self.scope.level] += 1
+    def _reset_scope_state(self):
+        # keyword = True denotes the presence of a trigger symbol such as Block, With, Module
+        # When keyword is True and is followed by a [, then the parser enters an active state
+        self.keyword = False
 
-            return index, token, value
+        # frames tracks the nestedness of local scopes (e.g., Block[{x = Block[{y = ...}, ...]}, ...]),
+        # one _ScopeFrame per level. The parser is in an active state when it is not empty.
+        self.frames = []
 
-        if self.scope.active and token is MToken.GROUP and value == "{":
-            if level not in self.scope.variables:
-                # The parser is not yet in the local variables section so initialize counters and
-                # containers and take a snapshot of the stack state. The frozen stack state is used
-                # later to identify the end of the RHS in an assignment expression.
-                self.scope.variables[level] = set()
-                self.scope.braces[level] += 1
-                self.scope.stack_state[level] = self._get_stack_state(level)
-            elif level in self.scope.variables and self.scope.braces[level]:
-                # The parser is inside the local variables section.
-                self.scope.braces[level] += 1
-            else:
-                # In all other cases, don't modify the stack.
-                pass
+    def get_state(self):
+        """
+        Return the scope state as a hashable value for set_state(). Equal
+        states annotate the rest of a token stream in the same way.
+        """
+        return self.keyword, tuple(frame.get_state() for frame in self.frames)
 
-            return index, token, value
+    def set_state(self, state):
+        self.keyword, frames = state
+        self.frames = [_ScopeFrame.from_state(frame) for frame in frames]
 
-        if (
-            self.scope.active
-            and self.scope.braces[level]
-            and token in (MToken.SYMBOL, MToken.BUILTIN)
-        ):
-            # The parser is inside the local variables section and on a builtin or a generic symbol
-            # token. If it isn't in the RHS of an assignment expression, then modify the token and
-            # add the value to the list of local scope variables at this level.
-            if not self.scope.rhs[level]:
-                self.scope.variables[level].add(value)
-                return index, MToken.LOCAL_SCOPE, value
-            else:
-                return index, token, value
-
-        elif self.scope.active and self.scope.braces[level]:
-            # If the parser is on an assignment operator, mark rsh = True so that symbols from the
-            # RHS of the assignment are not considered as local variables.
-            # The RHS value is reset when:
-            #   1. The parser is on a comma inside the local variables section, and the stack state
-            #      is the same as when it entered the section. For example, in
-            #      Block[{x = 1, y = 2}, x + y], the stack state is the same at left brace and the first comma.
-            #      But in Block[{x = {1, a}, y = 2}, x + y], the stack state is not the same at left brace
-            #      and the first comma, so it is still part of the RHS.
-            #   2. If it has exited the local variables section (handled earlier).
-            if token is MToken.OPERATOR and value in ("=", ":="):
-                self.scope.rhs[level] = True
-            elif (
-                token is MToken.GROUP
-                and value == ","
-                and self._get_stack_state(level) == self.scope.stack_state[level]
-            ):
-                self.scope.rhs[level] = False
+    # builtins(), unicode() and lexical_scope() were the passes of the
+    # annotation pipeline that annotate() replaced, and are kept for code
+    # that calls them.
 
+    @staticmethod
+    def builtins(index, token, value):
+        if token is MToken.SYMBOL and value in mma.SYSTEM_SYMBOLS:
+            return index, MToken.BUILTIN, value
+        else:
             return index, token, value
 
-        elif self.scope.active and token in (MToken.SYMBOL, MToken.BUILTIN):
-            # If the code has reached here, the parser is outside the local variables section and in
-            # the body of the scoping function.
-            if value in self.scope.variables[level]:
-                return index, MToken.LOCAL_SCOPE, value
-            else:
-                return index, token, value
+    @staticmethod
+    def unicode(index, token, value):
+        if token is MToken.UNKNOWN:
+            return index, UNICODE_TOKENS.get(value, token), value
+        else:
+            return index, token, value
 
-        self.scope.keyword = False
-        return index, token, value
+    def lexical_scope(self, index, token, value):
+        return self.annotate((index, token, value))
+
+    def annotate(self, item):
+        """
+        Annotate a single (index, token, value) item from the RegexLexer:
+        the local variables of Block, Module and With, and their uses in
+        its body, become LOCAL_SCOPE tokens. The engines have told builtins
+        from other symbols already (see symbol_token()).
+
+        This dispatches on the token type once and only touches the scope
+        state that the token type can change. item is returned as is when
+        its token does not change.
+        """
+        token = item[1]
+        if token is MToken.WHITESPACE:
+            return item
+
+        frames = self.frames
+        if token is MToken.SYMBOL or token is MToken.BUILTIN:
+            value = item[2]
+            if token is MToken.BUILTIN and value in SCOPE_KEYWORDS:
+                self.keyword = True
+                return item
+            if frames:
+                frame = frames[-1]
+                if frame.braces:
+                    if not frame.rhs:
+                        frame.variables.add(value)
+                        return item[0], MToken.LOCAL_SCOPE, value
+                elif frame.variables is None:
+                    frame.variables = set()
+                elif value in frame.variables:
+                    return item[0], MToken.LOCAL_SCOPE, value
+                return item
+
+        elif token is MToken.GROUP:
+            value = item[2]
+            if value == "[":
+                if self.keyword:
+                    frames.append(_ScopeFrame())
+                    self.keyword = False
+                if frames:
+                    frames[-1].brackets += 1
+                return item
+            if frames and self._scope_group(frames[-1], value):
+                return item
+
+        elif frames and frames[-1].braces:
+            if token is MToken.OPERATOR and item[2] in ("=", ":="):
+                frames[-1].rhs = True
+            return item
+
+        self.keyword = False
+        return item
+
+    def _scope_group(self, frame, value):
+        """
+        Update the scope state for a grouping token inside an active scope.
+        Return False if the token should reset the keyword state instead.
+        """
+        if value in ("<|", " ", " "):
+            frame.other_groups += 1
+        elif value in ("|>", " ", " "):
+            frame.other_groups -= 1
+        elif value == "}":
+            if frame.braces:
+                frame.braces -= 1
+            if not frame.braces:
+                frame.rhs = False
+        elif value == "]":
+            if frame.brackets:
+                frame.brackets -= 1
+                if not frame.brackets:
+                    self.frames.pop()
+                if not self.frames:
+                    self.keyword = False
+        elif value == "{":
+            if frame.variables is None:
+                frame.variables = set()
+                frame.braces += 1
+                frame.stack_state = frame.get_stack_state()
+            elif frame.braces:
+                frame.braces += 1
+        elif frame.braces:
+            if value == "," and frame.get_stack_state() == frame.stack_state:
+                frame.rhs = False
+        else:
+            return False
+        return True
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Lexing of memory-mapped files.
+
+The file is mapped instead of read, and is decoded as UTF-8 one block at
+a time for lexing with mathics_pygments.streaming, so the text of the
+file never exists as one Python string. Blocks of ASCII, which is all of
+a notebook as Mathematica writes it, decode with a plain copy.
+
+Token indices are byte offsets into the file. They are the character
+indices, plus the bytes that the non-ASCII token values before a token
+take beyond their length; only these values are encoded again to
+measure them. The text that bygroups() leaves out between tokens is
+ASCII. Bytes that are not valid UTF-8 are
+decoded with the "surrogateescape" error handler, so that they keep
+their length too.
+"""
+
+import codecs
+import mmap
+
+from mathics_pygments import streaming
+
+# Number of bytes decoded at a time.
+BLOCK_SIZE = 1 << 16
+
+
+def read_blocks(buffer, block_size: int = BLOCK_SIZE):
+    """
+    Generate the text of the UTF-8 bytes in buffer, a memory map, a block at
+    a time.
+    """
+    decode = codecs.getincrementaldecoder("utf-8")("surrogateescape").decode
+    # Pages that have been decoded are given back, so that they do not
+    # count towards the memory of the process. Offsets have to be aligned
+    # to pages for this.
+    release = getattr(mmap, "MADV_DONTNEED", None)
+    if block_size % mmap.PAGESIZE:
+        release = None
+    size = len(buffer)
+    for start in range(0, size, block_size):
+        end = min(start + block_size, size)
+        yield decode(buffer[start:end], end == size)
+        if release is not None:
+            buffer.madvise(release, start, end - start)
+
+
+def byte_offsets(tokens):
+    """
+    Generate the (index, token, value) triples of tokens with their indices
+    counted in bytes instead of characters.
+    """
+    # Bytes more than characters so far.
+    extra = 0
+    for item in tokens:
+        value = item[2]
+        if extra:
+            yield item[0] + extra, item[1], value
+        else:
+            yield item
+        if not value.isascii():
+            extra += len(value.encode("utf-8", "surrogateescape")) - len(value)
+
+
+def get_tokens_unprocessed(lexer, path, block_size: int = BLOCK_SIZE):
+    """
+    Generate the (index, token, value) triples that
+    lexer.get_uncached_tokens() gives for the UTF-8 text of the file at
+    path, with indices in bytes.
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped.
+        if not f.seek(0, 2):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            tokens = streaming.get_tokens_unprocessed(
+                lexer, read_blocks(buffer, block_size), block_size
+            )
+            yield from byte_offsets(tokens)
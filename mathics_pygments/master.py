@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+A single-regex-per-state engine for RegexLexer token tables.
+
+Pygments' RegexLexer tries the rules of the current state one after the
+other at every position. Here the rules of each state are joined into one
+alternation, each rule wrapped in its own group, so that each position
+costs a single regular expression call. Python's alternation is ordered,
+so the first rule that matches wins, just as in RegexLexer; the group
+that matched tells which rule it was.
+
+Each state further has one such regular expression per first character,
+leaving out the rules that cannot start with it.
+"""
+
+import re
+from threading import Lock
+
+from pygments.token import Error, Text, _TokenType
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+ASCII = frozenset(range(128))
+
+_compile_lock = Lock()
+
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: re.compile(r"\d").match,
+    sre_constants.CATEGORY_NOT_DIGIT: re.compile(r"\D").match,
+    sre_constants.CATEGORY_SPACE: re.compile(r"\s").match,
+    sre_constants.CATEGORY_NOT_SPACE: re.compile(r"\S").match,
+    sre_constants.CATEGORY_WORD: re.compile(r"\w").match,
+    sre_constants.CATEGORY_NOT_WORD: re.compile(r"\W").match,
+}
+
+
+class _UnknownOpcode(Exception):
+    pass
+
+
+def _first_in(items) -> tuple:
+    """First characters of a character class."""
+    negate = False
+    members = set()
+    non_ascii = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            if av < 128:
+                members.add(av)
+            else:
+                non_ascii = True
+        elif op is sre_constants.RANGE:
+            low, high = av
+            members.update(range(low, min(high, 127) + 1))
+            non_ascii = non_ascii or high > 127
+        elif op is sre_constants.CATEGORY and av in _CATEGORIES:
+            test = _CATEGORIES[av]
+            members.update(code for code in ASCII if test(chr(code)))
+            non_ascii = True
+        else:
+            raise _UnknownOpcode(op)
+    if negate:
+        return ASCII - members, True
+    return members, non_ascii
+
+
+def _first(items) -> tuple:
+    """
+    Return the ASCII character codes a parsed regular expression can start
+    with, whether it can start with a non-ASCII character, and whether it
+    can match the empty string. The answer may include characters that
+    cannot start a match, but never leaves out one that can.
+    """
+    chars = set()
+    non_ascii = False
+    for op, av in items:
+        nullable = False
+        if op is sre_constants.LITERAL:
+            if av < 128:
+                chars.add(av)
+            else:
+                non_ascii = True
+        elif op in (sre_constants.NOT_LITERAL, sre_constants.ANY):
+            chars.update(ASCII)
+            non_ascii = True
+        elif op is sre_constants.IN:
+            first_chars, first_non_ascii = _first_in(av)
+            chars.update(first_chars)
+            non_ascii = non_ascii or first_non_ascii
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                first_chars, first_non_ascii, branch_nullable = _first(branch)
+                chars.update(first_chars)
+                non_ascii = non_ascii or first_non_ascii
+                nullable = nullable or branch_nullable
+        elif op is sre_constants.SUBPATTERN:
+            first_chars, non_ascii_, nullable = _first(av[-1])
+            chars.update(first_chars)
+            non_ascii = non_ascii or non_ascii_
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            first_chars, non_ascii_, nullable = _first(av[2])
+            chars.update(first_chars)
+            non_ascii = non_ascii or non_ascii_
+            nullable = nullable or av[0] == 0
+        elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # Zero-width; ignoring a lookahead only makes the answer larger.
+            nullable = True
+        else:
+            raise _UnknownOpcode(op)
+        if not nullable:
+            return chars, non_ascii, False
+    return chars, non_ascii, True
+
+
+def first_chars(regex) -> tuple:
+    """
+    Return the ASCII character codes a compiled regular expression can
+    start a match with, and whether it can start one with a non-ASCII
+    character. Patterns that can match the empty string, or that use
+    constructs we do not analyze, can start with anything.
+    """
+    if regex.flags & re.IGNORECASE:
+        return ASCII, True
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+        chars, non_ascii, nullable = _first(parsed)
+    except _UnknownOpcode:
+        nullable = True
+    if nullable:
+        return ASCII, True
+    return frozenset(chars), non_ascii
+
+
+def _compile_rules(rules) -> tuple:
+    """
+    Join rules, a list of (rexmatch, action, new_state) triples, into one
+    alternation. Return its match method and a list, indexed by group
+    number, giving the rule whose group it is.
+    """
+    if not rules:
+        return None, None
+    patterns = []
+    by_group = [None]
+    flags = 0
+    for rule in rules:
+        regex = rule[0].__self__
+        flags |= regex.flags
+        patterns.append(f"({regex.pattern})")
+        by_group.append(rule)
+        by_group.extend([None] * regex.groups)
+    return re.compile("|".join(patterns), flags).match, by_group
+
+
+def compile_state(rules) -> tuple:
+    """
+    Compile the processed rules of one RegexLexer state, a list of
+    (rexmatch, action, new_state) triples.
+
+    Return a dictionary from each ASCII character to the master regex, as
+    returned by _compile_rules(), of the rules that can start with that
+    character, and the master regex to use for any other character. A rule
+    that cannot start on a character cannot win there, so leaving it out
+    does not change which rule matches first.
+    """
+    firsts = [first_chars(rule[0].__self__) for rule in rules]
+    masters = {}
+
+    def master(selected):
+        if selected not in masters:
+            masters[selected] = _compile_rules([rules[i] for i in selected])
+        return masters[selected]
+
+    dispatch = {}
+    for code in sorted(ASCII):
+        selected = tuple(i for i, (chars, _) in enumerate(firsts) if code in chars)
+        dispatch[chr(code)] = master(selected)
+    other = master(tuple(i for i, (_, non_ascii) in enumerate(firsts) if non_ascii))
+    return dispatch, other
+
+
+class MasterRegex:
+    """
+    Token generator equivalent to RegexLexer.get_tokens_unprocessed() for
+    the token table of a RegexLexer subclass.
+    """
+
+    def __init__(self, tokendefs: dict):
+        self.states = {
+            state: compile_state(rules) for state, rules in tokendefs.items()
+        }
+
+    @classmethod
+    def for_lexer(cls, lexer_class):
+        """
+        Return the MasterRegex of a RegexLexer subclass, compiling it the first
+        time. lexer_class must have been instantiated once so that Pygments has
+        processed its token table.
+        """
+        master = lexer_class.__dict__.get("_master_regex")
+        if master is None:
+            with _compile_lock:
+                master = lexer_class.__dict__.get("_master_regex")
+                if master is None:
+                    master = cls(lexer_class._tokens)
+                    lexer_class._master_regex = master
+        return master
+
+    def get_tokens_unprocessed(self, lexer, text, stack=("root",)):
+        """
+        Generate the (index, token, value) triples of text, starting with the
+        given state stack, and return the final state stack.
+        """
+        states = self.states
+        statestack = list(stack)
+        dispatch, other = states[statestack[-1]]
+        pos = 0
+        end = len(text)
+        while pos < end:
+            match, by_group = dispatch.get(text[pos], other)
+            m = match(text, pos) if match else None
+            if m:
+                rexmatch, action, new_state = by_group[m.lastindex]
+                if type(action) is _TokenType:
+                    yield pos, action, m.group()
+                elif action is not None:
+                    # Callbacks such as bygroups() need the groups of their own
+                    # regular expression.
+                    yield from action(lexer, rexmatch(text, pos))
+                pos = m.end()
+                if new_state is not None:
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == "#push":
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == "#push":
+                        statestack.append(statestack[-1])
+                    dispatch, other = states[statestack[-1]]
+            elif text[pos] == "\n":
+                # At EOL, reset state to "root", as RegexLexer does.
+                statestack = ["root"]
+                dispatch, other = states["root"]
+                yield pos, Text.Whitespace, "\n"
+                pos += 1
+            else:
+                yield pos, Error, text[pos]
+                pos += 1
+        return tuple(statestack)
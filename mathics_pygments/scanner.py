@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+A hand-written scanner for MathematicaLexer's token table.
+
+Instead of trying regular expressions, the scanner dispatches on the
+current character and follows the rules of MathematicaLexer.tokens with
+explicit loops over character classes. It produces exactly the
+(index, token, value) stream of RegexLexer.get_tokens_unprocessed() for
+that table, quirks included. Where a rule in lexer.Regex can backtrack,
+the functions below list the alternatives in the order Python's regular
+expression engine tries them.
+
+tests/test_engines.py checks the scanner against the regex engine.
+"""
+
+import string
+
+import mathics_pygments.builtins as mma
+from mathics_pygments.lexer import UNICODE_TOKENS, MToken, load_tables, symbol_token
+
+load_tables()
+
+DIGITS = frozenset(string.digits)
+IDENTIFIER_START = frozenset(string.ascii_letters + "$")
+IDENTIFIER_CHARS = frozenset(string.ascii_letters + string.digits + "$")
+SYMBOL_START = IDENTIFIER_START | {"`", "\\", "_"}
+
+# Regex.OPERATORS matches the longest operator at a position.
+OPERATORS = frozenset(mma.OPERATORS)
+OPERATOR_LENGTHS = sorted({len(op) for op in OPERATORS}, reverse=True)
+OPERATOR_START = frozenset(op[0] for op in OPERATORS)
+
+SYSTEM_SYMBOLS = mma.SYSTEM_SYMBOLS
+
+GROUPINGS = frozenset(mma.GROUPINGS)
+GROUPING_START = frozenset(grouping[0] for grouping in GROUPINGS)
+
+# After a run of digits, the number rules other than INTEGER can only
+# continue on one of these characters or on whitespace.
+NUMBER_CONTINUATION = frozenset(".`^*")
+
+
+def is_word(char: str) -> bool:
+    """The \\w character class of str regular expressions."""
+    return char.isalnum() or char == "_"
+
+
+def digits_end(text: str, pos: int, n: int) -> int:
+    """End of [0-9]* at pos."""
+    while pos < n and text[pos] in DIGITS:
+        pos += 1
+    return pos
+
+
+def whitespace_end(text: str, pos: int, n: int) -> int:
+    """End of \\s* at pos."""
+    while pos < n and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def identifier_end(text: str, pos: int, n: int) -> int:
+    """End of Regex.IDENTIFIER at pos, or -1."""
+    if pos < n and text[pos] in IDENTIFIER_START:
+        pos += 1
+        while pos < n and text[pos] in IDENTIFIER_CHARS:
+            pos += 1
+        return pos
+    return -1
+
+
+def segment_end(text: str, pos: int, n: int) -> int:
+    """End of an IDENTIFIER or a NAMED_CHARACTER at pos, or -1."""
+    end = identifier_end(text, pos, n)
+    if end < 0 and text.startswith("\\[", pos):
+        end = identifier_end(text, pos + 2, n)
+        if end < 0 or not text.startswith("]", end):
+            return -1
+        end += 1
+    return end
+
+
+def symbol_end(text: str, pos: int, n: int) -> int:
+    """End of Regex.SYMBOLS at pos, or -1."""
+    if pos < n and text[pos] in IDENTIFIER_START:
+        end = pos + 1
+        while end < n and text[end] in IDENTIFIER_CHARS:
+            end += 1
+    else:
+        if text.startswith("`", pos):
+            pos += 1
+        end = segment_end(text, pos, n)
+        if end < 0:
+            return -1
+    while text.startswith("`", end):
+        next_end = segment_end(text, end + 1, n)
+        if next_end < 0:
+            # The optional trailing backquote.
+            return end + 1
+        end = next_end
+    return end
+
+
+def blanks_end(text: str, pos: int) -> int:
+    """End of _{1,3} at pos, which must start with an underscore."""
+    end = pos + 1
+    while end < pos + 3 and text.startswith("_", end):
+        end += 1
+    return end
+
+
+def float_ends(text: str, pos: int, n: int) -> list:
+    """Ends of the matches of Regex.FLOAT at pos, in the order they are tried."""
+    ends = []
+    integer = digits_end(text, pos, n)
+    # ({INTEGER})?[.][0-9]+
+    if text.startswith(".", integer):
+        fraction = digits_end(text, integer + 1, n)
+        if fraction > integer + 1:
+            ends.append(fraction)
+    # {INTEGER}[.]
+    if integer > pos and text.startswith(".", integer):
+        ends.append(integer + 1)
+    return ends
+
+
+def real_ends(text: str, pos: int, n: int) -> list:
+    """Ends of the matches of Regex.REAL at pos, in the order they are tried."""
+    ends = []
+    integer = digits_end(text, pos, n)
+    mantissas = ([integer] if integer > pos else []) + float_ends(text, pos, n)
+    # ({INTEGER}|{FLOAT})`({INTEGER}|{FLOAT})?
+    for mantissa in mantissas:
+        if text.startswith("`", mantissa):
+            start = mantissa + 1
+            precision = digits_end(text, start, n)
+            if precision > start:
+                ends.append(precision)
+            ends.extend(float_ends(text, start, n))
+            ends.append(start)
+    # {FLOAT}
+    ends.extend(float_ends(text, pos, n))
+    return ends
+
+
+def number_end(text: str, pos: int, n: int) -> int:
+    """
+    End of the first of the "numbers" rules to match at pos, or -1.
+    Shorter matches of [0-9]+ are never followed by a non-digit, so only
+    the longest one is considered.
+    """
+    integer = digits_end(text, pos, n)
+    if integer > pos and not (
+        integer < n
+        and (text[integer] in NUMBER_CONTINUATION or text[integer].isspace())
+    ):
+        return integer
+
+    if integer > pos:
+        # BASE_NUMBER: {INTEGER}\s*\^\^\s*({REAL}|{INTEGER})
+        caret = whitespace_end(text, integer, n)
+        if text.startswith("^^", caret):
+            start = whitespace_end(text, caret + 2, n)
+            ends = real_ends(text, start, n)
+            if ends:
+                return ends[0]
+            digits = digits_end(text, start, n)
+            if digits > start:
+                return digits
+
+    # SCIENTIFIC_NUMBER: ({REAL}|{INTEGER})\s*\*\^\s*{INTEGER}
+    mantissas = real_ends(text, pos, n)
+    if integer > pos:
+        mantissas.append(integer)
+    for mantissa in mantissas:
+        star = whitespace_end(text, mantissa, n)
+        if text.startswith("*^", star):
+            start = whitespace_end(text, star + 2, n)
+            exponent = digits_end(text, start, n)
+            if exponent > start:
+                return exponent
+
+    # REAL, then INTEGER
+    ends = real_ends(text, pos, n)
+    if ends:
+        return ends[0]
+    return integer if integer > pos else -1
+
+
+def word_end(text: str, pos: int, n: int) -> int:
+    """End of \\w* at pos."""
+    while pos < n and is_word(text[pos]):
+        pos += 1
+    return pos
+
+
+def mathics_message(text: str, pos: int, n: int):
+    """
+    Match Regex.MATHICS_MESSAGE, (?<!\\w)(\\w+)::(\\w+):( )(.+), at pos.
+    Return the end of each of its groups, or None.
+    """
+    if pos and is_word(text[pos - 1]):
+        return None
+    name = word_end(text, pos, n)
+    if name == pos or not text.startswith("::", name):
+        return None
+    tag = word_end(text, name + 2, n)
+    if tag == name + 2 or not text.startswith(": ", tag):
+        return None
+    line = text.find("\n", tag + 2)
+    if line < 0:
+        line = n
+    if line == tag + 2:
+        return None
+    return name, tag, tag + 2, line
+
+
+def message_end(text: str, pos: int, n: int):
+    """
+    Match the rest of Regex.MESSAGES after "::\\", which is s*{SYMBOLS}:
+    the pattern is a raw string, so its "\\\\s*" is a backslash followed
+    by any number of "s", not whitespace. Return the start and end of the
+    symbol, or None.
+    """
+    run = pos
+    while text.startswith("s", run):
+        run += 1
+    # s* gives back one "s" at a time until the symbol matches.
+    for start in range(run, pos - 1, -1):
+        end = symbol_end(text, start, n)
+        if end >= 0:
+            return start, end
+    return None
+
+
+def slot_end(text: str, pos: int, n: int) -> int:
+    """End of Regex.SLOTS at pos, which must start with #."""
+    # #{SYMBOLS}
+    end = symbol_end(text, pos + 1, n)
+    if end >= 0:
+        return end
+    # #\"{SYMBOLS}\"
+    if text.startswith('"', pos + 1):
+        end = symbol_end(text, pos + 2, n)
+        if end >= 0 and text.startswith('"', end):
+            return end + 1
+    # #{1,2}[0-9]*
+    end = pos + 2 if text.startswith("#", pos + 1) else pos + 1
+    return digits_end(text, end, n)
+
+
+def operator_end(text: str, pos: int) -> int:
+    """End of the longest operator at pos, or -1."""
+    for length in OPERATOR_LENGTHS:
+        if text[pos : pos + length] in OPERATORS:
+            return pos + length
+    return -1
+
+
+def string_end(text: str, pos: int, n: int) -> int:
+    """
+    Position of the first quote at or after pos that no backslash escapes,
+    or n. Quotes and backslashes are searched for with str.find(), so a
+    long string is not looked at character by character.
+    """
+    quote = text.find('"', pos)
+    if quote < 0:
+        quote = n
+    while True:
+        backslash = text.find("\\", pos, quote)
+        if backslash < 0:
+            return quote
+        pos = backslash + 2
+        if pos > quote:
+            # The backslash escapes the quote.
+            quote = text.find('"', pos)
+            if quote < 0:
+                quote = n
+
+
+def get_tokens_unprocessed(text: str, stack=("root",)):
+    """
+    Generate the (index, token, value) triples RegexLexer would for
+    MathematicaLexer.tokens, starting with the given state stack, and
+    return the final state stack.
+    """
+    statestack = list(stack)
+    state = statestack[-1]
+    pos = 0
+    n = len(text)
+    # The next (* and *) at or after pos, in comments.
+    next_open = next_close = -1
+    while pos < n:
+        char = text[pos]
+        if state == "root":
+            if char == "(" and text.startswith("*", pos + 1):
+                yield pos, MToken.COMMENT, "(*"
+                pos += 2
+                state = "comments"
+                statestack.append(state)
+                continue
+
+            if char == '"':
+                yield pos, MToken.STRING, char
+                pos += 1
+                state = "strings"
+                statestack.append(state)
+                continue
+
+            # The whitespace and grouping rules come later in the table, but no
+            # rule before them can start on the characters they start on, so
+            # the most common tokens are tried first.
+            if char.isspace():
+                end = whitespace_end(text, pos + 1, n)
+                yield pos, MToken.WHITESPACE, text[pos:end]
+                pos = end
+                continue
+
+            if char in GROUPING_START:
+                end = pos + 2 if text[pos : pos + 2] in GROUPINGS else pos + 1
+                if end > pos + 1 or char in GROUPINGS:
+                    yield pos, MToken.GROUP, text[pos:end]
+                    pos = end
+                    continue
+
+            if char in DIGITS or char == ".":
+                end = number_end(text, pos, n)
+                if end >= 0:
+                    yield pos, MToken.NUMBER, text[pos:end]
+                    pos = end
+                    continue
+
+            if char in SYMBOL_START:
+                # Regex.NAMES. Shorter matches of SYMBOLS are never followed
+                # by an underscore, so it never backtracks into its symbols.
+                end = symbol_end(text, pos, n)
+                if end >= 0:
+                    if text.startswith("_", end):
+                        # {SYMBOLS}_{1,3}({SYMBOLS})?
+                        end = blanks_end(text, end)
+                        tail = symbol_end(text, end, n)
+                        if tail >= 0:
+                            end = tail
+                        yield pos, MToken.PATTERN, text[pos:end]
+                    else:
+                        value = text[pos:end]
+                        if value in SYSTEM_SYMBOLS:
+                            yield pos, MToken.BUILTIN, value
+                        elif "`" in value:
+                            yield pos, symbol_token(value), value
+                        else:
+                            yield pos, MToken.SYMBOL, value
+                    pos = end
+                    continue
+                if char == "_":
+                    # _{1,3}{SYMBOLS}
+                    end = symbol_end(text, blanks_end(text, pos), n)
+                    if end >= 0:
+                        yield pos, MToken.PATTERN, text[pos:end]
+                        pos = end
+                        continue
+
+            # Among ASCII characters, only "_" can still start a word here.
+            if char == "_" or (char > "\x7f" and is_word(char)):
+                groups = mathics_message(text, pos, n)
+                if groups:
+                    name, tag, space, end = groups
+                    yield pos, MToken.OPERATOR, text[pos:name]
+                    yield name + 2, MToken.WHITESPACE, text[name + 2 : tag]
+                    yield tag + 1, MToken.TEXT, " "
+                    yield space, MToken.TEXT, text[space:end]
+                    pos = end
+                    continue
+
+            if char == "#":
+                end = slot_end(text, pos, n)
+                yield pos, MToken.SLOT, text[pos:end]
+                pos = end
+                continue
+
+            if char == ":" and text.startswith("::\\", pos):
+                # MESSAGES: (::)(\\s*)(SYMBOLS)
+                groups = message_end(text, pos + 3, n)
+                if groups:
+                    start, end = groups
+                    yield pos, MToken.OPERATOR, "::"
+                    yield pos + 2, MToken.WHITESPACE, text[pos + 2 : start]
+                    yield start, MToken.MESSAGE, text[start:end]
+                    pos = end
+                    continue
+
+            if char in OPERATOR_START:
+                end = operator_end(text, pos)
+                if end >= 0:
+                    yield pos, MToken.OPERATOR, text[pos:end]
+                    pos = end
+                    continue
+
+            # Regex.IDENTIFIER never matches where Regex.SYMBOLS did not.
+
+            if char > "\x7f":
+                # Regex.UNICODE, the unicode_run() callback.
+                word = is_word(char)
+                end = pos + 1
+                while end < n:
+                    next_char = text[end]
+                    if next_char <= "\x7f" or is_word(next_char) is not word:
+                        break
+                    if not word and next_char.isspace():
+                        break
+                    end += 1
+                for index in range(pos, end):
+                    char = text[index]
+                    yield index, UNICODE_TOKENS.get(char, MToken.UNKNOWN), char
+                pos = end
+                continue
+
+        elif state == "comments":
+            if char == "(" and text.startswith("*", pos + 1):
+                yield pos, MToken.COMMENT, "(*"
+                pos += 2
+                statestack.append(state)
+                continue
+            if char == "*" and text.startswith(")", pos + 1):
+                yield pos, MToken.COMMENT, "*)"
+                pos += 2
+                if len(statestack) > 1:
+                    statestack.pop()
+                state = statestack[-1]
+                continue
+            # The body runs up to the next (* or *). Where they are is kept
+            # from one part of the comment to the next, so that nested
+            # comments do not search the rest of the text again each time.
+            if next_open < pos:
+                next_open = text.find("(*", pos)
+                if next_open < 0:
+                    next_open = n
+            if next_close < pos:
+                next_close = text.find("*)", pos)
+                if next_close < 0:
+                    next_close = n
+            end = min(next_open, next_close)
+            yield pos, MToken.COMMENT, text[pos:end]
+            pos = end
+            continue
+
+        elif state == "strings":
+            if char != '"':
+                end = string_end(text, pos, n)
+                yield pos, MToken.STRING, text[pos:end]
+                pos = end
+                continue
+            yield pos, MToken.STRING, char
+            pos += 1
+            if len(statestack) > 1:
+                statestack.pop()
+            state = statestack[-1]
+            continue
+
+        # No rule matched, which RegexLexer handles like this:
+        if char == "\n":
+            statestack = ["root"]
+            state = "root"
+            yield pos, MToken.WHITESPACE, char
+        else:
+            yield pos, MToken.UNKNOWN, char
+        pos += 1
+    return tuple(statestack)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Warming up MathematicaLexer before the first text it highlights.
+
+The first MathematicaLexer loads the symbol tables, builds the operator
+regular expressions and has Pygments compile its token table; the first
+text lexed imports the modules of the engine and compiles whatever else
+it needs. warmup() does all that ahead of time, so that a REPL can start
+it while it starts up and have its first prompt highlighted as fast as
+the next ones.
+
+Everything warmup() sets up is set up once per process, under locks, so
+lexing can go on in other threads meanwhile: a lexer created while the
+token table is being compiled waits for it rather than compiling it
+again.
+"""
+
+import threading
+
+from mathics_pygments.lexer import MathematicaLexer
+
+# Lexed once to set up everything a text may need: comments, strings,
+# numbers, patterns, messages, slots, scoping constructs, named and
+# Unicode characters.
+SNIPPET = """\
+(* A comment (* nested *) *)
+BeginPackage["Foo`"];
+f::usage = "f[x] gives \\"x\\".";
+f[x_Integer, y_:1, opts___] := Module[{a = x^2 + 1.5*^3, b = 16^^FF},
+  If[a > 0 && b != 2`10, Sin[a] + y, #1 & /@ Range[a]]]
+g = Function[{z}, With[{k = <|"a" -> 1|>}, Block[{k}, z -> k]]];
+Power::infy: Infinite expression 1/0 encountered.
+\\[Alpha] \\[Rule] α ∈ ℛ ∧ x〚1〛
+"""
+
+_lock = threading.Lock()
+# The futures of warmup(), by lexer options.
+_warmups = {}
+
+
+def _warm(options: dict) -> MathematicaLexer:
+    lexer = MathematicaLexer(**options)
+    for _ in lexer.get_tokens(SNIPPET):
+        pass
+    return lexer
+
+
+def _run(future, key: tuple, options: dict):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(_warm(options))
+    except BaseException as exc:
+        # Forgotten before anyone waiting hears of it, so that they can
+        # try again.
+        with _lock:
+            if _warmups.get(key) is future:
+                del _warmups[key]
+        future.set_exception(exc)
+
+
+def warmup(background: bool = True, **options):
+    """
+    Get MathematicaLexer ready to lex: load the symbol tables, compile
+    the token table and lex a representative snippet, with a lexer with
+    the given options, such as engine="scanner". With background true,
+    this is done on a daemon thread.
+
+    Return a concurrent.futures.Future, done when the lexer is ready; its
+    result is the lexer used. Calling warmup() again with the same options
+    returns the same future, unless that warmup failed. It is safe to lex in other threads while the
+    lexer warms up.
+    """
+    from concurrent.futures import Future
+
+    key = tuple(sorted((name, repr(value)) for name, value in options.items()))
+    with _lock:
+        future = _warmups.get(key)
+        if future is not None:
+            return future
+        future = _warmups[key] = Future()
+    if background:
+        threading.Thread(
+            target=_run,
+            args=(future, key, options),
+            name="mathics-pygments-warmup",
+            daemon=True,
+        ).start()
+    else:
+        _run(future, key, options)
+    return future
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Lexing of text read in chunks, with memory bounded by the chunk size.
+
+Chunks are collected into a buffer, and the buffer is lexed. Tokens are
+passed on up to the last restart point in it, and the text after that
+point is kept for lexing with the next chunks. A restart point is a
+token boundary at the top level where the tokens after it depend only on
+the text after it: the end of one of the grouping tokens ")", "[", "]",
+"{", "}" and "," (see mathics_pygments.incremental), or of whitespace
+ending with a newline. No rule reads past those without including them
+in its match, except that a number such as 1.5 *^3 can continue after
+whitespace. So whitespace followed by *^ or ^^ is not a restart point,
+and restart points are only used with two more characters in the buffer.
+
+Comments and strings have no restart points in them, so the memory used
+is proportional to the chunk size plus the longest comment, string or
+stretch of code without a restart point, instead of the size of the
+text.
+"""
+
+from mathics_pygments.incremental import BARRIERS
+from mathics_pygments.lexer import MathematicaAnnotations, MToken
+
+# Number of characters read at a time from a file object.
+CHUNK_SIZE = 1 << 16
+
+
+def read_chunks(source, chunk_size: int = CHUNK_SIZE):
+    """
+    Generate the chunks of source: a file object opened in text mode, or
+    an iterable of strings.
+    """
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def restart_point(text: str, index: int, token, value: str) -> int:
+    """
+    Return the end of the raw token (index, token, value) if lexing can
+    restart there, and 0 otherwise.
+    """
+    if token is MToken.GROUP and value in BARRIERS:
+        if value == "[" and text[index - 1 : index] == "\\":
+            return 0
+        return index + 1
+    if token is MToken.WHITESPACE and value.endswith("\n"):
+        end = index + len(value)
+        if text[end : end + 2] in ("*^", "^^"):
+            return 0
+        return end
+    return 0
+
+
+def last_restart_point(text: str, items: list, limit: int) -> tuple:
+    """
+    Return the number of the raw tokens items of text before their last
+    restart point up to limit, and the position of that point; (0, 0) if
+    there is none.
+    """
+    for number in range(len(items) - 1, -1, -1):
+        index, token, value = items[number]
+        if token is MToken.GROUP or token is MToken.WHITESPACE:
+            end = restart_point(text, index, token, value)
+            if end and end <= limit:
+                return number + 1, end
+    return 0, 0
+
+
+def get_tokens_unprocessed(lexer, source, chunk_size: int = CHUNK_SIZE):
+    """
+    Generate the (index, token, value) triples that
+    lexer.get_uncached_tokens() gives for the text of source, read in
+    chunks.
+    """
+    chunks = read_chunks(source, chunk_size)
+    if lexer.engine == "mathics-scanner":
+        # The Mathics3 tokeniser carries state of its own between tokens,
+        # so it cannot be restarted in the middle of the text.
+        yield from lexer.get_uncached_tokens("".join(chunks))
+        return
+
+    annotate = MathematicaAnnotations().annotate
+    offset = 0
+    buffer = ""
+    # The buffer is lexed again once it is at least this long. Without a
+    # restart point in it, it has to grow by half each time so that a long
+    # comment is not lexed over and over.
+    wanted = 0
+    exhausted = False
+    while not exhausted:
+        pieces = [buffer]
+        size = len(buffer)
+        for chunk in chunks:
+            pieces.append(chunk)
+            size += len(chunk)
+            if size >= wanted:
+                break
+        else:
+            exhausted = True
+        buffer = "".join(pieces)
+        del pieces
+
+        limit = len(buffer) if exhausted else len(buffer) - 2
+        items = []
+        append = items.append
+        for item in lexer.get_raw_tokens(buffer):
+            if item[0] >= limit:
+                break
+            append(item)
+        if exhausted:
+            kept = len(items)
+            restart = len(buffer)
+        else:
+            kept, restart = last_restart_point(buffer, items, limit)
+
+        if offset:
+            for index, token, value in items[:kept]:
+                yield annotate((offset + index, token, value))
+        else:
+            for item in items[:kept]:
+                yield annotate(item)
+        del items
+        offset += restart
+        buffer = buffer[restart:]
+        wanted = len(buffer) + max(chunk_size, len(buffer) // 2)
@@ -0,0 +1,7160 @@
+# -*- coding: utf-8 -*-
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+# Generated by mathics_pygments/generate/build_tables.py from
+# data/mma-tables.json and generate/symbol_tables.py. Do not edit.
+# fmt: off
+
+OPERATORS = (
+    "!",
+    "!!",
+    "!=",
+    "&",
+    "&&",
+    "'",
+    "*",
+    "**",
+    "*=",
+    "+",
+    "++",
+    "+=",
+    "-",
+    "--",
+    "-=",
+    "->",
+    ".",
+    "..",
+    "...",
+    "/",
+    "/*",
+    "/.",
+    "//",
+    "//.",
+    "//=",
+    "//@",
+    "/:",
+    "/;",
+    "/=",
+    "/@",
+    ":",
+    "::",
+    ":=",
+    ":>",
+    ";",
+    ";;",
+    "<",
+    "<->",
+    "<<",
+    "<=",
+    "<>",
+    "=",
+    "=!=",
+    "=.",
+    "==",
+    "===",
+    ">",
+    ">=",
+    ">>",
+    ">>>",
+    "?",
+    "??",
+    "@*",
+    "@@",
+    "@@@",
+    "\\!",
+    "^",
+    "^:=",
+    "^=",
+    "_",
+    "__",
+    "___",
+    "|",
+    "|->",
+    "||",
+    "~",
+    "~~",
+)
+
+GROUPINGS = (
+    "(",
+    ")",
+    ",",
+    "<|",
+    "[",
+    "]",
+    "{",
+    "|>",
+    "}",
+)
+
+SYSTEM_SYMBOLS = frozenset((
+    "$Aborted",
+    "$ActivationGroupID",
+    "$ActivationKey",
+    "$ActivationUserRegistered",
+    "$AddOnsDirectory",
+    "$AllowExternalChannelFunctions",
+    "$AssertFunction",
+    "$Assumptions",
+    "$AsynchronousTask",
+    "$AudioInputDevices",
+    "$AudioOutputDevices",
+    "$BaseDirectory",
+    "$BatchInput",
+    "$BatchOutput",
+    "$BlockchainBase",
+    "$BoxForms",
+    "$ByteOrdering",
+    "$CacheBaseDirectory",
+    "$Canceled",
+    "$ChannelBase",
+    "$CharacterEncoding",
+    "$CharacterEncodings",
+    "$CloudBase",
+    "$CloudConnected",
+    "$CloudCreditsAvailable",
+    "$CloudEvaluation",
+    "$CloudExpressionBase",
+    "$CloudObjectNameFormat",
+    "$CloudObjectURLType",
+    "$CloudRootDirectory",
+    "$CloudSymbolBase",
+    "$CloudUserID",
+    "$CloudUserUUID",
+    "$CloudVersion",
+    "$CloudVersionNumber",
+    "$CloudWolframEngineVersionNumber",
+    "$CommandLine",
+    "$CompilationTarget",
+    "$ConditionHold",
+    "$ConfiguredKernels",
+    "$Context",
+    "$ContextPath",
+    "$ControlActiveSetting",
+    "$CookieStore",
+    "$Cookies",
+    "$CreationDate",
+    "$CurrentLink",
+    "$CurrentTask",
+    "$CurrentWebSession",
+    "$DateStringFormat",
+    "$DefaultAudioInputDevice",
+    "$DefaultAudioOutputDevice",
+    "$DefaultFont",
+    "$DefaultFrontEnd",
+    "$DefaultImagingDevice",
+    "$DefaultLocalBase",
+    "$DefaultMailbox",
+    "$DefaultNetworkInterface",
+    "$DefaultPath",
+    "$Display",
+    "$DisplayFunction",
+    "$DistributedContexts",
+    "$DynamicEvaluation",
+    "$Echo",
+    "$EmbedCodeEnvironments",
+    "$EmbeddableServices",
+    "$EntityStores",
+    "$Epilog",
+    "$EvaluationCloudBase",
+    "$EvaluationCloudObject",
+    "$EvaluationEnvironment",
+    "$ExportFormats",
+    "$Failed",
+    "$FinancialDataSource",
+    "$FontFamilies",
+    "$FormatType",
+    "$FrontEnd",
+    "$FrontEndSession",
+    "$GeoEntityTypes",
+    "$GeoLocation",
+    "$GeoLocationCity",
+    "$GeoLocationCountry",
+    "$GeoLocationPrecision",
+    "$GeoLocationSource",
+    "$HTMLExportRules",
+    "$HTTPCookies",
+    "$HTTPRequest",
+    "$HistoryLength",
+    "$HomeDirectory",
+    "$IgnoreEOF",
+    "$ImageFormattingWidth",
+    "$ImagingDevice",
+    "$ImagingDevices",
+    "$ImportFormats",
+    "$IncomingMailSettings",
+    "$InitialDirectory",
+    "$Initialization",
+    "$InitializationContexts",
+    "$Input",
+    "$InputFileName",
+    "$InputStreamMethods",
+    "$Inspector",
+    "$InstallationDate",
+    "$InstallationDirectory",
+    "$InterfaceEnvironment",
+    "$InterpreterTypes",
+    "$IterationLimit",
+    "$KernelCount",
+    "$KernelID",
+    "$Language",
+    "$LaunchDirectory",
+    "$LibraryPath",
+    "$LicenseExpirationDate",
+    "$LicenseID",
+    "$LicenseProcesses",
+    "$LicenseServer",
+    "$LicenseSubprocesses",
+    "$LicenseType",
+    "$Line",
+    "$LinkSupported",
+    "$Linked",
+    "$LoadedFiles",
+    "$LocalBase",
+    "$LocalSymbolBase",
+    "$MachineAddresses",
+    "$MachineDomain",
+    "$MachineDomains",
+    "$MachineEpsilon",
+    "$MachineID",
+    "$MachineName",
+    "$MachinePrecision",
+    "$MachineType",
+    "$MaxExtraPrecision",
+    "$MaxLicenseProcesses",
+    "$MaxLicenseSubprocesses",
+    "$MaxMachineNumber",
+    "$MaxNumber",
+    "$MaxPiecewiseCases",
+    "$MaxPrecision",
+    "$MaxRootDegree",
+    "$MessageGroups",
+    "$MessageList",
+    "$MessagePrePrint",
+    "$Messages",
+    "$MinMachineNumber",
+    "$MinNumber",
+    "$MinPrecision",
+    "$MinorReleaseNumber",
+    "$MobilePhone",
+    "$ModuleNumber",
+    "$NetworkConnected",
+    "$NetworkInterfaces",
+    "$NetworkLicense",
+    "$NewMessage",
+    "$NewSymbol",
+    "$NoValue",
+    "$Notebooks",
+    "$NumberMarks",
+    "$Off",
+    "$OperatingSystem",
+    "$Output",
+    "$OutputForms",
+    "$OutputSizeLimit",
+    "$OutputStreamMethods",
+    "$Packages",
+    "$ParentLink",
+    "$ParentProcessID",
+    "$PasswordFile",
+    "$PatchLevelID",
+    "$Path",
+    "$PathnameSeparator",
+    "$PerformanceGoal",
+    "$Permissions",
+    "$PermissionsGroupBase",
+    "$PersistenceBase",
+    "$PersistencePath",
+    "$PipeSupported",
+    "$PlotTheme",
+    "$Post",
+    "$Pre",
+    "$PreInitialization",
+    "$PrePrint",
+    "$PreRead",
+    "$PreferencesDirectory",
+    "$PrintForms",
+    "$PrintLiteral",
+    "$Printout3DPreviewer",
+    "$ProcessID",
+    "$ProcessorCount",
+    "$ProcessorType",
+    "$ProductInformation",
+    "$ProgramName",
+    "$PublisherID",
+    "$RandomState",
+    "$RecursionLimit",
+    "$RegisteredDeviceClasses",
+    "$RegisteredUserName",
+    "$ReleaseNumber",
+    "$RequesterAddress",
+    "$RequesterWolframID",
+    "$RequesterWolframUUID",
+    "$ResourceSystemBase",
+    "$RootDirectory",
+    "$SSHAuthentication",
+    "$ScheduledTask",
+    "$ScriptCommandLine",
+    "$ScriptInputString",
+    "$SecuredAuthenticationKeyTokens",
+    "$ServiceCreditsAvailable",
+    "$Services",
+    "$SessionID",
+    "$SetParentLink",
+    "$SharedFunctions",
+    "$SharedVariables",
+    "$SoundDisplay",
+    "$SoundDisplayFunction",
+    "$SourceLink",
+    "$SummaryBoxDataSizeLimit",
+    "$SuppressInputFormHeads",
+    "$SynchronousEvaluation",
+    "$SyntaxHandler",
+    "$System",
+    "$SystemCharacterEncoding",
+    "$SystemID",
+    "$SystemMemory",
+    "$SystemShell",
+    "$SystemTimeZone",
+    "$SystemWordLength",
+    "$TemplatePath",
+    "$TemporaryDirectory",
+    "$TemporaryPrefix",
+    "$TestFileName",
+    "$TextStyle",
+    "$TimeUnit",
+    "$TimeZone",
+    "$TimeZoneEntity",
+    "$TimedOut",
+    "$TopDirectory",
+    "$TraceOff",
+    "$TraceOn",
+    "$TracePattern",
+    "$TracePostAction",
+    "$TracePreAction",
+    "$UnitSystem",
+    "$Urgent",
+    "$UserAddOnsDirectory",
+    "$UserAgentLanguages",
+    "$UserAgentMachine",
+    "$UserAgentName",
+    "$UserAgentOperatingSystem",
+    "$UserAgentString",
+    "$UserAgentVersion",
+    "$UserBaseDirectory",
+    "$UserDocumentsDirectory",
+    "$UserName",
+    "$UserURLBase",
+    "$Username",
+    "$Version",
+    "$VersionNumber",
+    "$VoiceStyles",
+    "$WolframID",
+    "$WolframUUID",
+    "AASTriangle",
+    "APIFunction",
+    "ARCHProcess",
+    "ARIMAProcess",
+    "ARMAProcess",
+    "ARProcess",
+    "ASATriangle",
+    "AbelianGroup",
+    "Abort",
+    "AbortKernels",
+    "AbortProtect",
+    "AbortScheduledTask",
+    "Above",
+    "Abs",
+    "AbsArg",
+    "AbsArgPlot",
+    "Absolute",
+    "AbsoluteCorrelation",
+    "AbsoluteCorrelationFunction",
+    "AbsoluteCurrentValue",
+    "AbsoluteDashing",
+    "AbsoluteFileName",
+    "AbsoluteOptions",
+    "AbsolutePointSize",
+    "AbsoluteThickness",
+    "AbsoluteTime",
+    "AbsoluteTiming",
+    "AcceptanceThreshold",
+    "AccountingForm",
+    "Accumulate",
+    "Accuracy",
+    "AccuracyGoal",
+    "ActionDelay",
+    "ActionMen",
+    "ActionMenuBox",
+    "ActionMenuBoxOptions",
+    "Activate",
+    "Active",
+    "ActiveClassification",
+    "ActiveClassificationObject",
+    "ActiveItem",
+    "ActivePrediction",
+    "ActivePredictionObject",
+    "ActiveStyle",
+    "AcyclicGraphQ",
+    "AddOnHelpPath",
+    "AddSides",
+    "AddTo",
+    "AddToSearchIndex",
+    "AddUsers",
+    "AdjacencyGraph",
+    "AdjacencyList",
+    "AdjacencyMatrix",
+    "AdjustTimeSeriesForecast",
+    "AdjustmentBox",
+    "AdjustmentBoxOptions",
+    "AdministrativeDivisionData",
+    "AffineHalfSpace",
+    "AffineSpace",
+    "AffineStateSpaceModel",
+    "AffineTransform",
+    "After",
+    "AggregatedEntityClass",
+    "AggregationLayer",
+    "AirPressureData",
+    "AirTemperatureData",
+    "AircraftData",
+    "AirportData",
+    "AiryAi",
+    "AiryAiPrime",
+    "AiryAiZero",
+    "AiryBi",
+    "AiryBiPrime",
+    "AiryBiZero",
+    "AlgebraicIntegerQ",
+    "AlgebraicNumber",
+    "AlgebraicNumberDenominator",
+    "AlgebraicNumberNorm",
+    "AlgebraicNumberPolynomial",
+    "AlgebraicNumberTrace",
+    "AlgebraicRules",
+    "AlgebraicRulesData",
+    "AlgebraicUnitQ",
+    "Algebraics",
+    "Alignment",
+    "AlignmentMarker",
+    "AlignmentPoint",
+    "All",
+    "AllTrue",
+    "AllowAdultContent",
+    "AllowGroupClose",
+    "AllowIncomplete",
+    "AllowInlineCells",
+    "AllowKernelInitialization",
+    "AllowLooseGrammar",
+    "AllowReverseGroupClose",
+    "AllowScriptLevelChange",
+    "AllowedCloudExtraParameters",
+    "AllowedCloudParameterExtensions",
+    "AllowedDimensions",
+    "AllowedFrequencyRange",
+    "AllowedHeads",
+    "AlphaChannel",
+    "Alphabet",
+    "AlphabeticOrder",
+    "AlphabeticSort",
+    "AlternateImage",
+    "AlternatingFactorial",
+    "AlternatingGroup",
+    "AlternativeHypothesis",
+    "Alternatives",
+    "AltitudeMethod",
+    "AmbientLight",
+    "AmbiguityFunction",
+    "AmbiguityList",
+    "Analytic",
+    "AnatomyData",
+    "AnatomyForm",
+    "AnatomyPlot3D",
+    "AnatomySkinStyle",
+    "AnatomyStyling",
+    "AnchoredSearch",
+    "And",
+    "AndersonDarlingTest",
+    "AngerJ",
+    "AngleBisector",
+    "AngleBracket",
+    "AnglePath",
+    "AnglePath3D",
+    "AngleVector",
+    "AngularGauge",
+    "Animate",
+    "AnimationCycleOffset",
+    "AnimationCycleRepetitions",
+    "AnimationDirection",
+    "AnimationDisplayTime",
+    "AnimationRate",
+    "AnimationRepetitions",
+    "AnimationRunTime",
+    "AnimationRunning",
+    "AnimationTimeIndex",
+    "Animator",
+    "AnimatorBox",
+    "AnimatorBoxOptions",
+    "AnimatorElements",
+    "Annotate",
+    "Annotation",
+    "AnnotationDelete",
+    "AnnotationNames",
+    "AnnotationRules",
+    "AnnotationValue",
+    "Annuity",
+    "AnnuityDue",
+    "Annulus",
+    "AnomalyDetection",
+    "AnomalyDetectorFunction",
+    "Anonymous",
+    "Antialiasing",
+    "AntihermitianMatrixQ",
+    "Antisymmetric",
+    "AntisymmetricMatrixQ",
+    "Antonyms",
+    "AnyOrder",
+    "AnySubset",
+    "AnyTrue",
+    "Apart",
+    "ApartSquareFree",
+    "Appearance",
+    "AppearanceElements",
+    "AppearanceRules",
+    "AppellF1",
+    "Append",
+    "AppendCheck",
+    "AppendLayer",
+    "AppendTo",
+    "Apply",
+    "ApplySides",
+    "ArcCos",
+    "ArcCosh",
+    "ArcCot",
+    "ArcCoth",
+    "ArcCsc",
+    "ArcCsch",
+    "ArcCurvature",
+    "ArcLength",
+    "ArcSec",
+    "ArcSech",
+    "ArcSin",
+    "ArcSinDistribution",
+    "ArcSinh",
+    "ArcTan",
+    "ArcTanh",
+    "Area",
+    "Arg",
+    "ArgMax",
+    "ArgMin",
+    "ArgumentCountQ",
+    "ArithmeticGeometricMean",
+    "Around",
+    "AroundReplace",
+    "Array",
+    "ArrayComponents",
+    "ArrayDepth",
+    "ArrayFilter",
+    "ArrayFlatten",
+    "ArrayMesh",
+    "ArrayPad",
+    "ArrayPlot",
+    "ArrayQ",
+    "ArrayResample",
+    "ArrayReshape",
+    "ArrayRules",
+    "Arrays",
+    "Arrow",
+    "Arrow3DBox",
+    "ArrowBox",
+    "Arrowheads",
+    "Ask",
+    "AskAppend",
+    "AskConfirm",
+    "AskDisplay",
+    "AskFunction",
+    "AskState",
+    "AskTemplateDisplay",
+    "AskedQ",
+    "AskedValue",
+    "AspectRatio",
+    "AspectRatioFixed",
+    "Assert",
+    "AssociateTo",
+    "Association",
+    "AssociationFormat",
+    "AssociationMap",
+    "AssociationQ",
+    "AssociationThread",
+    "AssumeDeterministic",
+    "Assuming",
+    "Assumptions",
+    "AstronomicalData",
+    "AsymptoticDSolveValue",
+    "AsymptoticEqual",
+    "AsymptoticEquivalent",
+    "AsymptoticGreater",
+    "AsymptoticGreaterEqual",
+    "AsymptoticIntegrate",
+    "AsymptoticLess",
+    "AsymptoticLessEqual",
+    "AsymptoticOutputTracker",
+    "AsymptoticRSolveValue",
+    "AsymptoticSolve",
+    "AsymptoticSum",
+    "Asynchronous",
+    "AsynchronousTaskObject",
+    "AsynchronousTasks",
+    "Atom",
+    "AtomCoordinates",
+    "AtomCount",
+    "AtomDiagramCoordinates",
+    "AtomList",
+    "AtomQ",
+    "AttentionLayer",
+    "Attributes",
+    "Audio",
+    "AudioAmplify",
+    "AudioAnnotate",
+    "AudioAnnotationLookup",
+    "AudioBlockMap",
+    "AudioCapture",
+    "AudioChannelAssignment",
+    "AudioChannelCombine",
+    "AudioChannelMix",
+    "AudioChannelSeparate",
+    "AudioChannels",
+    "AudioData",
+    "AudioDelay",
+    "AudioDelete",
+    "AudioDevice",
+    "AudioDistance",
+    "AudioFade",
+    "AudioFrequencyShift",
+    "AudioGenerator",
+    "AudioIdentify",
+    "AudioInputDevice",
+    "AudioInsert",
+    "AudioIntervals",
+    "AudioJoin",
+    "AudioLabel",
+    "AudioLength",
+    "AudioLocalMeasurements",
+    "AudioLooping",
+    "AudioLoudness",
+    "AudioMeasurements",
+    "AudioNormalize",
+    "AudioOutputDevice",
+    "AudioOverlay",
+    "AudioPad",
+    "AudioPan",
+    "AudioPartition",
+    "AudioPause",
+    "AudioPitchShift",
+    "AudioPlay",
+    "AudioPlot",
+    "AudioQ",
+    "AudioRecord",
+    "AudioReplace",
+    "AudioResample",
+    "AudioReverb",
+    "AudioSampleRate",
+    "AudioSpectralMap",
+    "AudioSpectralTransformation",
+    "AudioSplit",
+    "AudioStop",
+    "AudioStream",
+    "AudioStreams",
+    "AudioTimeStretch",
+    "AudioTrim",
+    "AudioType",
+    "AugmentedPolyhedron",
+    "AugmentedSymmetricPolynomial",
+    "Authenticate",
+    "Authentication",
+    "AuthenticationDialog",
+    "AutoAction",
+    "AutoCopy",
+    "AutoDelete",
+    "AutoEvaluateEvents",
+    "AutoGeneratedPackage",
+    "AutoIndent",
+    "AutoIndentSpacings",
+    "AutoItalicWords",
+    "AutoMatch",
+    "AutoMultiplicationSymbol",
+    "AutoNumberFormatting",
+    "AutoOpenNotebooks",
+    "AutoOpenPalettes",
+    "AutoQuoteCharacters",
+    "AutoRefreshed",
+    "AutoRemove",
+    "AutoScaling",
+    "AutoScroll",
+    "AutoSpacing",
+    "AutoStyleOptions",
+    "AutoStyleWords",
+    "AutoSubmitting",
+    "Autocomplete",
+    "AutocompletionFunction",
+    "AutocorrelationTest",
+    "AutoloadPath",
+    "Automatic",
+    "AutomaticImageSize",
+    "AutorunSequencing",
+    "Axes",
+    "AxesEdge",
+    "AxesLabel",
+    "AxesOrigin",
+    "AxesStyle",
+    "AxiomaticTheory",
+    "Axis",
+    "BSplineBasis",
+    "BSplineCurve",
+    "BSplineCurve3DBox",
+    "BSplineCurve3DBoxOptions",
+    "BSplineCurveBox",
+    "BSplineCurveBoxOptions",
+    "BSplineFunction",
+    "BSplineSurface",
+    "BSplineSurface3DBox",
+    "BSplineSurface3DBoxOptions",
+    "BabyMonsterGroupB",
+    "Back",
+    "Background",
+    "BackgroundAppearance",
+    "BackgroundTasksSettings",
+    "Backslash",
+    "Backsubstitution",
+    "Backward",
+    "Ball",
+    "Band",
+    "BandpassFilter",
+    "BandstopFilter",
+    "BarChart",
+    "BarChart3D",
+    "BarLegend",
+    "BarOrigin",
+    "BarSpacing",
+    "BarabasiAlbertGraphDistribution",
+    "BarcodeImage",
+    "BarcodeRecognize",
+    "BaringhausHenzeTest",
+    "BarlowProschanImportance",
+    "BarnesG",
+    "BartlettHannWindow",
+    "BartlettWindow",
+    "BaseDecode",
+    "BaseEncode",
+    "BaseForm",
+    "BaseStyle",
+    "Baseline",
+    "BaselinePosition",
+    "BasicRecurrentLayer",
+    "BatchNormalizationLayer",
+    "BatchSize",
+    "BatesDistribution",
+    "BattleLemarieWavelet",
+    "BayesianMaximization",
+    "BayesianMaximizationObject",
+    "BayesianMinimization",
+    "BayesianMinimizationObject",
+    "Because",
+    "BeckmannDistribution",
+    "Beep",
+    "Before",
+    "Begin",
+    "BeginDialogPacket",
+    "BeginFrontEndInteractionPacket",
+    "BeginPackage",
+    "BellB",
+    "BellY",
+    "Below",
+    "BenfordDistribution",
+    "BeniniDistribution",
+    "BenktanderGibratDistribution",
+    "BenktanderWeibullDistribution",
+    "BernoulliB",
+    "BernoulliDistribution",
+    "BernoulliGraphDistribution",
+    "BernoulliProcess",
+    "BernsteinBasis",
+    "BesselFilterModel",
+    "BesselI",
+    "BesselJ",
+    "BesselJZero",
+    "BesselK",
+    "BesselY",
+    "BesselYZero",
+    "Beta",
+    "BetaBinomialDistribution",
+    "BetaDistribution",
+    "BetaNegativeBinomialDistribution",
+    "BetaPrimeDistribution",
+    "BetaRegularized",
+    "Between",
+    "BetweennessCentrality",
+    "BeveledPolyhedron",
+    "BezierCurve",
+    "BezierCurve3DBox",
+    "BezierCurve3DBoxOptions",
+    "BezierCurveBox",
+    "BezierCurveBoxOptions",
+    "BezierFunction",
+    "BilateralFilter",
+    "BinCounts",
+    "BinLists",
+    "Binarize",
+    "BinaryDeserialize",
+    "BinaryDistance",
+    "BinaryFormat",
+    "BinaryImageQ",
+    "BinaryRead",
+    "BinaryReadList",
+    "BinarySerialize",
+    "BinaryWrite",
+    "Binomial",
+    "BinomialDistribution",
+    "BinomialProcess",
+    "BinormalDistribution",
+    "BiorthogonalSplineWavelet",
+    "BipartiteGraphQ",
+    "BiquadraticFilterModel",
+    "BirnbaumImportance",
+    "BirnbaumSaundersDistribution",
+    "BitAnd",
+    "BitClear",
+    "BitGet",
+    "BitLength",
+    "BitNot",
+    "BitOr",
+    "BitSet",
+    "BitShiftLeft",
+    "BitShiftRight",
+    "BitXor",
+    "BiweightLocation",
+    "BiweightMidvariance",
+    "Black",
+    "BlackmanHarrisWindow",
+    "BlackmanNuttallWindow",
+    "BlackmanWindow",
+    "Blank",
+    "BlankForm",
+    "BlankNullSequence",
+    "BlankSequence",
+    "Blend",
+    "Block",
+    "BlockMap",
+    "BlockRandom",
+    "BlockchainAddressData",
+    "BlockchainBase",
+    "BlockchainBlockData",
+    "BlockchainContractValue",
+    "BlockchainData",
+    "BlockchainGet",
+    "BlockchainKeyEncode",
+    "BlockchainPut",
+    "BlockchainTokenData",
+    "BlockchainTransaction",
+    "BlockchainTransactionData",
+    "BlockchainTransactionSign",
+    "BlockchainTransactionSubmit",
+    "BlomqvistBeta",
+    "BlomqvistBetaTest",
+    "Blue",
+    "Blur",
+    "BodePlot",
+    "BohmanWindow",
+    "Bold",
+    "Bond",
+    "BondCount",
+    "BondList",
+    "BondQ",
+    "Bookmarks",
+    "Boole",
+    "BooleanConsecutiveFunction",
+    "BooleanConvert",
+    "BooleanCountingFunction",
+    "BooleanFunction",
+    "BooleanGraph",
+    "BooleanMaxterms",
+    "BooleanMinimize",
+    "BooleanMinterms",
+    "BooleanQ",
+    "BooleanRegion",
+    "BooleanStrings",
+    "BooleanTable",
+    "BooleanVariables",
+    "Booleans",
+    "BorderDimensions",
+    "BorelTannerDistribution",
+    "Bottom",
+    "BottomHatTransform",
+    "BoundaryDiscretizeGraphics",
+    "BoundaryDiscretizeRegion",
+    "BoundaryMesh",
+    "BoundaryMeshRegion",
+    "BoundaryMeshRegionQ",
+    "BoundaryStyle",
+    "BoundedRegionQ",
+    "BoundingRegion",
+    "Bounds",
+    "Box",
+    "BoxBaselineShift",
+    "BoxData",
+    "BoxDimensions",
+    "BoxForm",
+    "BoxFormFormatTypes",
+    "BoxFrame",
+    "BoxID",
+    "BoxMargins",
+    "BoxMatrix",
+    "BoxObject",
+    "BoxRatios",
+    "BoxRotation",
+    "BoxRotationPoint",
+    "BoxStyle",
+    "BoxWhiskerChart",
+    "Boxed",
+    "Boxes",
+    "Bra",
+    "BraKet",
+    "BracketingBar",
+    "BrayCurtisDistance",
+    "BreadthFirstScan",
+    "Break",
+    "BridgeData",
+    "BrightnessEqualize",
+    "BroadcastStationData",
+    "Brown",
+    "BrownForsytheTest",
+    "BrownianBridgeProcess",
+    "BrowserCategory",
+    "BubbleChart",
+    "BubbleChart3D",
+    "BubbleScale",
+    "BubbleSizes",
+    "BuildingData",
+    "BulletGauge",
+    "BusinessDayQ",
+    "ButterflyGraph",
+    "ButterworthFilterModel",
+    "Button",
+    "ButtonBar",
+    "ButtonBox",
+    "ButtonBoxOptions",
+    "ButtonCell",
+    "ButtonContents",
+    "ButtonData",
+    "ButtonEvaluator",
+    "ButtonExpandable",
+    "ButtonFrame",
+    "ButtonFunction",
+    "ButtonMargins",
+    "ButtonMinHeight",
+    "ButtonNote",
+    "ButtonNotebook",
+    "ButtonSource",
+    "ButtonStyle",
+    "ButtonStyleMenuListing",
+    "Byte",
+    "ByteArray",
+    "ByteArrayFormat",
+    "ByteArrayQ",
+    "ByteArrayToString",
+    "ByteCount",
+    "ByteOrdering",
+    "C",
+    "CDF",
+    "CDFDeploy",
+    "CDFInformation",
+    "CDFWavelet",
+    "CForm",
+    "CMYKColor",
+    "CTCLossLayer",
+    "CacheGraphics",
+    "CachePersistence",
+    "CachedValue",
+    "CalendarConvert",
+    "CalendarData",
+    "CalendarType",
+    "CallPacket",
+    "Callout",
+    "CalloutMarker",
+    "CalloutStyle",
+    "CanberraDistance",
+    "Cancel",
+    "CancelButton",
+    "CandlestickChart",
+    "CanonicalGraph",
+    "CanonicalName",
+    "CanonicalWarpingCorrespondence",
+    "CanonicalWarpingDistance",
+    "CanonicalizePolygon",
+    "CanonicalizePolyhedron",
+    "CantorMesh",
+    "CantorStaircase",
+    "Cap",
+    "CapForm",
+    "CapitalDifferentialD",
+    "Capitalize",
+    "CapsuleShape",
+    "CaptureRunning",
+    "CardinalBSplineBasis",
+    "CarlemanLinearize",
+    "CarmichaelLambda",
+    "CaseOrdering",
+    "CaseSensitive",
+    "Cases",
+    "Cashflow",
+    "Casoratian",
+    "Catalan",
+    "CatalanNumber",
+    "Catch",
+    "Catenate",
+    "CatenateLayer",
+    "CauchyDistribution",
+    "CauchyWindow",
+    "CayleyGraph",
+    "Ceiling",
+    "CelestialSystem",
+    "Cell",
+    "CellAutoOverwrite",
+    "CellBaseline",
+    "CellBoundingBox",
+    "CellBracketOptions",
+    "CellChangeTimes",
+    "CellContents",
+    "CellContext",
+    "CellDingbat",
+    "CellDynamicExpression",
+    "CellEditDuplicate",
+    "CellElementSpacings",
+    "CellElementsBoundingBox",
+    "CellEpilog",
+    "CellEvaluationDuplicate",
+    "CellEvaluationFunction",
+    "CellEvaluationLanguage",
+    "CellEventActions",
+    "CellFrame",
+    "CellFrameColor",
+    "CellFrameLabelMargins",
+    "CellFrameLabels",
+    "CellFrameMargins",
+    "CellGroup",
+    "CellGroupData",
+    "CellGrouping",
+    "CellGroupingRules",
+    "CellHorizontalScrolling",
+    "CellID",
+    "CellLabel",
+    "CellLabelAutoDelete",
+    "CellLabelMargins",
+    "CellLabelPositioning",
+    "CellLabelStyle",
+    "CellMargins",
+    "CellObject",
+    "CellOpen",
+    "CellPrint",
+    "CellProlog",
+    "CellSize",
+    "CellStyle",
+    "CellTags",
+    "Cells",
+    "CellularAutomaton",
+    "CensoredDistribution",
+    "Censoring",
+    "Center",
+    "CenterArray",
+    "CenterDot",
+    "CentralFeature",
+    "CentralMoment",
+    "CentralMomentGeneratingFunction",
+    "Cepstrogram",
+    "CepstrogramArray",
+    "CepstrumArray",
+    "ChampernowneNumber",
+    "ChanVeseBinarize",
+    "ChangeOptions",
+    "ChannelBase",
+    "ChannelBrokerAction",
+    "ChannelDatabin",
+    "ChannelHistoryLength",
+    "ChannelListen",
+    "ChannelListener",
+    "ChannelListenerWait",
+    "ChannelListeners",
+    "ChannelObject",
+    "ChannelPreSendFunction",
+    "ChannelReceiverFunction",
+    "ChannelSend",
+    "ChannelSubscribers",
+    "Character",
+    "CharacterCounts",
+    "CharacterEncoding",
+    "CharacterEncodingsPath",
+    "CharacterName",
+    "CharacterRange",
+    "CharacteristicFunction",
+    "CharacteristicPolynomial",
+    "Characters",
+    "ChartBaseStyle",
+    "ChartElementData",
+    "ChartElementDataFunction",
+    "ChartElementFunction",
+    "ChartElements",
+    "ChartLabels",
+    "ChartLayout",
+    "ChartLegends",
+    "ChartStyle",
+    "Chebyshev",
+    "Chebyshev1FilterModel",
+    "Chebyshev2FilterModel",
+    "ChebyshevDistance",
+    "ChebyshevT",
+    "Check",
+    "CheckAbort",
+    "CheckAll",
+    "Checkbox",
+    "CheckboxBar",
+    "CheckboxBox",
+    "CheckboxBoxOptions",
+    "ChemicalData",
+    "ChessboardDistance",
+    "ChiDistribution",
+    "ChiSquareDistribution",
+    "ChineseRemainder",
+    "ChoiceButtons",
+    "ChoiceDialog",
+    "CholeskyDecomposition",
+    "Chop",
+    "ChromaticPolynomial",
+    "ChromaticityPlot",
+    "ChromaticityPlot3D",
+    "Circle",
+    "CircleBox",
+    "CircleDot",
+    "CircleMinus",
+    "CirclePlus",
+    "CirclePoints",
+    "CircleThrough",
+    "CircleTimes",
+    "CirculantGraph",
+    "CircularOrthogonalMatrixDistribution",
+    "CircularQuaternionMatrixDistribution",
+    "CircularRealMatrixDistribution",
+    "CircularSymplecticMatrixDistribution",
+    "CircularUnitaryMatrixDistribution",
+    "Circumsphere",
+    "CityData",
+    "ClassPriors",
+    "ClassifierFunction",
+    "ClassifierInformation",
+    "ClassifierMeasurements",
+    "ClassifierMeasurementsObject",
+    "Classify",
+    "Clear",
+    "ClearAll",
+    "ClearAttributes",
+    "ClearCookies",
+    "ClearPermissions",
+    "ClearSystemCache",
+    "ClebschGordan",
+    "ClickPane",
+    "Clip",
+    "ClipFill",
+    "ClipPlanes",
+    "ClipPlanesStyle",
+    "ClipRange",
+    "ClipboardNotebook",
+    "ClippingStyle",
+    "Clock",
+    "ClockGauge",
+    "ClockwiseContourIntegral",
+    "Close",
+    "CloseKernels",
+    "Closed",
+    "ClosenessCentrality",
+    "Closing",
+    "ClosingAutoSave",
+    "ClosingEvent",
+    "CloudAccountData",
+    "CloudBase",
+    "CloudConnect",
+    "CloudDeploy",
+    "CloudDirectory",
+    "CloudDisconnect",
+    "CloudEvaluate",
+    "CloudExport",
+    "CloudExpression",
+    "CloudExpressions",
+    "CloudFunction",
+    "CloudGet",
+    "CloudImport",
+    "CloudLoggingData",
+    "CloudObject",
+    "CloudObjectInformation",
+    "CloudObjectInformationData",
+    "CloudObjectNameFormat",
+    "CloudObjectURLType",
+    "CloudObjects",
+    "CloudPublish",
+    "CloudPut",
+    "CloudSave",
+    "CloudShare",
+    "CloudSubmit",
+    "CloudSymbol",
+    "CloudUnshare",
+    "ClusterClassify",
+    "ClusterDissimilarityFunction",
+    "ClusteringComponents",
+    "ClusteringTree",
+    "Coarse",
+    "CodeAssistOptions",
+    "Coefficient",
+    "CoefficientArrays",
+    "CoefficientDomain",
+    "CoefficientList",
+    "CoefficientRules",
+    "CoifletWavelet",
+    "Collect",
+    "Colon",
+    "ColonForm",
+    "ColorBalance",
+    "ColorCombine",
+    "ColorConvert",
+    "ColorCoverage",
+    "ColorData",
+    "ColorDataFunction",
+    "ColorDetect",
+    "ColorDistance",
+    "ColorFunction",
+    "ColorFunctionScaling",
+    "ColorNegate",
+    "ColorOutput",
+    "ColorProfileData",
+    "ColorQ",
+    "ColorQuantize",
+    "ColorReplace",
+    "ColorRules",
+    "ColorSelectorSettings",
+    "ColorSeparate",
+    "ColorSetter",
+    "ColorSetterBox",
+    "ColorSetterBoxOptions",
+    "ColorSlider",
+    "ColorSpace",
+    "ColorToneMapping",
+    "Colorize",
+    "ColorsNear",
+    "Column",
+    "ColumnAlignments",
+    "ColumnBackgrounds",
+    "ColumnForm",
+    "ColumnLines",
+    "ColumnSpacings",
+    "ColumnWidths",
+    "ColumnsEqual",
+    "CombinedEntityClass",
+    "CombinerFunction",
+    "CometData",
+    "CommonDefaultFormatTypes",
+    "CommonName",
+    "CommonUnits",
+    "Commonest",
+    "CommonestFilter",
+    "CommunityBoundaryStyle",
+    "CommunityGraphPlot",
+    "CommunityLabels",
+    "CommunityRegionStyle",
+    "CompanyData",
+    "CompatibleUnitQ",
+    "CompilationOptions",
+    "CompilationTarget",
+    "Compile",
+    "Compiled",
+    "CompiledCodeFunction",
+    "CompiledFunction",
+    "CompilerOptions",
+    "Complement",
+    "CompleteGraph",
+    "CompleteGraphQ",
+    "CompleteKaryTree",
+    "CompletionsListPacket",
+    "Complex",
+    "ComplexExpand",
+    "ComplexInfinity",
+    "ComplexListPlot",
+    "ComplexPlot",
+    "ComplexPlot3D",
+    "Complexes",
+    "ComplexityFunction",
+    "ComponentMeasurements",
+    "ComponentwiseContextMen",
+    "Compose",
+    "ComposeList",
+    "ComposeSeries",
+    "CompositeQ",
+    "Composition",
+    "CompoundElement",
+    "CompoundExpression",
+    "CompoundPoissonDistribution",
+    "CompoundPoissonProcess",
+    "CompoundRenewalProcess",
+    "Compress",
+    "CompressedData",
+    "ComputeUncertainty",
+    "Condition",
+    "ConditionalExpression",
+    "Conditioned",
+    "Cone",
+    "ConeBox",
+    "ConfidenceLevel",
+    "ConfidenceRange",
+    "ConfidenceTransform",
+    "ConfigurationPath",
+    "ConformAudio",
+    "ConformImages",
+    "Congruent",
+    "ConicHullRegion",
+    "ConicHullRegion3DBox",
+    "ConicHullRegionBox",
+    "ConicOptimization",
+    "Conjugate",
+    "ConjugateTranspose",
+    "Conjunction",
+    "Connect",
+    "ConnectLibraryCallbackFunction",
+    "ConnectSystemModelComponents",
+    "ConnectedComponents",
+    "ConnectedGraphComponents",
+    "ConnectedGraphQ",
+    "ConnectedMeshComponents",
+    "ConnectedMoleculeComponents",
+    "ConnectedMoleculeQ",
+    "ConnectionSettings",
+    "ConnesWindow",
+    "ConoverTest",
+    "ConsoleMessage",
+    "ConsoleMessagePacket",
+    "ConsolePrint",
+    "Constant",
+    "ConstantArray",
+    "ConstantArrayLayer",
+    "ConstantImage",
+    "ConstantPlusLayer",
+    "ConstantRegionQ",
+    "ConstantTimesLayer",
+    "Constants",
+    "ConstellationData",
+    "ConstrainedMax",
+    "ConstrainedMin",
+    "Construct",
+    "Containing",
+    "ContainsAll",
+    "ContainsAny",
+    "ContainsExactly",
+    "ContainsNone",
+    "ContainsOnly",
+    "ContentFieldOptions",
+    "ContentLocationFunction",
+    "ContentObject",
+    "ContentPadding",
+    "ContentSelectable",
+    "ContentSize",
+    "ContentsBoundingBox",
+    "Context",
+    "ContextMen",
+    "ContextToFileName",
+    "Contexts",
+    "Continuation",
+    "Continue",
+    "ContinuedFraction",
+    "ContinuedFractionK",
+    "ContinuousAction",
+    "ContinuousMarkovProcess",
+    "ContinuousTask",
+    "ContinuousTimeModelQ",
+    "ContinuousWaveletData",
+    "ContinuousWaveletTransform",
+    "ContourDetect",
+    "ContourGraphics",
+    "ContourIntegral",
+    "ContourLabels",
+    "ContourLines",
+    "ContourPlot",
+    "ContourPlot3D",
+    "ContourShading",
+    "ContourSmoothing",
+    "ContourStyle",
+    "Contours",
+    "ContraharmonicMean",
+    "ContrastiveLossLayer",
+    "Control",
+    "ControlActive",
+    "ControlAlignment",
+    "ControlGroupContentsBox",
+    "ControlPlacement",
+    "ControlType",
+    "ControllabilityGramian",
+    "ControllabilityMatrix",
+    "ControllableDecomposition",
+    "ControllableModelQ",
+    "ControllerDuration",
+    "ControllerInformation",
+    "ControllerInformationData",
+    "ControllerLinking",
+    "ControllerManipulate",
+    "ControllerMethod",
+    "ControllerPath",
+    "ControllerState",
+    "ControlsRendering",
+    "Convergents",
+    "ConversionOptions",
+    "ConversionRules",
+    "ConvertToBitmapPacket",
+    "ConvertToPostScript",
+    "ConvertToPostScriptPacket",
+    "ConvexHullMesh",
+    "ConvexPolygonQ",
+    "ConvexPolyhedronQ",
+    "ConvolutionLayer",
+    "Convolve",
+    "ConwayGroupCo1",
+    "ConwayGroupCo2",
+    "ConwayGroupCo3",
+    "CookieFunction",
+    "Cookies",
+    "CoordinateBoundingBox",
+    "CoordinateBoundingBoxArray",
+    "CoordinateBounds",
+    "CoordinateBoundsArray",
+    "CoordinateChartData",
+    "CoordinateTransform",
+    "CoordinateTransformData",
+    "CoordinatesToolOptions",
+    "CoprimeQ",
+    "Coproduct",
+    "CopulaDistribution",
+    "CopyDatabin",
+    "CopyDirectory",
+    "CopyFile",
+    "CopyTag",
+    "CopyToClipboard",
+    "Copyable",
+    "CornerFilter",
+    "CornerNeighbors",
+    "Correlation",
+    "CorrelationDistance",
+    "CorrelationFunction",
+    "CorrelationTest",
+    "Cos",
+    "CosIntegral",
+    "Cosh",
+    "CoshIntegral",
+    "CosineDistance",
+    "CosineWindow",
+    "Cot",
+    "Coth",
+    "Count",
+    "CountDistinct",
+    "CountDistinctBy",
+    "CountRoots",
+    "CounterAssignments",
+    "CounterBox",
+    "CounterBoxOptions",
+    "CounterClockwiseContourIntegral",
+    "CounterEvaluator",
+    "CounterFunction",
+    "CounterIncrements",
+    "CounterStyle",
+    "CounterStyleMenuListing",
+    "CountryData",
+    "Counts",
+    "CountsBy",
+    "Covariance",
+    "CovarianceEstimatorFunction",
+    "CovarianceFunction",
+    "CoxIngersollRossProcess",
+    "CoxModel",
+    "CoxModelFit",
+    "CoxianDistribution",
+    "CramerVonMisesTest",
+    "CreateArchive",
+    "CreateCellID",
+    "CreateChannel",
+    "CreateCloudExpression",
+    "CreateDataSystemModel",
+    "CreateDatabin",
+    "CreateDialog",
+    "CreateDirectory",
+    "CreateDocument",
+    "CreateFile",
+    "CreateIntermediateDirectories",
+    "CreateManagedLibraryExpression",
+    "CreateNotebook",
+    "CreatePalette",
+    "CreatePalettePacket",
+    "CreatePermissionsGroup",
+    "CreateScheduledTask",
+    "CreateSearchIndex",
+    "CreateSystemModel",
+    "CreateTemporary",
+    "CreateUUID",
+    "CreateWindow",
+    "CriterionFunction",
+    "CriticalSection",
+    "CriticalityFailureImportance",
+    "CriticalitySuccessImportance",
+    "Cross",
+    "CrossEntropyLossLayer",
+    "CrossMatrix",
+    "CrossingCount",
+    "CrossingDetect",
+    "CrossingPolygon",
+    "Csc",
+    "Csch",
+    "Cube",
+    "CubeRoot",
+    "Cubics",
+    "Cuboid",
+    "CuboidBox",
+    "Cumulant",
+    "CumulantGeneratingFunction",
+    "Cup",
+    "CupCap",
+    "Curl",
+    "CurlyDoubleQuote",
+    "CurlyQuote",
+    "CurrencyConvert",
+    "CurrentDate",
+    "CurrentImage",
+    "CurrentNotebookImage",
+    "CurrentScreenImage",
+    "CurrentValue",
+    "CurrentlySpeakingPacket",
+    "Curry",
+    "CurvatureFlowFilter",
+    "CurveClosed",
+    "Cyan",
+    "CycleGraph",
+    "CycleIndexPolynomial",
+    "Cycles",
+    "CyclicGroup",
+    "Cyclotomic",
+    "Cylinder",
+    "CylinderBox",
+    "CylindricalDecomposition",
+    "D",
+    "DEigensystem",
+    "DEigenvalues",
+    "DGaussianWavelet",
+    "DMSList",
+    "DMSString",
+    "DOSTextFormat",
+    "DSolve",
+    "DSolveValue",
+    "DagumDistribution",
+    "DamData",
+    "DamerauLevenshteinDistance",
+    "DampingFactor",
+    "Darker",
+    "Dashed",
+    "Dashing",
+    "DataCompression",
+    "DataDistribution",
+    "DataRange",
+    "DataReversed",
+    "DatabaseConnect",
+    "DatabaseDisconnect",
+    "DatabaseReference",
+    "Databin",
+    "DatabinAdd",
+    "DatabinRemove",
+    "DatabinUpload",
+    "Databins",
+    "Dataset",
+    "Date",
+    "DateBounds",
+    "DateDelimiters",
+    "DateDifference",
+    "DateFormat",
+    "DateFunction",
+    "DateHistogram",
+    "DateList",
+    "DateListLogPlot",
+    "DateListPlot",
+    "DateListStepPlot",
+    "DateObject",
+    "DateObjectQ",
+    "DateOverlapsQ",
+    "DatePattern",
+    "DatePlus",
+    "DateRange",
+    "DateReduction",
+    "DateString",
+    "DateTicksFormat",
+    "DateValue",
+    "DateWithinQ",
+    "Dated",
+    "DatedUnit",
+    "DaubechiesWavelet",
+    "DavisDistribution",
+    "DawsonF",
+    "DayCount",
+    "DayCountConvention",
+    "DayHemisphere",
+    "DayMatchQ",
+    "DayName",
+    "DayNightTerminator",
+    "DayPlus",
+    "DayRange",
+    "DayRound",
+    "DaylightQ",
+    "DeBruijnGraph",
+    "DeBruijnSequence",
+    "Debug",
+    "DebugTag",
+    "Decapitalize",
+    "Decimal",
+    "DecimalForm",
+    "DeclareKnownSymbols",
+    "DeclarePackage",
+    "Decompose",
+    "DeconvolutionLayer",
+    "Decrement",
+    "Decrypt",
+    "DecryptFile",
+    "DedekindEta",
+    "DeepSpaceProbeData",
+    "Default",
+    "DefaultAxesStyle",
+    "DefaultBaseStyle",
+    "DefaultBoxStyle",
+    "DefaultButton",
+    "DefaultColor",
+    "DefaultControlPlacement",
+    "DefaultDuplicateCellStyle",
+    "DefaultDuration",
+    "DefaultElement",
+    "DefaultFaceGridsStyle",
+    "DefaultFieldHintStyle",
+    "DefaultFont",
+    "DefaultFontProperties",
+    "DefaultFormatType",
+    "DefaultFormatTypeForStyle",
+    "DefaultFrameStyle",
+    "DefaultFrameTicksStyle",
+    "DefaultGridLinesStyle",
+    "DefaultInlineFormatType",
+    "DefaultInputFormatType",
+    "DefaultLabelStyle",
+    "DefaultMenuStyle",
+    "DefaultNaturalLanguage",
+    "DefaultNewCellStyle",
+    "DefaultNewInlineCellStyle",
+    "DefaultNotebook",
+    "DefaultOptions",
+    "DefaultOutputFormatType",
+    "DefaultPrintPrecision",
+    "DefaultStyle",
+    "DefaultStyleDefinitions",
+    "DefaultTextFormatType",
+    "DefaultTextInlineFormatType",
+    "DefaultTicksStyle",
+    "DefaultTooltipStyle",
+    "DefaultValue",
+    "DefaultValues",
+    "Defer",
+    "DefineExternal",
+    "DefineInputStreamMethod",
+    "DefineOutputStreamMethod",
+    "DefineResourceFunction",
+    "Definition",
+    "Degree",
+    "DegreeCentrality",
+    "DegreeGraphDistribution",
+    "DegreeLexicographic",
+    "DegreeReverseLexicographic",
+    "Deinitialization",
+    "Del",
+    "DelaunayMesh",
+    "Delayed",
+    "Deletable",
+    "Delete",
+    "DeleteAnomalies",
+    "DeleteBorderComponents",
+    "DeleteCases",
+    "DeleteChannel",
+    "DeleteCloudExpression",
+    "DeleteContents",
+    "DeleteDirectory",
+    "DeleteDuplicates",
+    "DeleteDuplicatesBy",
+    "DeleteFile",
+    "DeleteMissing",
+    "DeleteObject",
+    "DeletePermissionsKey",
+    "DeleteSearchIndex",
+    "DeleteSmallComponents",
+    "DeleteStopwords",
+    "DeleteWithContents",
+    "DeletionWarning",
+    "DelimitedArray",
+    "DelimitedSequence",
+    "Delimiter",
+    "DelimiterFlashTime",
+    "DelimiterMatching",
+    "Delimiters",
+    "DeliveryFunction",
+    "Dendrogram",
+    "Denominator",
+    "DensityGraphics",
+    "DensityHistogram",
+    "DensityPlot",
+    "DensityPlot3D",
+    "DependentVariables",
+    "Deploy",
+    "Deployed",
+    "Depth",
+    "DepthFirstScan",
+    "Derivative",
+    "DerivativeFilter",
+    "DerivedKey",
+    "DescriptorStateSpace",
+    "DesignMatrix",
+    "DestroyAfterEvaluation",
+    "Det",
+    "DeviceClose",
+    "DeviceConfigure",
+    "DeviceExecute",
+    "DeviceExecuteAsynchronous",
+    "DeviceObject",
+    "DeviceOpen",
+    "DeviceOpenQ",
+    "DeviceRead",
+    "DeviceReadBuffer",
+    "DeviceReadLatest",
+    "DeviceReadList",
+    "DeviceReadTimeSeries",
+    "DeviceStreams",
+    "DeviceWrite",
+    "DeviceWriteBuffer",
+    "Devices",
+    "DiacriticalPositioning",
+    "Diagonal",
+    "DiagonalMatrix",
+    "DiagonalMatrixQ",
+    "DiagonalizableMatrixQ",
+    "Dialog",
+    "DialogIndent",
+    "DialogInput",
+    "DialogLevel",
+    "DialogNotebook",
+    "DialogProlog",
+    "DialogReturn",
+    "DialogSymbols",
+    "Diamond",
+    "DiamondMatrix",
+    "DiceDissimilarity",
+    "DictionaryLookup",
+    "DictionaryWordQ",
+    "DifferenceDelta",
+    "DifferenceOrder",
+    "DifferenceQuotient",
+    "DifferenceRoot",
+    "DifferenceRootReduce",
+    "Differences",
+    "DifferentialD",
+    "DifferentialRoot",
+    "DifferentialRootReduce",
+    "DifferentiatorFilter",
+    "DigitBlock",
+    "DigitBlockMinimum",
+    "DigitCharacter",
+    "DigitCount",
+    "DigitQ",
+    "DigitalSignature",
+    "DihedralAngle",
+    "DihedralGroup",
+    "Dilation",
+    "DimensionReduce",
+    "DimensionReducerFunction",
+    "DimensionReduction",
+    "DimensionalCombinations",
+    "DimensionalMeshComponents",
+    "Dimensions",
+    "DiracComb",
+    "DiracDelta",
+    "DirectedEdge",
+    "DirectedEdges",
+    "DirectedGraph",
+    "DirectedGraphQ",
+    "DirectedInfinity",
+    "Direction",
+    "Directive",
+    "Directory",
+    "DirectoryName",
+    "DirectoryQ",
+    "DirectoryStack",
+    "DirichletBeta",
+    "DirichletCharacter",
+    "DirichletCondition",
+    "DirichletConvolve",
+    "DirichletDistribution",
+    "DirichletEta",
+    "DirichletL",
+    "DirichletLambda",
+    "DirichletTransform",
+    "DirichletWindow",
+    "DisableConsolePrintPacket",
+    "DisableFormatting",
+    "DiscreteChirpZTransform",
+    "DiscreteConvolve",
+    "DiscreteDelta",
+    "DiscreteHadamardTransform",
+    "DiscreteIndicator",
+    "DiscreteLQEstimatorGains",
+    "DiscreteLQRegulatorGains",
+    "DiscreteLimit",
+    "DiscreteLyapunovSolve",
+    "DiscreteMarkovProcess",
+    "DiscreteMaxLimit",
+    "DiscreteMinLimit",
+    "DiscretePlot",
+    "DiscretePlot3D",
+    "DiscreteRatio",
+    "DiscreteRiccatiSolve",
+    "DiscreteShift",
+    "DiscreteTimeModelQ",
+    "DiscreteUniformDistribution",
+    "DiscreteVariables",
+    "DiscreteWaveletData",
+    "DiscreteWaveletPacketTransform",
+    "DiscreteWaveletTransform",
+    "DiscretizeGraphics",
+    "DiscretizeRegion",
+    "Discriminant",
+    "DisjointQ",
+    "Disjunction",
+    "Disk",
+    "DiskBox",
+    "DiskMatrix",
+    "DiskSegment",
+    "Dispatch",
+    "DispatchQ",
+    "DispersionEstimatorFunction",
+    "Display",
+    "DisplayAllSteps",
+    "DisplayEndPacket",
+    "DisplayFlushImagePacket",
+    "DisplayForm",
+    "DisplayFunction",
+    "DisplayPacket",
+    "DisplayRules",
+    "DisplaySetSizePacket",
+    "DisplayString",
+    "DisplayTemporary",
+    "DisplayWith",
+    "DisplayWithRef",
+    "DisplayWithVariable",
+    "DistanceFunction",
+    "DistanceMatrix",
+    "DistanceTransform",
+    "Distribute",
+    "DistributeDefinitions",
+    "Distributed",
+    "DistributedContexts",
+    "DistributionChart",
+    "DistributionDomain",
+    "DistributionFitTest",
+    "DistributionParameterAssumptions",
+    "DistributionParameterQ",
+    "Dithering",
+    "Div",
+    "Divergence",
+    "Divide",
+    "DivideBy",
+    "DivideSides",
+    "Dividers",
+    "Divisible",
+    "DivisorSigma",
+    "DivisorSum",
+    "Divisors",
+    "Do",
+    "DockedCells",
+    "DocumentGenerator",
+    "DocumentGeneratorInformation",
+    "DocumentGeneratorInformationData",
+    "DocumentGenerators",
+    "DocumentNotebook",
+    "DocumentWeightingRules",
+    "Dodecahedron",
+    "DomainRegistrationInformation",
+    "DominantColors",
+    "Dot",
+    "DotDashed",
+    "DotEqual",
+    "DotLayer",
+    "DotPlusLayer",
+    "Dotted",
+    "DoubleBracketingBar",
+    "DoubleContourIntegral",
+    "DoubleDownArrow",
+    "DoubleLeftArrow",
+    "DoubleLeftRightArrow",
+    "DoubleLeftTee",
+    "DoubleLongLeftArrow",
+    "DoubleLongLeftRightArrow",
+    "DoubleLongRightArrow",
+    "DoubleRightArrow",
+    "DoubleRightTee",
+    "DoubleUpArrow",
+    "DoubleUpDownArrow",
+    "DoubleVerticalBar",
+    "DoublyInfinite",
+    "Down",
+    "DownArrow",
+    "DownArrowBar",
+    "DownArrowUpArrow",
+    "DownLeftRightVector",
+    "DownLeftTeeVector",
+    "DownLeftVector",
+    "DownLeftVectorBar",
+    "DownRightTeeVector",
+    "DownRightVector",
+    "DownRightVectorBar",
+    "DownTee",
+    "DownTeeArrow",
+    "DownValues",
+    "Downsample",
+    "DragAndDrop",
+    "DrawEdges",
+    "DrawFrontFaces",
+    "DrawHighlighted",
+    "Drop",
+    "DropoutLayer",
+    "Dt",
+    "DualLinearProgramming",
+    "DualPolyhedron",
+    "DualSystemsModel",
+    "DumpGet",
+    "DumpSave",
+    "DuplicateFreeQ",
+    "Duration",
+    "Dynamic",
+    "DynamicBox",
+    "DynamicBoxOptions",
+    "DynamicEvaluationTimeout",
+    "DynamicGeoGraphics",
+    "DynamicImage",
+    "DynamicLocation",
+    "DynamicModule",
+    "DynamicModuleBox",
+    "DynamicModuleBoxOptions",
+    "DynamicModuleParent",
+    "DynamicModuleValues",
+    "DynamicName",
+    "DynamicNamespace",
+    "DynamicReference",
+    "DynamicSetting",
+    "DynamicUpdating",
+    "DynamicWrapper",
+    "DynamicWrapperBox",
+    "DynamicWrapperBoxOptions",
+    "E",
+    "EarthImpactData",
+    "EarthquakeData",
+    "EccentricityCentrality",
+    "Echo",
+    "EchoFunction",
+    "EclipseType",
+    "EdgeAdd",
+    "EdgeBetweennessCentrality",
+    "EdgeCapForm",
+    "EdgeCapacity",
+    "EdgeColor",
+    "EdgeConnectivity",
+    "EdgeContract",
+    "EdgeCost",
+    "EdgeCount",
+    "EdgeCoverQ",
+    "EdgeCycleMatrix",
+    "EdgeDashing",
+    "EdgeDelete",
+    "EdgeDetect",
+    "EdgeForm",
+    "EdgeIndex",
+    "EdgeJoinForm",
+    "EdgeLabelStyle",
+    "EdgeLabeling",
+    "EdgeLabels",
+    "EdgeList",
+    "EdgeOpacity",
+    "EdgeQ",
+    "EdgeRenderingFunction",
+    "EdgeRules",
+    "EdgeShapeFunction",
+    "EdgeStyle",
+    "EdgeThickness",
+    "EdgeWeight",
+    "EdgeWeightedGraphQ",
+    "EditButtonSettings",
+    "EditCellTagsSettings",
+    "EditDistance",
+    "Editable",
+    "EffectiveInterest",
+    "Eigensystem",
+    "Eigenvalues",
+    "EigenvectorCentrality",
+    "Eigenvectors",
+    "Element",
+    "ElementData",
+    "ElementwiseLayer",
+    "ElidedForms",
+    "Eliminate",
+    "EliminationOrder",
+    "Ellipsoid",
+    "EllipticE",
+    "EllipticExp",
+    "EllipticExpPrime",
+    "EllipticF",
+    "EllipticFilterModel",
+    "EllipticK",
+    "EllipticLog",
+    "EllipticNomeQ",
+    "EllipticPi",
+    "EllipticReducedHalfPeriods",
+    "EllipticTheta",
+    "EllipticThetaPrime",
+    "EmbedCode",
+    "EmbeddedHTML",
+    "EmbeddedService",
+    "EmbeddingLayer",
+    "EmbeddingObject",
+    "EmitSound",
+    "EmphasizeSyntaxErrors",
+    "EmpiricalDistribution",
+    "Empty",
+    "EmptyGraphQ",
+    "EmptyRegion",
+    "EnableConsolePrintPacket",
+    "Enabled",
+    "Encode",
+    "Encrypt",
+    "EncryptFile",
+    "EncryptedObject",
+    "End",
+    "EndAdd",
+    "EndDialogPacket",
+    "EndFrontEndInteractionPacket",
+    "EndOfBuffer",
+    "EndOfFile",
+    "EndOfLine",
+    "EndOfString",
+    "EndPackage",
+    "EngineEnvironment",
+    "EngineeringForm",
+    "Enter",
+    "EnterExpressionPacket",
+    "EnterTextPacket",
+    "Entity",
+    "EntityClass",
+    "EntityClassList",
+    "EntityCopies",
+    "EntityFunction",
+    "EntityGroup",
+    "EntityInstance",
+    "EntityList",
+    "EntityPrefetch",
+    "EntityProperties",
+    "EntityProperty",
+    "EntityPropertyClass",
+    "EntityRegister",
+    "EntityStore",
+    "EntityStores",
+    "EntityTypeName",
+    "EntityUnregister",
+    "EntityValue",
+    "Entropy",
+    "EntropyFilter",
+    "Environment",
+    "Epilog",
+    "EpilogFunction",
+    "Equal",
+    "EqualColumns",
+    "EqualRows",
+    "EqualTilde",
+    "EqualTo",
+    "EquatedTo",
+    "Equilibrium",
+    "EquirippleFilterKernel",
+    "Equivalent",
+    "Erf",
+    "Erfc",
+    "Erfi",
+    "ErlangB",
+    "ErlangC",
+    "ErlangDistribution",
+    "Erosion",
+    "ErrorBox",
+    "ErrorBoxOptions",
+    "ErrorNorm",
+    "ErrorPacket",
+    "ErrorsDialogSettings",
+    "EscapeRadius",
+    "EstimatedBackground",
+    "EstimatedDistribution",
+    "EstimatedProcess",
+    "EstimatorGains",
+    "EstimatorRegulator",
+    "EuclideanDistance",
+    "EulerAngles",
+    "EulerCharacteristic",
+    "EulerE",
+    "EulerGamma",
+    "EulerMatrix",
+    "EulerPhi",
+    "EulerianGraphQ",
+    "Evaluatable",
+    "Evaluate",
+    "EvaluatePacket",
+    "EvaluateScheduledTask",
+    "Evaluated",
+    "EvaluationBox",
+    "EvaluationCell",
+    "EvaluationCompletionAction",
+    "EvaluationData",
+    "EvaluationElements",
+    "EvaluationEnvironment",
+    "EvaluationMode",
+    "EvaluationMonitor",
+    "EvaluationNotebook",
+    "EvaluationObject",
+    "EvaluationOrder",
+    "Evaluator",
+    "EvaluatorNames",
+    "EvenQ",
+    "EventData",
+    "EventEvaluator",
+    "EventHandler",
+    "EventHandlerTag",
+    "EventLabels",
+    "EventSeries",
+    "ExactBlackmanWindow",
+    "ExactNumberQ",
+    "ExactRootIsolation",
+    "ExampleData",
+    "Except",
+    "ExcludePods",
+    "ExcludedForms",
+    "ExcludedLines",
+    "ExcludedPhysicalQuantities",
+    "Exclusions",
+    "ExclusionsStyle",
+    "Exists",
+    "Exit",
+    "ExitDialog",
+    "ExoplanetData",
+    "Exp",
+    "ExpGammaDistribution",
+    "ExpIntegralE",
+    "ExpIntegralEi",
+    "ExpToTrig",
+    "Expand",
+    "ExpandAll",
+    "ExpandDenominator",
+    "ExpandFileName",
+    "ExpandNumerator",
+    "Expectation",
+    "ExpectationE",
+    "ExpectedValue",
+    "ExpirationDate",
+    "Exponent",
+    "ExponentFunction",
+    "ExponentPosition",
+    "ExponentStep",
+    "ExponentialDistribution",
+    "ExponentialFamily",
+    "ExponentialGeneratingFunction",
+    "ExponentialMovingAverage",
+    "ExponentialPowerDistribution",
+    "Export",
+    "ExportAutoReplacements",
+    "ExportByteArray",
+    "ExportForm",
+    "ExportPacket",
+    "ExportString",
+    "Expression",
+    "ExpressionCell",
+    "ExpressionPacket",
+    "ExpressionUUID",
+    "ExtendedEntityClass",
+    "ExtendedGCD",
+    "Extension",
+    "ExtentElementFunction",
+    "ExtentMarkers",
+    "ExtentSize",
+    "ExternalBundle",
+    "ExternalCall",
+    "ExternalDataCharacterEncoding",
+    "ExternalEvaluate",
+    "ExternalFunction",
+    "ExternalFunctionName",
+    "ExternalObject",
+    "ExternalOptions",
+    "ExternalSessionObject",
+    "ExternalSessions",
+    "ExternalTypeSignature",
+    "ExternalValue",
+    "Extract",
+    "ExtractArchive",
+    "ExtractLayer",
+    "ExtremeValueDistribution",
+    "FARIMAProcess",
+    "FEDisableConsolePrintPacket",
+    "FEEnableConsolePrintPacket",
+    "FRatioDistribution",
+    "FaceForm",
+    "FaceGrids",
+    "FaceGridsStyle",
+    "FacialFeatures",
+    "Factor",
+    "FactorComplete",
+    "FactorInteger",
+    "FactorList",
+    "FactorSquareFree",
+    "FactorSquareFreeList",
+    "FactorTerms",
+    "FactorTermsList",
+    "Factorial",
+    "Factorial2",
+    "FactorialMoment",
+    "FactorialMomentGeneratingFunction",
+    "FactorialPower",
+    "Fail",
+    "Failure",
+    "FailureAction",
+    "FailureDistribution",
+    "FailureQ",
+    "False",
+    "FareySequence",
+    "FeatureDistance",
+    "FeatureExtract",
+    "FeatureExtraction",
+    "FeatureExtractor",
+    "FeatureExtractorFunction",
+    "FeatureNames",
+    "FeatureNearest",
+    "FeatureSpacePlot",
+    "FeatureSpacePlot3D",
+    "FeatureTypes",
+    "FeedbackLinearize",
+    "FeedbackSector",
+    "FeedbackSectorStyle",
+    "FeedbackType",
+    "FetalGrowthData",
+    "Fibonacci",
+    "Fibonorial",
+    "FieldCompletionFunction",
+    "FieldHint",
+    "FieldHintStyle",
+    "FieldMasked",
+    "FieldSize",
+    "File",
+    "FileBaseName",
+    "FileByteCount",
+    "FileConvert",
+    "FileDate",
+    "FileExistsQ",
+    "FileExtension",
+    "FileFormat",
+    "FileHandler",
+    "FileHash",
+    "FileInformation",
+    "FileName",
+    "FileNameDepth",
+    "FileNameDialogSettings",
+    "FileNameDrop",
+    "FileNameForms",
+    "FileNameJoin",
+    "FileNameSetter",
+    "FileNameSplit",
+    "FileNameTake",
+    "FileNames",
+    "FilePrint",
+    "FileSize",
+    "FileSystemMap",
+    "FileSystemScan",
+    "FileTemplate",
+    "FileTemplateApply",
+    "FileType",
+    "FilledCurve",
+    "FilledCurveBox",
+    "FilledCurveBoxOptions",
+    "Filling",
+    "FillingStyle",
+    "FillingTransform",
+    "FilterRules",
+    "FilteredEntityClass",
+    "FinancialBond",
+    "FinancialData",
+    "FinancialDerivative",
+    "FinancialIndicator",
+    "Find",
+    "FindAnomalies",
+    "FindArgMax",
+    "FindArgMin",
+    "FindChannels",
+    "FindClique",
+    "FindClusters",
+    "FindCookies",
+    "FindCurvePath",
+    "FindCycle",
+    "FindDevices",
+    "FindDistribution",
+    "FindDistributionParameters",
+    "FindDivisions",
+    "FindEdgeCover",
+    "FindEdgeCut",
+    "FindEdgeIndependentPaths",
+    "FindEquationalProof",
+    "FindEulerianCycle",
+    "FindExternalEvaluators",
+    "FindFaces",
+    "FindFile",
+    "FindFit",
+    "FindFormula",
+    "FindFundamentalCycles",
+    "FindGeneratingFunction",
+    "FindGeoLocation",
+    "FindGeometricConjectures",
+    "FindGeometricTransform",
+    "FindGraphCommunities",
+    "FindGraphIsomorphism",
+    "FindGraphPartition",
+    "FindHamiltonianCycle",
+    "FindHamiltonianPath",
+    "FindHiddenMarkovStates",
+    "FindIndependentEdgeSet",
+    "FindIndependentVertexSet",
+    "FindInstance",
+    "FindIntegerNullVector",
+    "FindKClan",
+    "FindKClique",
+    "FindKClub",
+    "FindKPlex",
+    "FindLibrary",
+    "FindLinearRecurrence",
+    "FindList",
+    "FindMatchingColor",
+    "FindMaxValue",
+    "FindMaximum",
+    "FindMaximumFlow",
+    "FindMeshDefects",
+    "FindMinValue",
+    "FindMinimum",
+    "FindMinimumCostFlow",
+    "FindMinimumCut",
+    "FindMoleculeSubstructure",
+    "FindPath",
+    "FindPeaks",
+    "FindPermutation",
+    "FindPostmanTour",
+    "FindProcessParameters",
+    "FindRepeat",
+    "FindRoot",
+    "FindSequenceFunction",
+    "FindSettings",
+    "FindShortestPath",
+    "FindShortestTour",
+    "FindSpanningTree",
+    "FindSystemModelEquilibrium",
+    "FindTextualAnswer",
+    "FindThreshold",
+    "FindTransientRepeat",
+    "FindVertexCover",
+    "FindVertexCut",
+    "FindVertexIndependentPaths",
+    "Fine",
+    "FinishDynamic",
+    "FiniteAbelianGroupCount",
+    "FiniteGroupCount",
+    "FiniteGroupData",
+    "First",
+    "FirstCase",
+    "FirstPassageTimeDistribution",
+    "FirstPosition",
+    "FischerGroupFi22",
+    "FischerGroupFi23",
+    "FischerGroupFi24Prime",
+    "FisherHypergeometricDistribution",
+    "FisherRatioTest",
+    "FisherZDistribution",
+    "Fit",
+    "FitAll",
+    "FitRegularization",
+    "FittedModel",
+    "FixedOrder",
+    "FixedPoint",
+    "FixedPointList",
+    "FlashSelection",
+    "Flat",
+    "FlatTopWindow",
+    "Flatten",
+    "FlattenAt",
+    "FlattenLayer",
+    "FlipView",
+    "Floor",
+    "FlowPolynomial",
+    "FlushPrintOutputPacket",
+    "Fold",
+    "FoldList",
+    "FoldPair",
+    "FoldPairList",
+    "FollowRedirects",
+    "Font",
+    "FontColor",
+    "FontFamily",
+    "FontForm",
+    "FontName",
+    "FontOpacity",
+    "FontPostScriptName",
+    "FontProperties",
+    "FontReencoding",
+    "FontSize",
+    "FontSlant",
+    "FontSubstitutions",
+    "FontTracking",
+    "FontVariations",
+    "FontWeight",
+    "For",
+    "ForAll",
+    "FormBox",
+    "FormBoxOptions",
+    "FormControl",
+    "FormFunction",
+    "FormLayoutFunction",
+    "FormObject",
+    "FormPage",
+    "FormTheme",
+    "Format",
+    "FormatRules",
+    "FormatType",
+    "FormatTypeAutoConvert",
+    "FormatValues",
+    "FormulaData",
+    "FormulaLookup",
+    "FortranForm",
+    "Forward",
+    "ForwardBackward",
+    "Fourier",
+    "FourierCoefficient",
+    "FourierCosCoefficient",
+    "FourierCosSeries",
+    "FourierCosTransform",
+    "FourierDCT",
+    "FourierDCTFilter",
+    "FourierDCTMatrix",
+    "FourierDST",
+    "FourierDSTMatrix",
+    "FourierMatrix",
+    "FourierParameters",
+    "FourierSequenceTransform",
+    "FourierSeries",
+    "FourierSinCoefficient",
+    "FourierSinSeries",
+    "FourierSinTransform",
+    "FourierTransform",
+    "FourierTrigSeries",
+    "FractionBox",
+    "FractionBoxOptions",
+    "FractionLine",
+    "FractionalBrownianMotionProcess",
+    "FractionalGaussianNoiseProcess",
+    "FractionalPart",
+    "Frame",
+    "FrameBox",
+    "FrameBoxOptions",
+    "FrameInset",
+    "FrameLabel",
+    "FrameMargins",
+    "FrameRate",
+    "FrameStyle",
+    "FrameTicks",
+    "FrameTicksStyle",
+    "Framed",
+    "Frameless",
+    "FrechetDistribution",
+    "FreeQ",
+    "FrenetSerretSystem",
+    "FrequencySamplingFilterKernel",
+    "FresnelC",
+    "FresnelF",
+    "FresnelG",
+    "FresnelS",
+    "Friday",
+    "FrobeniusNumber",
+    "FrobeniusSolve",
+    "FromAbsoluteTime",
+    "FromCharacterCode",
+    "FromCoefficientRules",
+    "FromContinuedFraction",
+    "FromDMS",
+    "FromDate",
+    "FromDigits",
+    "FromEntity",
+    "FromJulianDate",
+    "FromLetterNumber",
+    "FromPolarCoordinates",
+    "FromRomanNumeral",
+    "FromSphericalCoordinates",
+    "FromUnixTime",
+    "Front",
+    "FrontEndDynamicExpression",
+    "FrontEndEventActions",
+    "FrontEndExecute",
+    "FrontEndObject",
+    "FrontEndResource",
+    "FrontEndResourceString",
+    "FrontEndStackSize",
+    "FrontEndToken",
+    "FrontEndTokenExecute",
+    "FrontEndValueCache",
+    "FrontEndVersion",
+    "FrontFaceColor",
+    "FrontFaceOpacity",
+    "Full",
+    "FullAxes",
+    "FullDefinition",
+    "FullForm",
+    "FullGraphics",
+    "FullInformationOutputRegulator",
+    "FullOptions",
+    "FullRegion",
+    "FullSimplify",
+    "Function",
+    "FunctionCompile",
+    "FunctionCompileExport",
+    "FunctionCompileExportByteArray",
+    "FunctionCompileExportLibrary",
+    "FunctionCompileExportString",
+    "FunctionDomain",
+    "FunctionExpand",
+    "FunctionInterpolation",
+    "FunctionPeriod",
+    "FunctionRange",
+    "FunctionSpace",
+    "FussellVeselyImportance",
+    "GARCHProcess",
+    "GCD",
+    "GaborFilter",
+    "GaborMatrix",
+    "GaborWavelet",
+    "GainMargins",
+    "GainPhaseMargins",
+    "GalaxyData",
+    "GalleryView",
+    "Gamma",
+    "GammaDistribution",
+    "GammaRegularized",
+    "GapPenalty",
+    "GatedRecurrentLayer",
+    "Gather",
+    "GatherBy",
+    "GaugeFaceElementFunction",
+    "GaugeFaceStyle",
+    "GaugeFrameElementFunction",
+    "GaugeFrameSize",
+    "GaugeFrameStyle",
+    "GaugeLabels",
+    "GaugeMarkers",
+    "GaugeStyle",
+    "GaussianFilter",
+    "GaussianIntegers",
+    "GaussianMatrix",
+    "GaussianOrthogonalMatrixDistribution",
+    "GaussianSymplecticMatrixDistribution",
+    "GaussianUnitaryMatrixDistribution",
+    "GaussianWindow",
+    "GegenbauerC",
+    "General",
+    "GeneralizedLinearModelFit",
+    "GenerateAsymmetricKeyPair",
+    "GenerateConditions",
+    "GenerateDerivedKey",
+    "GenerateDigitalSignature",
+    "GenerateDocument",
+    "GenerateHTTPResponse",
+    "GenerateSecuredAuthenticationKey",
+    "GenerateSymmetricKey",
+    "GeneratedCell",
+    "GeneratedDocumentBinding",
+    "GeneratedParameters",
+    "GeneratedQuantityMagnitudes",
+    "GeneratingFunction",
+    "GeneratorDescription",
+    "GeneratorHistoryLength",
+    "GeneratorOutputType",
+    "Generic",
+    "GenericCylindricalDecomposition",
+    "GenomeData",
+    "GenomeLookup",
+    "GeoAntipode",
+    "GeoArea",
+    "GeoArraySize",
+    "GeoBackground",
+    "GeoBoundingBox",
+    "GeoBounds",
+    "GeoBoundsRegion",
+    "GeoBubbleChart",
+    "GeoCenter",
+    "GeoCircle",
+    "GeoDestination",
+    "GeoDirection",
+    "GeoDisk",
+    "GeoDisplacement",
+    "GeoDistance",
+    "GeoDistanceList",
+    "GeoElevationData",
+    "GeoEntities",
+    "GeoGraphics",
+    "GeoGridDirectionDifference",
+    "GeoGridLines",
+    "GeoGridLinesStyle",
+    "GeoGridPosition",
+    "GeoGridRange",
+    "GeoGridRangePadding",
+    "GeoGridUnitArea",
+    "GeoGridUnitDistance",
+    "GeoGridVector",
+    "GeoGroup",
+    "GeoHemisphere",
+    "GeoHemisphereBoundary",
+    "GeoHistogram",
+    "GeoIdentify",
+    "GeoImage",
+    "GeoLabels",
+    "GeoLength",
+    "GeoListPlot",
+    "GeoLocation",
+    "GeoMarker",
+    "GeoModel",
+    "GeoNearest",
+    "GeoPath",
+    "GeoPosition",
+    "GeoPositionEN",
+    "GeoPositionXYZ",
+    "GeoProjection",
+    "GeoProjectionData",
+    "GeoRange",
+    "GeoRangePadding",
+    "GeoRegionValuePlot",
+    "GeoResolution",
+    "GeoScaleBar",
+    "GeoServer",
+    "GeoSmoothHistogram",
+    "GeoStreamPlot",
+    "GeoStyling",
+    "GeoStylingImageFunction",
+    "GeoVariant",
+    "GeoVector",
+    "GeoVectorEN",
+    "GeoVectorPlot",
+    "GeoVectorXYZ",
+    "GeoVisibleRegion",
+    "GeoVisibleRegionBoundary",
+    "GeoWithinQ",
+    "GeoZoomLevel",
+    "GeodesicClosing",
+    "GeodesicDilation",
+    "GeodesicErosion",
+    "GeodesicOpening",
+    "GeodesyData",
+    "GeogravityModelData",
+    "GeologicalPeriodData",
+    "GeomagneticModelData",
+    "GeometricAssertion",
+    "GeometricBrownianMotionProcess",
+    "GeometricDistribution",
+    "GeometricMean",
+    "GeometricMeanFilter",
+    "GeometricScene",
+    "GeometricTransformation",
+    "GeometricTransformation3DBox",
+    "GeometricTransformation3DBoxOptions",
+    "GeometricTransformationBox",
+    "GeometricTransformationBoxOptions",
+    "GestureHandler",
+    "GestureHandlerTag",
+    "Get",
+    "GetBoundingBoxSizePacket",
+    "GetContext",
+    "GetEnvironment",
+    "GetFileName",
+    "GetFrontEndOptionsDataPacket",
+    "GetLinebreakInformationPacket",
+    "GetMenusPacket",
+    "GetPageBreakInformationPacket",
+    "Glaisher",
+    "GlobalClusteringCoefficient",
+    "GlobalPreferences",
+    "GlobalSession",
+    "Glow",
+    "GoldenAngle",
+    "GoldenRatio",
+    "GompertzMakehamDistribution",
+    "GoodmanKruskalGamma",
+    "GoodmanKruskalGammaTest",
+    "Goto",
+    "Grad",
+    "Gradient",
+    "GradientFilter",
+    "GradientOrientationFilter",
+    "GrammarApply",
+    "GrammarRules",
+    "GrammarToken",
+    "Graph",
+    "Graph3D",
+    "GraphAssortativity",
+    "GraphAutomorphismGroup",
+    "GraphCenter",
+    "GraphComplement",
+    "GraphData",
+    "GraphDensity",
+    "GraphDiameter",
+    "GraphDifference",
+    "GraphDisjointUnion",
+    "GraphDistance",
+    "GraphDistanceMatrix",
+    "GraphElementData",
+    "GraphEmbedding",
+    "GraphHighlight",
+    "GraphHighlightStyle",
+    "GraphHub",
+    "GraphIntersection",
+    "GraphLayout",
+    "GraphLinkEfficiency",
+    "GraphPeriphery",
+    "GraphPlot",
+    "GraphPlot3D",
+    "GraphPower",
+    "GraphPropertyDistribution",
+    "GraphQ",
+    "GraphRadius",
+    "GraphReciprocity",
+    "GraphRoot",
+    "GraphStyle",
+    "GraphUnion",
+    "Graphics",
+    "Graphics3D",
+    "Graphics3DBox",
+    "Graphics3DBoxOptions",
+    "GraphicsArray",
+    "GraphicsBaseline",
+    "GraphicsBox",
+    "GraphicsBoxOptions",
+    "GraphicsColor",
+    "GraphicsColumn",
+    "GraphicsComplex",
+    "GraphicsComplex3DBox",
+    "GraphicsComplex3DBoxOptions",
+    "GraphicsComplexBox",
+    "GraphicsComplexBoxOptions",
+    "GraphicsContents",
+    "GraphicsData",
+    "GraphicsGrid",
+    "GraphicsGridBox",
+    "GraphicsGroup",
+    "GraphicsGroup3DBox",
+    "GraphicsGroup3DBoxOptions",
+    "GraphicsGroupBox",
+    "GraphicsGroupBoxOptions",
+    "GraphicsGrouping",
+    "GraphicsHighlightColor",
+    "GraphicsRow",
+    "GraphicsSpacing",
+    "GraphicsStyle",
+    "Gray",
+    "GrayLevel",
+    "Greater",
+    "GreaterEqual",
+    "GreaterEqualLess",
+    "GreaterEqualThan",
+    "GreaterFullEqual",
+    "GreaterGreater",
+    "GreaterLess",
+    "GreaterSlantEqual",
+    "GreaterThan",
+    "GreaterTilde",
+    "Green",
+    "GreenFunction",
+    "Grid",
+    "GridBaseline",
+    "GridBox",
+    "GridBoxAlignment",
+    "GridBoxBackground",
+    "GridBoxDividers",
+    "GridBoxFrame",
+    "GridBoxItemSize",
+    "GridBoxItemStyle",
+    "GridBoxOptions",
+    "GridBoxSpacings",
+    "GridCreationSettings",
+    "GridDefaultElement",
+    "GridElementStyleOptions",
+    "GridFrame",
+    "GridFrameMargins",
+    "GridGraph",
+    "GridLines",
+    "GridLinesStyle",
+    "GroebnerBasis",
+    "GroupActionBase",
+    "GroupBy",
+    "GroupCentralizer",
+    "GroupElementFromWord",
+    "GroupElementPosition",
+    "GroupElementQ",
+    "GroupElementToWord",
+    "GroupElements",
+    "GroupGenerators",
+    "GroupMultiplicationTable",
+    "GroupOrbits",
+    "GroupOrder",
+    "GroupPageBreakWithin",
+    "GroupSetwiseStabilizer",
+    "GroupStabilizer",
+    "GroupStabilizerChain",
+    "GroupTogetherGrouping",
+    "GroupTogetherNestedGrouping",
+    "Groupings",
+    "GrowCutComponents",
+    "Gudermannian",
+    "GuidedFilter",
+    "GumbelDistribution",
+    "HITSCentrality",
+    "HTMLSave",
+    "HTTPErrorResponse",
+    "HTTPRedirect",
+    "HTTPRequest",
+    "HTTPRequestData",
+    "HTTPResponse",
+    "HaarWavelet",
+    "HadamardMatrix",
+    "HalfLine",
+    "HalfNormalDistribution",
+    "HalfPlane",
+    "HalfSpace",
+    "HamiltonianGraphQ",
+    "HammingDistance",
+    "HammingWindow",
+    "HandlerFunctions",
+    "HandlerFunctionsKeys",
+    "HankelH1",
+    "HankelH2",
+    "HankelMatrix",
+    "HankelTransform",
+    "HannPoissonWindow",
+    "HannWindow",
+    "HaradaNortonGroupHN",
+    "HararyGraph",
+    "HarmonicMean",
+    "HarmonicMeanFilter",
+    "HarmonicNumber",
+    "Hash",
+    "Haversine",
+    "HazardFunction",
+    "Head",
+    "HeadCompose",
+    "HeaderLines",
+    "Heads",
+    "HeavisideLambda",
+    "HeavisidePi",
+    "HeavisideTheta",
+    "HeldGroupHe",
+    "HeldPart",
+    "HelpBrowserLookup",
+    "HelpBrowserNotebook",
+    "HelpBrowserSettings",
+    "Here",
+    "HermiteDecomposition",
+    "HermiteH",
+    "HermitianMatrixQ",
+    "HessenbergDecomposition",
+    "Hessian",
+    "HexadecimalCharacter",
+    "Hexahedron",
+    "HexahedronBox",
+    "HexahedronBoxOptions",
+    "HiddenMarkovProcess",
+    "HiddenSurface",
+    "HighlightGraph",
+    "HighlightImage",
+    "HighlightMesh",
+    "Highlighted",
+    "HighpassFilter",
+    "HigmanSimsGroupHS",
+    "HilbertCurve",
+    "HilbertFilter",
+    "HilbertMatrix",
+    "Histogram",
+    "Histogram3D",
+    "HistogramDistribution",
+    "HistogramList",
+    "HistogramTransform",
+    "HistogramTransformInterpolation",
+    "HistoricalPeriodData",
+    "HitMissTransform",
+    "HjorthDistribution",
+    "HodgeDual",
+    "HoeffdingD",
+    "HoeffdingDTest",
+    "Hold",
+    "HoldAll",
+    "HoldAllComplete",
+    "HoldComplete",
+    "HoldFirst",
+    "HoldForm",
+    "HoldPattern",
+    "HoldRest",
+    "HolidayCalendar",
+    "HomeDirectory",
+    "HomePage",
+    "Horizontal",
+    "HorizontalForm",
+    "HorizontalGauge",
+    "HorizontalScrollPosition",
+    "HornerForm",
+    "HostLookup",
+    "HotellingTSquareDistribution",
+    "HoytDistribution",
+    "Hue",
+    "HumanGrowthData",
+    "HumpDownHump",
+    "HumpEqual",
+    "HurwitzLerchPhi",
+    "HurwitzZeta",
+    "HyperbolicDistribution",
+    "HypercubeGraph",
+    "HyperexponentialDistribution",
+    "Hyperfactorial",
+    "Hypergeometric",
+    "Hypergeometric0F1",
+    "Hypergeometric0F1Regularized",
+    "Hypergeometric1F1",
+    "Hypergeometric1F1Regularized",
+    "Hypergeometric2F1",
+    "Hypergeometric2F1Regularized",
+    "HypergeometricDistribution",
+    "HypergeometricPFQ",
+    "HypergeometricPFQRegularized",
+    "Hyperlink",
+    "HyperlinkCreationSettings",
+    "Hyperplane",
+    "Hyphenation",
+    "HyphenationOptions",
+    "HypoexponentialDistribution",
+    "HypothesisTestData",
+    "I",
+    "IPAddress",
+    "IconData",
+    "IconRules",
+    "Iconize",
+    "IconizedObject",
+    "Icosahedron",
+    "Identity",
+    "IdentityMatrix",
+    "If",
+    "IgnoreCase",
+    "IgnoreDiacritics",
+    "IgnorePunctuation",
+    "IgnoreSpellCheck",
+    "IgnoringInactive",
+    "Im",
+    "Image",
+    "Image3D",
+    "Image3DProjection",
+    "Image3DSlices",
+    "ImageAccumulate",
+    "ImageAdd",
+    "ImageAdjust",
+    "ImageAlign",
+    "ImageApply",
+    "ImageApplyIndexed",
+    "ImageAspectRatio",
+    "ImageAssemble",
+    "ImageAugmentationLayer",
+    "ImageBoundingBoxes",
+    "ImageCache",
+    "ImageCacheValid",
+    "ImageCapture",
+    "ImageCaptureFunction",
+    "ImageCases",
+    "ImageChannels",
+    "ImageClip",
+    "ImageCollage",
+    "ImageColorSpace",
+    "ImageCompose",
+    "ImageContainsQ",
+    "ImageContents",
+    "ImageConvolve",
+    "ImageCooccurrence",
+    "ImageCorners",
+    "ImageCorrelate",
+    "ImageCorrespondingPoints",
+    "ImageCrop",
+    "ImageData",
+    "ImageDeconvolve",
+    "ImageDemosaic",
+    "ImageDifference",
+    "ImageDimensions",
+    "ImageDisplacements",
+    "ImageDistance",
+    "ImageEffect",
+    "ImageExposureCombine",
+    "ImageFeatureTrack",
+    "ImageFileApply",
+    "ImageFileFilter",
+    "ImageFileScan",
+    "ImageFilter",
+    "ImageFocusCombine",
+    "ImageForestingComponents",
+    "ImageFormattingWidth",
+    "ImageForwardTransformation",
+    "ImageGraphics",
+    "ImageHistogram",
+    "ImageIdentify",
+    "ImageInstanceQ",
+    "ImageKeypoints",
+    "ImageLevels",
+    "ImageLines",
+    "ImageMargins",
+    "ImageMarker",
+    "ImageMarkers",
+    "ImageMeasurements",
+    "ImageMesh",
+    "ImageMultiply",
+    "ImageOffset",
+    "ImagePad",
+    "ImagePadding",
+    "ImagePartition",
+    "ImagePeriodogram",
+    "ImagePerspectiveTransformation",
+    "ImagePosition",
+    "ImagePreviewFunction",
+    "ImagePyramid",
+    "ImagePyramidApply",
+    "ImageQ",
+    "ImageRangeCache",
+    "ImageRecolor",
+    "ImageReflect",
+    "ImageRegion",
+    "ImageResize",
+    "ImageResolution",
+    "ImageRestyle",
+    "ImageRotate",
+    "ImageRotated",
+    "ImageSaliencyFilter",
+    "ImageScaled",
+    "ImageScan",
+    "ImageSize",
+    "ImageSizeAction",
+    "ImageSizeCache",
+    "ImageSizeMultipliers",
+    "ImageSizeRaw",
+    "ImageSubtract",
+    "ImageTake",
+    "ImageTransformation",
+    "ImageTrim",
+    "ImageType",
+    "ImageValue",
+    "ImageValuePositions",
+    "ImagingDevice",
+    "ImplicitRegion",
+    "Implies",
+    "Import",
+    "ImportAutoReplacements",
+    "ImportByteArray",
+    "ImportOptions",
+    "ImportString",
+    "ImprovementImportance",
+    "In",
+    "InString",
+    "Inactivate",
+    "Inactive",
+    "IncidenceGraph",
+    "IncidenceList",
+    "IncidenceMatrix",
+    "IncludeAromaticBonds",
+    "IncludeConstantBasis",
+    "IncludeDefinitions",
+    "IncludeDirectories",
+    "IncludeFileExtension",
+    "IncludeGeneratorTasks",
+    "IncludeHydrogens",
+    "IncludeInflections",
+    "IncludeMetaInformation",
+    "IncludePods",
+    "IncludeQuantities",
+    "IncludeRelatedTables",
+    "IncludeSingularTerm",
+    "IncludeWindowTimes",
+    "Increment",
+    "IndefiniteMatrixQ",
+    "Indent",
+    "IndentMaxFraction",
+    "IndentingNewlineSpacings",
+    "IndependenceTest",
+    "IndependentEdgeSetQ",
+    "IndependentPhysicalQuantity",
+    "IndependentUnit",
+    "IndependentUnitDimension",
+    "IndependentVertexSetQ",
+    "Indeterminate",
+    "IndeterminateThreshold",
+    "IndexCreationOptions",
+    "IndexGraph",
+    "IndexTag",
+    "Indexed",
+    "Inequality",
+    "InexactNumberQ",
+    "InexactNumbers",
+    "InfiniteLine",
+    "InfinitePlane",
+    "Infinity",
+    "Infix",
+    "InflationAdjust",
+    "InflationMethod",
+    "Information",
+    "InformationData",
+    "InformationDataGrid",
+    "InheritScope",
+    "Inherited",
+    "InhomogeneousPoissonProcess",
+    "InitialEvaluationHistory",
+    "InitialSeeding",
+    "Initialization",
+    "InitializationCell",
+    "InitializationCellEvaluation",
+    "InitializationCellWarning",
+    "InitializationObjects",
+    "InitializationValue",
+    "Initialize",
+    "InlineCounterAssignments",
+    "InlineCounterIncrements",
+    "InlineRules",
+    "Inner",
+    "InnerPolygon",
+    "InnerPolyhedron",
+    "Inpaint",
+    "Input",
+    "InputAliases",
+    "InputAssumptions",
+    "InputAutoReplacements",
+    "InputField",
+    "InputFieldBox",
+    "InputFieldBoxOptions",
+    "InputForm",
+    "InputGrouping",
+    "InputNamePacket",
+    "InputNotebook",
+    "InputPacket",
+    "InputSettings",
+    "InputStream",
+    "InputString",
+    "InputStringPacket",
+    "InputToBoxFormPacket",
+    "Insert",
+    "InsertLinebreaks",
+    "InsertResults",
+    "InsertionFunction",
+    "InsertionPointObject",
+    "Inset",
+    "Inset3DBox",
+    "Inset3DBoxOptions",
+    "InsetBox",
+    "InsetBoxOptions",
+    "Insphere",
+    "Install",
+    "InstallService",
+    "InstanceNormalizationLayer",
+    "Integer",
+    "IntegerDigits",
+    "IntegerExponent",
+    "IntegerLength",
+    "IntegerName",
+    "IntegerPart",
+    "IntegerPartitions",
+    "IntegerQ",
+    "IntegerReverse",
+    "IntegerString",
+    "Integers",
+    "Integral",
+    "Integrate",
+    "Interactive",
+    "InteractiveTradingChart",
+    "Interlaced",
+    "Interleaving",
+    "InternallyBalancedDecomposition",
+    "InterpolatingFunction",
+    "InterpolatingPolynomial",
+    "Interpolation",
+    "InterpolationOrder",
+    "InterpolationPoints",
+    "InterpolationPrecision",
+    "InterpretTemplate",
+    "Interpretation",
+    "InterpretationBox",
+    "InterpretationBoxOptions",
+    "InterpretationFunction",
+    "Interpreter",
+    "InterquartileRange",
+    "Interrupt",
+    "InterruptSettings",
+    "IntersectingQ",
+    "Intersection",
+    "Interval",
+    "IntervalIntersection",
+    "IntervalMarkers",
+    "IntervalMarkersStyle",
+    "IntervalMemberQ",
+    "IntervalSlider",
+    "IntervalUnion",
+    "Into",
+    "Inverse",
+    "InverseBetaRegularized",
+    "InverseCDF",
+    "InverseChiSquareDistribution",
+    "InverseContinuousWaveletTransform",
+    "InverseDistanceTransform",
+    "InverseEllipticNomeQ",
+    "InverseErf",
+    "InverseErfc",
+    "InverseFourier",
+    "InverseFourierCosTransform",
+    "InverseFourierSequenceTransform",
+    "InverseFourierSinTransform",
+    "InverseFourierTransform",
+    "InverseFunction",
+    "InverseFunctions",
+    "InverseGammaDistribution",
+    "InverseGammaRegularized",
+    "InverseGaussianDistribution",
+    "InverseGudermannian",
+    "InverseHankelTransform",
+    "InverseHaversine",
+    "InverseImagePyramid",
+    "InverseJacobiCD",
+    "InverseJacobiCN",
+    "InverseJacobiCS",
+    "InverseJacobiDC",
+    "InverseJacobiDN",
+    "InverseJacobiDS",
+    "InverseJacobiNC",
+    "InverseJacobiND",
+    "InverseJacobiNS",
+    "InverseJacobiSC",
+    "InverseJacobiSD",
+    "InverseJacobiSN",
+    "InverseLaplaceTransform",
+    "InverseMellinTransform",
+    "InversePermutation",
+    "InverseRadon",
+    "InverseRadonTransform",
+    "InverseSeries",
+    "InverseShortTimeFourier",
+    "InverseSpectrogram",
+    "InverseSurvivalFunction",
+    "InverseTransformedRegion",
+    "InverseWaveletTransform",
+    "InverseWeierstrassP",
+    "InverseWishartMatrixDistribution",
+    "InverseZTransform",
+    "Invisible",
+    "InvisibleApplication",
+    "InvisibleTimes",
+    "IrreduciblePolynomialQ",
+    "IslandData",
+    "IsolatingInterval",
+    "IsomorphicGraphQ",
+    "IsotopeData",
+    "Italic",
+    "Item",
+    "ItemAspectRatio",
+    "ItemBox",
+    "ItemBoxOptions",
+    "ItemSize",
+    "ItemStyle",
+    "ItoProcess",
+    "JaccardDissimilarity",
+    "JacobiAmplitude",
+    "JacobiCD",
+    "JacobiCN",
+    "JacobiCS",
+    "JacobiDC",
+    "JacobiDN",
+    "JacobiDS",
+    "JacobiNC",
+    "JacobiND",
+    "JacobiNS",
+    "JacobiP",
+    "JacobiSC",
+    "JacobiSD",
+    "JacobiSN",
+    "JacobiSymbol",
+    "JacobiZeta",
+    "Jacobian",
+    "JankoGroupJ1",
+    "JankoGroupJ2",
+    "JankoGroupJ3",
+    "JankoGroupJ4",
+    "JarqueBeraALMTest",
+    "JohnsonDistribution",
+    "Join",
+    "JoinAcross",
+    "JoinForm",
+    "Joined",
+    "JoinedCurve",
+    "JoinedCurveBox",
+    "JoinedCurveBoxOptions",
+    "JordanDecomposition",
+    "JordanModelDecomposition",
+    "JuliaSetBoettcher",
+    "JuliaSetIterationCount",
+    "JuliaSetPlot",
+    "JuliaSetPoints",
+    "JulianDate",
+    "K",
+    "KCoreComponents",
+    "KDistribution",
+    "KEdgeConnectedComponents",
+    "KEdgeConnectedGraphQ",
+    "KVertexConnectedComponents",
+    "KVertexConnectedGraphQ",
+    "KagiChart",
+    "KaiserBesselWindow",
+    "KaiserWindow",
+    "KalmanEstimator",
+    "KalmanFilter",
+    "KarhunenLoeveDecomposition",
+    "KaryTree",
+    "KatzCentrality",
+    "KelvinBei",
+    "KelvinBer",
+    "KelvinKei",
+    "KelvinKer",
+    "KendallTa",
+    "KendallTauTest",
+    "KernelExecute",
+    "KernelFunction",
+    "KernelMixtureDistribution",
+    "Kernels",
+    "Ket",
+    "Key",
+    "KeyCollisionFunction",
+    "KeyComplement",
+    "KeyDrop",
+    "KeyDropFrom",
+    "KeyExistsQ",
+    "KeyFreeQ",
+    "KeyIntersection",
+    "KeyMap",
+    "KeyMemberQ",
+    "KeySelect",
+    "KeySort",
+    "KeySortBy",
+    "KeyTake",
+    "KeyUnion",
+    "KeyValueMap",
+    "KeyValuePattern",
+    "KeypointStrength",
+    "Keys",
+    "Khinchin",
+    "KillProcess",
+    "KirchhoffGraph",
+    "KirchhoffMatrix",
+    "KleinInvariantJ",
+    "KnapsackSolve",
+    "KnightTourGraph",
+    "KnotData",
+    "KnownUnitQ",
+    "KochCurve",
+    "KolmogorovSmirnovTest",
+    "KroneckerDelta",
+    "KroneckerModelDecomposition",
+    "KroneckerProduct",
+    "KroneckerSymbol",
+    "KuiperTest",
+    "KumaraswamyDistribution",
+    "Kurtosis",
+    "KuwaharaFilter",
+    "LABColor",
+    "LCHColor",
+    "LCM",
+    "LQEstimatorGains",
+    "LQGRegulator",
+    "LQOutputRegulatorGains",
+    "LQRegulatorGains",
+    "LUBackSubstitution",
+    "LUDecomposition",
+    "LUVColor",
+    "Label",
+    "LabelStyle",
+    "LabelVisibility",
+    "Labeled",
+    "LabeledSlider",
+    "LabelingFunction",
+    "LabelingSize",
+    "LaguerreL",
+    "LakeData",
+    "LambdaComponents",
+    "LambertW",
+    "LaminaData",
+    "LanczosWindow",
+    "LandauDistribution",
+    "Language",
+    "LanguageCategory",
+    "LanguageData",
+    "LanguageIdentify",
+    "LanguageOptions",
+    "LanguageTranslate",
+    "LaplaceDistribution",
+    "LaplaceTransform",
+    "Laplacian",
+    "LaplacianFilter",
+    "LaplacianGaussianFilter",
+    "Large",
+    "Larger",
+    "Last",
+    "Latitude",
+    "LatitudeLongitude",
+    "LatticeData",
+    "LatticeReduce",
+    "Launch",
+    "LaunchKernels",
+    "LayerSizeFunction",
+    "LayeredGraphPlot",
+    "LayoutInformation",
+    "LeaderSize",
+    "LeafCount",
+    "LeapYearQ",
+    "LearnDistribution",
+    "LearnedDistribution",
+    "LearningRate",
+    "LearningRateMultipliers",
+    "LeastSquares",
+    "LeastSquaresFilterKernel",
+    "Left",
+    "LeftArrow",
+    "LeftArrowBar",
+    "LeftArrowRightArrow",
+    "LeftDownTeeVector",
+    "LeftDownVector",
+    "LeftDownVectorBar",
+    "LeftRightArrow",
+    "LeftRightVector",
+    "LeftTee",
+    "LeftTeeArrow",
+    "LeftTeeVector",
+    "LeftTriangle",
+    "LeftTriangleBar",
+    "LeftTriangleEqual",
+    "LeftUpDownVector",
+    "LeftUpTeeVector",
+    "LeftUpVector",
+    "LeftUpVectorBar",
+    "LeftVector",
+    "LeftVectorBar",
+    "LegendAppearance",
+    "LegendFunction",
+    "LegendLabel",
+    "LegendLayout",
+    "LegendMargins",
+    "LegendMarkerSize",
+    "LegendMarkers",
+    "Legended",
+    "LegendreP",
+    "LegendreQ",
+    "LegendreType",
+    "Length",
+    "LengthWhile",
+    "LerchPhi",
+    "Less",
+    "LessEqual",
+    "LessEqualGreater",
+    "LessEqualThan",
+    "LessFullEqual",
+    "LessGreater",
+    "LessLess",
+    "LessSlantEqual",
+    "LessThan",
+    "LessTilde",
+    "LetterCharacter",
+    "LetterCounts",
+    "LetterNumber",
+    "LetterQ",
+    "Level",
+    "LeveneTest",
+    "LeviCivitaTensor",
+    "LevyDistribution",
+    "Lexicographic",
+    "LibraryDataType",
+    "LibraryFunction",
+    "LibraryFunctionError",
+    "LibraryFunctionInformation",
+    "LibraryFunctionLoad",
+    "LibraryFunctionUnload",
+    "LibraryLoad",
+    "LibraryUnload",
+    "LicenseID",
+    "LiftingFilterData",
+    "LiftingWaveletTransform",
+    "LightBlue",
+    "LightBrown",
+    "LightCyan",
+    "LightGray",
+    "LightGreen",
+    "LightMagenta",
+    "LightOrange",
+    "LightPink",
+    "LightPurple",
+    "LightRed",
+    "LightSources",
+    "LightYellow",
+    "Lighter",
+    "Lighting",
+    "LightingAngle",
+    "Likelihood",
+    "Limit",
+    "LimitsPositioning",
+    "LimitsPositioningTokens",
+    "LindleyDistribution",
+    "Line",
+    "Line3DBox",
+    "Line3DBoxOptions",
+    "LineBox",
+    "LineBoxOptions",
+    "LineBreak",
+    "LineBreakChart",
+    "LineBreakWithin",
+    "LineColor",
+    "LineGraph",
+    "LineIndent",
+    "LineIndentMaxFraction",
+    "LineIntegralConvolutionPlot",
+    "LineIntegralConvolutionScale",
+    "LineLegend",
+    "LineOpacity",
+    "LineSpacing",
+    "LineWrapParts",
+    "LinearFilter",
+    "LinearFractionalOptimization",
+    "LinearFractionalTransform",
+    "LinearGradientImage",
+    "LinearLayer",
+    "LinearModelFit",
+    "LinearOffsetFunction",
+    "LinearOptimization",
+    "LinearProgramming",
+    "LinearRecurrence",
+    "LinearSolve",
+    "LinearSolveFunction",
+    "LinearizingTransformationData",
+    "LinebreakAdjustments",
+    "LinebreakSemicolonWeighting",
+    "LinkActivate",
+    "LinkClose",
+    "LinkConnect",
+    "LinkConnectedQ",
+    "LinkCreate",
+    "LinkError",
+    "LinkFlush",
+    "LinkFunction",
+    "LinkHost",
+    "LinkInterrupt",
+    "LinkLaunch",
+    "LinkMode",
+    "LinkObject",
+    "LinkOpen",
+    "LinkOptions",
+    "LinkPatterns",
+    "LinkProtocol",
+    "LinkRankCentrality",
+    "LinkRead",
+    "LinkReadHeld",
+    "LinkReadyQ",
+    "LinkService",
+    "LinkWrite",
+    "LinkWriteHeld",
+    "Links",
+    "LiouvilleLambda",
+    "List",
+    "ListAnimate",
+    "ListContourPlot",
+    "ListContourPlot3D",
+    "ListConvolve",
+    "ListCorrelate",
+    "ListCurvePathPlot",
+    "ListDeconvolve",
+    "ListDensityPlot",
+    "ListDensityPlot3D",
+    "ListFormat",
+    "ListFourierSequenceTransform",
+    "ListInterpolation",
+    "ListLineIntegralConvolutionPlot",
+    "ListLinePlot",
+    "ListLogLinearPlot",
+    "ListLogLogPlot",
+    "ListLogPlot",
+    "ListPicker",
+    "ListPickerBox",
+    "ListPickerBoxBackground",
+    "ListPickerBoxOptions",
+    "ListPlay",
+    "ListPlot",
+    "ListPlot3D",
+    "ListPointPlot3D",
+    "ListPolarPlot",
+    "ListQ",
+    "ListSliceContourPlot3D",
+    "ListSliceDensityPlot3D",
+    "ListSliceVectorPlot3D",
+    "ListStepPlot",
+    "ListStreamDensityPlot",
+    "ListStreamPlot",
+    "ListSurfacePlot3D",
+    "ListVectorDensityPlot",
+    "ListVectorPlot",
+    "ListVectorPlot3D",
+    "ListZTransform",
+    "Listable",
+    "Listen",
+    "Literal",
+    "LiteralSearch",
+    "LocalAdaptiveBinarize",
+    "LocalCache",
+    "LocalClusteringCoefficient",
+    "LocalObject",
+    "LocalObjects",
+    "LocalResponseNormalizationLayer",
+    "LocalSubmit",
+    "LocalSymbol",
+    "LocalTime",
+    "LocalTimeZone",
+    "LocalizeDefinitions",
+    "LocalizeVariables",
+    "LocationEquivalenceTest",
+    "LocationTest",
+    "Locator",
+    "LocatorAutoCreate",
+    "LocatorBox",
+    "LocatorBoxOptions",
+    "LocatorCentering",
+    "LocatorPane",
+    "LocatorPaneBox",
+    "LocatorPaneBoxOptions",
+    "LocatorRegion",
+    "Locked",
+    "Log",
+    "Log10",
+    "Log2",
+    "LogBarnesG",
+    "LogGamma",
+    "LogGammaDistribution",
+    "LogIntegral",
+    "LogLikelihood",
+    "LogLinearPlot",
+    "LogLogPlot",
+    "LogLogisticDistribution",
+    "LogMultinormalDistribution",
+    "LogNormalDistribution",
+    "LogPlot",
+    "LogRankTest",
+    "LogSeriesDistribution",
+    "LogicalExpand",
+    "LogisticDistribution",
+    "LogisticSigmoid",
+    "LogitModelFit",
+    "LongEqual",
+    "LongForm",
+    "LongLeftArrow",
+    "LongLeftRightArrow",
+    "LongRightArrow",
+    "LongShortTermMemoryLayer",
+    "Longest",
+    "LongestCommonSequence",
+    "LongestCommonSequencePositions",
+    "LongestCommonSubsequence",
+    "LongestCommonSubsequencePositions",
+    "LongestMatch",
+    "LongestOrderedSequence",
+    "Longitude",
+    "Lookup",
+    "LoopFreeGraphQ",
+    "Loopback",
+    "LossFunction",
+    "LowerCaseQ",
+    "LowerLeftArrow",
+    "LowerRightArrow",
+    "LowerTriangularMatrixQ",
+    "LowerTriangularize",
+    "LowpassFilter",
+    "LucasL",
+    "LuccioSamiComponents",
+    "LunarEclipse",
+    "LyapunovSolve",
+    "LyonsGroupLy",
+    "MAProcess",
+    "MachineID",
+    "MachineName",
+    "MachineNumberQ",
+    "MachinePrecision",
+    "MacintoshSystemPageSetup",
+    "Magenta",
+    "Magnification",
+    "Magnify",
+    "MailAddressValidation",
+    "MailExecute",
+    "MailFolder",
+    "MailItem",
+    "MailReceiverFunction",
+    "MailResponseFunction",
+    "MailSearch",
+    "MailServerConnect",
+    "MailServerConnection",
+    "MailSettings",
+    "MainSolve",
+    "MaintainDynamicCaches",
+    "Majority",
+    "MakeBoxes",
+    "MakeExpression",
+    "MakeRules",
+    "ManagedLibraryExpressionID",
+    "ManagedLibraryExpressionQ",
+    "MandelbrotSetBoettcher",
+    "MandelbrotSetDistance",
+    "MandelbrotSetIterationCount",
+    "MandelbrotSetMemberQ",
+    "MandelbrotSetPlot",
+    "MangoldtLambda",
+    "ManhattanDistance",
+    "Manipulate",
+    "Manipulator",
+    "MannWhitneyTest",
+    "MannedSpaceMissionData",
+    "MantissaExponent",
+    "Manual",
+    "Map",
+    "MapAll",
+    "MapAt",
+    "MapIndexed",
+    "MapThread",
+    "MarchenkoPasturDistribution",
+    "MarcumQ",
+    "MardiaCombinedTest",
+    "MardiaKurtosisTest",
+    "MardiaSkewnessTest",
+    "MarginalDistribution",
+    "MarkovProcessProperties",
+    "Masking",
+    "MatchLocalNameQ",
+    "MatchLocalNames",
+    "MatchQ",
+    "MatchingDissimilarity",
+    "Material",
+    "MathMLForm",
+    "MathMLText",
+    "MathematicaNotation",
+    "MathematicalFunctionData",
+    "MathieuC",
+    "MathieuCPrime",
+    "MathieuCharacteristicA",
+    "MathieuCharacteristicB",
+    "MathieuCharacteristicExponent",
+    "MathieuGroupM11",
+    "MathieuGroupM12",
+    "MathieuGroupM22",
+    "MathieuGroupM23",
+    "MathieuGroupM24",
+    "MathieuS",
+    "MathieuSPrime",
+    "Matrices",
+    "MatrixExp",
+    "MatrixForm",
+    "MatrixFunction",
+    "MatrixLog",
+    "MatrixNormalDistribution",
+    "MatrixPlot",
+    "MatrixPower",
+    "MatrixPropertyDistribution",
+    "MatrixQ",
+    "MatrixRank",
+    "MatrixTDistribution",
+    "Max",
+    "MaxBend",
+    "MaxCellMeasure",
+    "MaxColorDistance",
+    "MaxDetect",
+    "MaxDuration",
+    "MaxExtraBandwidths",
+    "MaxExtraConditions",
+    "MaxFeatureDisplacement",
+    "MaxFeatures",
+    "MaxFilter",
+    "MaxItems",
+    "MaxIterations",
+    "MaxLimit",
+    "MaxMemoryUsed",
+    "MaxMixtureKernels",
+    "MaxOverlapFraction",
+    "MaxPlotPoints",
+    "MaxPoints",
+    "MaxRecursion",
+    "MaxStableDistribution",
+    "MaxStepFraction",
+    "MaxStepSize",
+    "MaxSteps",
+    "MaxTrainingRounds",
+    "MaxValue",
+    "MaxWordGap",
+    "MaximalBy",
+    "Maximize",
+    "MaxwellDistribution",
+    "McLaughlinGroupMcL",
+    "Mean",
+    "MeanAbsoluteLossLayer",
+    "MeanAround",
+    "MeanClusteringCoefficient",
+    "MeanDegreeConnectivity",
+    "MeanDeviation",
+    "MeanFilter",
+    "MeanGraphDistance",
+    "MeanNeighborDegree",
+    "MeanShift",
+    "MeanShiftFilter",
+    "MeanSquaredLossLayer",
+    "Median",
+    "MedianDeviation",
+    "MedianFilter",
+    "MedicalTestData",
+    "Medium",
+    "MeijerG",
+    "MeijerGReduce",
+    "MeixnerDistribution",
+    "MellinConvolve",
+    "MellinTransform",
+    "MemberQ",
+    "MemoryAvailable",
+    "MemoryConstrained",
+    "MemoryConstraint",
+    "MemoryInUse",
+    "Men",
+    "MengerMesh",
+    "MenuAppearance",
+    "MenuCommandKey",
+    "MenuEvaluator",
+    "MenuItem",
+    "MenuList",
+    "MenuPacket",
+    "MenuSortingValue",
+    "MenuStyle",
+    "MenuView",
+    "Merge",
+    "MergeDifferences",
+    "MergingFunction",
+    "MersennePrimeExponent",
+    "MersennePrimeExponentQ",
+    "Mesh",
+    "MeshCellCentroid",
+    "MeshCellCount",
+    "MeshCellHighlight",
+    "MeshCellIndex",
+    "MeshCellLabel",
+    "MeshCellMarker",
+    "MeshCellMeasure",
+    "MeshCellQuality",
+    "MeshCellShapeFunction",
+    "MeshCellStyle",
+    "MeshCells",
+    "MeshCoordinates",
+    "MeshFunctions",
+    "MeshPrimitives",
+    "MeshQualityGoal",
+    "MeshRange",
+    "MeshRefinementFunction",
+    "MeshRegion",
+    "MeshRegionQ",
+    "MeshShading",
+    "MeshStyle",
+    "Message",
+    "MessageDialog",
+    "MessageList",
+    "MessageName",
+    "MessageObject",
+    "MessageOptions",
+    "MessagePacket",
+    "Messages",
+    "MessagesNotebook",
+    "MetaCharacters",
+    "MetaInformation",
+    "MeteorShowerData",
+    "Method",
+    "MethodOptions",
+    "MexicanHatWavelet",
+    "MeyerWavelet",
+    "Midpoint",
+    "Min",
+    "MinColorDistance",
+    "MinDetect",
+    "MinFilter",
+    "MinIntervalSize",
+    "MinLimit",
+    "MinMax",
+    "MinRecursion",
+    "MinSize",
+    "MinStableDistribution",
+    "MinValue",
+    "MineralData",
+    "MinimalBy",
+    "MinimalPolynomial",
+    "MinimalStateSpaceModel",
+    "Minimize",
+    "MinimumTimeIncrement",
+    "MinkowskiQuestionMark",
+    "MinorPlanetData",
+    "Minors",
+    "Minus",
+    "MinusPlus",
+    "Missing",
+    "MissingBehavior",
+    "MissingDataMethod",
+    "MissingDataRules",
+    "MissingQ",
+    "MissingString",
+    "MissingStyle",
+    "MissingValuePattern",
+    "MittagLefflerE",
+    "MixedFractionParts",
+    "MixedGraphQ",
+    "MixedMagnitude",
+    "MixedRadix",
+    "MixedRadixQuantity",
+    "MixedUnit",
+    "MixtureDistribution",
+    "Mod",
+    "Modal",
+    "Mode",
+    "Modular",
+    "ModularInverse",
+    "ModularLambda",
+    "Module",
+    "Modulus",
+    "MoebiusM",
+    "Molecule",
+    "MoleculeContainsQ",
+    "MoleculeEquivalentQ",
+    "MoleculeGraph",
+    "MoleculeModify",
+    "MoleculePattern",
+    "MoleculePlot",
+    "MoleculePlot3D",
+    "MoleculeProperty",
+    "MoleculeQ",
+    "MoleculeValue",
+    "Moment",
+    "MomentConvert",
+    "MomentEvaluate",
+    "MomentGeneratingFunction",
+    "MomentOfInertia",
+    "Momentary",
+    "Monday",
+    "Monitor",
+    "MonomialList",
+    "MonomialOrder",
+    "MonsterGroupM",
+    "MoonPhase",
+    "MoonPosition",
+    "MorletWavelet",
+    "MorphologicalBinarize",
+    "MorphologicalBranchPoints",
+    "MorphologicalComponents",
+    "MorphologicalEulerNumber",
+    "MorphologicalGraph",
+    "MorphologicalPerimeter",
+    "MorphologicalTransform",
+    "MortalityData",
+    "Most",
+    "MountainData",
+    "MouseAnnotation",
+    "MouseAppearance",
+    "MouseAppearanceTag",
+    "MouseButtons",
+    "MousePointerNote",
+    "MousePosition",
+    "Mouseover",
+    "MovieData",
+    "MovingAverage",
+    "MovingMap",
+    "MovingMedian",
+    "MoyalDistribution",
+    "MultiLetterItalics",
+    "MultiLetterStyle",
+    "Multicolumn",
+    "MultiedgeStyle",
+    "MultigraphQ",
+    "MultilaunchWarning",
+    "MultilineFunction",
+    "Multinomial",
+    "MultinomialDistribution",
+    "MultinormalDistribution",
+    "MultiplicativeOrder",
+    "Multiplicity",
+    "MultiplySides",
+    "Multiselection",
+    "MultivariateHypergeometricDistribution",
+    "MultivariatePoissonDistribution",
+    "MultivariateTDistribution",
+    "N",
+    "NArgMax",
+    "NArgMin",
+    "NBernoulliB",
+    "NBodySimulation",
+    "NBodySimulationData",
+    "NCache",
+    "NDEigensystem",
+    "NDEigenvalues",
+    "NDSolve",
+    "NDSolveValue",
+    "NExpectation",
+    "NHoldAll",
+    "NHoldFirst",
+    "NHoldRest",
+    "NIntegrate",
+    "NMaxValue",
+    "NMaximize",
+    "NMinValue",
+    "NMinimize",
+    "NProbability",
+    "NProduct",
+    "NProductFactors",
+    "NRoots",
+    "NSolve",
+    "NSum",
+    "NSumTerms",
+    "NValues",
+    "NakagamiDistribution",
+    "NameQ",
+    "Names",
+    "NamespaceBox",
+    "NamespaceBoxOptions",
+    "Nand",
+    "Nearest",
+    "NearestFunction",
+    "NearestNeighborGraph",
+    "NearestTo",
+    "NebulaData",
+    "NeedCurrentFrontEndPackagePacket",
+    "NeedCurrentFrontEndSymbolsPacket",
+    "NeedlemanWunschSimilarity",
+    "Needs",
+    "Negative",
+    "NegativeBinomialDistribution",
+    "NegativeDefiniteMatrixQ",
+    "NegativeIntegers",
+    "NegativeMultinomialDistribution",
+    "NegativeRationals",
+    "NegativeReals",
+    "NegativeSemidefiniteMatrixQ",
+    "NeighborhoodData",
+    "NeighborhoodGraph",
+    "Nest",
+    "NestGraph",
+    "NestList",
+    "NestWhile",
+    "NestWhileList",
+    "NestedGreaterGreater",
+    "NestedLessLess",
+    "NestedScriptRules",
+    "NetAppend",
+    "NetBidirectionalOperator",
+    "NetChain",
+    "NetDecoder",
+    "NetDelete",
+    "NetDrop",
+    "NetEncoder",
+    "NetEvaluationMode",
+    "NetExtract",
+    "NetFlatten",
+    "NetFoldOperator",
+    "NetGraph",
+    "NetInformation",
+    "NetInitialize",
+    "NetInsert",
+    "NetInsertSharedArrays",
+    "NetJoin",
+    "NetMapOperator",
+    "NetMapThreadOperator",
+    "NetMeasurements",
+    "NetModel",
+    "NetNestOperator",
+    "NetPairEmbeddingOperator",
+    "NetPort",
+    "NetPortGradient",
+    "NetPrepend",
+    "NetRename",
+    "NetReplace",
+    "NetReplacePart",
+    "NetSharedArray",
+    "NetStateObject",
+    "NetTake",
+    "NetTrain",
+    "NetTrainResultsObject",
+    "NetworkPacketCapture",
+    "NetworkPacketRecording",
+    "NetworkPacketRecordingDuring",
+    "NetworkPacketTrace",
+    "NeumannValue",
+    "NevilleThetaC",
+    "NevilleThetaD",
+    "NevilleThetaN",
+    "NevilleThetaS",
+    "NewPrimitiveStyle",
+    "Next",
+    "NextCell",
+    "NextDate",
+    "NextPrime",
+    "NextScheduledTaskTime",
+    "NicholsGridLines",
+    "NicholsPlot",
+    "NightHemisphere",
+    "NoWhitespace",
+    "NominalVariables",
+    "NonAssociative",
+    "NonCommutativeMultiply",
+    "NonConstants",
+    "NonNegative",
+    "NonNegativeIntegers",
+    "NonNegativeRationals",
+    "NonNegativeReals",
+    "NonPositive",
+    "NonPositiveIntegers",
+    "NonPositiveRationals",
+    "NonPositiveReals",
+    "NoncentralBetaDistribution",
+    "NoncentralChiSquareDistribution",
+    "NoncentralFRatioDistribution",
+    "NoncentralStudentTDistribution",
+    "NondimensionalizationTransform",
+    "None",
+    "NoneTrue",
+    "NonlinearModelFit",
+    "NonlinearStateSpaceModel",
+    "NonlocalMeansFilter",
+    "Nor",
+    "NorlundB",
+    "Norm",
+    "NormFunction",
+    "Normal",
+    "NormalDistribution",
+    "NormalGrouping",
+    "NormalMatrixQ",
+    "NormalizationLayer",
+    "Normalize",
+    "Normalized",
+    "NormalizedSquaredEuclideanDistance",
+    "NormalsFunction",
+    "Not",
+    "NotCongruent",
+    "NotCupCap",
+    "NotDoubleVerticalBar",
+    "NotElement",
+    "NotEqualTilde",
+    "NotExists",
+    "NotGreater",
+    "NotGreaterEqual",
+    "NotGreaterFullEqual",
+    "NotGreaterGreater",
+    "NotGreaterLess",
+    "NotGreaterSlantEqual",
+    "NotGreaterTilde",
+    "NotHumpDownHump",
+    "NotHumpEqual",
+    "NotLeftTriangle",
+    "NotLeftTriangleBar",
+    "NotLeftTriangleEqual",
+    "NotLess",
+    "NotLessEqual",
+    "NotLessFullEqual",
+    "NotLessGreater",
+    "NotLessLess",
+    "NotLessSlantEqual",
+    "NotLessTilde",
+    "NotNestedGreaterGreater",
+    "NotNestedLessLess",
+    "NotPrecedes",
+    "NotPrecedesEqual",
+    "NotPrecedesSlantEqual",
+    "NotPrecedesTilde",
+    "NotReverseElement",
+    "NotRightTriangle",
+    "NotRightTriangleBar",
+    "NotRightTriangleEqual",
+    "NotSquareSubset",
+    "NotSquareSubsetEqual",
+    "NotSquareSuperset",
+    "NotSquareSupersetEqual",
+    "NotSubset",
+    "NotSubsetEqual",
+    "NotSucceeds",
+    "NotSucceedsEqual",
+    "NotSucceedsSlantEqual",
+    "NotSucceedsTilde",
+    "NotSuperset",
+    "NotSupersetEqual",
+    "NotTilde",
+    "NotTildeEqual",
+    "NotTildeFullEqual",
+    "NotTildeTilde",
+    "NotVerticalBar",
+    "Notebook",
+    "NotebookApply",
+    "NotebookAutoSave",
+    "NotebookClose",
+    "NotebookConvertSettings",
+    "NotebookCreate",
+    "NotebookCreateReturnObject",
+    "NotebookDefault",
+    "NotebookDelete",
+    "NotebookDirectory",
+    "NotebookDynamicExpression",
+    "NotebookEvaluate",
+    "NotebookEventActions",
+    "NotebookFileName",
+    "NotebookFind",
+    "NotebookFindReturnObject",
+    "NotebookGet",
+    "NotebookGetLayoutInformationPacket",
+    "NotebookGetMisspellingsPacket",
+    "NotebookImport",
+    "NotebookInformation",
+    "NotebookInterfaceObject",
+    "NotebookLocate",
+    "NotebookObject",
+    "NotebookOpen",
+    "NotebookOpenReturnObject",
+    "NotebookPath",
+    "NotebookPrint",
+    "NotebookPut",
+    "NotebookPutReturnObject",
+    "NotebookRead",
+    "NotebookResetGeneratedCells",
+    "NotebookSave",
+    "NotebookSaveAs",
+    "NotebookSelection",
+    "NotebookSetupLayoutInformationPacket",
+    "NotebookTemplate",
+    "NotebookWrite",
+    "Notebooks",
+    "NotebooksMen",
+    "Nothing",
+    "NotificationFunction",
+    "Now",
+    "NuclearExplosionData",
+    "NuclearReactorData",
+    "Null",
+    "NullRecords",
+    "NullSpace",
+    "NullWords",
+    "Number",
+    "NumberCompose",
+    "NumberDecompose",
+    "NumberExpand",
+    "NumberFieldClassNumber",
+    "NumberFieldDiscriminant",
+    "NumberFieldFundamentalUnits",
+    "NumberFieldIntegralBasis",
+    "NumberFieldNormRepresentatives",
+    "NumberFieldRegulator",
+    "NumberFieldRootsOfUnity",
+    "NumberFieldSignature",
+    "NumberForm",
+    "NumberFormat",
+    "NumberLinePlot",
+    "NumberMarks",
+    "NumberMultiplier",
+    "NumberPadding",
+    "NumberPoint",
+    "NumberQ",
+    "NumberSeparator",
+    "NumberSigns",
+    "NumberString",
+    "Numerator",
+    "NumeratorDenominator",
+    "NumericArray",
+    "NumericArrayQ",
+    "NumericArrayType",
+    "NumericFunction",
+    "NumericQ",
+    "NumericalOrder",
+    "NumericalSort",
+    "NuttallWindow",
+    "NyquistGridLines",
+    "NyquistPlot",
+    "O",
+    "OLEData",
+    "ONanGroupON",
+    "ObservabilityGramian",
+    "ObservabilityMatrix",
+    "ObservableDecomposition",
+    "ObservableModelQ",
+    "OceanData",
+    "Octahedron",
+    "OddQ",
+    "Off",
+    "Offset",
+    "On",
+    "Once",
+    "OneIdentity",
+    "Opacity",
+    "OpacityFunction",
+    "OpacityFunctionScaling",
+    "Open",
+    "OpenAppend",
+    "OpenFunctionInspectorPacket",
+    "OpenRead",
+    "OpenSpecialOptions",
+    "OpenTemporary",
+    "OpenWrite",
+    "Opener",
+    "OpenerBox",
+    "OpenerBoxOptions",
+    "OpenerView",
+    "Opening",
+    "Operate",
+    "OperatingSystem",
+    "OptimumFlowData",
+    "OptionInspectorSettings",
+    "OptionQ",
+    "OptionValue",
+    "OptionValueBox",
+    "OptionValueBoxOptions",
+    "Optional",
+    "OptionalElement",
+    "Options",
+    "OptionsPacket",
+    "OptionsPattern",
+    "Or",
+    "Orange",
+    "Order",
+    "OrderDistribution",
+    "OrderedQ",
+    "Ordering",
+    "OrderingBy",
+    "OrderingLayer",
+    "Orderless",
+    "OrderlessPatternSequence",
+    "OrnsteinUhlenbeckProcess",
+    "OrthogonalMatrixQ",
+    "Orthogonalize",
+    "Out",
+    "Outer",
+    "OuterPolygon",
+    "OuterPolyhedron",
+    "OutputAutoOverwrite",
+    "OutputControllabilityMatrix",
+    "OutputControllableModelQ",
+    "OutputForm",
+    "OutputFormData",
+    "OutputGrouping",
+    "OutputMathEditExpression",
+    "OutputNamePacket",
+    "OutputResponse",
+    "OutputSizeLimit",
+    "OutputStream",
+    "Over",
+    "OverBar",
+    "OverDot",
+    "OverHat",
+    "OverTilde",
+    "OverVector",
+    "Overflow",
+    "Overlaps",
+    "Overlay",
+    "OverlayBox",
+    "OverlayBoxOptions",
+    "Overscript",
+    "OverscriptBox",
+    "OverscriptBoxOptions",
+    "OverwriteTarget",
+    "OwenT",
+    "OwnValues",
+    "PDF",
+    "PERTDistribution",
+    "PIDData",
+    "PIDDerivativeFilter",
+    "PIDFeedforward",
+    "PIDTune",
+    "Package",
+    "PackingMethod",
+    "PadLeft",
+    "PadRight",
+    "PaddedForm",
+    "Padding",
+    "PaddingLayer",
+    "PaddingSize",
+    "PadeApproximant",
+    "PageBreakAbove",
+    "PageBreakBelow",
+    "PageBreakWithin",
+    "PageFooterLines",
+    "PageFooters",
+    "PageHeaderLines",
+    "PageHeaders",
+    "PageHeight",
+    "PageRankCentrality",
+    "PageTheme",
+    "PageWidth",
+    "Pagination",
+    "PairedBarChart",
+    "PairedHistogram",
+    "PairedSmoothHistogram",
+    "PairedTTest",
+    "PairedZTest",
+    "PaletteNotebook",
+    "PalettePath",
+    "PalindromeQ",
+    "Pane",
+    "PaneBox",
+    "PaneBoxOptions",
+    "PaneSelector",
+    "PaneSelectorBox",
+    "PaneSelectorBoxOptions",
+    "Panel",
+    "PanelBox",
+    "PanelBoxOptions",
+    "Paneled",
+    "PaperWidth",
+    "ParabolicCylinderD",
+    "ParagraphIndent",
+    "ParagraphSpacing",
+    "ParallelArray",
+    "ParallelCombine",
+    "ParallelDo",
+    "ParallelEvaluate",
+    "ParallelMap",
+    "ParallelNeeds",
+    "ParallelProduct",
+    "ParallelSubmit",
+    "ParallelSum",
+    "ParallelTable",
+    "ParallelTry",
+    "Parallelepiped",
+    "Parallelization",
+    "Parallelize",
+    "Parallelogram",
+    "Parameter",
+    "ParameterEstimator",
+    "ParameterMixtureDistribution",
+    "ParameterVariables",
+    "ParametricFunction",
+    "ParametricNDSolve",
+    "ParametricNDSolveValue",
+    "ParametricPlot",
+    "ParametricPlot3D",
+    "ParametricRegion",
+    "ParentBox",
+    "ParentCell",
+    "ParentConnect",
+    "ParentDirectory",
+    "ParentForm",
+    "ParentList",
+    "ParentNotebook",
+    "Parenthesize",
+    "ParetoDistribution",
+    "ParetoPickandsDistribution",
+    "ParkData",
+    "Part",
+    "PartBehavior",
+    "PartLayer",
+    "PartOfSpeech",
+    "PartProtection",
+    "PartialCorrelationFunction",
+    "PartialD",
+    "ParticleAcceleratorData",
+    "ParticleData",
+    "Partition",
+    "PartitionGranularity",
+    "PartitionsP",
+    "PartitionsQ",
+    "ParzenWindow",
+    "PascalDistribution",
+    "PassEventsDown",
+    "PassEventsUp",
+    "Paste",
+    "PasteAutoQuoteCharacters",
+    "PasteBoxFormInlineCells",
+    "PasteButton",
+    "Path",
+    "PathGraph",
+    "PathGraphQ",
+    "Pattern",
+    "PatternSequence",
+    "PatternTest",
+    "PaulWavelet",
+    "PauliMatrix",
+    "Pause",
+    "PausedTime",
+    "PeakDetect",
+    "PeanoCurve",
+    "PearsonChiSquareTest",
+    "PearsonCorrelationTest",
+    "PearsonDistribution",
+    "PercentForm",
+    "PerfectNumber",
+    "PerfectNumberQ",
+    "PerformanceGoal",
+    "Perimeter",
+    "PeriodicBoundaryCondition",
+    "PeriodicInterpolation",
+    "Periodogram",
+    "PeriodogramArray",
+    "Permanent",
+    "Permissions",
+    "PermissionsGroup",
+    "PermissionsGroupMemberQ",
+    "PermissionsGroups",
+    "PermissionsKey",
+    "PermissionsKeys",
+    "PermutationCycles",
+    "PermutationCyclesQ",
+    "PermutationGroup",
+    "PermutationLength",
+    "PermutationList",
+    "PermutationListQ",
+    "PermutationMax",
+    "PermutationMin",
+    "PermutationOrder",
+    "PermutationPower",
+    "PermutationProduct",
+    "PermutationReplace",
+    "PermutationSupport",
+    "Permutations",
+    "Permute",
+    "PeronaMalikFilter",
+    "Perpendicular",
+    "PerpendicularBisector",
+    "PersistenceLocation",
+    "PersistenceTime",
+    "PersistentObject",
+    "PersistentObjects",
+    "PersistentValue",
+    "PersonData",
+    "PetersenGraph",
+    "PhaseMargins",
+    "PhaseRange",
+    "PhysicalSystemData",
+    "Pi",
+    "Pick",
+    "PieChart",
+    "PieChart3D",
+    "Piecewise",
+    "PiecewiseExpand",
+    "PillaiTrace",
+    "PillaiTraceTest",
+    "PingTime",
+    "Pink",
+    "PitchRecognize",
+    "Pivoting",
+    "PixelConstrained",
+    "PixelValue",
+    "PixelValuePositions",
+    "Placed",
+    "Placeholder",
+    "PlaceholderReplace",
+    "Plain",
+    "PlanarAngle",
+    "PlanarGraph",
+    "PlanarGraphQ",
+    "PlanckRadiationLaw",
+    "PlaneCurveData",
+    "PlanetData",
+    "PlanetaryMoonData",
+    "PlantData",
+    "Play",
+    "PlayRange",
+    "Plot",
+    "Plot3D",
+    "Plot3Matrix",
+    "PlotDivision",
+    "PlotJoined",
+    "PlotLabel",
+    "PlotLabels",
+    "PlotLayout",
+    "PlotLegends",
+    "PlotMarkers",
+    "PlotPoints",
+    "PlotRange",
+    "PlotRangeClipPlanesStyle",
+    "PlotRangeClipping",
+    "PlotRangePadding",
+    "PlotRegion",
+    "PlotStyle",
+    "PlotTheme",
+    "Pluralize",
+    "Plus",
+    "PlusMinus",
+    "Pochhammer",
+    "PodStates",
+    "PodWidth",
+    "Point",
+    "Point3DBox",
+    "Point3DBoxOptions",
+    "PointBox",
+    "PointBoxOptions",
+    "PointFigureChart",
+    "PointLegend",
+    "PointSize",
+    "PoissonConsulDistribution",
+    "PoissonDistribution",
+    "PoissonProcess",
+    "PoissonWindow",
+    "PolarAxes",
+    "PolarAxesOrigin",
+    "PolarGridLines",
+    "PolarPlot",
+    "PolarTicks",
+    "PoleZeroMarkers",
+    "PolyGamma",
+    "PolyLog",
+    "PolyaAeppliDistribution",
+    "Polygon",
+    "Polygon3DBox",
+    "Polygon3DBoxOptions",
+    "PolygonAngle",
+    "PolygonBox",
+    "PolygonBoxOptions",
+    "PolygonCoordinates",
+    "PolygonDecomposition",
+    "PolygonHoleScale",
+    "PolygonIntersections",
+    "PolygonScale",
+    "PolygonalNumber",
+    "Polyhedron",
+    "PolyhedronAngle",
+    "PolyhedronCoordinates",
+    "PolyhedronData",
+    "PolyhedronDecomposition",
+    "PolyhedronGenus",
+    "PolynomialExtendedGCD",
+    "PolynomialForm",
+    "PolynomialGCD",
+    "PolynomialLCM",
+    "PolynomialMod",
+    "PolynomialQ",
+    "PolynomialQuotient",
+    "PolynomialQuotientRemainder",
+    "PolynomialReduce",
+    "PolynomialRemainder",
+    "Polynomials",
+    "PoolingLayer",
+    "PopupMen",
+    "PopupMenuBox",
+    "PopupMenuBoxOptions",
+    "PopupView",
+    "PopupWindow",
+    "Position",
+    "PositionIndex",
+    "Positive",
+    "PositiveDefiniteMatrixQ",
+    "PositiveIntegers",
+    "PositiveRationals",
+    "PositiveReals",
+    "PositiveSemidefiniteMatrixQ",
+    "PossibleZeroQ",
+    "PostScript",
+    "Postfix",
+    "Power",
+    "PowerDistribution",
+    "PowerExpand",
+    "PowerMod",
+    "PowerModList",
+    "PowerRange",
+    "PowerSpectralDensity",
+    "PowerSymmetricPolynomial",
+    "PowersRepresentations",
+    "PreDecrement",
+    "PreIncrement",
+    "Precedence",
+    "PrecedenceForm",
+    "Precedes",
+    "PrecedesEqual",
+    "PrecedesSlantEqual",
+    "PrecedesTilde",
+    "Precision",
+    "PrecisionGoal",
+    "Predict",
+    "PredictionRoot",
+    "PredictorFunction",
+    "PredictorInformation",
+    "PredictorMeasurements",
+    "PredictorMeasurementsObject",
+    "PreemptProtect",
+    "PreferencesPath",
+    "Prefix",
+    "Prepend",
+    "PrependLayer",
+    "PrependTo",
+    "PreprocessingRules",
+    "PreserveColor",
+    "PreserveImageOptions",
+    "Previous",
+    "PreviousCell",
+    "PreviousDate",
+    "PriceGraphDistribution",
+    "PrimaryPlaceholder",
+    "Prime",
+    "PrimeN",
+    "PrimeOmega",
+    "PrimePi",
+    "PrimePowerQ",
+    "PrimeQ",
+    "PrimeZetaP",
+    "Primes",
+    "PrimitivePolynomialQ",
+    "PrimitiveRoot",
+    "PrimitiveRootList",
+    "PrincipalComponents",
+    "PrincipalValue",
+    "Print",
+    "PrintAction",
+    "PrintForm",
+    "PrintPrecision",
+    "PrintTemporary",
+    "PrintableASCIIQ",
+    "PrintingCopies",
+    "PrintingOptions",
+    "PrintingPageRange",
+    "PrintingStartingPageNumber",
+    "PrintingStyleEnvironment",
+    "Printout3D",
+    "Printout3DPreviewer",
+    "Prism",
+    "PrismBox",
+    "PrismBoxOptions",
+    "PrivateCellOptions",
+    "PrivateEvaluationOptions",
+    "PrivateFontOptions",
+    "PrivateFrontEndOptions",
+    "PrivateKey",
+    "PrivateNotebookOptions",
+    "PrivatePaths",
+    "Probability",
+    "ProbabilityDistribution",
+    "ProbabilityPlot",
+    "ProbabilityPr",
+    "ProbabilityScalePlot",
+    "ProbitModelFit",
+    "ProcessConnection",
+    "ProcessDirectory",
+    "ProcessEnvironment",
+    "ProcessEstimator",
+    "ProcessInformation",
+    "ProcessObject",
+    "ProcessParameterAssumptions",
+    "ProcessParameterQ",
+    "ProcessStateDomain",
+    "ProcessStatus",
+    "ProcessTimeDomain",
+    "Processes",
+    "Product",
+    "ProductDistribution",
+    "ProductLog",
+    "ProgressIndicator",
+    "ProgressIndicatorBox",
+    "ProgressIndicatorBoxOptions",
+    "Projection",
+    "Prolog",
+    "PromptForm",
+    "ProofObject",
+    "Properties",
+    "Property",
+    "PropertyList",
+    "PropertyValue",
+    "Proportion",
+    "Proportional",
+    "Protect",
+    "Protected",
+    "ProteinData",
+    "Pruning",
+    "PseudoInverse",
+    "PsychrometricPropertyData",
+    "PublicKey",
+    "PublisherID",
+    "PulsarData",
+    "PunctuationCharacter",
+    "Purple",
+    "Put",
+    "PutAppend",
+    "Pyramid",
+    "PyramidBox",
+    "PyramidBoxOptions",
+    "QBinomial",
+    "QFactorial",
+    "QGamma",
+    "QHypergeometricPFQ",
+    "QPochhammer",
+    "QPolyGamma",
+    "QRDecomposition",
+    "QnDispersion",
+    "QuadraticIrrationalQ",
+    "QuadraticOptimization",
+    "Quantile",
+    "QuantilePlot",
+    "Quantity",
+    "QuantityArray",
+    "QuantityDistribution",
+    "QuantityForm",
+    "QuantityMagnitude",
+    "QuantityQ",
+    "QuantityUnit",
+    "QuantityVariable",
+    "QuantityVariableCanonicalUnit",
+    "QuantityVariableDimensions",
+    "QuantityVariableIdentifier",
+    "QuantityVariablePhysicalQuantity",
+    "QuantityVariableQ",
+    "Quartics",
+    "QuartileDeviation",
+    "QuartileSkewness",
+    "Quartiles",
+    "Query",
+    "QueueProperties",
+    "QueueingNetworkProcess",
+    "QueueingProcess",
+    "Quiet",
+    "Quit",
+    "Quotient",
+    "QuotientRemainder",
+    "RGBColor",
+    "RSolve",
+    "RSolveValue",
+    "RadialGradientImage",
+    "RadialityCentrality",
+    "RadicalBox",
+    "RadicalBoxOptions",
+    "RadioButton",
+    "RadioButtonBar",
+    "RadioButtonBox",
+    "RadioButtonBoxOptions",
+    "Radon",
+    "RadonTransform",
+    "RamanujanTa",
+    "RamanujanTauL",
+    "RamanujanTauTheta",
+    "RamanujanTauZ",
+    "Ramp",
+    "Random",
+    "RandomChoice",
+    "RandomColor",
+    "RandomComplex",
+    "RandomEntity",
+    "RandomFunction",
+    "RandomGeoPosition",
+    "RandomGraph",
+    "RandomImage",
+    "RandomInstance",
+    "RandomInteger",
+    "RandomPermutation",
+    "RandomPoint",
+    "RandomPolygon",
+    "RandomPolyhedron",
+    "RandomPrime",
+    "RandomReal",
+    "RandomSample",
+    "RandomSeed",
+    "RandomSeeding",
+    "RandomVariate",
+    "RandomWalkProcess",
+    "RandomWord",
+    "Range",
+    "RangeFilter",
+    "RangeSpecification",
+    "RankedMax",
+    "RankedMin",
+    "RarerProbability",
+    "Raster",
+    "Raster3D",
+    "Raster3DBox",
+    "Raster3DBoxOptions",
+    "RasterArray",
+    "RasterBox",
+    "RasterBoxOptions",
+    "RasterSize",
+    "Rasterize",
+    "Rational",
+    "RationalFunctions",
+    "Rationalize",
+    "Rationals",
+    "Ratios",
+    "RawArray",
+    "RawBoxes",
+    "RawData",
+    "RawMedium",
+    "RayleighDistribution",
+    "Re",
+    "ReIm",
+    "ReImLabels",
+    "ReImPlot",
+    "ReImStyle",
+    "Read",
+    "ReadByteArray",
+    "ReadLine",
+    "ReadList",
+    "ReadProtected",
+    "ReadString",
+    "Real",
+    "RealAbs",
+    "RealBlockDiagonalForm",
+    "RealDigits",
+    "RealExponent",
+    "RealSign",
+    "Reals",
+    "Reap",
+    "RecognitionPrior",
+    "RecognitionThreshold",
+    "Record",
+    "RecordLists",
+    "RecordSeparators",
+    "Rectangle",
+    "RectangleBox",
+    "RectangleBoxOptions",
+    "RectangleChart",
+    "RectangleChart3D",
+    "RectangularRepeatingElement",
+    "RecurrenceFilter",
+    "RecurrenceTable",
+    "RecurringDigitsForm",
+    "Red",
+    "Reduce",
+    "RefBox",
+    "ReferenceLineStyle",
+    "ReferenceMarkerStyle",
+    "ReferenceMarkers",
+    "Refine",
+    "ReflectionMatrix",
+    "ReflectionTransform",
+    "Refresh",
+    "RefreshRate",
+    "Region",
+    "RegionBinarize",
+    "RegionBoundary",
+    "RegionBounds",
+    "RegionCentroid",
+    "RegionDifference",
+    "RegionDimension",
+    "RegionDisjoint",
+    "RegionDistance",
+    "RegionDistanceFunction",
+    "RegionEmbeddingDimension",
+    "RegionEqual",
+    "RegionFunction",
+    "RegionImage",
+    "RegionIntersection",
+    "RegionMeasure",
+    "RegionMember",
+    "RegionMemberFunction",
+    "RegionMoment",
+    "RegionNearest",
+    "RegionNearestFunction",
+    "RegionPlot",
+    "RegionPlot3D",
+    "RegionProduct",
+    "RegionQ",
+    "RegionResize",
+    "RegionSize",
+    "RegionSymmetricDifference",
+    "RegionUnion",
+    "RegionWithin",
+    "RegisterExternalEvaluator",
+    "RegularExpression",
+    "RegularPolygon",
+    "Regularization",
+    "RegularlySampledQ",
+    "Reinstall",
+    "RelationGraph",
+    "RelationalDatabase",
+    "Release",
+    "ReleaseHold",
+    "ReliabilityDistribution",
+    "ReliefImage",
+    "ReliefPlot",
+    "RemoteAuthorizationCaching",
+    "RemoteConnect",
+    "RemoteConnectionObject",
+    "RemoteFile",
+    "RemoteRun",
+    "RemoteRunProcess",
+    "Remove",
+    "RemoveAlphaChannel",
+    "RemoveAsynchronousTask",
+    "RemoveAudioStream",
+    "RemoveBackground",
+    "RemoveChannelListener",
+    "RemoveChannelSubscribers",
+    "RemoveDiacritics",
+    "RemoveInputStreamMethod",
+    "RemoveOutputStreamMethod",
+    "RemoveProperty",
+    "RemoveScheduledTask",
+    "RemoveUsers",
+    "Removed",
+    "RenameDirectory",
+    "RenameFile",
+    "RenderAll",
+    "RenderingOptions",
+    "RenewalProcess",
+    "RenkoChart",
+    "RepairMesh",
+    "Repeated",
+    "RepeatedNull",
+    "RepeatedString",
+    "RepeatedTiming",
+    "RepeatingElement",
+    "Replace",
+    "ReplaceAll",
+    "ReplaceHeldPart",
+    "ReplaceImageValue",
+    "ReplaceList",
+    "ReplacePart",
+    "ReplacePixelValue",
+    "ReplaceRepeated",
+    "ReplicateLayer",
+    "RequiredPhysicalQuantities",
+    "Resampling",
+    "ResamplingAlgorithmData",
+    "ResamplingMethod",
+    "Rescale",
+    "RescalingTransform",
+    "ResetDirectory",
+    "ResetMenusPacket",
+    "ResetScheduledTask",
+    "ReshapeLayer",
+    "Residue",
+    "ResizeLayer",
+    "Resolve",
+    "ResourceAcquire",
+    "ResourceData",
+    "ResourceFunction",
+    "ResourceObject",
+    "ResourceRegister",
+    "ResourceRemove",
+    "ResourceSearch",
+    "ResourceSubmissionObject",
+    "ResourceSubmit",
+    "ResourceSystemBase",
+    "ResourceUpdate",
+    "ResponseForm",
+    "Rest",
+    "RestartInterval",
+    "Restricted",
+    "Resultant",
+    "ResumePacket",
+    "Return",
+    "ReturnEntersInput",
+    "ReturnExpressionPacket",
+    "ReturnInputFormPacket",
+    "ReturnPacket",
+    "ReturnReceiptFunction",
+    "ReturnTextPacket",
+    "Reverse",
+    "ReverseBiorthogonalSplineWavelet",
+    "ReverseElement",
+    "ReverseEquilibrium",
+    "ReverseGraph",
+    "ReverseSort",
+    "ReverseSortBy",
+    "ReverseUpEquilibrium",
+    "RevolutionAxis",
+    "RevolutionPlot3D",
+    "RiccatiSolve",
+    "RiceDistribution",
+    "RidgeFilter",
+    "RiemannR",
+    "RiemannSiegelTheta",
+    "RiemannSiegelZ",
+    "RiemannXi",
+    "Riffle",
+    "Right",
+    "RightArrow",
+    "RightArrowBar",
+    "RightArrowLeftArrow",
+    "RightComposition",
+    "RightCosetRepresentative",
+    "RightDownTeeVector",
+    "RightDownVector",
+    "RightDownVectorBar",
+    "RightTee",
+    "RightTeeArrow",
+    "RightTeeVector",
+    "RightTriangle",
+    "RightTriangleBar",
+    "RightTriangleEqual",
+    "RightUpDownVector",
+    "RightUpTeeVector",
+    "RightUpVector",
+    "RightUpVectorBar",
+    "RightVector",
+    "RightVectorBar",
+    "RiskAchievementImportance",
+    "RiskReductionImportance",
+    "RogersTanimotoDissimilarity",
+    "RollPitchYawAngles",
+    "RollPitchYawMatrix",
+    "RomanNumeral",
+    "Root",
+    "RootApproximant",
+    "RootIntervals",
+    "RootLocusPlot",
+    "RootMeanSquare",
+    "RootOfUnityQ",
+    "RootReduce",
+    "RootSum",
+    "Roots",
+    "Rotate",
+    "RotateLabel",
+    "RotateLeft",
+    "RotateRight",
+    "RotationAction",
+    "RotationBox",
+    "RotationBoxOptions",
+    "RotationMatrix",
+    "RotationTransform",
+    "Round",
+    "RoundImplies",
+    "RoundingRadius",
+    "Row",
+    "RowAlignments",
+    "RowBackgrounds",
+    "RowBox",
+    "RowHeights",
+    "RowLines",
+    "RowMinHeight",
+    "RowReduce",
+    "RowSpacings",
+    "RowsEqual",
+    "RudinShapiro",
+    "RudvalisGroupR",
+    "Rule",
+    "RuleCondition",
+    "RuleDelayed",
+    "RuleForm",
+    "RulePlot",
+    "RulerUnits",
+    "Run",
+    "RunProcess",
+    "RunScheduledTask",
+    "RunThrough",
+    "RuntimeAttributes",
+    "RuntimeOptions",
+    "RussellRaoDissimilarity",
+    "SARIMAProcess",
+    "SARMAProcess",
+    "SASTriangle",
+    "SSSTriangle",
+    "SameQ",
+    "SameTest",
+    "SampleDepth",
+    "SampleRate",
+    "SampledEntityClass",
+    "SampledSoundFunction",
+    "SampledSoundList",
+    "SamplingPeriod",
+    "SatelliteData",
+    "SatisfiabilityCount",
+    "SatisfiabilityInstances",
+    "SatisfiableQ",
+    "Saturday",
+    "Save",
+    "SaveAutoDelete",
+    "SaveConnection",
+    "SaveDefinitions",
+    "Saveable",
+    "SavitzkyGolayMatrix",
+    "SawtoothWave",
+    "Scale",
+    "ScaleDivisions",
+    "ScaleOrigin",
+    "ScalePadding",
+    "ScaleRangeStyle",
+    "ScaleRanges",
+    "Scaled",
+    "ScaledMousePosition",
+    "ScalingFunctions",
+    "ScalingMatrix",
+    "ScalingTransform",
+    "Scan",
+    "ScheduledTask",
+    "ScheduledTaskActiveQ",
+    "ScheduledTaskInformation",
+    "ScheduledTaskInformationData",
+    "ScheduledTaskObject",
+    "ScheduledTasks",
+    "SchurDecomposition",
+    "ScientificForm",
+    "ScientificNotationThreshold",
+    "ScorerGi",
+    "ScorerGiPrime",
+    "ScorerHi",
+    "ScorerHiPrime",
+    "ScreenRectangle",
+    "ScreenStyleEnvironment",
+    "ScriptBaselineShifts",
+    "ScriptForm",
+    "ScriptLevel",
+    "ScriptMinSize",
+    "ScriptRules",
+    "ScriptSizeMultipliers",
+    "ScrollPosition",
+    "Scrollbars",
+    "ScrollingOptions",
+    "SearchAdjustment",
+    "SearchIndexObject",
+    "SearchIndices",
+    "SearchQueryString",
+    "SearchResultObject",
+    "Sec",
+    "Sech",
+    "SechDistribution",
+    "SecondOrderConeOptimization",
+    "SectionGrouping",
+    "SectorChart",
+    "SectorChart3D",
+    "SectorOrigin",
+    "SectorSpacing",
+    "SecuredAuthenticationKey",
+    "SecuredAuthenticationKeys",
+    "SeedRandom",
+    "Select",
+    "SelectComponents",
+    "SelectFirst",
+    "SelectWithContents",
+    "Selectable",
+    "SelectedCells",
+    "SelectedNotebook",
+    "Selection",
+    "SelectionAnimate",
+    "SelectionCell",
+    "SelectionCellCreateCell",
+    "SelectionCellDefaultStyle",
+    "SelectionCellParentStyle",
+    "SelectionCreateCell",
+    "SelectionDebuggerTag",
+    "SelectionDuplicateCell",
+    "SelectionEvaluate",
+    "SelectionEvaluateCreateCell",
+    "SelectionMove",
+    "SelectionPlaceholder",
+    "SelectionSetStyle",
+    "SelfLoopStyle",
+    "SelfLoops",
+    "SemanticImport",
+    "SemanticImportString",
+    "SemanticInterpretation",
+    "SemialgebraicComponentInstances",
+    "SemidefiniteOptimization",
+    "SendMail",
+    "SendMessage",
+    "Sequence",
+    "SequenceAlignment",
+    "SequenceAttentionLayer",
+    "SequenceCases",
+    "SequenceCount",
+    "SequenceFold",
+    "SequenceFoldList",
+    "SequenceForm",
+    "SequenceHold",
+    "SequenceLastLayer",
+    "SequenceMostLayer",
+    "SequencePosition",
+    "SequencePredict",
+    "SequencePredictorFunction",
+    "SequenceReplace",
+    "SequenceRestLayer",
+    "SequenceReverseLayer",
+    "SequenceSplit",
+    "Series",
+    "SeriesCoefficient",
+    "SeriesData",
+    "ServiceConnect",
+    "ServiceDisconnect",
+    "ServiceExecute",
+    "ServiceObject",
+    "ServiceRequest",
+    "ServiceResponse",
+    "ServiceSubmit",
+    "SessionSubmit",
+    "SessionTime",
+    "Set",
+    "SetAccuracy",
+    "SetAlphaChannel",
+    "SetAttributes",
+    "SetBoxFormNamesPacket",
+    "SetCloudDirectory",
+    "SetCookies",
+    "SetDelayed",
+    "SetDirectory",
+    "SetEnvironment",
+    "SetEvaluationNotebook",
+    "SetFileDate",
+    "SetFileLoadingContext",
+    "SetNotebookStatusLine",
+    "SetOptions",
+    "SetOptionsPacket",
+    "SetPermissions",
+    "SetPrecision",
+    "SetProperty",
+    "SetSecuredAuthenticationKey",
+    "SetSelectedNotebook",
+    "SetSharedFunction",
+    "SetSharedVariable",
+    "SetSpeechParametersPacket",
+    "SetStreamPosition",
+    "SetSystemModel",
+    "SetSystemOptions",
+    "SetUsers",
+    "SetValue",
+    "Setbacks",
+    "Setter",
+    "SetterBar",
+    "SetterBox",
+    "SetterBoxOptions",
+    "Setting",
+    "Shading",
+    "Shallow",
+    "ShannonWavelet",
+    "ShapiroWilkTest",
+    "Share",
+    "SharingList",
+    "Sharpen",
+    "ShearingMatrix",
+    "ShearingTransform",
+    "ShellRegion",
+    "ShenCastanMatrix",
+    "ShiftRegisterSequence",
+    "ShiftedGompertzDistribution",
+    "Short",
+    "ShortDownArrow",
+    "ShortLeftArrow",
+    "ShortRightArrow",
+    "ShortTimeFourier",
+    "ShortTimeFourierData",
+    "ShortUpArrow",
+    "Shortest",
+    "ShortestMatch",
+    "ShortestPathFunction",
+    "Show",
+    "ShowAutoConvert",
+    "ShowAutoSpellCheck",
+    "ShowAutoStyles",
+    "ShowCellBracket",
+    "ShowCellLabel",
+    "ShowCellTags",
+    "ShowClosedCellArea",
+    "ShowCodeAssist",
+    "ShowContents",
+    "ShowControls",
+    "ShowCursorTracker",
+    "ShowGroupOpenCloseIcon",
+    "ShowGroupOpener",
+    "ShowInvisibleCharacters",
+    "ShowPageBreaks",
+    "ShowPredictiveInterface",
+    "ShowSelection",
+    "ShowShortBoxForm",
+    "ShowSpecialCharacters",
+    "ShowStringCharacters",
+    "ShowSyntaxStyles",
+    "ShrinkWrapBoundingBox",
+    "ShrinkingDelay",
+    "SiderealTime",
+    "SiegelTheta",
+    "SiegelTukeyTest",
+    "SierpinskiCurve",
+    "SierpinskiMesh",
+    "Sign",
+    "SignPadding",
+    "SignTest",
+    "Signature",
+    "SignedRankTest",
+    "SignedRegionDistance",
+    "SignificanceLevel",
+    "SimilarityRules",
+    "SimpleGraph",
+    "SimpleGraphQ",
+    "SimplePolygonQ",
+    "SimplePolyhedronQ",
+    "Simplex",
+    "Simplify",
+    "Sin",
+    "SinIntegral",
+    "Sinc",
+    "SinghMaddalaDistribution",
+    "SingleEvaluation",
+    "SingleLetterItalics",
+    "SingleLetterStyle",
+    "SingularValueDecomposition",
+    "SingularValueList",
+    "SingularValuePlot",
+    "SingularValues",
+    "Sinh",
+    "SinhIntegral",
+    "SixJSymbol",
+    "Skeleton",
+    "SkeletonTransform",
+    "SkellamDistribution",
+    "SkewNormalDistribution",
+    "Skewness",
+    "SkinStyle",
+    "Skip",
+    "SliceContourPlot3D",
+    "SliceDensityPlot3D",
+    "SliceDistribution",
+    "SliceVectorPlot3D",
+    "SlideView",
+    "Slider",
+    "Slider2D",
+    "Slider2DBox",
+    "Slider2DBoxOptions",
+    "SliderBox",
+    "SliderBoxOptions",
+    "Slot",
+    "SlotSequence",
+    "Small",
+    "SmallCircle",
+    "Smaller",
+    "SmithDecomposition",
+    "SmithDelayCompensator",
+    "SmithWatermanSimilarity",
+    "SmoothDensityHistogram",
+    "SmoothHistogram",
+    "SmoothHistogram3D",
+    "SmoothKernelDistribution",
+    "SnDispersion",
+    "Snippet",
+    "SnubPolyhedron",
+    "SocialMediaData",
+    "Socket",
+    "SocketConnect",
+    "SocketListen",
+    "SocketListener",
+    "SocketObject",
+    "SocketOpen",
+    "SocketReadMessage",
+    "SocketReadyQ",
+    "SocketWaitAll",
+    "SocketWaitNext",
+    "Sockets",
+    "SoftmaxLayer",
+    "SokalSneathDissimilarity",
+    "SolarEclipse",
+    "SolarSystemFeatureData",
+    "SolidAngle",
+    "SolidData",
+    "SolidRegionQ",
+    "Solve",
+    "SolveAlways",
+    "SolveDelayed",
+    "Sort",
+    "SortBy",
+    "SortedBy",
+    "SortedEntityClass",
+    "Sound",
+    "SoundAndGraphics",
+    "SoundNote",
+    "SoundVolume",
+    "SourceLink",
+    "Sow",
+    "Space",
+    "SpaceCurveData",
+    "SpaceForm",
+    "Spacer",
+    "Spacings",
+    "Span",
+    "SpanAdjustments",
+    "SpanCharacterRounding",
+    "SpanFromAbove",
+    "SpanFromBoth",
+    "SpanFromLeft",
+    "SpanLineThickness",
+    "SpanMaxSize",
+    "SpanMinSize",
+    "SpanSymmetric",
+    "SpanningCharacters",
+    "SparseArray",
+    "SpatialGraphDistribution",
+    "SpatialMedian",
+    "SpatialTransformationLayer",
+    "Speak",
+    "SpeakTextPacket",
+    "SpearmanRankTest",
+    "SpearmanRho",
+    "SpeciesData",
+    "SpecificityGoal",
+    "SpectralLineData",
+    "Spectrogram",
+    "SpectrogramArray",
+    "Specularity",
+    "SpeechRecognize",
+    "SpeechSynthesize",
+    "SpellingCorrection",
+    "SpellingCorrectionList",
+    "SpellingDictionaries",
+    "SpellingDictionariesPath",
+    "SpellingOptions",
+    "SpellingSuggestionsPacket",
+    "Sphere",
+    "SphereBox",
+    "SpherePoints",
+    "SphericalBesselJ",
+    "SphericalBesselY",
+    "SphericalHankelH1",
+    "SphericalHankelH2",
+    "SphericalHarmonicY",
+    "SphericalPlot3D",
+    "SphericalRegion",
+    "SphericalShell",
+    "SpheroidalEigenvalue",
+    "SpheroidalJoiningFactor",
+    "SpheroidalPS",
+    "SpheroidalPSPrime",
+    "SpheroidalQS",
+    "SpheroidalQSPrime",
+    "SpheroidalRadialFactor",
+    "SpheroidalS1",
+    "SpheroidalS1Prime",
+    "SpheroidalS2",
+    "SpheroidalS2Prime",
+    "Splice",
+    "SplicedDistribution",
+    "SplineClosed",
+    "SplineDegree",
+    "SplineKnots",
+    "SplineWeights",
+    "Split",
+    "SplitBy",
+    "SpokenString",
+    "Sqrt",
+    "SqrtBox",
+    "SqrtBoxOptions",
+    "Square",
+    "SquareFreeQ",
+    "SquareIntersection",
+    "SquareMatrixQ",
+    "SquareRepeatingElement",
+    "SquareSubset",
+    "SquareSubsetEqual",
+    "SquareSuperset",
+    "SquareSupersetEqual",
+    "SquareUnion",
+    "SquareWave",
+    "SquaredEuclideanDistance",
+    "SquaresR",
+    "StabilityMargins",
+    "StabilityMarginsStyle",
+    "StableDistribution",
+    "Stack",
+    "StackBegin",
+    "StackComplete",
+    "StackInhibit",
+    "StackedDateListPlot",
+    "StackedListPlot",
+    "StadiumShape",
+    "StandardAtmosphereData",
+    "StandardDeviation",
+    "StandardDeviationFilter",
+    "StandardForm",
+    "StandardOceanData",
+    "Standardize",
+    "Standardized",
+    "StandbyDistribution",
+    "Star",
+    "StarClusterData",
+    "StarData",
+    "StarGraph",
+    "StartAsynchronousTask",
+    "StartExternalSession",
+    "StartOfLine",
+    "StartOfString",
+    "StartProcess",
+    "StartScheduledTask",
+    "StartWebSession",
+    "StartingStepSize",
+    "StartupSound",
+    "StateDimensions",
+    "StateFeedbackGains",
+    "StateOutputEstimator",
+    "StateResponse",
+    "StateSpaceModel",
+    "StateSpaceRealization",
+    "StateSpaceTransform",
+    "StateTransformationLinearize",
+    "StationaryDistribution",
+    "StationaryWaveletPacketTransform",
+    "StationaryWaveletTransform",
+    "StatusArea",
+    "StatusCentrality",
+    "StepMonitor",
+    "StereochemistryElements",
+    "StieltjesGamma",
+    "StirlingS1",
+    "StirlingS2",
+    "StopAsynchronousTask",
+    "StopScheduledTask",
+    "StoppingPowerData",
+    "StrataVariables",
+    "StratonovichProcess",
+    "StreamColorFunction",
+    "StreamColorFunctionScaling",
+    "StreamDensityPlot",
+    "StreamMarkers",
+    "StreamPlot",
+    "StreamPoints",
+    "StreamPosition",
+    "StreamScale",
+    "StreamStyle",
+    "Streams",
+    "String",
+    "StringBreak",
+    "StringByteCount",
+    "StringCases",
+    "StringContainsQ",
+    "StringCount",
+    "StringDelete",
+    "StringDrop",
+    "StringEndsQ",
+    "StringExpression",
+    "StringExtract",
+    "StringForm",
+    "StringFormat",
+    "StringFreeQ",
+    "StringInsert",
+    "StringJoin",
+    "StringLength",
+    "StringMatchQ",
+    "StringPadLeft",
+    "StringPadRight",
+    "StringPart",
+    "StringPartition",
+    "StringPosition",
+    "StringQ",
+    "StringRepeat",
+    "StringReplace",
+    "StringReplaceList",
+    "StringReplacePart",
+    "StringReverse",
+    "StringRiffle",
+    "StringRotateLeft",
+    "StringRotateRight",
+    "StringSkeleton",
+    "StringSplit",
+    "StringStartsQ",
+    "StringTake",
+    "StringTemplate",
+    "StringToByteArray",
+    "StringToStream",
+    "StringTrim",
+    "StripBoxes",
+    "StripOnInput",
+    "StripWrapperBoxes",
+    "StrokeForm",
+    "StructuralImportance",
+    "StructuredArray",
+    "StructuredSelection",
+    "StruveH",
+    "StruveL",
+    "Stub",
+    "StudentTDistribution",
+    "Style",
+    "StyleBox",
+    "StyleBoxAutoDelete",
+    "StyleData",
+    "StyleDefinitions",
+    "StyleForm",
+    "StyleHints",
+    "StyleKeyMapping",
+    "StyleMenuListing",
+    "StyleNameDialogSettings",
+    "StyleNames",
+    "StylePrint",
+    "StyleSheetPath",
+    "SubMinus",
+    "SubPlus",
+    "SubStar",
+    "SubValues",
+    "Subdivide",
+    "Subfactorial",
+    "Subgraph",
+    "SubresultantPolynomialRemainders",
+    "SubresultantPolynomials",
+    "Subresultants",
+    "Subscript",
+    "SubscriptBox",
+    "SubscriptBoxOptions",
+    "Subscripted",
+    "Subsequences",
+    "Subset",
+    "SubsetEqual",
+    "SubsetMap",
+    "SubsetQ",
+    "Subsets",
+    "SubstitutionSystem",
+    "Subsuperscript",
+    "SubsuperscriptBox",
+    "SubsuperscriptBoxOptions",
+    "Subtract",
+    "SubtractFrom",
+    "SubtractSides",
+    "Succeeds",
+    "SucceedsEqual",
+    "SucceedsSlantEqual",
+    "SucceedsTilde",
+    "Success",
+    "SuchThat",
+    "Sum",
+    "SumConvergence",
+    "SummationLayer",
+    "SunPosition",
+    "Sunday",
+    "Sunrise",
+    "Sunset",
+    "SuperDagger",
+    "SuperMinus",
+    "SuperPlus",
+    "SuperStar",
+    "SupernovaData",
+    "Superscript",
+    "SuperscriptBox",
+    "SuperscriptBoxOptions",
+    "Superset",
+    "SupersetEqual",
+    "Surd",
+    "SurdForm",
+    "SurfaceArea",
+    "SurfaceColor",
+    "SurfaceData",
+    "SurfaceGraphics",
+    "SurvivalDistribution",
+    "SurvivalFunction",
+    "SurvivalModel",
+    "SurvivalModelFit",
+    "SuspendPacket",
+    "SuzukiDistribution",
+    "SuzukiGroupSuz",
+    "SwatchLegend",
+    "Switch",
+    "Symbol",
+    "SymbolName",
+    "SymletWavelet",
+    "Symmetric",
+    "SymmetricGroup",
+    "SymmetricKey",
+    "SymmetricMatrixQ",
+    "SymmetricPolynomial",
+    "SymmetricReduction",
+    "Symmetrize",
+    "SymmetrizedArray",
+    "SymmetrizedArrayRules",
+    "SymmetrizedDependentComponents",
+    "SymmetrizedIndependentComponents",
+    "SymmetrizedReplacePart",
+    "SynchronousInitialization",
+    "SynchronousUpdating",
+    "Synonyms",
+    "Syntax",
+    "SyntaxForm",
+    "SyntaxInformation",
+    "SyntaxLength",
+    "SyntaxPacket",
+    "SyntaxQ",
+    "SynthesizeMissingValues",
+    "SystemDialogInput",
+    "SystemException",
+    "SystemGet",
+    "SystemHelpPath",
+    "SystemInformation",
+    "SystemInformationData",
+    "SystemInstall",
+    "SystemModel",
+    "SystemModelExamples",
+    "SystemModelLinearize",
+    "SystemModelParametricSimulate",
+    "SystemModelPlot",
+    "SystemModelProgressReporting",
+    "SystemModelReliability",
+    "SystemModelSimulate",
+    "SystemModelSimulateSensitivity",
+    "SystemModelSimulationData",
+    "SystemModeler",
+    "SystemModels",
+    "SystemOpen",
+    "SystemOptions",
+    "SystemProcessData",
+    "SystemProcesses",
+    "SystemStub",
+    "SystemTest",
+    "SystemsConnectionsModel",
+    "SystemsModelDelay",
+    "SystemsModelDelayApproximate",
+    "SystemsModelDelete",
+    "SystemsModelDimensions",
+    "SystemsModelExtract",
+    "SystemsModelFeedbackConnect",
+    "SystemsModelLabels",
+    "SystemsModelLinearity",
+    "SystemsModelMerge",
+    "SystemsModelOrder",
+    "SystemsModelParallelConnect",
+    "SystemsModelSeriesConnect",
+    "SystemsModelStateFeedbackConnect",
+    "SystemsModelVectorRelativeOrders",
+    "TTest",
+    "Tab",
+    "TabFilling",
+    "TabSpacings",
+    "TabView",
+    "TabViewBox",
+    "TabViewBoxOptions",
+    "Table",
+    "TableAlignments",
+    "TableDepth",
+    "TableDirections",
+    "TableForm",
+    "TableHeadings",
+    "TableSpacing",
+    "TableView",
+    "TableViewBox",
+    "TableViewBoxBackground",
+    "TableViewBoxOptions",
+    "TagBox",
+    "TagBoxNote",
+    "TagBoxOptions",
+    "TagSet",
+    "TagSetDelayed",
+    "TagStyle",
+    "TagUnset",
+    "TaggingRules",
+    "Take",
+    "TakeDrop",
+    "TakeLargest",
+    "TakeLargestBy",
+    "TakeList",
+    "TakeSmallest",
+    "TakeSmallestBy",
+    "TakeWhile",
+    "Tally",
+    "Tan",
+    "Tanh",
+    "TargetDevice",
+    "TargetFunctions",
+    "TargetSystem",
+    "TargetUnits",
+    "TaskAbort",
+    "TaskExecute",
+    "TaskObject",
+    "TaskRemove",
+    "TaskResume",
+    "TaskSuspend",
+    "TaskWait",
+    "Tasks",
+    "TautologyQ",
+    "TeXForm",
+    "TeXSave",
+    "TelegraphProcess",
+    "TemplateApply",
+    "TemplateBox",
+    "TemplateBoxOptions",
+    "TemplateEvaluate",
+    "TemplateExpression",
+    "TemplateIf",
+    "TemplateObject",
+    "TemplateSequence",
+    "TemplateSlot",
+    "TemplateSlotSequence",
+    "TemplateUnevaluated",
+    "TemplateVerbatim",
+    "TemplateWith",
+    "TemporalData",
+    "TemporalRegularity",
+    "Temporary",
+    "TemporaryVariable",
+    "TensorContract",
+    "TensorDimensions",
+    "TensorExpand",
+    "TensorProduct",
+    "TensorQ",
+    "TensorRank",
+    "TensorReduce",
+    "TensorSymmetry",
+    "TensorTranspose",
+    "TensorWedge",
+    "TestID",
+    "TestReport",
+    "TestReportObject",
+    "TestResultObject",
+    "Tetrahedron",
+    "TetrahedronBox",
+    "TetrahedronBoxOptions",
+    "Text",
+    "Text3DBox",
+    "Text3DBoxOptions",
+    "TextAlignment",
+    "TextBand",
+    "TextBoundingBox",
+    "TextBox",
+    "TextCases",
+    "TextCell",
+    "TextClipboardType",
+    "TextContents",
+    "TextData",
+    "TextElement",
+    "TextForm",
+    "TextGrid",
+    "TextJustification",
+    "TextLine",
+    "TextPacket",
+    "TextParagraph",
+    "TextPosition",
+    "TextRecognize",
+    "TextSearch",
+    "TextSearchReport",
+    "TextSentences",
+    "TextString",
+    "TextStructure",
+    "TextStyle",
+    "TextTranslation",
+    "TextWords",
+    "Texture",
+    "TextureCoordinateFunction",
+    "TextureCoordinateScaling",
+    "Therefore",
+    "ThermodynamicData",
+    "ThermometerGauge",
+    "Thick",
+    "Thickness",
+    "Thin",
+    "Thinning",
+    "ThisLink",
+    "ThompsonGroupTh",
+    "Thread",
+    "ThreadingLayer",
+    "ThreeJSymbol",
+    "Threshold",
+    "Through",
+    "Throw",
+    "ThueMorse",
+    "Thumbnail",
+    "Thursday",
+    "Ticks",
+    "TicksStyle",
+    "TideData",
+    "Tilde",
+    "TildeEqual",
+    "TildeFullEqual",
+    "TildeTilde",
+    "TimeConstrained",
+    "TimeConstraint",
+    "TimeDirection",
+    "TimeFormat",
+    "TimeGoal",
+    "TimeObject",
+    "TimeObjectQ",
+    "TimeSeries",
+    "TimeSeriesAggregate",
+    "TimeSeriesForecast",
+    "TimeSeriesInsert",
+    "TimeSeriesInvertibility",
+    "TimeSeriesMap",
+    "TimeSeriesMapThread",
+    "TimeSeriesModel",
+    "TimeSeriesModelFit",
+    "TimeSeriesResample",
+    "TimeSeriesRescale",
+    "TimeSeriesShift",
+    "TimeSeriesThread",
+    "TimeSeriesWindow",
+    "TimeUsed",
+    "TimeValue",
+    "TimeWarpingCorrespondence",
+    "TimeWarpingDistance",
+    "TimeZone",
+    "TimeZoneConvert",
+    "TimeZoneOffset",
+    "TimelinePlot",
+    "Times",
+    "TimesBy",
+    "Timing",
+    "Tiny",
+    "TitleGrouping",
+    "TitsGroupT",
+    "ToBoxes",
+    "ToCharacterCode",
+    "ToColor",
+    "ToContinuousTimeModel",
+    "ToDate",
+    "ToDiscreteTimeModel",
+    "ToEntity",
+    "ToExpression",
+    "ToFileName",
+    "ToHeldExpression",
+    "ToInvertibleTimeSeries",
+    "ToLowerCase",
+    "ToNumberField",
+    "ToPolarCoordinates",
+    "ToRadicals",
+    "ToRules",
+    "ToSphericalCoordinates",
+    "ToString",
+    "ToUpperCase",
+    "Today",
+    "ToeplitzMatrix",
+    "Together",
+    "Toggle",
+    "ToggleFalse",
+    "Toggler",
+    "TogglerBar",
+    "TogglerBox",
+    "TogglerBoxOptions",
+    "TokenWords",
+    "Tolerance",
+    "Tomorrow",
+    "TooBig",
+    "Tooltip",
+    "TooltipBox",
+    "TooltipBoxOptions",
+    "TooltipDelay",
+    "TooltipStyle",
+    "Top",
+    "TopHatTransform",
+    "TopologicalSort",
+    "Total",
+    "TotalHeight",
+    "TotalLayer",
+    "TotalVariationFilter",
+    "TotalWidth",
+    "TouchPosition",
+    "TouchscreenAutoZoom",
+    "TouchscreenControlPlacement",
+    "Tr",
+    "Trace",
+    "TraceAbove",
+    "TraceAction",
+    "TraceBackward",
+    "TraceDepth",
+    "TraceDialog",
+    "TraceForward",
+    "TraceInternal",
+    "TraceLevel",
+    "TraceOff",
+    "TraceOn",
+    "TraceOriginal",
+    "TracePrint",
+    "TraceScan",
+    "TrackedSymbols",
+    "TrackingFunction",
+    "TracyWidomDistribution",
+    "TradingChart",
+    "TraditionalForm",
+    "TraditionalFunctionNotation",
+    "TraditionalNotation",
+    "TraditionalOrder",
+    "TrainingProgressCheckpointing",
+    "TrainingProgressFunction",
+    "TrainingProgressMeasurements",
+    "TrainingProgressReporting",
+    "TrainingStoppingCriterion",
+    "TransferFunctionCancel",
+    "TransferFunctionExpand",
+    "TransferFunctionFactor",
+    "TransferFunctionModel",
+    "TransferFunctionPoles",
+    "TransferFunctionTransform",
+    "TransferFunctionZeros",
+    "TransformationClass",
+    "TransformationFunction",
+    "TransformationFunctions",
+    "TransformationMatrix",
+    "TransformedDistribution",
+    "TransformedField",
+    "TransformedProcess",
+    "TransformedRegion",
+    "TransitionDirection",
+    "TransitionDuration",
+    "TransitionEffect",
+    "TransitiveClosureGraph",
+    "TransitiveReductionGraph",
+    "Translate",
+    "TranslationOptions",
+    "TranslationTransform",
+    "Transliterate",
+    "Transparent",
+    "TransparentColor",
+    "Transpose",
+    "TransposeLayer",
+    "TrapSelection",
+    "TravelDirections",
+    "TravelDirectionsData",
+    "TravelDistance",
+    "TravelDistanceList",
+    "TravelMethod",
+    "TravelTime",
+    "TreeForm",
+    "TreeGraph",
+    "TreeGraphQ",
+    "TreePlot",
+    "TrendStyle",
+    "Triangle",
+    "TriangleCenter",
+    "TriangleConstruct",
+    "TriangleMeasurement",
+    "TriangleWave",
+    "TriangularDistribution",
+    "TriangulateMesh",
+    "Trig",
+    "TrigExpand",
+    "TrigFactor",
+    "TrigFactorList",
+    "TrigReduce",
+    "TrigToExp",
+    "Trigger",
+    "TrimmedMean",
+    "TrimmedVariance",
+    "TropicalStormData",
+    "True",
+    "TrueQ",
+    "TruncatedDistribution",
+    "TruncatedPolyhedron",
+    "TsallisQExponentialDistribution",
+    "TsallisQGaussianDistribution",
+    "Tube",
+    "TubeBSplineCurveBox",
+    "TubeBSplineCurveBoxOptions",
+    "TubeBezierCurveBox",
+    "TubeBezierCurveBoxOptions",
+    "TubeBox",
+    "TubeBoxOptions",
+    "Tuesday",
+    "TukeyLambdaDistribution",
+    "TukeyWindow",
+    "TunnelData",
+    "Tuples",
+    "TuranGraph",
+    "TuringMachine",
+    "TuttePolynomial",
+    "TwoWayRule",
+    "TypeSpecifier",
+    "Typed",
+    "URL",
+    "URLBuild",
+    "URLDecode",
+    "URLDispatcher",
+    "URLDownload",
+    "URLDownloadSubmit",
+    "URLEncode",
+    "URLExecute",
+    "URLExpand",
+    "URLFetch",
+    "URLFetchAsynchronous",
+    "URLParse",
+    "URLQueryDecode",
+    "URLQueryEncode",
+    "URLRead",
+    "URLResponseTime",
+    "URLSave",
+    "URLSaveAsynchronous",
+    "URLShorten",
+    "URLSubmit",
+    "UnateQ",
+    "Uncompress",
+    "UnconstrainedParameters",
+    "Undefined",
+    "UnderBar",
+    "Underflow",
+    "Underlined",
+    "Underoverscript",
+    "UnderoverscriptBox",
+    "UnderoverscriptBoxOptions",
+    "Underscript",
+    "UnderscriptBox",
+    "UnderscriptBoxOptions",
+    "UnderseaFeatureData",
+    "UndirectedEdge",
+    "UndirectedGraph",
+    "UndirectedGraphQ",
+    "UndoOptions",
+    "UndoTrackedVariables",
+    "Unequal",
+    "UnequalTo",
+    "Unevaluated",
+    "UniformDistribution",
+    "UniformGraphDistribution",
+    "UniformPolyhedron",
+    "UniformSumDistribution",
+    "Uninstall",
+    "Union",
+    "UnionPlus",
+    "Unique",
+    "UnitBox",
+    "UnitConvert",
+    "UnitDimensions",
+    "UnitRootTest",
+    "UnitSimplify",
+    "UnitStep",
+    "UnitSystem",
+    "UnitTriangle",
+    "UnitVector",
+    "UnitVectorLayer",
+    "UnitaryMatrixQ",
+    "Unitize",
+    "UnityDimensions",
+    "UniverseModelData",
+    "UniversityData",
+    "UnixTime",
+    "Unprotect",
+    "UnregisterExternalEvaluator",
+    "UnsameQ",
+    "UnsavedVariables",
+    "Unset",
+    "UnsetShared",
+    "UntrackedVariables",
+    "Up",
+    "UpArrow",
+    "UpArrowBar",
+    "UpArrowDownArrow",
+    "UpDownArrow",
+    "UpEquilibrium",
+    "UpSet",
+    "UpSetDelayed",
+    "UpTee",
+    "UpTeeArrow",
+    "UpTo",
+    "UpValues",
+    "Update",
+    "UpdateDynamicObjects",
+    "UpdateDynamicObjectsSynchronous",
+    "UpdateInterval",
+    "UpdateSearchIndex",
+    "UpperCaseQ",
+    "UpperLeftArrow",
+    "UpperRightArrow",
+    "UpperTriangularMatrixQ",
+    "UpperTriangularize",
+    "Upsample",
+    "UseGraphicsRange",
+    "UserDefinedWavelet",
+    "Using",
+    "UsingFrontEnd",
+    "UtilityFunction",
+    "V2Get",
+    "ValenceErrorHandling",
+    "ValidationLength",
+    "ValidationSet",
+    "Value",
+    "ValueBox",
+    "ValueBoxOptions",
+    "ValueDimensions",
+    "ValueForm",
+    "ValuePreprocessingFunction",
+    "ValueQ",
+    "Values",
+    "ValuesData",
+    "Variables",
+    "Variance",
+    "VarianceEquivalenceTest",
+    "VarianceEstimatorFunction",
+    "VarianceGammaDistribution",
+    "VarianceTest",
+    "VectorAngle",
+    "VectorAround",
+    "VectorColorFunction",
+    "VectorColorFunctionScaling",
+    "VectorDensityPlot",
+    "VectorGlyphData",
+    "VectorGreater",
+    "VectorGreaterEqual",
+    "VectorLess",
+    "VectorLessEqual",
+    "VectorMarkers",
+    "VectorPlot",
+    "VectorPlot3D",
+    "VectorPoints",
+    "VectorQ",
+    "VectorScale",
+    "VectorStyle",
+    "Vectors",
+    "Vee",
+    "Verbatim",
+    "Verbose",
+    "VerboseConvertToPostScriptPacket",
+    "VerificationTest",
+    "VerifyConvergence",
+    "VerifyDerivedKey",
+    "VerifyDigitalSignature",
+    "VerifyInterpretation",
+    "VerifySecurityCertificates",
+    "VerifySolutions",
+    "VerifyTestAssumptions",
+    "Version",
+    "VersionNumber",
+    "VertexAdd",
+    "VertexCapacity",
+    "VertexColors",
+    "VertexComponent",
+    "VertexConnectivity",
+    "VertexContract",
+    "VertexCoordinateRules",
+    "VertexCoordinates",
+    "VertexCorrelationSimilarity",
+    "VertexCosineSimilarity",
+    "VertexCount",
+    "VertexCoverQ",
+    "VertexDataCoordinates",
+    "VertexDegree",
+    "VertexDelete",
+    "VertexDiceSimilarity",
+    "VertexEccentricity",
+    "VertexInComponent",
+    "VertexInDegree",
+    "VertexIndex",
+    "VertexJaccardSimilarity",
+    "VertexLabelStyle",
+    "VertexLabeling",
+    "VertexLabels",
+    "VertexList",
+    "VertexNormals",
+    "VertexOutComponent",
+    "VertexOutDegree",
+    "VertexQ",
+    "VertexRenderingFunction",
+    "VertexReplace",
+    "VertexShape",
+    "VertexShapeFunction",
+    "VertexSize",
+    "VertexStyle",
+    "VertexTextureCoordinates",
+    "VertexWeight",
+    "VertexWeightedGraphQ",
+    "Vertical",
+    "VerticalBar",
+    "VerticalForm",
+    "VerticalGauge",
+    "VerticalSeparator",
+    "VerticalSlider",
+    "VerticalTilde",
+    "ViewAngle",
+    "ViewCenter",
+    "ViewMatrix",
+    "ViewPoint",
+    "ViewPointSelectorSettings",
+    "ViewPort",
+    "ViewProjection",
+    "ViewRange",
+    "ViewVector",
+    "ViewVertical",
+    "VirtualGroupData",
+    "Visible",
+    "VisibleCell",
+    "VoiceStyleData",
+    "VoigtDistribution",
+    "VolcanoData",
+    "Volume",
+    "VonMisesDistribution",
+    "VoronoiMesh",
+    "WaitAll",
+    "WaitAsynchronousTask",
+    "WaitNext",
+    "WaitUntil",
+    "WakebyDistribution",
+    "WalleniusHypergeometricDistribution",
+    "WaringYuleDistribution",
+    "WarpingCorrespondence",
+    "WarpingDistance",
+    "WatershedComponents",
+    "WatsonUSquareTest",
+    "WattsStrogatzGraphDistribution",
+    "WaveletBestBasis",
+    "WaveletFilterCoefficients",
+    "WaveletImagePlot",
+    "WaveletListPlot",
+    "WaveletMapIndexed",
+    "WaveletMatrixPlot",
+    "WaveletPhi",
+    "WaveletPsi",
+    "WaveletScale",
+    "WaveletScalogram",
+    "WaveletThreshold",
+    "WeakStationarity",
+    "WeaklyConnectedComponents",
+    "WeaklyConnectedGraphComponents",
+    "WeaklyConnectedGraphQ",
+    "WeatherData",
+    "WeatherForecastData",
+    "WebAudioSearch",
+    "WebElementObject",
+    "WebExecute",
+    "WebImage",
+    "WebImageSearch",
+    "WebSearch",
+    "WebSessionObject",
+    "WebSessions",
+    "WebWindowObject",
+    "WeberE",
+    "Wedge",
+    "Wednesday",
+    "WeibullDistribution",
+    "WeierstrassE1",
+    "WeierstrassE2",
+    "WeierstrassE3",
+    "WeierstrassEta1",
+    "WeierstrassEta2",
+    "WeierstrassEta3",
+    "WeierstrassHalfPeriodW1",
+    "WeierstrassHalfPeriodW2",
+    "WeierstrassHalfPeriodW3",
+    "WeierstrassHalfPeriods",
+    "WeierstrassInvariantG2",
+    "WeierstrassInvariantG3",
+    "WeierstrassInvariants",
+    "WeierstrassP",
+    "WeierstrassPPrime",
+    "WeierstrassSigma",
+    "WeierstrassZeta",
+    "WeightedAdjacencyGraph",
+    "WeightedAdjacencyMatrix",
+    "WeightedData",
+    "WeightedGraphQ",
+    "Weights",
+    "WelchWindow",
+    "WheelGraph",
+    "WhenEvent",
+    "Which",
+    "While",
+    "White",
+    "WhiteNoiseProcess",
+    "WhitePoint",
+    "Whitespace",
+    "WhitespaceCharacter",
+    "WhittakerM",
+    "WhittakerW",
+    "WienerFilter",
+    "WienerProcess",
+    "WignerD",
+    "WignerSemicircleDistribution",
+    "WikipediaData",
+    "WikipediaSearch",
+    "WilksW",
+    "WilksWTest",
+    "WindDirectionData",
+    "WindSpeedData",
+    "WindVectorData",
+    "WindingCount",
+    "WindingPolygon",
+    "WindowClickSelect",
+    "WindowElements",
+    "WindowFloating",
+    "WindowFrame",
+    "WindowFrameElements",
+    "WindowMargins",
+    "WindowMovable",
+    "WindowOpacity",
+    "WindowPersistentStyles",
+    "WindowSelected",
+    "WindowSize",
+    "WindowStatusArea",
+    "WindowTitle",
+    "WindowToolbars",
+    "WindowWidth",
+    "WinsorizedMean",
+    "WinsorizedVariance",
+    "WishartMatrixDistribution",
+    "With",
+    "WolframAlpha",
+    "WolframAlphaDate",
+    "WolframAlphaQuantity",
+    "WolframAlphaResult",
+    "WolframLanguageData",
+    "Word",
+    "WordBoundary",
+    "WordCharacter",
+    "WordCloud",
+    "WordCount",
+    "WordCounts",
+    "WordData",
+    "WordDefinition",
+    "WordFrequency",
+    "WordFrequencyData",
+    "WordList",
+    "WordOrientation",
+    "WordSearch",
+    "WordSelectionFunction",
+    "WordSeparators",
+    "WordSpacings",
+    "WordStem",
+    "WordTranslation",
+    "WorkingPrecision",
+    "WrapAround",
+    "Write",
+    "WriteLine",
+    "WriteString",
+    "Wronskian",
+    "XMLElement",
+    "XMLObject",
+    "XMLTemplate",
+    "XYZColor",
+    "Xnor",
+    "Xor",
+    "Yellow",
+    "Yesterday",
+    "YuleDissimilarity",
+    "ZIPCodeData",
+    "ZTest",
+    "ZTransform",
+    "ZernikeR",
+    "ZeroSymmetric",
+    "ZeroTest",
+    "ZeroWidthTimes",
+    "Zeta",
+    "ZetaZero",
+    "ZipfDistribution",
+    "ZoomCenter",
+    "ZoomFactor",
+    "\\[Element]",
+    "\\[Pi]",
+))
+
+UNICODE_OPERATORS = (
+    "+",
+    "=",
+    ">",
+    "^",
+    "¬",
+    "°",
+    "·",
+    "×",
+    "÷",
+    "—",
+    "‖",
+    "←",
+    "↑",
+    "→",
+    "↓",
+    "↔",
+    "↕",
+    "↖",
+    "↗",
+    "↘",
+    "↙",
+    "↤",
+    "↥",
+    "↦",
+    "↧",
+    "↼",
+    "↽",
+    "↾",
+    "↿",
+    "⇀",
+    "⇁",
+    "⇂",
+    "⇃",
+    "⇄",
+    "⇅",
+    "⇆",
+    "⇋",
+    "⇌",
+    "⇐",
+    "⇑",
+    "⇒",
+    "⇓",
+    "⇔",
+    "⇕",
+    "⇤",
+    "⇥",
+    "⇵",
+    "∀",
+    "∃",
+    "∄",
+    "∇",
+    "∈",
+    "∉",
+    "∋",
+    "∌",
+    "∍",
+    "∏",
+    "∐",
+    "∑",
+    "√",
+    "∝",
+    "∥",
+    "∦",
+    "∧",
+    "∫",
+    "∮",
+    "∯",
+    "∲",
+    "∳",
+    "∴",
+    "∵",
+    "∶",
+    "∷",
+    "≀",
+    "≁",
+    "≂",
+    "≃",
+    "≄",
+    "≅",
+    "≇",
+    "≈",
+    "≉",
+    "≍",
+    "≎",
+    "≏",
+    "≐",
+    "≠",
+    "≡",
+    "≢",
+    "≤",
+    "≥",
+    "≦",
+    "≧",
+    "≨",
+    "≩",
+    "≪",
+    "≫",
+    "≭",
+    "≮",
+    "≯",
+    "≰",
+    "≱",
+    "≲",
+    "≳",
+    "≴",
+    "≵",
+    "≶",
+    "≷",
+    "≸",
+    "≹",
+    "≺",
+    "≻",
+    "≼",
+    "≽",
+    "≾",
+    "≿",
+    "⊀",
+    "⊁",
+    "⊂",
+    "⊃",
+    "⊄",
+    "⊅",
+    "⊆",
+    "⊇",
+    "⊈",
+    "⊉",
+    "⊎",
+    "⊏",
+    "⊐",
+    "⊑",
+    "⊒",
+    "⊓",
+    "⊔",
+    "⊕",
+    "⊖",
+    "⊗",
+    "⊙",
+    "⊢",
+    "⊣",
+    "⊤",
+    "⊥",
+    "⊨",
+    "⊲",
+    "⊳",
+    "⊴",
+    "⊵",
+    "⊻",
+    "⊽",
+    "⋀",
+    "⋁",
+    "⋂",
+    "⋃",
+    "⋚",
+    "⋛",
+    "⋠",
+    "⋡",
+    "⋢",
+    "⋣",
+    "⋨",
+    "⋩",
+    "⋪",
+    "⋫",
+    "⋬",
+    "⋭",
+    "⌈",
+    "⌉",
+    "⌊",
+    "⌋",
+    "⌣",
+    "▸",
+    "▾",
+    "◂",
+    "⟵",
+    "⟶",
+    "⟷",
+    "⟸",
+    "⟹",
+    "⟺",
+    "⤒",
+    "⤓",
+    "⥎",
+    "⥏",
+    "⥐",
+    "⥑",
+    "⥒",
+    "⥓",
+    "⥔",
+    "⥕",
+    "⥖",
+    "⥗",
+    "⥘",
+    "⥙",
+    "⥚",
+    "⥛",
+    "⥜",
+    "⥝",
+    "⥞",
+    "⥟",
+    "⥠",
+    "⥡",
+    "⥮",
+    "⥯",
+    "⥰",
+    "⧏",
+    "⧐",
+    "⧦",
+    "⧴",
+    "⩵",
+    "⩽",
+    "⩾",
+    "⪡",
+    "⪢",
+    "⪯",
+    "⪰",
+    "⫤",
+)
+
+UNICODE_OPERATOR_NAMES = dict((
+    ("+", "Plus"),
+    ("=", "Set"),
+    (">", "RawGreater"),
+    ("^", "Power"),
+    ("¬", "Not"),
+    ("·", "CenterDot"),
+    ("×", "Times"),
+    ("÷", "Divide"),
+    ("—", "LongDash"),
+    ("‖", "RightDoubleBracketingBar"),
+    ("←", "LeftArrow"),
+    ("↑", "UpArrow"),
+    ("→", "Rule"),
+    ("↓", "DownArrow"),
+    ("↔", "UndirectedEdge"),
+    ("↕", "UpDownArrow"),
+    ("↖", "UpperLeftArrow"),
+    ("↗", "UpperRightArrow"),
+    ("↘", "LowerRightArrow"),
+    ("↙", "LowerLeftArrow"),
+    ("↤", "LeftTeeArrow"),
+    ("↥", "UpTeeArrow"),
+    ("↦", "Function"),
+    ("↧", "DownTeeArrow"),
+    ("↼", "LeftVector"),
+    ("↽", "DownLeftVector"),
+    ("↾", "RightUpVector"),
+    ("↿", "LeftUpVector"),
+    ("⇀", "RightVector"),
+    ("⇁", "DownRightVector"),
+    ("⇂", "RightDownVector"),
+    ("⇃", "LeftDownVector"),
+    ("⇄", "RightArrowLeftArrow"),
+    ("⇅", "UpArrowDownArrow"),
+    ("⇆", "LeftArrowRightArrow"),
+    ("⇋", "ReverseEquilibrium"),
+    ("⇌", "Equilibrium"),
+    ("⇐", "DoubleLeftArrow"),
+    ("⇑", "DoubleUpArrow"),
+    ("⇒", "DoubleRightArrow"),
+    ("⇓", "DoubleDownArrow"),
+    ("⇔", "DoubleLeftRightArrow"),
+    ("⇕", "DoubleUpDownArrow"),
+    ("⇤", "LeftArrowBar"),
+    ("⇥", "RightArrowBar"),
+    ("⇵", "DownArrowUpArrow"),
+    ("∀", "ForAll"),
+    ("∃", "Exists"),
+    ("∄", "NotExists"),
+    ("∇", "Del"),
+    ("∈", "Element"),
+    ("∉", "NotElement"),
+    ("∋", "ReverseElement"),
+    ("∌", "NotReverseElement"),
+    ("∍", "SuchThat"),
+    ("∏", "Product"),
+    ("∐", "Coproduct"),
+    ("∑", "Sum"),
+    ("√", "Sqrt"),
+    ("∝", "Proportional"),
+    ("∥", "DoubleVerticalBar"),
+    ("∦", "NotDoubleVerticalBar"),
+    ("∧", "And"),
+    ("∫", "Integral"),
+    ("∮", "ContourIntegral"),
+    ("∯", "DoubleContourIntegral"),
+    ("∲", "ClockwiseContourIntegral"),
+    ("∳", "CounterClockwiseContourIntegral"),
+    ("∴", "Therefore"),
+    ("∵", "Because"),
+    ("∶", "Colon"),
+    ("∷", "Proportion"),
+    ("≀", "VerticalTilde"),
+    ("≁", "NotTilde"),
+    ("≂", "EqualTilde"),
+    ("≃", "TildeEqual"),
+    ("≄", "NotTildeEqual"),
+    ("≅", "TildeFullEqual"),
+    ("≇", "NotTildeFullEqual"),
+    ("≈", "TildeTilde"),
+    ("≉", "NotTildeTilde"),
+    ("≍", "CupCap"),
+    ("≎", "HumpDownHump"),
+    ("≏", "HumpEqual"),
+    ("≐", "DotEqual"),
+    ("≠", "NotEqual"),
+    ("≡", "Congruent"),
+    ("≢", "NotCongruent"),
+    ("≤", "LessEqual"),
+    ("≥", "GreaterEqual"),
+    ("≦", "LessFullEqual"),
+    ("≧", "GreaterFullEqual"),
+    ("≨", "NotLessFullEqual"),
+    ("≩", "NotGreaterFullEqual"),
+    ("≪", "LessLess"),
+    ("≫", "GreaterGreater"),
+    ("≭", "NotCupCap"),
+    ("≮", "NotLess"),
+    ("≯", "NotGreater"),
+    ("≰", "NotLessEqual"),
+    ("≱", "NotGreaterEqual"),
+    ("≲", "LessTilde"),
+    ("≳", "GreaterTilde"),
+    ("≴", "NotLessTilde"),
+    ("≵", "NotGreaterTilde"),
+    ("≶", "LessGreater"),
+    ("≷", "GreaterLess"),
+    ("≸", "NotLessGreater"),
+    ("≹", "NotGreaterLess"),
+    ("≺", "Precedes"),
+    ("≻", "Succeeds"),
+    ("≼", "PrecedesSlantEqual"),
+    ("≽", "SucceedsSlantEqual"),
+    ("≾", "PrecedesTilde"),
+    ("≿", "SucceedsTilde"),
+    ("⊀", "NotPrecedes"),
+    ("⊁", "NotSucceeds"),
+    ("⊂", "Subset"),
+    ("⊃", "Superset"),
+    ("⊄", "NotSubset"),
+    ("⊅", "NotSuperset"),
+    ("⊆", "SubsetEqual"),
+    ("⊇", "SupersetEqual"),
+    ("⊈", "NotSubsetEqual"),
+    ("⊉", "NotSupersetEqual"),
+    ("⊎", "UnionPlus"),
+    ("⊏", "SquareSubset"),
+    ("⊐", "SquareSuperset"),
+    ("⊑", "SquareSubsetEqual"),
+    ("⊒", "SquareSupersetEqual"),
+    ("⊓", "SquareIntersection"),
+    ("⊔", "SquareUnion"),
+    ("⊕", "CirclePlus"),
+    ("⊖", "CircleMinus"),
+    ("⊗", "CircleTimes"),
+    ("⊙", "CircleDot"),
+    ("⊢", "RightTee"),
+    ("⊣", "LeftTee"),
+    ("⊤", "DownTee"),
+    ("⊥", "UpTee"),
+    ("⊨", "DoubleRightTee"),
+    ("⊲", "LeftTriangle"),
+    ("⊳", "RightTriangle"),
+    ("⊴", "LeftTriangleEqual"),
+    ("⊵", "RightTriangleEqual"),
+    ("⊻", "Xor"),
+    ("⊽", "Nor"),
+    ("⋀", "Wedge"),
+    ("⋁", "Vee"),
+    ("⋂", "Intersection"),
+    ("⋃", "Union"),
+    ("⋚", "LessEqualGreater"),
+    ("⋛", "GreaterEqualLess"),
+    ("⋠", "NotPrecedesSlantEqual"),
+    ("⋡", "NotSucceedsSlantEqual"),
+    ("⋢", "NotSquareSubsetEqual"),
+    ("⋣", "NotSquareSupersetEqual"),
+    ("⋨", "NotPrecedesTilde"),
+    ("⋩", "NotSucceedsTilde"),
+    ("⋪", "NotLeftTriangle"),
+    ("⋫", "NotRightTriangle"),
+    ("⋬", "NotLeftTriangleEqual"),
+    ("⋭", "NotRightTriangleEqual"),
+    ("⌈", "LeftCeiling"),
+    ("⌉", "RightCeiling"),
+    ("⌊", "LeftFloor"),
+    ("⌋", "RightFloor"),
+    ("⌣", "Cup"),
+    ("▸", "RightPointer"),
+    ("▾", "DownPointer"),
+    ("◂", "LeftPointer"),
+    ("⟵", "LongLeftArrow"),
+    ("⟶", "LongRightArrow"),
+    ("⟷", "LongLeftRightArrow"),
+    ("⟸", "DoubleLongLeftArrow"),
+    ("⟹", "DoubleLongRightArrow"),
+    ("⟺", "DoubleLongLeftRightArrow"),
+    ("⤒", "UpArrowBar"),
+    ("⤓", "DownArrowBar"),
+    ("⥎", "LeftRightVector"),
+    ("⥏", "RightUpDownVector"),
+    ("⥐", "DownLeftRightVector"),
+    ("⥑", "LeftUpDownVector"),
+    ("⥒", "LeftVectorBar"),
+    ("⥓", "RightVectorBar"),
+    ("⥔", "RightUpVectorBar"),
+    ("⥕", "RightDownVectorBar"),
+    ("⥖", "DownLeftVectorBar"),
+    ("⥗", "DownRightVectorBar"),
+    ("⥘", "LeftUpVectorBar"),
+    ("⥙", "LeftDownVectorBar"),
+    ("⥚", "LeftTeeVector"),
+    ("⥛", "RightTeeVector"),
+    ("⥜", "RightUpTeeVector"),
+    ("⥝", "RightDownTeeVector"),
+    ("⥞", "DownLeftTeeVector"),
+    ("⥟", "DownRightTeeVector"),
+    ("⥠", "LeftUpTeeVector"),
+    ("⥡", "LeftDownTeeVector"),
+    ("⥮", "UpEquilibrium"),
+    ("⥯", "ReverseUpEquilibrium"),
+    ("⥰", "RoundImplies"),
+    ("⧏", "LeftTriangleBar"),
+    ("⧐", "RightTriangleBar"),
+    ("⧦", "Equivalent"),
+    ("⧴", "RuleDelayed"),
+    ("⩵", "Equal"),
+    ("⩽", "LessSlantEqual"),
+    ("⩾", "GreaterSlantEqual"),
+    ("⪡", "NestedLessLess"),
+    ("⪢", "NestedGreaterGreater"),
+    ("⪯", "PrecedesEqual"),
+    ("⪰", "SucceedsEqual"),
+    ("⫤", "DoubleLeftTee"),
+))
+
+UNICODE_GROUPINGS = frozenset((
+    "〈",
+    "〉",
+    "〚",
+    "〛",
+))
+
+UNICODE_SYSTEM_SYMBOLS = frozenset((
+    "π",
+    "∞",
+))
+
+UNICODE_SYSTEM_UNDEFINED_SYMBOLS = frozenset((
+    "±",
+    "µ",
+    "¶",
+    "Å",
+    "Α",
+    "Β",
+    "Γ",
+    "Δ",
+    "Ε",
+    "Ζ",
+    "Η",
+    "Θ",
+    "Ι",
+    "Κ",
+    "Λ",
+    "Μ",
+    "Ν",
+    "Ξ",
+    "Ο",
+    "Π",
+    "Ρ",
+    "Σ",
+    "Τ",
+    "Υ",
+    "Φ",
+    "Χ",
+    "Ψ",
+    "Ω",
+    "α",
+    "β",
+    "γ",
+    "δ",
+    "ε",
+    "ζ",
+    "η",
+    "θ",
+    "ι",
+    "κ",
+    "λ",
+    "μ",
+    "ν",
+    "ξ",
+    "ο",
+    "ρ",
+    "ς",
+    "σ",
+    "τ",
+    "υ",
+    "φ",
+    "χ",
+    "ψ",
+    "ω",
+    "ϑ",
+    "ϒ",
+    "ϕ",
+    "ϖ",
+    "Ϛ",
+    "ϛ",
+    "Ϝ",
+    "ϝ",
+    "Ϟ",
+    "ϟ",
+    "Ϡ",
+    "ϡ",
+    "ϰ",
+    "ϱ",
+    "ϵ",
+    "‐",
+    "–",
+    "‘",
+    "’",
+    "“",
+    "”",
+    "†",
+    "‡",
+    "•",
+    "…",
+    "′",
+    "″",
+    "‵",
+    "‶",
+    "⁃",
+    "€",
+    "ℊ",
+    "ℋ",
+    "ℌ",
+    "ℏ",
+    "ℐ",
+    "ℑ",
+    "ℒ",
+    "ℓ",
+    "℘",
+    "ℛ",
+    "ℜ",
+    "™",
+    "℧",
+    "ℨ",
+    "ℬ",
+    "ℭ",
+    "ℯ",
+    "ℰ",
+    "ℱ",
+    "ℳ",
+    "ℴ",
+    "ℵ",
+    "ℶ",
+    "ℷ",
+    "ℸ",
+    "↵",
+    "∂",
+    "∅",
+    "∓",
+    "∖",
+    "∘",
+    "∟",
+    "∠",
+    "∡",
+    "∢",
+    "∨",
+    "⊼",
+    "⋄",
+    "⋆",
+    "⋮",
+    "⋯",
+    "⋰",
+    "⋱",
+    "⌀",
+    "⌘",
+    "⌢",
+    "⎴",
+    "⎵",
+    "␣",
+    "─",
+    "│",
+    "■",
+    "□",
+    "▪",
+    "▫",
+    "▮",
+    "▯",
+    "▲",
+    "△",
+    "▴",
+    "▶",
+    "▼",
+    "▽",
+    "◀",
+    "◆",
+    "◇",
+    "○",
+    "●",
+    "◦",
+    "◻",
+    "◼",
+    "★",
+    "☹",
+    "☺",
+    "☿",
+    "♀",
+    "♁",
+    "♂",
+    "♃",
+    "♄",
+    "♅",
+    "♆",
+    "♇",
+    "♠",
+    "♡",
+    "♢",
+    "♣",
+    "♩",
+    "♪",
+    "♫",
+    "♬",
+    "♭",
+    "♮",
+    "♯",
+    "✓",
+    "✶",
+    "𝒩",
+))
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Lexing driven by the Mathics3 tokeniser.
+
+The token table of MathematicaLexer approximates the Wolfram Language
+with regular expressions. This engine instead lets the Tokeniser of
+mathics_scanner, which the Mathics3 parser reads its input with, decide
+where tokens start and end, and maps its token tags to MToken. It
+recognizes, for example, \\[Rule] as one operator, \\[Alpha]1 as one
+symbol, and the box constructs of \\(x\\^2\\).
+
+The Tokeniser skips whitespace and comments; these are lexed here, in
+between its tokens. Where the Tokeniser raises an exception, one token
+of the regular lexer is used instead and tokenising resumes after it, so
+that highlighting never fails.
+
+The Tokeniser copies the rest of its input for some tokens and errors,
+so it is only given a short stretch of text at a time, and its syntax
+messages, which are not used, are not formatted. Lexing time is linear
+in the size of text, however many errors it has.
+"""
+
+from mathics_scanner.feed import LineFeeder
+from mathics_scanner.tokeniser import Tokeniser
+
+from mathics_pygments import scanner
+from mathics_pygments.lexer import UNICODE_TOKENS, MToken, load_tables, symbol_token
+
+load_tables()
+
+# Tokeniser tags that are not operators.
+TAG_TOKENS = {
+    "Filename": MToken.NAMESPACE,
+    "LeftRowBox": MToken.GROUP,
+    "Number": MToken.NUMBER,
+    "Pattern": MToken.PATTERN,
+    "RawComma": MToken.GROUP,
+    "RawLeftAssociation": MToken.GROUP,
+    "RawLeftBrace": MToken.GROUP,
+    "RawLeftBracket": MToken.GROUP,
+    "RawLeftParenthesis": MToken.GROUP,
+    "RawRightAssociation": MToken.GROUP,
+    "RawRightBrace": MToken.GROUP,
+    "RawRightBracket": MToken.GROUP,
+    "RawRightParenthesis": MToken.GROUP,
+    "RightRowBox": MToken.GROUP,
+    "Slot": MToken.SLOT,
+    "SlotSequence": MToken.SLOT,
+    "String": MToken.STRING,
+    "Symbol": MToken.SYMBOL,
+}
+
+# The Tokeniser is given at least this many characters of text past the
+# start of a token (see get_tokens_unprocessed()), and has to end the
+# token more than MARGIN characters before the end of what it is given.
+BLOCK = 1 << 7
+MARGIN = 1 << 5
+
+# Tokeniser._skip_blank() skips these, besides comments.
+BLANKS = frozenset(" \r\n\t")
+
+
+def comment_end(text: str, pos: int) -> int:
+    """
+    End of the (nested) comment at pos, or the end of text if it is not
+    closed.
+    """
+    depth = 0
+    while True:
+        opening = text.find("(*", pos)
+        closing = text.find("*)", pos)
+        if closing < 0:
+            return len(text)
+        if 0 <= opening < closing:
+            depth += 1
+            pos = opening + 2
+        else:
+            depth -= 1
+            pos = closing + 2
+            if depth == 0:
+                return pos
+
+
+def string_end(text: str, pos: int) -> int:
+    """End of the string at pos, or the end of text if it is not closed."""
+    n = len(text)
+    pos += 1
+    while pos < n:
+        char = text[pos]
+        if char == '"':
+            return pos + 1
+        pos += 2 if char == "\\" else 1
+    return n
+
+
+def blanks(text: str, pos: int):
+    """
+    Generate tokens for the whitespace and comments at pos, which the
+    Tokeniser skips, and return the position after them.
+    """
+    n = len(text)
+    while pos < n:
+        char = text[pos]
+        if char in BLANKS:
+            end = pos + 1
+            while end < n and text[end] in BLANKS:
+                end += 1
+            yield pos, MToken.WHITESPACE, text[pos:end]
+        elif text.startswith("(*", pos):
+            end = comment_end(text, pos)
+            yield pos, MToken.COMMENT, text[pos:end]
+        elif pos + 2 == n and text.endswith("\\\n"):
+            # A line continuation at the end of the input.
+            end = n
+            yield pos, MToken.WHITESPACE, text[pos:end]
+        else:
+            break
+        pos = end
+    return pos
+
+
+def recover(text: str, pos: int):
+    """
+    Return a token for the text at pos, where the Tokeniser failed.
+    Strings run to their closing quote, as the Tokeniser would have it;
+    anything else is the first token the scanner engine finds on the rest
+    of the line.
+    """
+    if text[pos] == '"':
+        end = string_end(text, pos)
+        return pos, MToken.STRING, text[pos:end]
+    # The scanner is given the line a block at a time, as the Tokeniser is.
+    n = len(text)
+    size = BLOCK
+    while True:
+        end = min(pos + size, n)
+        line_end = text.find("\n", pos, end)
+        if line_end >= 0:
+            end = line_end
+        _, token, value = next(scanner.get_tokens_unprocessed(text[pos:end]))
+        if line_end >= 0 or end == n or len(value) < size - MARGIN:
+            return pos, token, value
+        size *= 2
+
+
+class TextFeeder(LineFeeder):
+    """
+    Feeds text[start:end], with a newline after it at the end of text,
+    as the only line of input, and drops the messages of the Tokeniser.
+    """
+
+    def __init__(self, text: str, start: int, end: int):
+        super().__init__("<pygments>")
+        # Whether this is the rest of text, and whether the Tokeniser has
+        # asked for more.
+        self.final = end >= len(text)
+        self.more = False
+        # The Tokeniser looks at the character after a symbol without
+        # checking for the end of its input, so at the end of text it gets
+        # a newline past it.
+        self.source_text = text[start:end] + "\n" if self.final else text[start:end]
+
+    def feed(self) -> str:
+        if self.lineno:
+            self.more = True
+            return ""
+        self.lineno = 1
+        return self.source_text
+
+    def empty(self) -> bool:
+        return self.lineno > 0
+
+    def message(self, symbol_name: str, tag: str, *args) -> None:
+        pass
+
+
+class QuietTokeniser(Tokeniser):
+    """A Tokeniser that does not format the syntax messages it would send."""
+
+    def sntx_message(self, start_pos=None):
+        if start_pos is None:
+            start_pos = self.pos
+        return "sntxf", start_pos, start_pos
+
+
+def new_tokeniser(text: str, pos: int, size: int, mode: str, boxes: int):
+    tokeniser = QuietTokeniser(TextFeeder(text, pos, pos + size))
+    tokeniser._change_token_scanning_mode(mode)
+    tokeniser.is_inside_box = boxes > 0
+    return tokeniser
+
+
+def get_tokens_unprocessed(text: str):
+    """
+    Generate (index, token, value) triples for text, starting at the top
+    level.
+
+    The Tokeniser is given 2 * BLOCK characters of text at a time, from
+    the position of a token on, and a new one is started once it is BLOCK
+    characters past that, so that the copies of the rest of its input it
+    makes for some tokens stay short. Where what it finds may go on past
+    the end of its input, it is given twice as much from the same
+    position, up to the rest of text.
+    """
+    boxes = 0
+    after_message_name = False
+    base = 0
+    tokeniser = new_tokeniser(text, base, 2 * BLOCK, "expr", boxes)
+    pos = 0
+    n = len(text)
+    while True:
+        pos = yield from blanks(text, pos)
+        if pos >= n:
+            break
+
+        mode = tokeniser.mode
+        if pos - base >= BLOCK:
+            base = pos
+            tokeniser = new_tokeniser(text, base, 2 * BLOCK, mode, boxes)
+        while True:
+            tokeniser.pos = pos - base
+            try:
+                token = tokeniser.next()
+            except Exception:
+                # Mostly mathics_scanner.errors.SyntaxError, but some
+                # incomplete escape sequences make the Tokeniser index past
+                # the end of its input.
+                token = None
+            feeder = tokeniser.feeder
+            size = len(feeder.source_text)
+            if feeder.final or not (feeder.more or tokeniser.pos > size - MARGIN):
+                break
+            base = pos
+            tokeniser = new_tokeniser(text, base, 2 * size, mode, boxes)
+
+        if token is None or tokeniser.pos <= pos - base:
+            item = recover(text, pos)
+            yield item
+            pos += len(item[2])
+            # Go on in the default scanning mode.
+            tokeniser._change_token_scanning_mode("expr")
+            after_message_name = False
+            continue
+
+        tag = token.tag
+        end = min(base + tokeniser.pos, n)
+        value = text[pos:end]
+        mtoken = TAG_TOKENS.get(tag, MToken.OPERATOR)
+        if after_message_name and tag in ("Symbol", "String"):
+            mtoken = MToken.MESSAGE
+        elif tag == "Symbol":
+            # Letter-like characters such as π.
+            mtoken = UNICODE_TOKENS.get(value) or symbol_token(value)
+        elif tag == "LeftRowBox":
+            boxes += 1
+            tokeniser.is_inside_box = True
+        elif tag == "RightRowBox" and boxes:
+            boxes -= 1
+            tokeniser.is_inside_box = boxes > 0
+        after_message_name = tag == "MessageName"
+
+        yield pos, mtoken, value
+        pos = end
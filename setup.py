@@ -80,7 +80,7 @@ setup(
         "Topic :: Text Processing",
         "Topic :: Utilities",
     ],
-    packages=["mathics_pygments"],
+    packages=["mathics_pygments", "mathics_pygments.generate"],
     package_data={
         "mathics_pygments": [
             "data/mma-tables.json",
@@ -90,7 +90,10 @@ setup(
     include_package_data=False,
     platforms=["any"],
     entry_points={
-        "pygments.lexers": ["MathematicaLexer = mathics_pygments:MathematicaLexer"],
+        "pygments.lexers": [
+            "MathematicaLexer = mathics_pygments:MathematicaLexer",
+            "FastMathematicaLexer = mathics_pygments:FastMathematicaLexer",
+        ],
         "pygments.styles": [
             "mathematica = mathics_pygments:MathematicaStyle",
             "mathematicanotebook = mathics_pygments:MathematicaNotebookStyle",
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Worst-case inputs for the rules of MathematicaLexer: long runs of the
+characters that rules repeat or backtrack over. Lexing four times as much
+of each must take about four times as long, never sixteen: the times of
+lexing three sizes of each must fit a power law with an exponent well
+below 2.
+
+The "mathics-scanner" engine is only given input full of syntax errors,
+where it falls back on the scanner engine; otherwise its speed is that
+of the Mathics3 tokeniser.
+
+These tests time the lexer, so other processes busy on the same CPU can
+fail them. They are only run with the environment variable
+MATHICS_PYGMENTS_TIMING set, as "make check-timing" does.
+"""
+
+import math
+import os
+import time
+
+import pytest
+
+from mathics_pygments.lexer import MathematicaLexer
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("MATHICS_PYGMENTS_TIMING"),
+    reason="timing tests run only with MATHICS_PYGMENTS_TIMING set",
+)
+
+# Functions of a size n giving about n characters of input.
+INPUTS = {
+    "underscores": lambda n: "_" * n,
+    "underscores before ::": lambda n: "_" * n + "::",
+    "digits and underscores": lambda n: "1_" * (n // 2),
+    "Unicode letters and underscores": lambda n: "α_" * (n // 2),
+    "messages without text": lambda n: "_::_" * (n // 4),
+    "digits": lambda n: "1" * n,
+    "digit before whitespace": lambda n: "1" + " " * n,
+    "dots": lambda n: "1." * (n // 2),
+    "precisions": lambda n: "1`" * (n // 2),
+    "bases": lambda n: "1^^" * (n // 3),
+    "exponents": lambda n: "1*^" * (n // 3),
+    "backticks": lambda n: "`" * n,
+    "contexts": lambda n: "a`" * (n // 2),
+    "contexts before a blank": lambda n: "a`" * (n // 2) + "_",
+    "patterns": lambda n: "a_" * (n // 2),
+    "named characters": lambda n: "\\[Alpha]`" * (n // 9),
+    "unterminated named characters": lambda n: "\\[a" * (n // 3),
+    "slots": lambda n: "#a`" * (n // 3),
+    "hashes": lambda n: "#" * n,
+    "stars": lambda n: "*" * n,
+    "stars in a comment": lambda n: "(*" + "*" * n,
+    "nested comments": lambda n: "(*" * (n // 2),
+    "parentheses": lambda n: "(" * n,
+    "message operators": lambda n: "::\\" + "s" * n,
+    "backslashes in a string": lambda n: '"' + "\\" * n,
+    "escaped quotes in a string": lambda n: '"' + '\\"' * (n // 2),
+    "escapes before a quote": lambda n: ('"' + "\\" * 15 + '"') * (n // 17),
+}
+
+# Input the Mathics3 tokeniser rejects every few characters.
+ERRORS = {
+    "syntax errors": lambda n: "a ? b ; \\[ x\n" * (n // 14),
+    "syntax errors on one line": lambda n: "a ? b ; \\[ x " * (n // 14),
+    "unterminated named characters": lambda n: "\\[a" * (n // 3),
+}
+
+SIZES = (16_000, 32_000, 64_000)
+# The exponent of a power law fitted to the times of lexing SIZES: about
+# 1 for linear lexing, 2 for quadratic.
+MAX_EXPONENT = 1.5
+
+
+def lex_time(lexer, text: str, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in lexer.get_tokens_unprocessed(text):
+            pass
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def exponent(lexer, make) -> float:
+    """The least-squares slope of log time against log size."""
+    xs = [math.log(size) for size in SIZES]
+    ys = [math.log(lex_time(lexer, make(size))) for size in SIZES]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+
+
+@pytest.mark.parametrize("engine", ["regex", "master", "scanner"])
+@pytest.mark.parametrize("name", INPUTS)
+def test_linear_time(engine, name):
+    lexer = MathematicaLexer(engine=engine)
+    growth = exponent(lexer, INPUTS[name])
+    assert growth < MAX_EXPONENT, f"{name}: time grows as size ** {growth:.2f}"
+
+
+@pytest.mark.parametrize("name", ERRORS)
+def test_mathics_scanner_linear_time(name):
+    pytest.importorskip("mathics_scanner")
+    lexer = MathematicaLexer(engine="mathics-scanner")
+    growth = exponent(lexer, ERRORS[name])
+    assert growth < MAX_EXPONENT, f"{name}: time grows as size ** {growth:.2f}"
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+import pytest
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+
+import mathics_pygments.batch as batch
+from mathics_pygments.batch import highlight_many, lex_many
+from mathics_pygments.lexer import MathematicaLexer
+
+from .test_engines import SNIPPETS
+
+
+def write_files(directory):
+    paths = []
+    for i, snippet in enumerate(SNIPPETS):
+        path = directory / f"file{i}.m"
+        path.write_text(snippet, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_lex_many(tmp_path):
+    paths = write_files(tmp_path)
+    lexer = MathematicaLexer(engine="scanner")
+    results = list(lex_many(paths, workers=2, engine="scanner"))
+    assert [path for path, _ in results] == paths
+    for (path, tokens), snippet in zip(results, SNIPPETS):
+        assert tokens == list(lexer.get_tokens(snippet))
+
+    unordered = dict(lex_many(paths, workers=2, ordered=False))
+    assert unordered == dict(results)
+
+
+def test_highlight_many(tmp_path):
+    paths = write_files(tmp_path)
+    formatter = HtmlFormatter()
+    lexer = MathematicaLexer()
+    results = list(highlight_many(paths, formatter, workers=2))
+    assert results == [
+        (path, highlight(snippet, lexer, formatter))
+        for path, snippet in zip(paths, SNIPPETS)
+    ]
+
+
+@pytest.mark.parametrize("engine", ["regex", "scanner"])
+def test_lex_parallel(engine):
+    lexer = MathematicaLexer(engine=engine)
+    text = (
+        "Module[{x = 1},\n  f[x]\n];\n"
+        '(* a comment\n over "lines" *)\ns = "a string\n  (* over lines";\n'
+        "\n".join(SNIPPETS)
+    ) * 20
+    tokens = list(lexer.get_tokens_unprocessed(text))
+    assert list(lexer.get_tokens_parallel(text, workers=2, segments=7)) == tokens
+
+
+def test_lex_parallel_bad_split_points(monkeypatch):
+    # Split points inside comments and strings make the workers' tokens
+    # wrong up to their next common restart point.
+    lexer = MathematicaLexer()
+    text = '(* c\n (* c\n *) c\n *) x = "s\n s\n s"; y\n' * 20
+    points = [index + 1 for index, char in enumerate(text) if char == "\n"]
+    monkeypatch.setattr(batch, "split_points", lambda text, count: points[::3])
+    tokens = list(lexer.get_tokens_unprocessed(text))
+    assert list(batch.lex_parallel(lexer, text, workers=2)) == tokens
+
+
+@pytest.mark.parametrize("step", [1, 2, 5])
+def test_lex_parallel_split_in_scopes(monkeypatch, step):
+    # Split points inside Module and Block make the workers annotate from
+    # the wrong scope state, up to where it is the same again.
+    lexer = MathematicaLexer()
+    text = (
+        "Module[{x = 1, y},\n  x + y\n  Block[{z},\n    x z\n  ]\n  x\n];\n"
+        "f[x_] := x\nWith\n[{a = 2},\n  a\n]\n"
+    ) * 10
+    points = [index + 1 for index, char in enumerate(text) if char == "\n"]
+    monkeypatch.setattr(batch, "split_points", lambda text, count: points[::step])
+    tokens = list(lexer.get_tokens_unprocessed(text))
+    assert list(batch.lex_parallel(lexer, text, workers=2)) == tokens
+
+
+def test_lex_parallel_serial(monkeypatch):
+    # Unless workers is given, text is lexed without a pool on a single
+    # CPU and below PARALLEL_MIN_SIZE.
+    lexer = MathematicaLexer()
+    text = "Module[{x = 1},\n  f[x]\n];\n" * 20
+    tokens = list(lexer.get_tokens_unprocessed(text))
+    monkeypatch.setattr(batch, "_tokens_parallel", None)
+    monkeypatch.setattr(batch, "cpu_count", lambda: 4)
+    assert list(lexer.get_tokens_parallel(text)) == tokens
+    monkeypatch.setattr(batch, "PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr(batch, "cpu_count", lambda: 1)
+    assert list(lexer.get_tokens_parallel(text)) == tokens
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+import marshal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+
+from mathics_pygments.cache import CacheInfo, DiskCache, TokenCache
+from mathics_pygments.lexer import MathematicaLexer
+
+from .test_engines import SNIPPETS
+
+
+def test_cache_hits():
+    cache = TokenCache()
+    lexer = MathematicaLexer(cache=cache)
+    text = "Module[{x}, f[x]]\n"
+    tokens = tuple(MathematicaLexer().get_tokens_unprocessed(text))
+    assert tuple(lexer.get_tokens_unprocessed(text)) == tokens
+    assert cache.get_tokens(lexer, text) is cache.get_tokens(lexer, text)
+    assert cache.info() == CacheInfo(hits=2, misses=1, evictions=0, entries=1, size=18)
+
+    # Other options are other entries.
+    scanner = MathematicaLexer(engine="scanner", cache=cache)
+    assert tuple(scanner.get_tokens_unprocessed(text)) == tokens
+    assert cache.info().misses == 2
+
+    formatter = HtmlFormatter()
+    assert highlight(text, lexer, formatter) == highlight(
+        text, MathematicaLexer(), formatter
+    )
+    assert cache.info().hits == 3
+
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 0, 0)
+
+
+def test_cache_eviction():
+    cache = TokenCache(max_entries=2)
+    lexer = MathematicaLexer(cache=cache)
+    for text in ("a", "b", "a", "c"):
+        lexer.get_tokens_unprocessed(text)
+    assert cache.info() == CacheInfo(hits=1, misses=3, evictions=1, entries=2, size=2)
+    lexer.get_tokens_unprocessed("a")
+    assert cache.info().hits == 2
+
+    cache = TokenCache(max_size=10)
+    lexer = MathematicaLexer(cache=cache)
+    for text in ("x" * 4, "y" * 4, "z" * 4):
+        lexer.get_tokens_unprocessed(text)
+    assert cache.info().entries == 2
+    assert cache.info().size == 8
+
+
+def test_cache_threads():
+    cache = TokenCache(max_entries=len(SNIPPETS) // 2)
+    lexer = MathematicaLexer(cache=cache)
+    expected = {
+        snippet: tuple(MathematicaLexer().get_tokens_unprocessed(snippet))
+        for snippet in SNIPPETS
+    }
+    failures = []
+
+    def work():
+        for _ in range(5):
+            for snippet, tokens in expected.items():
+                if tuple(lexer.get_tokens_unprocessed(snippet)) != tokens:
+                    failures.append(snippet)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not failures
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 5 * len(SNIPPETS)
+    assert info.entries <= len(SNIPPETS) // 2
+
+
+def test_shared_cache():
+    assert MathematicaLexer(cache=True).cache is MathematicaLexer(cache="yes").cache
+    assert MathematicaLexer(cache=False).cache is None
+
+
+def test_disk_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    formatter = HtmlFormatter(style="colorful")
+    expected = [
+        (
+            tuple(MathematicaLexer().get_tokens_unprocessed(snippet)),
+            highlight(snippet, MathematicaLexer(), formatter),
+        )
+        for snippet in SNIPPETS
+    ]
+
+    # The second run, as of a rebuild, finds everything in the cache.
+    for rebuild in (False, True):
+        cache = DiskCache(path)
+        lexer = MathematicaLexer(cache=cache)
+        for snippet, (tokens, output) in zip(SNIPPETS, expected):
+            assert tuple(lexer.get_tokens_unprocessed(snippet)) == tokens
+            assert cache.highlight(snippet, lexer, formatter) == output
+        assert (cache.info().misses == 0) == rebuild
+
+    # Other formatter options and styles are other entries.
+    cache.highlight(SNIPPETS[0], lexer, HtmlFormatter(style="colorful", linenos=True))
+    cache.highlight(SNIPPETS[0], lexer, HtmlFormatter(style="zenburn"))
+    assert cache.info().misses == 2
+    entries = cache.info().entries
+    assert MathematicaLexer(cache=path).cache.info().entries == entries
+
+
+def test_disk_cache_eviction(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), max_size=2000)
+    lexer = MathematicaLexer(cache=cache)
+    for number in range(100):
+        lexer.get_tokens_unprocessed(f"f[x{number}, y]\n")
+    assert 0 < cache.info().size <= 2000
+    assert cache.info().entries < 100
+
+
+def lex_with_disk_cache(path):
+    lexer = MathematicaLexer(cache=DiskCache(path))
+    for snippet in SNIPPETS * 3:
+        lexer.get_tokens_unprocessed(snippet)
+
+
+def test_disk_cache_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    DiskCache(path)
+    with ProcessPoolExecutor(4) as executor:
+        for _ in executor.map(lex_with_disk_cache, [path] * 8):
+            pass
+    cache = DiskCache(path)
+    assert cache.info().entries == len(set(SNIPPETS))
+    lexer = MathematicaLexer(cache=cache)
+    for snippet in SNIPPETS:
+        assert tuple(lexer.get_tokens_unprocessed(snippet)) == tuple(
+            MathematicaLexer().get_tokens_unprocessed(snippet)
+        )
+    assert cache.info().misses == 0
+
+
+def stored_size(cache) -> int:
+    return (
+        cache._connect()
+        .execute("SELECT value FROM totals WHERE name = 'size'")
+        .fetchone()[0]
+    )
+
+
+def test_disk_cache_total_size(tmp_path):
+    # The size kept by each write is that of the entries, also after
+    # entries are replaced or evicted.
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path, max_size=3000)
+    lexer = MathematicaLexer(cache=cache)
+    for number in range(60):
+        lexer.get_tokens_unprocessed(f"f[x{number % 40}, y]\n")
+        cache._put(cache._key("replaced"), number * "x")
+        assert stored_size(cache) == cache.info().size <= 3000
+    cache.clear()
+    assert stored_size(DiskCache(path)) == 0
+
+
+def test_disk_cache_unreadable(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path)
+    lexer = MathematicaLexer(cache=cache)
+    tokens = tuple(lexer.get_tokens_unprocessed(SNIPPETS[0]))
+    with cache._connect() as connection:
+        connection.execute("UPDATE entries SET value = substr(value, 1, 5)")
+
+    # An entry cut short is a miss, and is replaced.
+    assert tuple(lexer.get_tokens_unprocessed(SNIPPETS[0])) == tokens
+    assert cache.info().misses == 2
+    assert tuple(lexer.get_tokens_unprocessed(SNIPPETS[0])) == tokens
+    assert cache.info().hits == 1
+
+    # Entries written in another marshal format are not looked at.
+    monkeypatch.setattr("marshal.version", marshal.version + 1)
+    assert tuple(lexer.get_tokens_unprocessed(SNIPPETS[0])) == tokens
+    assert cache.info() == CacheInfo(1, 3, 0, 2, cache.info().size)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+"""
+Differential tests: every MathematicaLexer engine must produce exactly the
+tokens of the default "regex" engine.
+"""
+
+import random
+from itertools import groupby
+from operator import itemgetter
+
+import pytest
+
+import mathics_pygments.builtins as mma
+from mathics_pygments.lexer import FastMathematicaLexer, MathematicaLexer, MToken
+
+SNIPPETS = [
+    "(* a comment *)",
+    "(* foo (* bar *) baz *)",
+    "(* unterminated (* comment",
+    "(*)*) (**) (***) ((* x *)) *) (",
+    "(* a ((* b *) c *) (* a *(* b *) **) (*********) (* f[(x)] (y*) *",
+    '"a string \\" with a quote" "newline\\n" "\\\\" "unterminated',
+    '"multi\nline"\n"\n"',
+    '"a\\\\" "\\\\\\"" "\\\\\\\\"x" "{\\"k\\": [\\"v\\\\\\\\\\"]}" "\\',
+    "123 1.23 .5 7. 1` 1.2` 1.23`30 20`20 2^^101 8 ^^ 17 10^^ 3.4",
+    "1*^3 2 *^23 1.23*^4 1.5`10*^-3",
+    "_Head __Head ___Head x_ x_Head Foo`Bar__Integer Foo`Bar___Ctx`Baz`Qux x_.",
+    '# #1 ##2 #foo #"foo" #Foo$1`Bar2$ &',
+    "General::foo Foo`Bar::baz a::b: some message text",
+    "f::\\usage f::\\sss`ctx f::\\s",
+    "Power::infy: Infinite expression 1/0 encountered.",
+    "1_::usage: text\nx_α::usage: text\n1α::tag: a message\n_::a: b α::c: d",
+    "<<Foo` <<Foo`Bar` System`Plus `ctx`sym \\[Alpha] \\[Pi]",
+    "x∈ℛ∧〚π〛⊕☃ α::x: foo ∈β::x: y a b",
+    "Block[{x=Module[{y=<|a->1,b->2|>},y],z=With[{k={1,2}},k*3]}, x+y*Block[{k=3},f[k]]]",
+    "f[x_, y_:1] := Module[{a = x^2}, If[a > 0, Sin[a] + y, #1 & /@ Range[a]]]",
+    " ".join(mma.OPERATORS),
+    "@ \\ $ ` ! \t\r\n\x00 \x7f",
+]
+
+FRAGMENTS = [
+    "(*",
+    "*)",
+    "(",
+    ")",
+    "*",
+    '"',
+    "\\",
+    "\\n",
+    '\\"',
+    "\n",
+    " ",
+    "\t",
+    "x",
+    "Foo",
+    "`",
+    "_",
+    "____",
+    "__",
+    "#",
+    "##",
+    "$",
+    "1",
+    "23",
+    ".",
+    "`",
+    "^^",
+    "*^",
+    "::",
+    "::\\",
+    "s",
+    ":",
+    ": ",
+    "[",
+    "]",
+    "{",
+    "}",
+    "<|",
+    "|>",
+    ",",
+    "=",
+    ":=",
+    ";",
+    "->",
+    "Block",
+    "With",
+    "Module",
+    "Sin",
+    "\\[Alpha]",
+    "α",
+    "∈",
+    "π",
+    "〚",
+    "☃",
+    " ",
+    "@",
+    "!",
+    "&",
+    "/.",
+    "'",
+]
+
+
+def random_code(rng: random.Random, length: int) -> str:
+    """Concatenate random fragments that exercise rule boundaries."""
+    return "".join(rng.choice(FRAGMENTS) for _ in range(length))
+
+
+def corpus(count: int = 500, seed: int = 0):
+    rng = random.Random(seed)
+    yield from SNIPPETS
+    for _ in range(count):
+        yield random_code(rng, rng.randint(1, 80))
+
+
+def assert_same_tokens(lexer, reference, code):
+    expected = list(reference.get_tokens_unprocessed(code))
+    returned = list(lexer.get_tokens_unprocessed(code))
+    assert returned == expected, repr(code)
+
+
+def assert_same_raw_tokens(lexer, reference, code, stack):
+    expected = list(reference.get_raw_tokens(code, stack))
+    returned = list(lexer.get_raw_tokens(code, stack))
+    assert returned == expected, (code, stack)
+
+
+@pytest.mark.parametrize("engine", ["master", "scanner"])
+def test_engine_matches_regex(engine):
+    reference = MathematicaLexer()
+    lexer = MathematicaLexer(engine=engine)
+    for code in corpus():
+        assert_same_tokens(lexer, reference, code)
+
+
+@pytest.mark.parametrize("stack", [("root", "comments"), ("root", "strings")])
+def test_scanner_matches_regex_in_substates(stack):
+    reference = MathematicaLexer()
+    lexer = MathematicaLexer(engine="scanner")
+    for code in corpus(seed=1):
+        assert_same_raw_tokens(lexer, reference, code, stack)
+
+
+def test_scanner_matches_regex_on_random_characters():
+    # Unlike the fragments, single characters also land in the middle of
+    # numbers, symbols and the operators of mma.OPERATORS.
+    alphabet = [chr(code) for code in range(128)] + list("αβé∈ℛ☃〚〛 \u3000…")
+    rng = random.Random(2)
+    reference = MathematicaLexer()
+    lexer = FastMathematicaLexer()
+    for _ in range(2000):
+        code = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 40)))
+        assert_same_tokens(lexer, reference, code)
+
+
+def test_fast_lexer():
+    lexer = FastMathematicaLexer()
+    assert lexer.engine == "scanner"
+    assert not set(lexer.aliases) & set(MathematicaLexer.aliases)
+    assert FastMathematicaLexer(engine="regex").engine == "regex"
+
+
+def assert_covers(tokens, code):
+    pos = 0
+    for index, _, value in tokens:
+        assert index == pos and value, (code, index, value)
+        pos += len(value)
+    assert pos == len(code), code
+
+
+def test_mathics_scanner_engine():
+    pytest.importorskip("mathics_scanner")
+    lexer = MathematicaLexer(engine="mathics-scanner")
+    tokens = list(lexer.get_tokens_unprocessed(r"f::usage = a \[Rule] \[Alpha]1"))
+    assert tokens == [
+        (0, MToken.SYMBOL, "f"),
+        (1, MToken.OPERATOR, "::"),
+        (3, MToken.MESSAGE, "usage"),
+        (8, MToken.WHITESPACE, " "),
+        (9, MToken.OPERATOR, "="),
+        (10, MToken.WHITESPACE, " "),
+        (11, MToken.SYMBOL, "a"),
+        (12, MToken.WHITESPACE, " "),
+        (13, MToken.OPERATOR, r"\[Rule]"),
+        (20, MToken.WHITESPACE, " "),
+        (21, MToken.SYMBOL, r"\[Alpha]1"),
+    ]
+    # The tokeniser rejects much of the corpus; the engine must recover.
+    for code in corpus():
+        assert_covers(list(lexer.get_tokens_unprocessed(code)), code)
+
+
+def test_mathics_scanner_blocks(monkeypatch):
+    # The Tokeniser is given text a block at a time; the size of the
+    # blocks must not change the tokens, nor must errors near their ends.
+    pytest.importorskip("mathics_scanner")
+    from mathics_pygments import tokeniser
+
+    codes = list(corpus()) + ["a ? b ; \\[ x\n" * 50, "<< foo`\nx\n" * 50]
+    expected = [list(tokeniser.get_tokens_unprocessed(code)) for code in codes]
+    for block in (1, 7, 64):
+        monkeypatch.setattr(tokeniser, "BLOCK", block)
+        for code, tokens in zip(codes, expected):
+            assert list(tokeniser.get_tokens_unprocessed(code)) == tokens, code
+
+
+@pytest.mark.parametrize("engine", MathematicaLexer.engines)
+@pytest.mark.parametrize("mergestrings", [False, True])
+def test_merged_tokens(engine, mergestrings):
+    if engine == "mathics-scanner":
+        pytest.importorskip("mathics_scanner")
+    lexer = MathematicaLexer(engine=engine, mergestrings=mergestrings)
+    merging = MathematicaLexer(
+        engine=engine, mergestrings=mergestrings, mergetokens=True
+    )
+    for code in corpus():
+        tokens = list(lexer.get_tokens_unprocessed(code))
+        merged = list(merging.get_tokens_unprocessed(code))
+        # Each run of tokens of the same type becomes one token, at the
+        # index of the first, so the merged tokens make up the same text.
+        runs = [list(run) for _, run in groupby(tokens, key=itemgetter(1))]
+        expected = [
+            (run[0][0], run[0][1], "".join(value for _, _, value in run))
+            for run in runs
+        ]
+        assert merged == expected, code
+        assert "".join(value for _, _, value in merged) == "".join(
+            value for _, _, value in tokens
+        )
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+import random
+
+import pytest
+
+import mathics_pygments.incremental as incremental
+from mathics_pygments.lexer import MathematicaLexer, MToken
+
+from .test_engines import FRAGMENTS, SNIPPETS
+
+TEXTS = [
+    "",
+    "\n".join(SNIPPETS),
+    "f[x_] := Module[{a = x^2, b = {1, 2}}, If[a > 0, Sin[a] + b, {a, b}]];\n" * 20,
+    "Block[{x = 1}, With[{y = x}, Module[{z}, z = x + y; g[z, {x, y}]]]]\n" * 20,
+]
+
+INSERTIONS = FRAGMENTS + ["Module[{x},", "\\[", "]", "(* c *)", "x = 1, "]
+
+
+@pytest.fixture
+def checkpoint_interval(monkeypatch):
+    # Small intervals give many checkpoints on the short texts below.
+    monkeypatch.setattr(incremental, "CHECKPOINT_INTERVAL", 8)
+
+
+def random_edit(rng, text):
+    offset = rng.randint(0, len(text))
+    deleted = rng.randint(0, min(len(text) - offset, rng.choice((0, 1, 3, 20))))
+    count = rng.choice((0, 1, 1, 2, 5))
+    inserted = "".join(rng.choice(INSERTIONS) for _ in range(count))
+    return offset, deleted, inserted
+
+
+@pytest.mark.parametrize("engine", MathematicaLexer.engines)
+def test_edits_match_full_relexing(engine, checkpoint_interval):
+    if engine == "mathics-scanner":
+        pytest.importorskip("mathics_scanner")
+    lexer = MathematicaLexer(engine=engine)
+    rng = random.Random(0)
+    for text in TEXTS:
+        stream = lexer.get_token_stream(text)
+        assert list(stream) == list(lexer.get_tokens_unprocessed(text))
+        for _ in range(30):
+            old_tokens = list(stream)
+            offset, deleted, inserted = random_edit(rng, stream.text)
+            stream, (start, end) = stream.edit(offset, deleted, inserted)
+            text = text[:offset] + inserted + text[offset + deleted :]
+            assert stream.text == text
+            tokens = list(lexer.get_tokens_unprocessed(text))
+            assert list(stream) == tokens, (offset, deleted, inserted)
+
+            # Outside of the changed range, the tokens are the old ones.
+            delta = len(inserted) - deleted
+            old_tokens = set(old_tokens)
+            for index, token, value in tokens:
+                if index + len(value) <= start:
+                    assert (index, token, value) in old_tokens
+                elif index >= end:
+                    assert (index - delta, token, value) in old_tokens
+
+
+def test_edit_relexes_locally(checkpoint_interval):
+    lexer = MathematicaLexer()
+    text = "Module[{x = 1}, f[x, y]];\n" * 100
+    stream = lexer.get_token_stream(text)
+    stream, changed = stream.edit(text.index("y"), 1, "x")
+    assert changed == (text.index("y"), text.index("y") + 1)
+    assert (text.index("y"), MToken.LOCAL_SCOPE, "x") in list(stream)
+    assert len(stream.positions) > 100
+
+    with pytest.raises(ValueError):
+        stream.edit(len(text), 1, "")
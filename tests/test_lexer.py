@@ -3,11 +3,23 @@
 # Copyright (c) 2016 rsmenon
 # Licensed under the MIT License (https://opensource.org/licenses/MIT)
 
+import pickle
+import random
+import subprocess
+import sys
+
 import pytest
+from pygments.lexer import RegexLexer
 from pygments.token import Token
 
 import mathics_pygments.builtins as mma
-from mathics_pygments.lexer import MathematicaLexer, MToken
+from mathics_pygments.lexer import (
+    LexerState,
+    MathematicaAnnotations,
+    MathematicaLexer,
+    MToken,
+)
+from tests.annotation_pipeline import AnnotationPipeline
 
 lexer = MathematicaLexer()
 
@@ -57,6 +69,58 @@ def test_nested_comments():
     verify(code, expected)
 
 
+def test_comment_delimiters():
+    # The text between two delimiters is one token, however many "*" and
+    # parentheses it has, and every (* and *) in it nests or closes.
+    code = [
+        "(***********)",
+        "(* f[(x)] ** (y*) *)",
+        "(* a ((* b *) c *)",
+        "(* a *(* b *) c *)",
+        "(* a **)x",
+    ]
+    expected = [
+        [
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, "*********"),
+            (MToken.COMMENT, "*)"),
+        ],
+        [
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, " f[(x)] ** (y"),
+            (MToken.COMMENT, "*)"),
+            (MToken.WHITESPACE, " "),
+            (MToken.OPERATOR, "*"),
+            (MToken.GROUP, ")"),
+        ],
+        [
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, " a ("),
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, " b "),
+            (MToken.COMMENT, "*)"),
+            (MToken.COMMENT, " c "),
+            (MToken.COMMENT, "*)"),
+        ],
+        [
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, " a *"),
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, " b "),
+            (MToken.COMMENT, "*)"),
+            (MToken.COMMENT, " c "),
+            (MToken.COMMENT, "*)"),
+        ],
+        [
+            (MToken.COMMENT, "(*"),
+            (MToken.COMMENT, " a *"),
+            (MToken.COMMENT, "*)"),
+            (MToken.SYMBOL, "x"),
+        ],
+    ]
+    verify_all(code, expected)
+
+
 def test_multiline_comment():
     code = "(* a comment\non two lines *)"
     expected = [
@@ -73,34 +137,15 @@ def test_strings():
         '"a string \\" with a quote"',
         '"a string with a newline\\n"',
         '"a string with \\ two backslashes"',
+        '"a string ending in a backslash\\\\"',
+        '""',
     ]
+    # The text between the quotes is one token, escapes included.
     expected = [
-        [
-            (MToken.STRING, '"'),
-            (MToken.STRING, "a string"),
-            (MToken.STRING, '"'),
-        ],
-        [
-            (MToken.STRING, '"'),
-            (MToken.STRING, "a string "),
-            (MToken.STRING, '\\"'),
-            (MToken.STRING, " with a quote"),
-            (MToken.STRING, '"'),
-        ],
-        [
-            (MToken.STRING, '"'),
-            (MToken.STRING, "a string with a newline"),
-            (MToken.STRING, "\\n"),
-            (MToken.STRING, '"'),
-        ],
-        [
-            (MToken.STRING, '"'),
-            (MToken.STRING, "a string with "),
-            (MToken.STRING, "\\"),
-            (MToken.STRING, " two backslashes"),
-            (MToken.STRING, '"'),
-        ],
+        [(MToken.STRING, '"'), (MToken.STRING, string[1:-1]), (MToken.STRING, '"')]
+        for string in code[:-1]
     ]
+    expected.append([(MToken.STRING, '"'), (MToken.STRING, '"')])
     verify_all(code, expected)
 
 
@@ -177,6 +222,41 @@ def test_operators():
     verify_all(code, expected)
 
 
+def test_mathics_messages():
+    code = ["α::usage: some text", "1α::tag: a message", "x_α::usage: text"]
+    expected = [
+        [
+            (MToken.OPERATOR, "α"),
+            (MToken.WHITESPACE, "usage"),
+            (MToken.TEXT, " "),
+            (MToken.TEXT, "some text"),
+        ],
+        # A message starts at the start of a word only, not where the
+        # rule for numbers or patterns leaves off.
+        [
+            (MToken.NUMBER, "1"),
+            (MToken.SYMBOL, "α"),
+            (MToken.OPERATOR, "::"),
+            (MToken.SYMBOL, "tag"),
+            (MToken.OPERATOR, ":"),
+            (MToken.WHITESPACE, " "),
+            (MToken.SYMBOL, "a"),
+            (MToken.WHITESPACE, " "),
+            (MToken.SYMBOL, "message"),
+        ],
+        [
+            (MToken.PATTERN, "x_"),
+            (MToken.SYMBOL, "α"),
+            (MToken.OPERATOR, "::"),
+            (MToken.SYMBOL, "usage"),
+            (MToken.OPERATOR, ":"),
+            (MToken.WHITESPACE, " "),
+            (MToken.SYMBOL, "text"),
+        ],
+    ]
+    verify_all(code, expected)
+
+
 @pytest.mark.skip(
     "We detect Messages but are not able separate these from an ::Exception"
 )
@@ -233,6 +313,18 @@ def test_builtins():
     verify_all(code, expected)
 
 
+def test_qualified_builtins():
+    code = ["System`Plus", "System`Sin", "Global`Plus", "System`Foo", "`Plus"]
+    expected = [
+        [(MToken.BUILTIN, "System`Plus")],
+        [(MToken.BUILTIN, "System`Sin")],
+        [(MToken.SYMBOL, "Global`Plus")],
+        [(MToken.SYMBOL, "System`Foo")],
+        [(MToken.SYMBOL, "`Plus")],
+    ]
+    verify_all(code, expected)
+
+
 def test_unicode_builtins():
     code = list(mma.UNICODE_SYSTEM_SYMBOLS)
     expected = [[(MToken.BUILTIN, sym)] for sym in code]
@@ -257,6 +349,22 @@ def test_unicode_undefined():
     verify_all(code, expected)
 
 
+def test_unicode_runs():
+    code = "x∈ℛ∧〚π〛⊕☃"
+    expected = [
+        (MToken.SYMBOL, "x"),
+        (MToken.OPERATOR, "∈"),
+        (MToken.SYMBOL, "ℛ"),
+        (MToken.OPERATOR, "∧"),
+        (MToken.GROUP, "〚"),
+        (MToken.BUILTIN, "π"),
+        (MToken.GROUP, "〛"),
+        (MToken.OPERATOR, "⊕"),
+        (MToken.UNKNOWN, "☃"),
+    ]
+    verify(code, expected)
+
+
 def test_lexical_scope_simple():
     code = [
         "Block[{x = 1}, Sin[x]]",
@@ -434,3 +542,147 @@ def test_lexical_scope_nasty():
         (MToken.GROUP, "]"),
     ]
     verify(code, expected)
+
+
+def test_lexical_scope_deeply_nested():
+    depth = 1000
+    code = "".join(f"Module[{{x{i}}}, x{i} + " for i in range(depth))
+    code += "x" + "]" * depth + "; x0"
+    tokens = list(lexer.get_tokens(code))
+    local = [value for token, value in tokens if token is MToken.LOCAL_SCOPE]
+    # Each variable is marked in its definition and in the body of its own level.
+    assert local == [f"x{i}" for i in range(depth) for _ in range(2)]
+    assert tokens[-2] == (MToken.SYMBOL, "x0")
+
+
+def test_annotate_matches_annotation_pipeline():
+    # MathematicaAnnotations.annotate() must give what the annotation
+    # pipeline it replaced gave, and so must the passes kept from it.
+    fragments = [
+        "Block",
+        "With",
+        "Module",
+        "[",
+        "]",
+        "{",
+        "}",
+        "<|",
+        "|>",
+        ",",
+        "=",
+        ":=",
+        " ",
+        "\n",
+        "x",
+        "y",
+        "Plus",
+        "Sin",
+        "1",
+        "2.5",
+        "(* c *)",
+        '"s"',
+        "#",
+        "x_",
+        "->",
+        ";",
+        "π",
+        "〚",
+        "〛",
+    ]
+    rng = random.Random(1234)
+    for _ in range(300):
+        code = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 60)))
+        raw = list(RegexLexer.get_tokens_unprocessed(lexer, code))
+        pipeline = AnnotationPipeline()
+        expected = [pipeline(item) for item in raw]
+
+        annotate = MathematicaAnnotations().annotate
+        assert [annotate(item) for item in raw] == expected, code
+
+        ma = MathematicaAnnotations()
+        annotated = []
+        for item in raw:
+            for func in (ma.builtins, ma.unicode, ma.lexical_scope):
+                item = func(*item)
+            annotated.append(item)
+        assert annotated == expected, code
+
+
+def split_lines(tokens):
+    """Split the values of tokens after each newline."""
+    for index, token, value in tokens:
+        for piece in value.splitlines(keepends=True):
+            yield index, token, piece
+            index += len(piece)
+
+
+@pytest.mark.parametrize("engine", MathematicaLexer.engines)
+def test_merge_strings(engine):
+    code = 'f["a \\" b", "", x] <> "unterminated\n'
+    merging = MathematicaLexer(engine=engine, mergestrings=True)
+    tokens = list(merging.get_tokens_unprocessed(code))
+    assert [value for _, token, value in tokens if token is MToken.STRING] == [
+        '"a \\" b"',
+        '""',
+        '"unterminated\n',
+    ]
+    assert "".join(value for _, _, value in tokens) == code
+    assert all(code.startswith(value, index) for index, _, value in tokens)
+
+
+@pytest.mark.parametrize("mergestrings", [False, True])
+def test_elide_data(mergestrings):
+    payload = "1:eJxTTMoPSpMBAAvEAkk=" * 100
+    code = (
+        f'x = CompressedData["{payload}"]; System`CompressedData[ "\n{payload}" ];'
+        f' f["{payload}"]; CompressedData["short"]'
+    )
+    lexer = MathematicaLexer(elidedata=True, mergestrings=mergestrings)
+    text = "".join(value for _, _, value in lexer.get_tokens_unprocessed(code))
+    first = f"{payload[:16]}… (2,200 characters)"
+    second = f"\n{payload[:15]}… (2,201 characters)"
+    assert text == (
+        f'x = CompressedData["{first}"]; System`CompressedData[ "{second}" ];'
+        f' f["{payload}"]; CompressedData["short"]'
+    )
+
+
+@pytest.mark.parametrize("engine", ["regex", "scanner"])
+def test_line_tokens(engine):
+    lexer = MathematicaLexer(engine=engine)
+    code = (
+        "Module[{x = 1,\n    y = 2},\n  (* a (* nested\n comment *)\n  *)\n"
+        '  f[x, "a string\n  (* over *) lines", y]\n]\n'
+        "(* unterminated\n"
+    )
+    state = LexerState()
+    tokens = []
+    start = 0
+    for line in code.splitlines(keepends=True):
+        line_tokens, state = lexer.get_line_tokens(line, state)
+        tokens.extend(
+            (start + index, token, value) for index, token, value in line_tokens
+        )
+        start += len(line)
+    assert tokens == list(split_lines(lexer.get_tokens_unprocessed(code)))
+
+    assert state.comment_depth == 1
+    assert pickle.loads(pickle.dumps(state)) == state
+    assert len({state, LexerState(), lexer.get_line_tokens("Module[{x},")[1]}) == 3
+
+
+def test_import_does_not_load_tables():
+    # The symbol tables are loaded by the first lexer, not on import, so
+    # that listing the Pygments lexers stays fast.
+    code = (
+        "import sys, mathics_pygments\n"
+        "from pygments.lexers import get_all_lexers\n"
+        "list(get_all_lexers())\n"
+        "print('mathics_pygments.builtins' in sys.modules)\n"
+        "mathics_pygments.MathematicaLexer()\n"
+        "print('mathics_pygments.builtins' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.split() == ["False", "True"]
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+import os.path as osp
+import subprocess
+import sys
+
+from mathics_pygments import warmup
+from mathics_pygments.lexer import MathematicaLexer
+
+
+def test_warmup():
+    future = warmup(engine="master")
+    lexer = future.result(timeout=60)
+    assert isinstance(lexer, MathematicaLexer) and lexer.engine == "master"
+    assert warmup(engine="master") is future
+    assert warmup(background=False, engine="scanner").done()
+
+
+def test_warmup_while_lexing():
+    # A fresh interpreter, so that the token table is compiled while
+    # other threads lex.
+    code = """
+import threading
+
+from mathics_pygments import warmup
+from mathics_pygments.lexer import MathematicaLexer
+from tests.test_engines import SNIPPETS
+
+results = []
+def lex():
+    results.append([list(MathematicaLexer().get_tokens(s)) for s in SNIPPETS])
+future = warmup()
+threads = [threading.Thread(target=lex) for _ in range(4)]
+for thread in threads:
+    thread.start()
+future.result()
+for thread in threads:
+    thread.join()
+assert all(result == results[0] for result in results)
+assert results[0] == [list(MathematicaLexer().get_tokens(s)) for s in SNIPPETS]
+"""
+    root = osp.dirname(osp.dirname(osp.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
+
+
+def test_warmup_failed(monkeypatch):
+    def fail(options):
+        raise RuntimeError("no tables")
+
+    monkeypatch.setattr("mathics_pygments.startup._warm", fail)
+    future = warmup(background=False, engine="regex", stripnl=False)
+    assert isinstance(future.exception(), RuntimeError)
+
+    # A failed warmup is not kept, so the next one tries again.
+    monkeypatch.undo()
+    again = warmup(background=False, engine="regex", stripnl=False)
+    assert again is not future
+    assert again.result().engine == "regex"
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+import io
+import random
+import tracemalloc
+
+import pytest
+
+from mathics_pygments.lexer import MathematicaLexer
+
+from .test_engines import FRAGMENTS, SNIPPETS
+
+TEXTS = [
+    "",
+    "\n".join(SNIPPETS),
+    "(* a long comment " + "with (* nesting *) " * 200 + "*) f[x]\n",
+    '"a long string\n' + "over lines\n" * 200 + '" <> g[x]\n',
+    "x = 1.5\n*^3;\ny = 16\n^^ff;\n{1\n, 2}\n",
+]
+
+
+def chunked(text, size):
+    return (text[start : start + size] for start in range(0, len(text), size))
+
+
+@pytest.mark.parametrize("engine", ["regex", "scanner"])
+def test_streaming_matches_lexing(engine):
+    lexer = MathematicaLexer(engine=engine)
+    rng = random.Random(0)
+    texts = TEXTS + [
+        "".join(rng.choice(FRAGMENTS + ["\n", "]", "*^", "1"]) for _ in range(100))
+        for _ in range(50)
+    ]
+    for text in texts:
+        tokens = list(lexer.get_tokens_unprocessed(text))
+        for size in (1, 2, 7, 1000):
+            assert list(lexer.get_tokens_streaming(chunked(text, size), size)) == (
+                tokens
+            ), (text, size)
+    text = TEXTS[1]
+    stream = lexer.get_tokens_streaming(io.StringIO(text), 10)
+    assert list(stream) == list(lexer.get_tokens_unprocessed(text))
+
+
+def test_streaming_memory():
+    lexer = MathematicaLexer(engine="scanner")
+    code = "f[x_, y_] := Module[{a = x^2}, (* square *) a + y];\n"
+    chunk_size = 1024
+
+    def peak_memory(count):
+        chunks = (code for _ in range(count))
+        tracemalloc.start()
+        try:
+            for _ in lexer.get_tokens_streaming(chunks, chunk_size):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak_memory(10)
+    small = peak_memory(1_000)
+    large = peak_memory(10_000)
+    # The peak is that of a buffer of a few chunks and its tokens, whatever
+    # the size of the text: tens of kB against 500 kB here.
+    assert large < 1.5 * small, (small, large)
+    assert large < len(code) * 10_000 / 4, large
+
+
+@pytest.mark.parametrize("engine", ["regex", "scanner"])
+def test_mapped_file(engine, tmp_path):
+    lexer = MathematicaLexer(engine=engine)
+    data = ("\n".join(SNIPPETS) + '\nx = "é \xff" -> π;\n').encode("utf-8") * 20
+    data += b"y = 1 (* \xe9 *)\n"
+    path = tmp_path / "test.m"
+    path.write_bytes(data)
+    text = data.decode("utf-8", "surrogateescape")
+    tokens = list(lexer.get_tokens_unprocessed(text))
+    mapped = list(lexer.get_tokens_mapped(path, 100))
+    assert [item[1:] for item in mapped] == [item[1:] for item in tokens]
+    for index, _, value in mapped:
+        assert data[index:].startswith(value.encode("utf-8", "surrogateescape"))
+
+    path.write_bytes(b"")
+    assert list(lexer.get_tokens_mapped(path)) == []
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Rocky Bernstein
+# Licensed under the MIT License (https://opensource.org/licenses/MIT)
+
+from mathics_pygments import builtins, tables
+from mathics_pygments.generate import build_tables
+
+
+def test_tables_up_to_date():
+    # Run "make tables" after changing the symbol tables.
+    assert build_tables.main(["--check"]) == 0
+
+
+def test_tables_deduplicated():
+    for table in (tables.OPERATORS, tables.GROUPINGS, tables.UNICODE_OPERATORS):
+        assert len(set(table)) == len(table)
+        assert list(table) == sorted(table)
+    assert set(builtins.UNICODE_OPERATOR_NAMES) <= builtins.UNICODE_OPERATORS
+    assert "Plus" in builtins.SYSTEM_SYMBOLS
+    assert "°" in builtins.UNICODE_OPERATORS